@@ -0,0 +1,34 @@
+"""
+Gofannon: a collection of tools for LLMs.
+
+Subpackages and the core classes are loaded lazily (PEP 562), so
+``import gofannon`` is cheap and never pulls in optional backends.
+"""
+import importlib
+
+_CORE_ATTRS = {
+    'FunctionRegistry': 'gofannon.config',
+    'ToolConfig': 'gofannon.config',
+    'BaseTool': 'gofannon.base',
+    'ToolResult': 'gofannon.base',
+    'WorkflowContext': 'gofannon.base',
+}
+
+_SUBPACKAGES = {
+    'arxiv', 'base', 'basic_math', 'config', 'file', 'get_url_content',
+    'github', 'google_search', 'grant_query', 'headless_browser', 'manifest',
+    'nasa', 'nhsta', 'open_notify_space', 'orchestration', 'pdf_reader',
+    'reasoning', 'simpler_grants_gov', 'wikipedia',
+}
+
+
+def __getattr__(name):
+    if name in _CORE_ATTRS:
+        return getattr(importlib.import_module(_CORE_ATTRS[name]), name)
+    if name in _SUBPACKAGES:
+        return importlib.import_module(f"{__name__}.{name}")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_CORE_ATTRS) | _SUBPACKAGES)
@@ -1,12 +1,54 @@
 from..base import BaseTool
-import requests
 from ..config import FunctionRegistry
 import logging
+import re
 
 logger = logging.getLogger(__name__)
 
+ARXIV_API_URL = "http://export.arxiv.org/api/query"
+ATOM_NS = "http://www.w3.org/2005/Atom"
+# arXiv accepts long ``id_list``s, but keep each bulk request modest.
+MAX_IDS_PER_REQUEST = 100
+
+
+# New-style (``2101.00001v2``) and old-style (``hep-th/9901001``) arXiv ids.
+ARXIV_ID = re.compile(r"(\d{4}\.\d{4,5}|[a-z]+(-[a-z]+)*(\.[A-Z]{2})?/\d{7})(v\d+)?")
+
+
+def split_feed(text):
+    """
+    Split an arXiv Atom feed into one feed per entry, keyed by article id
+    (``2101.00001v2`` and ``2101.00001`` both map to the entry), plus the
+    feed without entries under ``None``.
+
+    Raises ``ValueError`` if arXiv rejected the query.
+    """
+    import xml.etree.ElementTree as ET
+
+    ET.register_namespace("", ATOM_NS)
+    ET.register_namespace("opensearch", "http://a9.com/-/spec/opensearch/1.1/")
+    ET.register_namespace("arxiv", "http://arxiv.org/schemas/atom")
+    root = ET.fromstring(text)
+    entries = root.findall(f"{{{ATOM_NS}}}entry")
+    for entry in entries:
+        root.remove(entry)
+    feeds = {None: ET.tostring(root, encoding="unicode")}
+    for entry in entries:
+        entry_id = entry.findtext(f"{{{ATOM_NS}}}id", "")
+        if "/api/errors" in entry_id:
+            summary = entry.findtext(f"{{{ATOM_NS}}}summary", "").strip()
+            raise ValueError(f"arXiv rejected the query: {summary}")
+        root.append(entry)
+        feed = ET.tostring(root, encoding="unicode")
+        root.remove(entry)
+        article_id = entry_id.rsplit("/abs/", 1)[-1]
+        feeds[article_id] = feeds[re.sub(r"v\d+$", "", article_id)] = feed
+    return feeds
+
 @FunctionRegistry.register
 class GetArticle(BaseTool):
+    thread_safe = True
+
     def __init__(self, name="get_article"):
         super().__init__()
         self.name = name
@@ -33,9 +75,50 @@ class GetArticle(BaseTool):
 
     def fn(self, id):
         logger.debug("Fetching Article '%s' from ArXiv", id)
-        base_url = "http://export.arxiv.org/api/query"
         params = {
             "id_list": id
         }
-        response = requests.get(base_url, params=params)
-        return response.text  
\ No newline at end of file
+        response = self.http_session(ARXIV_API_URL).get(ARXIV_API_URL, params=params)
+        return response.text
+
+    async def afn(self, id):
+        logger.debug("Fetching Article '%s' from ArXiv", id)
+        params = {
+            "id_list": id
+        }
+        response = await self.async_http_client(ARXIV_API_URL).get(ARXIV_API_URL, params=params)
+        return response.text
+
+    def fn_many(self, arguments_list):
+        """
+        Fetch many articles with one request per ``MAX_IDS_PER_REQUEST`` ids.
+
+        Each result is the response feed holding just that id's entry (none
+        for an unknown id), like ``fn`` returns. An HTTP error response is
+        returned for every id of its request, as ``fn`` would. Ids that are
+        not arXiv ids fail without being sent, since arXiv rejects a whole
+        query over one of them.
+        """
+        ids = [arguments["id"] for arguments in arguments_list]
+        logger.debug("Fetching %d articles from ArXiv", len(ids))
+        feeds = {}
+        unique = []
+        for id in dict.fromkeys(ids):
+            if ARXIV_ID.fullmatch(id):
+                unique.append(id)
+            else:
+                feeds[id] = ValueError(f"Not an arXiv id: {id!r}")
+        for start in range(0, len(unique), MAX_IDS_PER_REQUEST):
+            chunk = unique[start:start + MAX_IDS_PER_REQUEST]
+            params = {"id_list": ",".join(chunk), "max_results": len(chunk)}
+            response = self.http_session(ARXIV_API_URL).get(ARXIV_API_URL, params=params)
+            if not response.ok:
+                feeds.update(dict.fromkeys(chunk, response.text))
+                continue
+            try:
+                chunk_feeds = split_feed(response.text)
+            except ValueError as e:
+                feeds.update(dict.fromkeys(chunk, e))
+                continue
+            feeds.update({id: chunk_feeds.get(id, chunk_feeds[None]) for id in chunk})
+        return [feeds[id] for id in ids]
@@ -1,4 +1,9 @@
-import time
+import contextvars
+import functools
+import threading
+import inspect
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from typing import Any, Callable
@@ -6,10 +11,13 @@ import json
 import logging
 from pathlib import Path
 
-import anyio
-
+from . import deadline, metrics, singleflight, tracing, validation
 from .adk_mixin import AdkMixin
-from ..config import ToolConfig
+from .cache import get_cache, make_key
+from .checkpoints import BLOB_REF, BlobStore, FirestoreStore, TrackedDict, is_blob_ref
+from .execution_log import spill
+from .retry import DEFAULT_RETRY_POLICY, NO_RETRY, Retrier, classify, service_policy
+from ..config import ToolConfig, ensure_logging
 
 from .smol_agents import SmolAgentsMixin
 from .langchain import LangchainMixin
@@ -28,45 +36,219 @@ class ToolResult:
 
 
 class WorkflowContext:
-    def __init__(self, firebase_config=None):
+    def __init__(self, firebase_config=None, checkpoint_store=None, log_retention=None,
+                 workflow_id="default"):
+        # Tools of a parallel ToolChain report into the same context.
+        self._lock = threading.Lock()
+        self.log_retention = log_retention
+        self._blobs = None
+        if log_retention is not None and log_retention.spill_bytes is not None:
+            self._blobs = BlobStore(log_retention.blob_path)
+        self._reset_tracking()
         self.data = {}
         self.execution_log = []
+        self.cache_stats = {"hits": 0, "misses": 0, "evictions": 0}
+        # ToolChain step id -> fingerprint of the inputs it completed with.
+        self.completed_steps = {}
         self.firebase_config = firebase_config
+        # Firestore document the checkpoints of this context are saved to.
+        self.workflow_id = workflow_id
+        self._firestore_store = None
+        self.checkpoint_store = checkpoint_store
         self.local_storage = Path.home() / ".llama" / "checkpoints"
         self.local_storage.mkdir(parents=True, exist_ok=True)
 
+    # ``data``, ``execution_log`` and ``completed_steps`` track what changed
+    # since the last checkpoint so that a ``checkpoint_store`` (see
+    # ``gofannon.base.checkpoints``) only has to persist the difference. Only
+    # top-level ``data`` keys are tracked: reassign a key after mutating its
+    # value in place.
+
+    def _reset_tracking(self):
+        self._replaced = True
+        self._dirty_keys = set()
+        self._dirty_steps = set()
+        # Positions in the full log, counting entries the retention policy
+        # has already dropped from memory.
+        self._saved_log_entries = 0
+        self._dropped_log_entries = 0
+
+    @property
+    def data(self):
+        return self._data
+
+    @data.setter
+    def data(self, value):
+        self._data = TrackedDict(value, on_change=self._dirty_keys.add)
+        self._replaced = True
+
+    @property
+    def execution_log(self):
+        return self._execution_log
+
+    @execution_log.setter
+    def execution_log(self, value):
+        max_entries = self.log_retention.max_entries if self.log_retention else None
+        if max_entries is None:
+            self._dropped_log_entries = 0
+            self._execution_log = list(value)
+        else:
+            value = list(value)
+            self._dropped_log_entries = max(0, len(value) - max_entries)
+            self._execution_log = deque(value, maxlen=max_entries)
+        self._replaced = True
+
+    def resolve_blob(self, value):
+        """The full value behind a log entry's spilled input or output."""
+        if is_blob_ref(value):
+            return (self._blobs or BlobStore()).get(value[BLOB_REF])
+        return value
+
+    @property
+    def completed_steps(self):
+        return self._completed_steps
+
+    @completed_steps.setter
+    def completed_steps(self, value):
+        self._completed_steps = TrackedDict(value, on_change=self._dirty_steps.add)
+        self._replaced = True
+
+    def pending_changes(self):
+        """
+        Changes since the last checkpoint, as a dict with ``reset`` (the state
+        was replaced wholesale and must be written from scratch), ``set``
+        (changed ``data`` items), ``deleted`` (removed ``data`` keys), ``log``
+        (new execution-log entries) and ``steps`` (changed completed steps).
+        ``log_end`` is the position in the full log after the last entry;
+        with a ``log_retention`` limit, entries dropped from memory before
+        they were saved are not included.
+        """
+        with self._lock:
+            log_end = self._dropped_log_entries + len(self._execution_log)
+            dirty_steps = set(self._dirty_steps)
+            reset = self._replaced or not dirty_steps <= self._completed_steps.keys()
+            if reset:
+                return {
+                    "reset": True,
+                    "set": dict(self._data),
+                    "deleted": [],
+                    "log": list(self._execution_log),
+                    "log_end": log_end,
+                    "steps": dict(self._completed_steps),
+                }
+            dirty_keys = set(self._dirty_keys)
+            return {
+                "reset": False,
+                "set": {k: self._data[k] for k in dirty_keys if k in self._data},
+                "deleted": [k for k in dirty_keys if k not in self._data],
+                "log": self._unsaved_log(log_end),
+                "log_end": log_end,
+                "steps": {k: self._completed_steps[k] for k in dirty_steps},
+            }
+
+    def mark_saved(self, changes):
+        """Record that ``changes`` (from ``pending_changes``) were persisted."""
+        with self._lock:
+            if changes["reset"]:
+                self._replaced = False
+                self._dirty_keys.clear()
+                self._dirty_steps.clear()
+            else:
+                self._dirty_keys.difference_update(changes["set"])
+                self._dirty_keys.difference_update(changes["deleted"])
+                self._dirty_steps.difference_update(changes["steps"])
+            self._saved_log_entries = changes["log_end"]
+
+    def _unsaved_log(self, log_end):
+        unsaved = max(0, min(log_end - self._saved_log_entries, len(self._execution_log)))
+        return list(self._execution_log)[len(self._execution_log) - unsaved:]
+
     def save_checkpoint(self, name="checkpoint"):
-        if self.firebase_config:
+        if self.checkpoint_store is not None:
+            self.checkpoint_store.save(self, name)
+        elif self.firebase_config:
             self._save_to_firebase(name)
         else:
             self._save_local(name)
 
+    def load_checkpoint(self, name="checkpoint") -> bool:
+        """
+        Restore ``data``, ``execution_log`` and ``completed_steps`` from the
+        checkpoint ``name``. Returns False (leaving the context unchanged) if
+        there is no such checkpoint.
+        """
+        if self.checkpoint_store is not None:
+            checkpoint = self.checkpoint_store.load(name)
+        elif self.firebase_config:
+            checkpoint = self._load_from_firebase(name)
+        else:
+            checkpoint = self._load_local(name)
+        if checkpoint is None:
+            return False
+
+        # The restored state may predate later checkpoints in the store, so
+        # the next checkpoint is written in full rather than as a delta.
+        self.data = checkpoint.get("data", {})
+        self.execution_log = checkpoint.get("execution_log", [])
+        self.completed_steps = checkpoint.get("completed_steps", {})
+        return True
+
     def _save_local(self, name):
         path = self.local_storage / f"{name}.json"
         with open(path, "w") as f:
-            json.dump({"data": self.data, "execution_log": self.execution_log}, f)
+            json.dump({
+                "data": self.data,
+                "execution_log": list(self.execution_log),
+                "completed_steps": self.completed_steps,
+            }, f)
+
+    def _load_local(self, name):
+        path = self.local_storage / f"{name}.json"
+        if not path.exists():
+            return None
+        with open(path) as f:
+            return json.load(f)
+
+    def _firestore(self):
+        # Checkpoints go to the "workflows/<workflow_id>" document, whose
+        # state is written as deltas and whose checkpoints record only what
+        # changed since the previous one.
+        if self._firestore_store is None:
+            self._firestore_store = FirestoreStore()
+        return self._firestore_store
 
     def _save_to_firebase(self, name):
-        from firebase_admin import firestore
+        self._firestore().save_checkpoint(self.workflow_id, name, self)
 
-        db = firestore.client()
-        doc_ref = db.collection("checkpoints").document(name)
-        doc_ref.set(
-            {
-                "data": self.data,
-                "execution_log": self.execution_log,
-                "timestamp": firestore.SERVER_TIMESTAMP,
-            }
-        )
+    def _load_from_firebase(self, name):
+        state = self._firestore().load_checkpoint(self.workflow_id, name)
+        if state is None:
+            # Written before checkpoints shared a workflow document.
+            state = FirestoreStore(collection="checkpoints").get_state(name)
+        return state
 
-    def log_execution(self, tool_name, duration, input_data, output_data):
+    def log_execution(self, tool_name, duration, input_data, output_data, attempts=1):
+        if self._blobs is not None:
+            input_data = spill(input_data, self.log_retention, self._blobs)
+            output_data = spill(output_data, self.log_retention, self._blobs)
         entry = {
             "tool": tool_name,
             "duration": duration,
             "input": input_data,
             "output": output_data,
+            "attempts": attempts,
         }
-        self.execution_log.append(entry)
+        with self._lock:
+            log = self._execution_log
+            if isinstance(log, deque) and len(log) == log.maxlen:
+                self._dropped_log_entries += 1
+            log.append(entry)
+
+    def record_cache(self, hits=0, misses=0, evictions=0):
+        with self._lock:
+            self.cache_stats["hits"] += hits
+            self.cache_stats["misses"] += misses
+            self.cache_stats["evictions"] += evictions
 
 
 class BaseTool(SmolAgentsMixin,
@@ -77,7 +259,59 @@ class BaseTool(SmolAgentsMixin,
                LlamaStackMixin,
                AdkMixin,
                ABC):
+    # Optional native coroutine counterpart of ``fn``. Tools that can do their
+    # I/O without blocking define ``async def afn(self, **kwargs)``;
+    # ``execute_async`` prefers it over running ``fn`` in a worker thread.
+    afn = None
+
+    # Optional bulk counterpart of ``fn`` for APIs that answer many inputs in
+    # one request. ``fn_many(self, arguments_list)`` returns one output per
+    # entry, or an exception instance for an entry that failed;
+    # ``execute_many`` prefers it over one ``fn`` call per entry.
+    fn_many = None
+
+    # Optional variants of ``fn``/``afn`` used by ``execute``, for tools that
+    # report failures as error strings: they raise the failures worth retrying
+    # (see ``is_retryable``) instead, so that ``execute`` retries them.
+    # ``fn`` keeps returning error strings to callers outside ``execute``,
+    # such as the framework adapters.
+    _fn_raw = None
+    _afn_raw = None
+
+    # Opt-in result caching (see ``gofannon.base.cache``). Tools that change
+    # state set ``mutating = True`` and are never cached.
+    cache_policy = None
+    mutating = False
+
+    # Whether one instance may serve concurrent ``fn`` calls, i.e. ``fn`` keeps
+    # no per-call state on ``self``. Thread-safe tools are pooled and reused by
+    # the orchestrator; others get a fresh instance per call.
+    thread_safe = False
+
+    # Retries of transient failures (see ``gofannon.base.retry``); ``None``
+    # falls back to the policy of the tool's ``API_SERVICE`` or the default.
+    retry_policy = None
+
+    # Whether identical concurrent calls share one run of ``fn`` (see
+    # ``gofannon.base.singleflight``). Mutating tools never do.
+    coalesce = True
+
+    # Default time limit of a call in seconds, retries included (see
+    # ``gofannon.base.deadline``); ``None`` lets calls run indefinitely.
+    timeout = None
+
+    # CPU-bound tools run ``fn`` in a pool of worker processes instead of a
+    # thread, so they don't hold the GIL of the caller (see
+    # ``gofannon.base.process_pool``). The tool and its arguments must pickle.
+    cpu_bound = False
+
+    # Whether tool workers (see ``gofannon.orchestration.worker``) serve the
+    # tool without it being listed in their ``tools``. Only tools that use no
+    # files, network access or credentials of the worker's host opt in.
+    remote_safe = False
+
     def __init__(self, **kwargs):
+        ensure_logging()
         self.logger = logging.getLogger(
             f"{self.__class__.__module__}.{self.__class__.__name__}"
         )
@@ -96,6 +330,28 @@ class BaseTool(SmolAgentsMixin,
         if hasattr(self, "API_SERVICE"):
             self.api_key = ToolConfig.get(f"{self.API_SERVICE}_api_key")
 
+    def http_session(self, url=None):
+        """
+        Shared, pooled ``requests`` session for this tool.
+
+        Sessions are keyed by ``API_SERVICE`` when the tool declares one and by
+        the host of ``url`` otherwise.
+        """
+        from .http import get_session, session_key
+
+        return get_session(session_key(getattr(self, "API_SERVICE", None), url))
+
+    def async_http_client(self, url=None):
+        """
+        Shared ``httpx.AsyncClient`` for this tool on the running event loop.
+
+        Keyed like ``http_session``, so sync and async calls of the tool share
+        one rate limit and circuit breaker.
+        """
+        from .http import get_async_client, session_key
+
+        return get_async_client(session_key(getattr(self, "API_SERVICE", None), url))
+
     @property
     @abstractmethod
     def definition(self):
@@ -109,22 +365,282 @@ class BaseTool(SmolAgentsMixin,
     def fn(self, *args, **kwargs):
         pass
 
-    def execute(self, context: WorkflowContext, **kwargs) -> ToolResult:
+    def cache_scope(self):
+        """Instance settings that change this tool's results, for cache keys."""
+        return {
+            "api_key": getattr(self, "api_key", None),
+            "base_url": getattr(self, "base_url", None),
+        }
+
+    def _result_cache(self):
+        if self.cache_policy is None or self.mutating:
+            return None
+        cls = type(self)
+        return get_cache(f"{cls.__module__}.{cls.__qualname__}", self.cache_policy)
+
+    def validate_arguments(self, arguments):
+        """
+        Raise ``ArgumentValidationError`` unless ``arguments`` match the
+        ``parameters`` schema of ``definition`` (see ``gofannon.base.validation``).
+        """
+        validation.check_arguments(self, arguments)
+
+    def _bound_arguments(self, arguments):
+        # Fill in defaults so that passing a default explicitly gives the same key.
         try:
-            start_time = time.time()
-            result = self.fn(**kwargs)
-            duration = time.time() - start_time
-
-            context.log_execution(
-                tool_name=self.__class__.__name__,
-                duration=duration,
-                input_data=kwargs,
-                output_data=result,
-            )
-
-            return ToolResult(success=True, output=result)
-        except Exception as e:
-            return ToolResult(success=False, output=None, error=str(e), retryable=True)
-
-    async def execute_async(self, arguments: dict):
-        return await anyio.to_thread.run_sync(self.fn, **arguments)
+            bound = inspect.signature(self.fn).bind(**arguments)
+            bound.apply_defaults()
+            return bound.arguments
+        except TypeError:
+            return arguments
+
+    def _cache_key(self, arguments):
+        return make_key(type(self).__qualname__, self._bound_arguments(arguments),
+                        self.cache_policy.key_args, self.cache_scope())
+
+    def _flight_key(self, arguments):
+        """Key under which identical in-flight calls are coalesced, or None."""
+        if not self.coalesce or self.mutating:
+            return None
+        cls = type(self)
+        return make_key(f"{cls.__module__}.{cls.__qualname__}", self._bound_arguments(arguments),
+                        scope=self.cache_scope())
+
+    def _call_once(self, arguments, retrier):
+        """Call ``fn`` under ``retrier``, coalesced; returns ``(result, shared)``."""
+        call = functools.partial(retrier.call, functools.partial(self._call_sync, arguments))
+        key = self._flight_key(arguments)
+        if key is None:
+            return call(), False
+        return singleflight.get_group().do(key, call)
+
+    async def _call_once_async(self, arguments, retrier):
+        call = functools.partial(retrier.acall, functools.partial(self._call_async, arguments))
+        key = self._flight_key(arguments)
+        if key is None:
+            return await call(), False
+        return await singleflight.get_group().do_async(key, call)
+
+    def _cache_result(self, cache, key, result):
+        """Store ``result`` if the policy allows; returns the number of evictions."""
+        cache_if = self.cache_policy.cache_if
+        if cache_if is not None and not cache_if(result):
+            return 0
+        return cache.set(key, result)
+
+    def _retrier(self):
+        policy = self.retry_policy
+        if policy is None:
+            if self.mutating:
+                policy = NO_RETRY
+            else:
+                policy = service_policy(getattr(self, "API_SERVICE", None)) or DEFAULT_RETRY_POLICY
+        return Retrier(policy, self.__class__.__name__)
+
+    def is_retryable(self, exc):
+        """
+        Whether ``exc`` is worth retrying under this tool's retry policy
+        (e.g. a 429, a 5xx or a dropped connection). Tools that report failures
+        as error strings re-raise these from ``_fn_raw``/``_afn_raw``, so that
+        ``execute`` retries them and returns a retryable ``ToolResult``.
+        """
+        return classify(exc, self._retrier().policy)[0]
+
+    def execute(self, context: WorkflowContext, timeout=None, **kwargs) -> ToolResult:
+        tool_name = self.__class__.__name__
+        start_time = metrics.clock()
+        retrier = self._retrier()
+        call = functools.partial(
+            deadline.call_with_timeout, functools.partial(self._call_once, kwargs, retrier),
+            self.timeout if timeout is None else timeout, tool_name)
+        shared = False
+        with tracing.span(f"tool {tool_name}", "tool") as span:
+            try:
+                self.validate_arguments(kwargs)
+                cache = self._result_cache()
+                if cache is not None:
+                    key = self._cache_key(kwargs)
+                    hit, result = cache.get(key)
+                    if hit:
+                        context.record_cache(hits=1)
+                        metrics.record_cache(tool_name, hits=1)
+                    else:
+                        context.record_cache(misses=1)
+                        result, shared = call()
+                        # The call that ran stores the result for everyone.
+                        evictions = 0 if shared else self._cache_result(cache, key, result)
+                        context.record_cache(evictions=evictions)
+                        metrics.record_cache(tool_name, misses=1, evictions=evictions)
+                else:
+                    result, shared = call()
+                duration = metrics.clock() - start_time
+
+                context.log_execution(
+                    tool_name=tool_name,
+                    duration=duration,
+                    input_data=kwargs,
+                    output_data=result,
+                    attempts=retrier.attempts,
+                )
+                metrics.record_tool_call(tool_name, duration, kwargs, result,
+                                         attempts=retrier.attempts, shared=shared)
+
+                return ToolResult(success=True, output=result)
+            except Exception as e:
+                retryable, _ = classify(e, retrier.policy)
+                span.record_error(e)
+                span.set_attribute("attempts", retrier.attempts)
+                metrics.record_tool_call(tool_name, metrics.clock() - start_time, kwargs,
+                                         error=e, retryable=retryable,
+                                         attempts=retrier.attempts, shared=not retrier.attempts)
+                return ToolResult(success=False, output=None, error=str(e),
+                                  retryable=retryable)
+
+    async def execute_async(self, arguments: dict, timeout=None):
+        tool_name = self.__class__.__name__
+        start_time = metrics.clock()
+        retrier = self._retrier()
+        timeout = self.timeout if timeout is None else timeout
+
+        def call():
+            return deadline.await_with_timeout(self._call_once_async(arguments, retrier),
+                                               timeout, tool_name)
+
+        shared = False
+        with tracing.span(f"tool {tool_name}", "tool"):
+            try:
+                self.validate_arguments(arguments)
+                cache = self._result_cache()
+                if cache is None:
+                    result, shared = await call()
+                else:
+                    key = self._cache_key(arguments)
+                    hit, result = cache.get(key)
+                    if hit:
+                        metrics.record_cache(tool_name, hits=1)
+                    else:
+                        result, shared = await call()
+                        evictions = 0 if shared else self._cache_result(cache, key, result)
+                        metrics.record_cache(tool_name, misses=1, evictions=evictions)
+            except Exception as e:
+                metrics.record_tool_call(tool_name, metrics.clock() - start_time, arguments, error=e,
+                                         retryable=classify(e, retrier.policy)[0],
+                                         attempts=retrier.attempts, shared=not retrier.attempts)
+                raise
+            metrics.record_tool_call(tool_name, metrics.clock() - start_time, arguments, result,
+                                     attempts=retrier.attempts, shared=shared)
+            return result
+
+    def execute_many(self, context: WorkflowContext, arguments_list, max_concurrency=8,
+                     timeout=None) -> list:
+        """
+        Run the tool once per keyword-argument dict of ``arguments_list``.
+
+        Returns a ``ToolResult`` per entry, in order; a failing entry doesn't
+        fail the others. Tools with ``fn_many`` answer all entries in one bulk
+        call; otherwise up to ``max_concurrency`` entries run at a time (one at
+        a time for tools that aren't ``thread_safe``). ``timeout`` bounds each
+        call, or the bulk call.
+        """
+        arguments_list = [dict(arguments) for arguments in arguments_list]
+        if self.fn_many is not None and arguments_list:
+            return self._execute_bulk(context, arguments_list, timeout)
+        workers = min(max_concurrency, len(arguments_list)) if self.thread_safe else 1
+        if workers <= 1:
+            return [self.execute(context, timeout=timeout, **arguments) for arguments in arguments_list]
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="gofannon-many") as executor:
+            futures = [
+                executor.submit(contextvars.copy_context().run,
+                                functools.partial(self.execute, context, timeout, **arguments))
+                for arguments in arguments_list
+            ]
+            return [future.result() for future in futures]
+
+    def _execute_bulk(self, context, arguments_list, timeout):
+        tool_name = self.__class__.__name__
+        results = [None] * len(arguments_list)
+        for index, arguments in enumerate(arguments_list):
+            try:
+                self.validate_arguments(arguments)
+            except validation.ArgumentValidationError as e:
+                metrics.record_tool_call(tool_name, 0, arguments, error=e)
+                results[index] = ToolResult(success=False, output=None, error=str(e))
+        cache = self._result_cache()
+        keys = {}
+        if cache is not None:
+            for index, arguments in enumerate(arguments_list):
+                if results[index] is not None:
+                    continue
+                keys[index] = self._cache_key(arguments)
+                hit, result = cache.get(keys[index])
+                if hit:
+                    results[index] = ToolResult(success=True, output=result)
+            hits = sum(results[index] is not None for index in keys)
+            context.record_cache(hits=hits, misses=len(keys) - hits)
+            metrics.record_cache(tool_name, hits=hits, misses=len(keys) - hits)
+        pending = [index for index, result in enumerate(results) if result is None]
+        if not pending:
+            return results
+
+        start_time = metrics.clock()
+        retrier = self._retrier()
+        batch = [arguments_list[index] for index in pending]
+        with tracing.span(f"tool {tool_name}", "tool", batch_size=len(batch)) as span:
+            try:
+                outputs = deadline.call_with_timeout(
+                    functools.partial(retrier.call, functools.partial(self.fn_many, batch)),
+                    self.timeout if timeout is None else timeout, tool_name)
+                if len(outputs) != len(batch):
+                    raise ValueError(f"{tool_name}.fn_many returned {len(outputs)} results "
+                                     f"for {len(batch)} calls")
+            except Exception as e:
+                span.record_error(e)
+                span.set_attribute("attempts", retrier.attempts)
+                outputs = [e] * len(batch)
+            duration = metrics.clock() - start_time
+
+        evictions = 0
+        for index, arguments, output in zip(pending, batch, outputs):
+            if isinstance(output, Exception):
+                retryable, _ = classify(output, retrier.policy)
+                metrics.record_tool_call(tool_name, duration, arguments, error=output,
+                                         retryable=retryable, attempts=retrier.attempts)
+                results[index] = ToolResult(success=False, output=None, error=str(output),
+                                            retryable=retryable)
+                continue
+            context.log_execution(tool_name=tool_name, duration=duration, input_data=arguments,
+                                  output_data=output, attempts=retrier.attempts)
+            metrics.record_tool_call(tool_name, duration, arguments, output,
+                                     attempts=retrier.attempts)
+            if cache is not None:
+                evictions += self._cache_result(cache, keys[index], output)
+            results[index] = ToolResult(success=True, output=output)
+        if evictions:
+            context.record_cache(evictions=evictions)
+            metrics.record_cache(tool_name, evictions=evictions)
+        return results
+
+    def _call_sync(self, arguments):
+        if self.cpu_bound:
+            from .process_pool import get_process_pool
+
+            return get_process_pool().call(self, arguments)
+        if self._fn_raw is not None:
+            return self._fn_raw(**arguments)
+        return self.fn(**arguments)
+
+    async def _call_async(self, arguments):
+        if self._afn_raw is not None:
+            return await self._afn_raw(**arguments)
+        if self.afn is not None:
+            return await self.afn(**arguments)
+        if inspect.iscoroutinefunction(self.fn):
+            return await self.fn(**arguments)
+        if self.cpu_bound:
+            from .process_pool import get_process_pool
+
+            return await get_process_pool().call_async(self, arguments)
+
+        import anyio
+
+        return await anyio.to_thread.run_sync(functools.partial(self.fn, **arguments))
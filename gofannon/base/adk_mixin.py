@@ -253,7 +253,8 @@ class AdkMixin:
 
         gofannon_params_schema = gofannon_def.get("parameters", {"type": "object", "properties": {}})
 
-        original_gofannon_fn = self.fn # type: ignore
+        # Prefer the tool's native coroutine when it has one.
+        original_gofannon_fn = getattr(self, "afn", None) or self.fn # type: ignore
         is_gofannon_fn_async = inspect.iscoroutinefunction(original_gofannon_fn)
 
         # Define a custom ADK Tool class
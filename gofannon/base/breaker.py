@@ -0,0 +1,182 @@
+"""
+Circuit breakers for upstream services.
+
+Every request made through the shared HTTP sessions and async client goes
+through the breaker of its service, keyed like the sessions: the tool's
+``API_SERVICE`` or the host. When too many recent requests to a service failed
+(a transport error or a 5xx response) the circuit opens, and requests fail at
+once with a retryable ``CircuitOpenError`` instead of each waiting out a
+timeout. After ``reset_timeout`` the circuit half-opens and lets a few probe
+requests through: if they succeed it closes again, otherwise it re-opens.
+
+The state of each circuit is exported as the ``gofannon_circuit_state{service}``
+gauge (0 closed, 1 open, 2 half-open), alongside
+``gofannon_circuit_rejections_total{service}``.
+"""
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+
+from . import metrics
+
+CLOSED, OPEN, HALF_OPEN = "closed", "open", "half_open"
+_STATE_VALUES = {CLOSED: 0, OPEN: 1, HALF_OPEN: 2}
+
+
+class CircuitOpenError(Exception):
+    """A request was refused because the circuit of its service is open."""
+    retryable = True
+    # Retrying within the same call would only wait out the open circuit.
+    fail_fast = True
+
+    def __init__(self, service, retry_after):
+        super().__init__(f"Circuit for {service} is open; retry in {retry_after:.1f}s")
+        self.service = service
+        self.retry_after = retry_after
+
+
+@dataclass(frozen=True)
+class BreakerPolicy:
+    """
+    When a circuit opens and how it recovers.
+
+    Args:
+        failure_rate: Fraction of failed requests, among the last ``window``,
+            that opens the circuit.
+        window: Number of recent requests the failure rate is computed over.
+        min_requests: Requests needed in the window before it can open.
+        reset_timeout: Seconds the circuit stays open before half-opening.
+        half_open_probes: Requests let through while half-open; the circuit
+            closes once they all succeed.
+    """
+    failure_rate: float = 0.5
+    window: int = 20
+    min_requests: int = 10
+    reset_timeout: float = 30.0
+    half_open_probes: int = 1
+
+
+DEFAULT_BREAKER_POLICY = BreakerPolicy()
+
+
+def is_failure(status_code):
+    """Whether a response status counts against its service."""
+    return isinstance(status_code, int) and status_code >= 500
+
+
+class CircuitBreaker:
+    """Thread-safe breaker of one service."""
+    clock = staticmethod(time.monotonic)
+
+    def __init__(self, service, policy=DEFAULT_BREAKER_POLICY):
+        self.service = service
+        self.policy = policy
+        self.state = CLOSED
+        self._outcomes = deque(maxlen=policy.window)
+        self._opened_at = 0.0
+        self._probes = 0
+        self._probe_successes = 0
+        self._lock = threading.Lock()
+        self._export()
+
+    def _export(self):
+        metrics.get_registry().set_gauge("gofannon_circuit_state", _STATE_VALUES[self.state],
+                                         service=self.service)
+
+    def _transition(self, state):
+        self.state = state
+        if state == OPEN:
+            self._opened_at = self.clock()
+        elif state == HALF_OPEN:
+            self._probes = self._probe_successes = 0
+        else:
+            self._outcomes.clear()
+        self._export()
+
+    def before_request(self):
+        """Raise ``CircuitOpenError`` unless a request may go out now."""
+        with self._lock:
+            if self.state == OPEN:
+                remaining = self._opened_at + self.policy.reset_timeout - self.clock()
+                if remaining > 0:
+                    self._reject(remaining)
+                self._transition(HALF_OPEN)
+            if self.state == HALF_OPEN:
+                if self._probes >= self.policy.half_open_probes:
+                    self._reject(0.0)
+                self._probes += 1
+
+    def cancel(self):
+        """Give back a request allowed by ``before_request`` that never went out."""
+        with self._lock:
+            if self.state == HALF_OPEN and self._probes:
+                self._probes -= 1
+
+    def _reject(self, retry_after):
+        metrics.get_registry().inc("gofannon_circuit_rejections_total", service=self.service)
+        raise CircuitOpenError(self.service, retry_after)
+
+    def record(self, failed):
+        """Report the outcome of a request allowed by ``before_request``."""
+        with self._lock:
+            if self.state == HALF_OPEN:
+                if failed:
+                    self._transition(OPEN)
+                else:
+                    self._probe_successes += 1
+                    if self._probe_successes >= self.policy.half_open_probes:
+                        self._transition(CLOSED)
+                return
+            if self.state == OPEN:
+                return
+            self._outcomes.append(failed)
+            if (len(self._outcomes) >= self.policy.min_requests
+                    and sum(self._outcomes) >= self.policy.failure_rate * len(self._outcomes)):
+                self._transition(OPEN)
+
+
+_policies = {}
+_host_aliases = {}
+_breakers = {}
+_breakers_lock = threading.Lock()
+
+
+def configure_breaker(service, policy, *, hosts=()):
+    """
+    Use ``policy`` for the circuit of ``service`` (an ``API_SERVICE`` or a
+    host). ``hosts`` share the circuit of ``service`` for requests that are
+    only keyed by host, such as those of the shared async client. Pass
+    ``policy=None`` to restore the default; a ``failure_rate`` above 1 keeps
+    the circuit closed for good.
+    """
+    with _breakers_lock:
+        for host, target in list(_host_aliases.items()):
+            if target == service:
+                del _host_aliases[host]
+        if policy is None:
+            _policies.pop(service, None)
+        else:
+            _policies[service] = policy
+            for host in hosts:
+                _host_aliases[host] = service
+        _breakers.pop(service, None)
+
+
+def get_breaker(key):
+    """The breaker of a service key or host, created on first use."""
+    key = _host_aliases.get(key, key)
+    breaker = _breakers.get(key)
+    if breaker is None:
+        with _breakers_lock:
+            breaker = _breakers.get(key)
+            if breaker is None:
+                policy = _policies.get(key, DEFAULT_BREAKER_POLICY)
+                breaker = _breakers[key] = CircuitBreaker(key, policy)
+    return breaker
+
+
+def reset_breakers():
+    """Forget the state of every circuit."""
+    with _breakers_lock:
+        _breakers.clear()
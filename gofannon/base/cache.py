@@ -0,0 +1,250 @@
+"""
+Result caching for idempotent tools.
+
+A tool opts in by declaring a ``cache_policy`` class attribute::
+
+    @FunctionRegistry.register
+    class WikipediaLookup(BaseTool):
+        cache_policy = CachePolicy(ttl=3600)
+
+``BaseTool.execute`` and ``execute_async`` then look results up in the tool's
+cache before calling ``fn``. Tools that change state declare ``mutating = True``
+and are never cached, whatever their policy says.
+"""
+import copy
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_DISK_PATH = Path(
+    os.getenv("GOFANNON_CACHE_DIR", str(Path.home() / ".cache" / "gofannon"))
+)
+
+
+@dataclass(frozen=True)
+class CachePolicy:
+    """
+    How a tool's results are cached.
+
+    Args:
+        ttl: Seconds a result stays valid; ``None`` means until evicted.
+        max_entries: Maximum number of results kept in memory.
+        max_bytes: Maximum total (JSON-encoded) size of the results kept in
+            memory; ``None`` means unbounded.
+        key_args: Names of the arguments that form the cache key; ``None``
+            means all of them.
+        disk: Also persist results under ``disk_path`` so they survive the
+            process. Only JSON-serializable results are written.
+        disk_path: Root directory of the on-disk store.
+        cache_if: Predicate deciding whether a result may be cached, for tools
+            that report errors in their return value instead of raising.
+    """
+    ttl: Optional[float] = 300
+    max_entries: int = 256
+    max_bytes: Optional[int] = None
+    key_args: Optional[Tuple[str, ...]] = None
+    disk: bool = False
+    disk_path: Optional[Path] = None
+    cache_if: Optional[Callable[[Any], bool]] = None
+
+
+def _encode(value):
+    return json.dumps(value, sort_keys=True, separators=(",", ":"), default=repr)
+
+
+_IMMUTABLE = (str, bytes, int, float, bool, type(None))
+
+
+def _detach(value):
+    """
+    A copy of ``value`` that callers may mutate without changing the cached
+    result; immutable values are returned as they are.
+    """
+    if isinstance(value, _IMMUTABLE):
+        return value
+    return copy.deepcopy(value)
+
+
+def make_key(namespace, arguments, key_args=None, scope=None):
+    """
+    Canonical key for ``arguments``: argument order and formatting don't matter.
+
+    ``scope`` holds instance settings that change results (credentials, base
+    URLs); it is hashed into the key, never stored.
+    """
+    if key_args is not None:
+        arguments = {k: arguments.get(k) for k in key_args}
+    digest = hashlib.sha256(_encode([arguments, scope]).encode("utf-8")).hexdigest()
+    return f"{namespace}:{digest}"
+
+
+class DiskStore:
+    """One JSON file per key under ``path``; expired entries are removed on read."""
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self.path.mkdir(parents=True, exist_ok=True)
+
+    def _file(self, key):
+        return self.path / f"{hashlib.sha256(key.encode('utf-8')).hexdigest()}.json"
+
+    def get(self, key):
+        """Return ``(hit, value, expires)``."""
+        path = self._file(key)
+        try:
+            with open(path) as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return False, None, None
+        if entry["expires"] is not None and entry["expires"] < time.time():
+            path.unlink(missing_ok=True)
+            return False, None, None
+        return True, entry["value"], entry["expires"]
+
+    def set(self, key, value, expires):
+        try:
+            payload = json.dumps({"expires": expires, "value": value})
+        except (TypeError, ValueError):
+            logger.debug("Result for %s is not JSON-serializable; not written to disk", key)
+            return
+        tmp = self._file(key).with_suffix(".tmp")
+        with open(tmp, "w") as f:
+            f.write(payload)
+        os.replace(tmp, self._file(key))
+
+    def clear(self):
+        for path in self.path.glob("*.json"):
+            path.unlink(missing_ok=True)
+
+
+class ResultCache:
+    """
+    In-memory LRU cache with TTL and entry/size bounds, optionally backed by a
+    ``DiskStore``. Safe to share between threads.
+    """
+
+    def __init__(self, policy: CachePolicy, disk_store: DiskStore = None):
+        self.policy = policy
+        self.disk_store = disk_store
+        self._entries = OrderedDict()  # key -> (expires, size, value)
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key):
+        """Return ``(hit, value)``."""
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires, size, value = entry
+                if expires is None or expires >= now:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return True, _detach(value)
+                self._remove(key)
+
+        if self.disk_store is not None:
+            hit, value, expires = self.disk_store.get(key)
+            if hit:
+                self._store(key, value, expires)
+                with self._lock:
+                    self.hits += 1
+                return True, _detach(value)
+
+        with self._lock:
+            self.misses += 1
+        return False, None
+
+    def set(self, key, value):
+        """Cache ``value``; returns the number of entries evicted to make room."""
+        expires = self._expires(time.time())
+        if self.disk_store is not None:
+            self.disk_store.set(key, value, expires)
+        return self._store(key, value, expires)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+        if self.disk_store is not None:
+            self.disk_store.clear()
+
+    def stats(self):
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+            }
+
+    def __len__(self):
+        return len(self._entries)
+
+    def _expires(self, now):
+        return None if self.policy.ttl is None else now + self.policy.ttl
+
+    def _store(self, key, value, expires):
+        size = len(_encode(value))
+        max_bytes = self.policy.max_bytes
+        if max_bytes is not None and size > max_bytes:
+            return 0
+
+        value = _detach(value)
+        evicted = 0
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (expires, size, value)
+            self._bytes += size
+            while len(self._entries) > self.policy.max_entries or (
+                max_bytes is not None and self._bytes > max_bytes
+            ):
+                self._remove(next(iter(self._entries)))
+                evicted += 1
+            self.evictions += evicted
+        return evicted
+
+    def _remove(self, key):
+        _, size, _ = self._entries.pop(key)
+        self._bytes -= size
+
+
+_caches = {}
+_caches_lock = threading.Lock()
+
+
+def get_cache(namespace, policy: CachePolicy) -> ResultCache:
+    """Return the process-wide cache of ``namespace``, created from ``policy``."""
+    cache = _caches.get(namespace)
+    if cache is None:
+        with _caches_lock:
+            cache = _caches.get(namespace)
+            if cache is None:
+                disk_store = None
+                if policy.disk:
+                    disk_store = DiskStore(Path(policy.disk_path or DEFAULT_DISK_PATH) / namespace)
+                cache = _caches[namespace] = ResultCache(policy, disk_store)
+    return cache
+
+
+def clear_caches():
+    """Empty every cache, including on-disk stores."""
+    with _caches_lock:
+        caches = list(_caches.values())
+        _caches.clear()
+    for cache in caches:
+        cache.clear()
@@ -0,0 +1,862 @@
+"""
+Checkpoint storage backends for ``WorkflowContext``.
+
+``WorkflowContext`` tracks which ``data`` keys, log entries and completed steps
+changed since its last checkpoint (see ``WorkflowContext.pending_changes``).
+``JournalCheckpointStore`` persists only those changes, so a checkpoint costs
+the size of the step that produced it rather than the size of the whole
+workflow. ``SQLiteStore`` keeps the checkpoints and saved contexts of many
+workflows in one local database.
+
+Large values are stored once, by the SHA-256 of their JSON encoding, and
+replaced by a ``{BLOB_REF: digest, "size": ...}`` reference: on disk in a
+``BlobStore`` for execution logs that spill (see ``execution_log``), and in a
+``blobs`` subcollection by ``FirestoreStore``.
+"""
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+import weakref
+from dataclasses import dataclass, field
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+BLOB_REF = "__gofannon_blob__"
+
+DEFAULT_BLOB_PATH = Path(
+    os.getenv("GOFANNON_BLOB_DIR", str(Path.home() / ".llama" / "blobs"))
+)
+
+
+def encode_value(value):
+    """The JSON form of a value that blobs are addressed by."""
+    return json.dumps(value, default=str)
+
+
+def blob_digest(encoded):
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+def blob_ref(digest, size, **extra):
+    return {BLOB_REF: digest, "size": size, **extra}
+
+
+def is_blob_ref(value):
+    return isinstance(value, dict) and BLOB_REF in value
+
+
+class BlobStore:
+    """
+    Immutable values on disk, one file per digest of their JSON encoding, so
+    identical outputs (the same file read by many steps) are stored once.
+    """
+
+    def __init__(self, path=None):
+        self.path = Path(path) if path is not None else DEFAULT_BLOB_PATH
+
+    def _file(self, digest):
+        return self.path / digest[:2] / digest
+
+    def put(self, encoded):
+        """Store the JSON string ``encoded``; returns its digest."""
+        digest = blob_digest(encoded)
+        path = self._file(digest)
+        if not path.exists():
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_name(f"{digest}.{os.getpid()}.tmp")
+            tmp.write_bytes(encoded.encode("utf-8"))
+            os.replace(tmp, path)
+        return digest
+
+    def get(self, digest):
+        return json.loads(self._file(digest).read_text(encoding="utf-8"))
+
+    def __contains__(self, digest):
+        return self._file(digest).exists()
+
+
+class TrackedDict(dict):
+    """A dict that reports every key written or removed to ``on_change``."""
+
+    def __init__(self, *args, on_change, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._on_change = on_change
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self._on_change(key)
+
+    def __delitem__(self, key):
+        super().__delitem__(key)
+        self._on_change(key)
+
+    def __ior__(self, other):
+        self.update(other)
+        return self
+
+    def update(self, *args, **kwargs):
+        for key, value in dict(*args, **kwargs).items():
+            self[key] = value
+
+    def setdefault(self, key, default=None):
+        if key not in self:
+            self[key] = default
+        return self[key]
+
+    def pop(self, key, *default):
+        had_key = key in self
+        value = super().pop(key, *default)
+        if had_key:
+            self._on_change(key)
+        return value
+
+    def popitem(self):
+        key, value = super().popitem()
+        self._on_change(key)
+        return key, value
+
+    def clear(self):
+        keys = list(self)
+        super().clear()
+        for key in keys:
+            self._on_change(key)
+
+    def __reduce__(self):
+        return (dict, (dict(self),))
+
+
+class CheckpointStore:
+    """Interface of the checkpoint backends usable with ``WorkflowContext``."""
+
+    def save(self, context, name):
+        """Persist the context's pending changes as checkpoint ``name``."""
+        raise NotImplementedError
+
+    def load(self, name):
+        """
+        Return the state saved at checkpoint ``name`` as a dict with ``data``,
+        ``execution_log`` and ``completed_steps``, or None if there is none.
+        """
+        raise NotImplementedError
+
+
+FSYNC_POLICIES = ("always", "interval", "never")
+
+
+class JournalCheckpointStore(CheckpointStore):
+    """
+    Append-only journal of context changes for one workflow, in ``directory``.
+
+    Every ``save`` appends JSON-lines records for the changed ``data`` keys,
+    new execution-log entries and completed steps, followed by a checkpoint
+    marker. Records after the last marker (e.g. from a crash mid-write) are
+    ignored when loading. Every ``compact_every`` checkpoints, or once the
+    journal exceeds ``compact_bytes``, the state is folded into a snapshot and
+    a new, empty journal is started; checkpoints before the last one are
+    then no longer available.
+
+    Args:
+        directory: Where the snapshot and journal of this workflow live.
+        fsync: ``"always"`` to fsync after every checkpoint, ``"interval"`` to
+            fsync at most every ``fsync_interval`` seconds, ``"never"`` to
+            leave it to the OS.
+        fsync_interval: Seconds between fsyncs under the ``"interval"`` policy.
+        compact_every: Checkpoints between compactions; ``None`` disables
+            count-based compaction.
+        compact_bytes: Journal size that triggers a compaction; ``None``
+            disables size-based compaction.
+    """
+
+    def __init__(self, directory, fsync="interval", fsync_interval=1.0,
+                 compact_every=100, compact_bytes=64 * 1024 * 1024):
+        if fsync not in FSYNC_POLICIES:
+            raise ValueError(f"fsync must be one of {FSYNC_POLICIES}, got {fsync!r}")
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.fsync = fsync
+        self.fsync_interval = fsync_interval
+        self.compact_every = compact_every
+        self.compact_bytes = compact_bytes
+        self._generation = self._read_snapshot().get("generation", 0)
+        self._checkpoints_since_compaction = 0
+        self._last_fsync = 0.0
+
+    @property
+    def snapshot_path(self):
+        return self.directory / "snapshot.json"
+
+    @property
+    def journal_path(self):
+        # The generation ties a journal to the snapshot it extends, so a crash
+        # between writing a snapshot and removing the old journal is harmless.
+        return self.directory / f"journal.{self._generation}.jsonl"
+
+    def save(self, context, name):
+        changes = context.pending_changes()
+        records = []
+        if changes["reset"]:
+            records.append({"op": "reset"})
+        records.extend({"op": "set", "key": k, "value": v} for k, v in changes["set"].items())
+        records.extend({"op": "del", "key": k} for k in changes["deleted"])
+        records.extend({"op": "log", "entry": entry} for entry in changes["log"])
+        if changes["steps"]:
+            records.append({"op": "steps", "steps": changes["steps"]})
+        records.append({"op": "checkpoint", "name": name, "time": time.time()})
+
+        payload = "".join(json.dumps(record) + "\n" for record in records)
+        with open(self.journal_path, "a") as f:
+            f.write(payload)
+            f.flush()
+            if self._should_fsync():
+                os.fsync(f.fileno())
+                self._last_fsync = time.monotonic()
+            size = f.tell()
+        context.mark_saved(changes)
+
+        self._checkpoints_since_compaction += 1
+        if ((self.compact_every is not None and self._checkpoints_since_compaction >= self.compact_every)
+                or (self.compact_bytes is not None and size >= self.compact_bytes)):
+            self.compact()
+
+    def _should_fsync(self):
+        if self.fsync == "always":
+            return True
+        if self.fsync == "interval":
+            return time.monotonic() - self._last_fsync >= self.fsync_interval
+        return False
+
+    def compact(self):
+        """
+        Fold the journal into a snapshot of the state at its last checkpoint.
+
+        The snapshot is replayed from the stored records rather than taken
+        from a context, whose execution log may have been truncated by its
+        ``log_retention``. Only that last checkpoint can still be loaded
+        afterwards; earlier ones are dropped.
+        """
+        _, state, latest = self._replay(None)
+        old_journal = self.journal_path
+        snapshot = {"generation": self._generation + 1, **state, "checkpoint": latest}
+        tmp = self.snapshot_path.with_suffix(".tmp")
+        with open(tmp, "w") as f:
+            json.dump(snapshot, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, self.snapshot_path)
+        self._generation += 1
+        old_journal.unlink(missing_ok=True)
+        self._checkpoints_since_compaction = 0
+        logger.debug("Compacted checkpoint journal in %s", self.directory)
+
+    def load(self, name):
+        """
+        State at the latest checkpoint ``name``, or None if there is none.
+        Checkpoints that a compaction folded into the snapshot, other than
+        the one the snapshot was taken at, are gone and return None.
+        """
+        found, _, _ = self._replay(name)
+        return found
+
+    def _replay(self, name):
+        """
+        Replay the snapshot and journal. Returns the state at the latest
+        checkpoint ``name`` (or None), the state at the last checkpoint and
+        that checkpoint's name.
+        """
+        snapshot = self._read_snapshot()
+        state = {
+            "data": snapshot.get("data", {}),
+            "execution_log": snapshot.get("execution_log", []),
+            "completed_steps": snapshot.get("completed_steps", {}),
+        }
+        latest = snapshot.get("checkpoint")
+        found = self._copy(state) if latest is not None and latest == name else None
+
+        for record in self._read_journal():
+            op = record["op"]
+            if op == "reset":
+                state = {"data": {}, "execution_log": [], "completed_steps": {}}
+            elif op == "set":
+                state["data"][record["key"]] = record["value"]
+            elif op == "del":
+                state["data"].pop(record["key"], None)
+            elif op == "log":
+                state["execution_log"].append(record["entry"])
+            elif op == "steps":
+                state["completed_steps"].update(record["steps"])
+            elif op == "checkpoint":
+                latest = record["name"]
+                if latest == name:
+                    found = self._copy(state)
+        return found, state, latest
+
+    @staticmethod
+    def _copy(state):
+        return {
+            "data": dict(state["data"]),
+            "execution_log": list(state["execution_log"]),
+            "completed_steps": dict(state["completed_steps"]),
+        }
+
+    def _read_snapshot(self):
+        try:
+            with open(self.snapshot_path) as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+
+    def _read_journal(self):
+        """Records up to the last checkpoint marker; a torn tail is dropped."""
+        try:
+            with open(self.journal_path) as f:
+                lines = f.readlines()
+        except FileNotFoundError:
+            return []
+        records = []
+        committed = 0
+        for line in lines:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                break
+            records.append(record)
+            if record["op"] == "checkpoint":
+                committed = len(records)
+        return records[:committed]
+
+
+class SQLiteStore:
+    """
+    Checkpoints and saved contexts of many workflows in one SQLite database.
+
+    A local, single-host alternative to Firestore: the database runs in WAL
+    mode so readers don't block the writer, and rows are indexed by workflow
+    id, checkpoint name and timestamp. A write is committed before
+    ``save_checkpoint`` / ``save_context`` returns, so it survives a crash of
+    the process. Writes from threads that arrive while another commit is in
+    progress are committed together in one transaction (at most
+    ``batch_size`` writes), so concurrent workflows share the cost of a
+    commit.
+
+    ``get_context`` / ``save_context`` mirror ``FirebaseWrapper``;
+    ``workflow(workflow_id)`` returns a ``CheckpointStore`` for
+    ``WorkflowContext(checkpoint_store=...)``.
+    """
+
+    def __init__(self, path=None, batch_size=64, timeout=30.0):
+        self.path = Path(path) if path is not None else Path.home() / ".llama" / "gofannon.db"
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.batch_size = batch_size
+        # ``_lock`` serializes use of the connection; ``_queue_lock`` only
+        # guards the queue, so writers can join it while a commit runs.
+        self._lock = threading.Lock()
+        self._queue_lock = threading.Lock()
+        self._pending = []
+        # Writes are numbered as they are queued; ``_committed`` is the
+        # number of the last one committed.
+        self._queued = 0
+        self._committed = 0
+        # Number of a write whose transaction failed -> the error.
+        self._failed = {}
+        self._conn = sqlite3.connect(str(self.path), timeout=timeout,
+                                     check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript("""
+            CREATE TABLE IF NOT EXISTS checkpoints (
+                workflow_id TEXT NOT NULL,
+                name TEXT NOT NULL,
+                created REAL NOT NULL,
+                state TEXT NOT NULL,
+                PRIMARY KEY (workflow_id, name)
+            );
+            CREATE INDEX IF NOT EXISTS checkpoints_created
+                ON checkpoints (workflow_id, created);
+            CREATE TABLE IF NOT EXISTS workflows (
+                workflow_id TEXT PRIMARY KEY,
+                updated REAL NOT NULL,
+                state TEXT NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS workflows_updated ON workflows (updated);
+        """)
+
+    def workflow(self, workflow_id):
+        """Checkpoint store for one workflow, backed by this database."""
+        return SQLiteCheckpointStore(self, workflow_id)
+
+    @staticmethod
+    def _state(context):
+        return json.dumps({
+            "data": context.data,
+            "execution_log": list(context.execution_log),
+            "completed_steps": context.completed_steps,
+        })
+
+    def save_checkpoint(self, workflow_id, name, context):
+        self._write(
+            "INSERT INTO checkpoints (workflow_id, name, created, state) VALUES (?, ?, ?, ?) "
+            "ON CONFLICT (workflow_id, name) DO UPDATE "
+            "SET created = excluded.created, state = excluded.state",
+            (workflow_id, name, time.time(), self._state(context)),
+        )
+
+    def load_checkpoint(self, workflow_id, name):
+        row = self._read_one(
+            "SELECT state FROM checkpoints WHERE workflow_id = ? AND name = ?",
+            (workflow_id, name),
+        )
+        return json.loads(row[0]) if row else None
+
+    def list_checkpoints(self, workflow_id, since=None):
+        """``(name, created)`` pairs of a workflow's checkpoints, oldest first."""
+        with self._lock:
+            return self._conn.execute(
+                "SELECT name, created FROM checkpoints "
+                "WHERE workflow_id = ? AND created >= ? ORDER BY created, rowid",
+                (workflow_id, since if since is not None else float("-inf")),
+            ).fetchall()
+
+    def save_context(self, workflow_id, context):
+        self._write(
+            "INSERT INTO workflows (workflow_id, updated, state) VALUES (?, ?, ?) "
+            "ON CONFLICT (workflow_id) DO UPDATE "
+            "SET updated = excluded.updated, state = excluded.state",
+            (workflow_id, time.time(), self._state(context)),
+        )
+
+    def get_context(self, workflow_id):
+        """
+        The context last saved for ``workflow_id`` (or a fresh one), with its
+        checkpoints going to this database.
+        """
+        from . import WorkflowContext
+
+        context = WorkflowContext(checkpoint_store=self.workflow(workflow_id))
+        row = self._read_one("SELECT state FROM workflows WHERE workflow_id = ?", (workflow_id,))
+        if row:
+            state = json.loads(row[0])
+            context.data = state.get("data", {})
+            context.execution_log = state.get("execution_log", [])
+            context.completed_steps = state.get("completed_steps", {})
+        return context
+
+    def _write(self, sql, params):
+        """Queue a write and return once it is committed."""
+        with self._queue_lock:
+            self._pending.append((sql, params))
+            self._queued += 1
+            ticket = self._queued
+        with self._lock:
+            # A commit that ran while we waited for the lock may have
+            # included this write already.
+            while self._committed < ticket:
+                self._commit_locked()
+            error = self._failed.pop(ticket, None)
+        if error is not None:
+            raise error
+
+    def _commit_locked(self):
+        with self._queue_lock:
+            batch = self._pending[:self.batch_size]
+            del self._pending[:len(batch)]
+        first = self._committed + 1
+        self._committed += len(batch)
+        try:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                for sql, params in batch:
+                    self._conn.execute(sql, params)
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._conn.execute("COMMIT")
+        except Exception as e:
+            # Every write of the transaction was lost; each writer sees why.
+            for ticket in range(first, self._committed + 1):
+                self._failed[ticket] = e
+            return
+        logger.debug("Committed %d checkpoint writes to %s", len(batch), self.path)
+
+    def _read_one(self, sql, params):
+        with self._lock:
+            return self._conn.execute(sql, params).fetchone()
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+class SQLiteCheckpointStore(CheckpointStore):
+    """The checkpoints of one workflow in a ``SQLiteStore``."""
+
+    def __init__(self, db, workflow_id):
+        self.db = db
+        self.workflow_id = workflow_id
+
+    def save(self, context, name):
+        self.db.save_checkpoint(self.workflow_id, name, context)
+
+    def load(self, name):
+        return self.db.load_checkpoint(self.workflow_id, name)
+
+
+class _Writes(list):
+    """Pending Firestore writes, plus the blobs among them."""
+
+    def __init__(self):
+        super().__init__()
+        self.blobs = set()
+
+
+@dataclass
+class _SinceCheckpoint:
+    """What changed in a workflow document since its last checkpoint."""
+    seq: int
+    reset: bool = False
+    keys: set = field(default_factory=set)
+    steps: set = field(default_factory=set)
+
+
+class FirestoreStore:
+    """
+    Workflow contexts and checkpoints in Firestore, written as deltas.
+
+    Each workflow is a document in ``collection`` holding ``data`` and
+    ``completed_steps`` as maps. Saving a context the store has saved before
+    sends only the changed fields via ``update``; execution-log entries go to
+    an ``execution_log`` subcollection, one document per entry, written in
+    batches of at most ``batch_size`` writes. Checkpoints go to a
+    ``checkpoints`` subcollection in order, each holding only the ``data``
+    items and completed steps changed since the previous one (the first one
+    a process writes for a workflow holds them all); loading a checkpoint
+    replays them. When the values of a document
+    (``data`` items, log inputs and outputs) would take more than
+    ``max_document_bytes`` in JSON form, the largest ones are moved to a
+    content-addressed ``blobs`` subcollection, split into chunks below
+    Firestore's 1 MiB document limit, and replaced by a reference; the
+    default leaves headroom for ``completed_steps`` and the other fields.
+
+    ``client`` defaults to ``firebase_admin.firestore.client()``.
+    """
+
+    CHUNK_BYTES = 512 * 1024
+
+    def __init__(self, client=None, collection="workflows", batch_size=400,
+                 max_document_bytes=960 * 1024):
+        self._client = client
+        self.collection = collection
+        self.batch_size = batch_size
+        self.max_document_bytes = max_document_bytes
+        self._lock = threading.Lock()
+        # Context -> id of the document it was last read from or saved to;
+        # deltas are only valid against that document.
+        self._synced = weakref.WeakKeyDictionary()
+        self._stored_blobs = set()
+        # Document id -> changes since the last checkpoint this store wrote.
+        self._since_checkpoint = {}
+        # Document id -> stored size of each of its ``data`` items.
+        self._data_sizes = {}
+
+    @property
+    def client(self):
+        if self._client is None:
+            from firebase_admin import firestore
+
+            self._client = firestore.client()
+        return self._client
+
+    def workflow(self, doc_id):
+        """Checkpoint store for one workflow document."""
+        return FirestoreCheckpointStore(self, doc_id)
+
+    def _doc(self, doc_id):
+        return self.client.collection(self.collection).document(doc_id)
+
+    def save_context(self, doc_id, context):
+        writes, changes, log_length, doc_write, sizes = self._context_writes(doc_id, context)
+        if doc_write is not None:
+            writes.append(doc_write)
+        self._commit(writes)
+        self._saved(doc_id, context, changes, sizes)
+        return log_length
+
+    def _context_writes(self, doc_id, context):
+        """
+        The writes saving ``context`` to ``doc_id``: log entries and blobs,
+        plus the write of the workflow document itself (None if unchanged),
+        which the caller commits last so that the document never points past
+        log entries or blobs that have not been written yet.
+        """
+        from firebase_admin import firestore
+
+        doc_ref = self._doc(doc_id)
+        with self._lock:
+            full = self._synced.get(context) != doc_id
+        changes = context.pending_changes()
+        if full and not changes["reset"]:
+            # Saved elsewhere since: the document needs the whole state.
+            changes = dict(changes, reset=True, set=dict(context.data), deleted=[],
+                           log=list(context.execution_log),
+                           steps=dict(context.completed_steps))
+        log_start = changes["log_end"] - len(changes["log"])
+
+        writes = _Writes()
+        log_ref = doc_ref.collection("execution_log")
+        for seq, entry in enumerate(changes["log"], start=log_start):
+            # Values the log spilled to local disk go to the document's blobs.
+            values = {name: context.resolve_blob(entry[name])
+                      for name in ("input", "output") if name in entry}
+            rest = {k: v for k, v in entry.items() if k not in values}
+            values, _ = self._fit(doc_ref, values, writes,
+                                  self.max_document_bytes - len(encode_value(rest)))
+            entry = dict(rest, **values)
+            writes.append(("set", log_ref.document(f"{seq:012d}"), dict(entry, seq=seq)))
+
+        log_length = log_start + len(changes["log"])
+        doc_write = None
+        if changes["reset"]:
+            data, sizes = self._fit(doc_ref, changes["set"], writes, self.max_document_bytes)
+            fields = {
+                "data": data,
+                "completed_steps": changes["steps"],
+                "execution_log_length": log_length,
+                "timestamp": firestore.SERVER_TIMESTAMP,
+            }
+            doc_write = ("set", doc_ref, fields)
+        elif changes["set"] or changes["deleted"] or changes["log"] or changes["steps"]:
+            fields = {"execution_log_length": log_length, "timestamp": firestore.SERVER_TIMESTAMP}
+            with self._lock:
+                sizes = self._data_sizes.get(doc_id)
+            if sizes is None:
+                # Read from elsewhere: estimate from the values themselves.
+                sizes = {k: len(k) + len(encode_value(v)) for k, v in context.data.items()}
+            sizes = {k: size for k, size in sizes.items()
+                     if k not in changes["set"] and k not in changes["deleted"]}
+            data, changed_sizes = self._fit(doc_ref, changes["set"], writes,
+                                            self.max_document_bytes - sum(sizes.values()))
+            sizes.update(changed_sizes)
+            for key, value in data.items():
+                fields[firestore.FieldPath("data", key).to_api_repr()] = value
+            for key in changes["deleted"]:
+                fields[firestore.FieldPath("data", key).to_api_repr()] = firestore.DELETE_FIELD
+            for key, value in changes["steps"].items():
+                fields[firestore.FieldPath("completed_steps", key).to_api_repr()] = value
+            doc_write = ("update", doc_ref, fields)
+        else:
+            sizes = None
+        return writes, changes, log_length, doc_write, sizes
+
+    def _saved(self, doc_id, context, changes, sizes, checkpoint_seq=None):
+        context.mark_saved(changes)
+        with self._lock:
+            self._synced[context] = doc_id
+            if sizes is not None:
+                self._data_sizes[doc_id] = sizes
+            if checkpoint_seq is not None:
+                self._since_checkpoint[doc_id] = _SinceCheckpoint(checkpoint_seq)
+                return
+            since = self._since_checkpoint.get(doc_id)
+            if since is None:
+                return
+            if changes["reset"]:
+                since.reset = True
+            since.keys.update(changes["set"], changes["deleted"])
+            since.steps.update(changes["steps"])
+
+    def get_context(self, doc_id):
+        """
+        The context saved as ``doc_id`` (or a fresh one), with its checkpoints
+        going to the same document.
+        """
+        from . import WorkflowContext
+
+        context = WorkflowContext(firebase_config=True, checkpoint_store=self.workflow(doc_id))
+        state = self.get_state(doc_id)
+        if state is not None:
+            context.data = state["data"]
+            context.execution_log = state["execution_log"]
+            context.completed_steps = state["completed_steps"]
+            context.mark_saved(context.pending_changes())
+            with self._lock:
+                self._synced[context] = doc_id
+                self._data_sizes.pop(doc_id, None)
+        return context
+
+    def get_state(self, doc_id):
+        """``data``, ``execution_log`` and ``completed_steps`` of ``doc_id``, or None."""
+        doc_ref = self._doc(doc_id)
+        snapshot = doc_ref.get()
+        if not snapshot.exists:
+            return None
+        return self._read_state(doc_ref, snapshot.to_dict())
+
+    def save_checkpoint(self, doc_id, name, context):
+        """
+        Save ``context`` to ``doc_id`` and record checkpoint ``name`` in its
+        ``checkpoints`` subcollection, with the changes since the previous
+        checkpoint. Checkpoints refer to the shared execution log by length
+        instead of copying it.
+        """
+        from firebase_admin import firestore
+
+        doc_ref = self._doc(doc_id)
+        writes, changes, log_length, doc_write, sizes = self._context_writes(doc_id, context)
+        with self._lock:
+            since = self._since_checkpoint.get(doc_id)
+        if since is None:
+            seq = self._last_checkpoint_seq(doc_ref) + 1
+            reset = True
+        else:
+            seq = since.seq + 1
+            reset = since.reset or changes["reset"]
+
+        data = context.data
+        if reset:
+            keys, steps = set(data), dict(context.completed_steps)
+        else:
+            keys = since.keys | set(changes["set"]) | set(changes["deleted"])
+            steps = {k: context.completed_steps[k]
+                     for k in since.steps | set(changes["steps"])}
+        writes.append(("set", doc_ref.collection("checkpoints").document(f"{seq:012d}"), {
+            "name": name,
+            "seq": seq,
+            "reset": reset,
+            "data": self._fit(doc_ref, {k: data[k] for k in keys if k in data}, writes,
+                              self.max_document_bytes)[0],
+            "deleted": [k for k in keys if k not in data],
+            "completed_steps": steps,
+            "execution_log_length": log_length,
+            "timestamp": firestore.SERVER_TIMESTAMP,
+        }))
+        if doc_write is None:
+            doc_write = ("update", doc_ref, {})
+        doc_write[2]["checkpoint_seq"] = seq
+        writes.append(doc_write)
+        self._commit(writes)
+        self._saved(doc_id, context, changes, sizes, checkpoint_seq=seq)
+
+    @staticmethod
+    def _last_checkpoint_seq(doc_ref):
+        snapshot = doc_ref.get()
+        return snapshot.to_dict().get("checkpoint_seq", 0) if snapshot.exists else 0
+
+    def _commit(self, writes):
+        for start in range(0, len(writes), self.batch_size):
+            batch = self.client.batch()
+            for op, ref, fields in writes[start:start + self.batch_size]:
+                getattr(batch, op)(ref, fields)
+            batch.commit()
+        with self._lock:
+            self._stored_blobs.update(writes.blobs)
+
+    def load_checkpoint(self, doc_id, name):
+        """The state at the latest checkpoint ``name`` of ``doc_id``, or None."""
+        doc_ref = self._doc(doc_id)
+        checkpoints = doc_ref.collection("checkpoints")
+        records = [snapshot.to_dict() for snapshot in checkpoints.order_by("seq").stream()]
+        matches = [i for i, record in enumerate(records) if record.get("name") == name]
+        if not matches:
+            # Checkpoints written before they were deltas are named by ``name``.
+            snapshot = checkpoints.document(name).get()
+            return self._read_state(doc_ref, snapshot.to_dict()) if snapshot.exists else None
+        end = matches[-1]
+        start = max(i for i in range(end + 1) if records[i].get("reset"))
+        data, steps = {}, {}
+        for record in records[start:end + 1]:
+            data.update(record.get("data", {}))
+            for key in record.get("deleted", []):
+                data.pop(key, None)
+            steps.update(record.get("completed_steps", {}))
+        return self._read_state(doc_ref, {
+            "data": data,
+            "completed_steps": steps,
+            "execution_log_length": records[end]["execution_log_length"],
+        })
+
+    def _read_state(self, doc_ref, fields):
+        blobs = {}
+        if "execution_log" in fields:
+            # Documents written before the log moved to a subcollection.
+            log = fields["execution_log"]
+        else:
+            length = fields.get("execution_log_length", 0)
+            query = doc_ref.collection("execution_log").order_by("seq").limit(length)
+            log = []
+            for entry_snapshot in query.stream():
+                entry = entry_snapshot.to_dict()
+                entry.pop("seq", None)
+                for field in ("input", "output"):
+                    if field in entry:
+                        entry[field] = self._restore(doc_ref, entry[field], blobs)
+                log.append(entry)
+        return {
+            "data": {k: self._restore(doc_ref, v, blobs) for k, v in fields.get("data", {}).items()},
+            "execution_log": log,
+            "completed_steps": fields.get("completed_steps", {}),
+        }
+
+    def _fit(self, doc_ref, values, writes, budget):
+        """
+        ``values`` with the largest ones moved to blobs until their JSON form,
+        keys included, fits in ``budget`` bytes; returns them and the stored
+        size of each.
+        """
+        encoded = {k: encode_value(v) for k, v in values.items()}
+        sizes = {k: len(k) + len(e) for k, e in encoded.items()}
+        stored = dict(values)
+        total = sum(sizes.values())
+        for key in sorted(sizes, key=sizes.get, reverse=True):
+            if total <= budget:
+                break
+            stored[key] = self._store_blob(doc_ref, encoded[key], writes)
+            ref_size = len(key) + len(encode_value(stored[key]))
+            total += ref_size - sizes[key]
+            sizes[key] = ref_size
+        return stored, sizes
+
+    def _store_blob(self, doc_ref, encoded, writes):
+        digest = blob_digest(encoded)
+        key = (doc_ref.path, digest)
+        with self._lock:
+            stored = key in self._stored_blobs
+        if not stored and key not in writes.blobs:
+            writes.blobs.add(key)
+            blobs = doc_ref.collection("blobs")
+            chunks = [encoded[i:i + self.CHUNK_BYTES]
+                      for i in range(0, len(encoded), self.CHUNK_BYTES)]
+            for i, chunk in enumerate(chunks):
+                writes.append(("set", blobs.document(f"{digest}.{i}"), {"chunk": chunk}))
+            writes.append(("set", blobs.document(digest), {"chunks": len(chunks)}))
+        return blob_ref(digest, len(encoded))
+
+    def _restore(self, doc_ref, value, blobs):
+        if not is_blob_ref(value):
+            return value
+        digest = value[BLOB_REF]
+        if digest not in blobs:
+            collection = doc_ref.collection("blobs")
+            chunks = collection.document(digest).get().to_dict()["chunks"]
+            blobs[digest] = json.loads("".join(
+                collection.document(f"{digest}.{i}").get().to_dict()["chunk"]
+                for i in range(chunks)
+            ))
+        return blobs[digest]
+
+
+class FirestoreCheckpointStore(CheckpointStore):
+    """The checkpoints of one workflow document in a ``FirestoreStore``."""
+
+    def __init__(self, db, doc_id):
+        self.db = db
+        self.doc_id = doc_id
+
+    def save(self, context, name):
+        self.db.save_checkpoint(self.doc_id, name, context)
+
+    def load(self, name):
+        return self.db.load_checkpoint(self.doc_id, name)
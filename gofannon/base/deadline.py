@@ -0,0 +1,106 @@
+"""
+Per-call time limits for tools.
+
+``BaseTool.execute(context, timeout=...)`` and ``execute_async(arguments,
+timeout=...)`` (or a tool's ``timeout`` class attribute) bound how long a call
+may take, retries included. When the time is up the call returns a retryable
+``ToolResult`` (``execute``) or raises ``ToolTimeoutError``
+(``execute_async``):
+
+- async tools (``afn`` or coroutine ``fn``) are cancelled;
+- sync tools, which Python cannot interrupt, are abandoned: their thread keeps
+  running in the background and its result is dropped.
+
+The deadline is also visible to the code running inside the call, so that it
+can stop cooperatively: requests through the shared HTTP sessions never wait
+past it, retries are not attempted once their backoff would overrun it, and
+long-running tools can call ``check()`` between steps.
+"""
+import asyncio
+import contextvars
+import threading
+import time
+from contextlib import contextmanager
+
+# Absolute ``time.monotonic()`` by which the current call must finish.
+_deadline = contextvars.ContextVar("gofannon_deadline", default=None)
+
+
+class ToolTimeoutError(TimeoutError):
+    """A tool call ran out of time."""
+    retryable = True
+    # Retrying within the call would only run further past its deadline.
+    fail_fast = True
+
+
+def remaining():
+    """Seconds left before the current deadline, or None without one."""
+    deadline = _deadline.get()
+    if deadline is None:
+        return None
+    return deadline - time.monotonic()
+
+
+def check():
+    """Raise ``ToolTimeoutError`` if the current deadline has passed."""
+    left = remaining()
+    if left is not None and left <= 0:
+        raise ToolTimeoutError("Deadline exceeded")
+
+
+@contextmanager
+def scope(timeout):
+    """Run the body under a deadline ``timeout`` seconds from now (or an earlier, enclosing one)."""
+    if timeout is None:
+        yield
+        return
+    deadline = time.monotonic() + timeout
+    current = _deadline.get()
+    token = _deadline.set(deadline if current is None else min(current, deadline))
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
+
+
+def call_with_timeout(fn, timeout, name="call"):
+    """
+    Run ``fn()`` in a daemon thread and wait at most ``timeout`` seconds for
+    it. Raises ``ToolTimeoutError`` if it doesn't finish in time, leaving the
+    thread to finish (and its result to be dropped) in the background.
+    """
+    if timeout is None:
+        return fn()
+    outcome = {}
+    done = threading.Event()
+
+    def run():
+        try:
+            with scope(timeout):
+                outcome["result"] = fn()
+        except BaseException as e:
+            outcome["error"] = e
+        finally:
+            done.set()
+
+    context = contextvars.copy_context()
+    threading.Thread(target=context.run, args=(run,), name=f"gofannon-{name}",
+                     daemon=True).start()
+    if not done.wait(timeout):
+        raise ToolTimeoutError(f"{name} timed out after {timeout:g}s")
+    if "error" in outcome:
+        raise outcome["error"]
+    return outcome["result"]
+
+
+async def await_with_timeout(awaitable, timeout, name="call"):
+    """Await ``awaitable``, cancelling it after ``timeout`` seconds with ``ToolTimeoutError``."""
+    if timeout is None:
+        return await awaitable
+    with scope(timeout):
+        try:
+            return await asyncio.wait_for(awaitable, timeout)
+        except ToolTimeoutError:
+            raise
+        except asyncio.TimeoutError:
+            raise ToolTimeoutError(f"{name} timed out after {timeout:g}s") from None
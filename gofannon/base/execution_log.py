@@ -0,0 +1,51 @@
+"""
+Bounded-memory execution logs.
+
+By default ``WorkflowContext`` keeps every ``log_execution`` entry, inputs and
+outputs included, for the lifetime of the context. Long-running agents that
+read repositories or PDFs pass a retention policy instead::
+
+    context = WorkflowContext(log_retention=LogRetention(max_entries=1000))
+
+Only the ``max_entries`` most recent entries stay in memory, and inputs or
+outputs larger than ``spill_bytes`` are written once to a content-addressed
+``BlobStore`` on disk (shared with ``checkpoints``); the entry keeps a reference with their size and a short
+preview, which ``WorkflowContext.resolve_blob`` turns back into the value.
+"""
+import logging
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
+
+# Spilled values use the blob store and references of the checkpoint backends.
+from .checkpoints import BLOB_REF, BlobStore, blob_ref, encode_value, is_blob_ref  # noqa: F401
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class LogRetention:
+    """
+    How much of the execution log a ``WorkflowContext`` keeps in memory.
+
+    Args:
+        max_entries: Number of most recent entries kept; ``None`` keeps all.
+        spill_bytes: Inputs and outputs whose JSON form is larger than this
+            are moved to the blob store; ``None`` keeps them inline.
+        blob_path: Root directory of the blob store.
+        preview_chars: Length of the preview kept in place of a spilled value.
+    """
+    max_entries: Optional[int] = 1000
+    spill_bytes: Optional[int] = 16 * 1024
+    blob_path: Optional[Path] = None
+    preview_chars: int = 200
+
+
+def spill(value, retention, blobs):
+    """``value``, or a blob reference if it is larger than the policy allows."""
+    if retention.spill_bytes is None:
+        return value
+    encoded = encode_value(value)
+    if len(encoded) <= retention.spill_bytes:
+        return value
+    return blob_ref(blobs.put(encoded), len(encoded), preview=encoded[:retention.preview_chars])
@@ -0,0 +1,238 @@
+"""
+Shared HTTP clients for gofannon tools.
+
+Sync tools should make their requests through ``get_session`` (usually via
+``BaseTool.http_session``) rather than the module-level ``requests`` helpers,
+so that connections are kept alive and pooled per service. Native async tools
+(those implementing ``afn``) should obtain their client from
+``get_async_client`` (usually via ``BaseTool.async_http_client``) instead of
+creating their own, so that every in-flight call on an event loop shares one
+connection pool per service. Both resolve a request to the same key, so sync
+and async calls to a service share its rate limit and circuit breaker.
+"""
+import asyncio
+import os
+import threading
+import weakref
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from . import breaker, deadline, ratelimit, tracing
+
+DEFAULT_TIMEOUT = float(os.getenv("GOFANNON_HTTP_TIMEOUT", "30"))
+DEFAULT_MAX_CONNECTIONS = int(os.getenv("GOFANNON_HTTP_MAX_CONNECTIONS", "100"))
+DEFAULT_MAX_KEEPALIVE = int(os.getenv("GOFANNON_HTTP_MAX_KEEPALIVE", "20"))
+DEFAULT_POOL_CONNECTIONS = int(os.getenv("GOFANNON_HTTP_POOL_CONNECTIONS", "10"))
+
+# Headers sent on every request of a service, before per-call headers.
+SERVICE_HEADERS = {
+    "github": {"Accept": "application/vnd.github.v3+json"},
+}
+
+_sessions = {}
+_session_settings = {}
+_sessions_lock = threading.Lock()
+
+
+class PooledSession(requests.Session):
+    """
+    A ``requests.Session`` that applies a default timeout to every request
+    (capped by the deadline of the calling tool, see ``deadline``), waits for
+    the rate limit of its ``key`` (see ``ratelimit``) and fails fast while the
+    circuit of its ``key`` is open (see ``breaker``).
+    """
+
+    def __init__(self, timeout=DEFAULT_TIMEOUT, key=None):
+        super().__init__()
+        self.timeout = timeout
+        self.key = key
+
+    def request(self, method, url, **kwargs):
+        kwargs.setdefault("timeout", self.timeout)
+        left = deadline.remaining()
+        if left is not None:
+            # Never wait past the deadline of the tool call making the request.
+            deadline.check()
+            if kwargs["timeout"] is None or isinstance(kwargs["timeout"], (int, float)):
+                kwargs["timeout"] = left if kwargs["timeout"] is None else min(kwargs["timeout"], left)
+        host = urlparse(url).hostname
+        circuit = breaker.get_breaker(self.key or host)
+        circuit.before_request()
+        limiter = ratelimit.limiter_for(self.key, host)
+        if limiter is not None:
+            try:
+                # Queue for a token only as long as the deadline allows.
+                limiter.acquire(timeout=left)
+            except BaseException:
+                circuit.cancel()
+                raise
+        # Query strings are left out of spans: some APIs take keys there.
+        with tracing.span(f"HTTP {method}", "http", url=url.split("?", 1)[0]) as span:
+            try:
+                response = super().request(method, url, **kwargs)
+            except Exception:
+                circuit.record(failed=True)
+                raise
+            except BaseException:
+                circuit.cancel()
+                raise
+            circuit.record(failed=breaker.is_failure(response.status_code))
+            span.set_attribute("status_code", response.status_code)
+            return response
+
+
+def _tracing_transport(transport, key=None):
+    """
+    Wrap an ``httpx`` async transport so every request gets an HTTP span,
+    waits for the rate limit of ``key`` (or of its host) and fails fast while
+    the circuit of ``key`` (or of its host) is open, like ``PooledSession``.
+    """
+    import httpx
+
+    class TracingTransport(httpx.AsyncBaseTransport):
+        async def handle_async_request(self, request):
+            host = request.url.host
+            circuit = breaker.get_breaker(key or host)
+            circuit.before_request()
+            limiter = ratelimit.limiter_for(key, host)
+            if limiter is not None:
+                try:
+                    await limiter.acquire_async(timeout=deadline.remaining())
+                except BaseException:
+                    circuit.cancel()
+                    raise
+            url = str(request.url.copy_with(query=None))
+            with tracing.span(f"HTTP {request.method}", "http", url=url) as span:
+                try:
+                    response = await transport.handle_async_request(request)
+                except Exception:
+                    circuit.record(failed=True)
+                    raise
+                except BaseException:
+                    circuit.cancel()
+                    raise
+                circuit.record(failed=breaker.is_failure(response.status_code))
+                span.set_attribute("status_code", response.status_code)
+                return response
+
+        async def aclose(self):
+            await transport.aclose()
+
+    return TracingTransport()
+
+
+def session_key(service=None, url=None):
+    """Pool key for a request: the tool's ``API_SERVICE`` if any, else the host."""
+    if service:
+        return service
+    if url:
+        return urlparse(url).netloc
+    raise ValueError("session_key requires a service name or a URL")
+
+
+def configure_session(key, *, timeout=None, headers=None, pool_connections=None,
+                      pool_maxsize=None):
+    """
+    Set the timeout, headers and pool sizes used for the session of ``key``.
+
+    Takes effect for the next ``get_session`` call; an existing session for
+    ``key`` is closed and replaced.
+    """
+    settings = {
+        "timeout": timeout,
+        "headers": headers,
+        "pool_connections": pool_connections,
+        "pool_maxsize": pool_maxsize,
+    }
+    with _sessions_lock:
+        _session_settings[key] = {k: v for k, v in settings.items() if v is not None}
+        session = _sessions.pop(key, None)
+    if session is not None:
+        session.close()
+
+
+def _build_session(key):
+    settings = _session_settings.get(key, {})
+    session = PooledSession(timeout=settings.get("timeout", DEFAULT_TIMEOUT), key=key)
+    adapter = HTTPAdapter(
+        pool_connections=settings.get("pool_connections", DEFAULT_POOL_CONNECTIONS),
+        pool_maxsize=settings.get("pool_maxsize", DEFAULT_MAX_KEEPALIVE),
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers.update(SERVICE_HEADERS.get(key, {}))
+    session.headers.update(settings.get("headers", {}))
+    return session
+
+
+def get_session(key):
+    """Return the shared, pooled session for ``key`` (see ``session_key``)."""
+    session = _sessions.get(key)
+    if session is None:
+        with _sessions_lock:
+            session = _sessions.get(key)
+            if session is None:
+                session = _sessions[key] = _build_session(key)
+    return session
+
+
+def close_sessions():
+    """Close every shared session; new ones are created on next use."""
+    with _sessions_lock:
+        sessions = list(_sessions.values())
+        _sessions.clear()
+    for session in sessions:
+        session.close()
+
+# httpx connection pools are bound to the event loop that created them, so
+# clients are kept per running loop, one per key.
+_async_clients = weakref.WeakKeyDictionary()
+_async_client_override = None
+
+
+def get_async_client(key=None):
+    """
+    Return the shared ``httpx.AsyncClient`` of ``key`` (see ``session_key``)
+    for the running event loop. Without a key, requests are rate limited and
+    circuit broken by host.
+    """
+    if _async_client_override is not None:
+        return _async_client_override
+
+    clients = _async_clients.setdefault(asyncio.get_running_loop(), {})
+    client = clients.get(key)
+    if client is None or client.is_closed:
+        import httpx
+
+        client = httpx.AsyncClient(
+            timeout=DEFAULT_TIMEOUT,
+            transport=_tracing_transport(httpx.AsyncHTTPTransport(
+                limits=httpx.Limits(
+                    max_connections=DEFAULT_MAX_CONNECTIONS,
+                    max_keepalive_connections=DEFAULT_MAX_KEEPALIVE,
+                ),
+            ), key=key),
+            follow_redirects=True,
+        )
+        clients[key] = client
+    return client
+
+
+def set_async_client(client):
+    """
+    Use ``client`` for every async tool call, on every loop.
+
+    Mainly useful for tests (e.g. a client built on ``httpx.MockTransport``).
+    Pass ``None`` to restore the per-loop shared clients.
+    """
+    global _async_client_override
+    _async_client_override = client
+
+
+async def aclose_async_client():
+    """Close the shared clients of the running event loop, if any."""
+    clients = _async_clients.pop(asyncio.get_running_loop(), {})
+    for client in clients.values():
+        await client.aclose()
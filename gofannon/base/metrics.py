@@ -0,0 +1,273 @@
+"""
+Process-wide metrics for tool calls and LLM requests.
+
+``BaseTool.execute``/``execute_async``, the orchestrators' LLM calls and
+``ReasoningTool.get_response`` report into the default registry
+(``get_registry()``):
+
+- ``gofannon_tool_calls_total{tool, outcome}``: calls by outcome
+  (``success``/``error``), plus ``gofannon_tool_retryable_errors_total{tool}``
+  and ``gofannon_tool_retries_total{tool}`` (attempts beyond the first).
+- ``gofannon_tool_coalesced_total{tool}``: calls that shared the outcome of an
+  identical call already in flight instead of running ``fn``.
+- ``gofannon_tool_duration_seconds{tool}``: latency histogram.
+- ``gofannon_tool_request_bytes{tool}`` / ``gofannon_tool_response_bytes{tool}``:
+  size of the arguments and results (JSON-encoded; strings by length).
+- ``gofannon_tool_cache_total{tool, result}``: result-cache hits, misses and
+  evictions.
+- ``gofannon_tool_validation_seconds{tool}``: time spent checking arguments
+  against the tool's schema, and ``gofannon_tool_invalid_arguments_total{tool}``
+  for calls rejected by the check.
+- ``gofannon_llm_calls_total{model, source, outcome}``,
+  ``gofannon_llm_duration_seconds{model, source}`` and
+  ``gofannon_llm_tokens_total{model, source, kind}``.
+
+Read them with ``get_registry().snapshot()`` or expose them to Prometheus with
+``prometheus_text()`` / ``start_metrics_server()``.
+"""
+import bisect
+import json
+import logging
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+logger = logging.getLogger(__name__)
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60)
+VALIDATION_BUCKETS = (0.00001, 0.000025, 0.00005, 0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01)
+BYTES_BUCKETS = (64, 256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304, 16777216)
+
+# The clock used for every duration reported here: monotonic, high resolution.
+clock = time.perf_counter
+
+
+class Histogram:
+    """Cumulative-bucket histogram in the Prometheus sense."""
+
+    def __init__(self, buckets=LATENCY_BUCKETS):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value):
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def snapshot(self):
+        cumulative = 0
+        buckets = {}
+        for bound, count in zip(self.buckets + (float("inf"),), self.counts):
+            cumulative += count
+            buckets[bound] = cumulative
+        return {"count": self.count, "sum": self.sum, "buckets": buckets}
+
+
+def _labels_key(labels):
+    return tuple(sorted((k, str(v)) for k, v in labels.items()))
+
+
+class MetricsRegistry:
+    """Counters, gauges and histograms keyed by metric name and labels."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counters = {}
+        self._gauges = {}
+        self._histograms = {}
+        self._help = {}
+
+    def describe(self, name, text):
+        """Set the ``# HELP`` text of ``name`` in the Prometheus output."""
+        self._help[name] = text
+
+    def inc(self, name, amount=1, **labels):
+        key = (name, _labels_key(labels))
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + amount
+
+    def set_gauge(self, name, value, **labels):
+        with self._lock:
+            self._gauges[(name, _labels_key(labels))] = value
+
+    def observe(self, name, value, buckets=LATENCY_BUCKETS, **labels):
+        key = (name, _labels_key(labels))
+        with self._lock:
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                histogram = self._histograms[key] = Histogram(buckets)
+            histogram.observe(value)
+
+    def value(self, name, **labels):
+        """Current value of a counter or gauge (0 if never set)."""
+        key = (name, _labels_key(labels))
+        with self._lock:
+            if key in self._gauges:
+                return self._gauges[key]
+            return self._counters.get(key, 0)
+
+    def histogram(self, name, **labels):
+        """``count``, ``sum`` and cumulative ``buckets`` of a histogram, or None."""
+        with self._lock:
+            histogram = self._histograms.get((name, _labels_key(labels)))
+            return histogram.snapshot() if histogram else None
+
+    def snapshot(self):
+        """
+        All metrics as ``{"counters": ..., "gauges": ..., "histograms": ...}``,
+        each mapping a metric name to a list of ``{"labels": ..., ...}`` samples.
+        """
+        with self._lock:
+            counters = list(self._counters.items())
+            gauges = list(self._gauges.items())
+            histograms = [(key, h.snapshot()) for key, h in self._histograms.items()]
+        result = {"counters": {}, "gauges": {}, "histograms": {}}
+        for kind, items in (("counters", counters), ("gauges", gauges)):
+            for (name, labels), value in items:
+                result[kind].setdefault(name, []).append({"labels": dict(labels), "value": value})
+        for (name, labels), histogram in histograms:
+            result["histograms"].setdefault(name, []).append(dict(histogram, labels=dict(labels)))
+        return result
+
+    def reset(self):
+        with self._lock:
+            self._counters.clear()
+            self._gauges.clear()
+            self._histograms.clear()
+
+    def prometheus_text(self):
+        """The registry in the Prometheus text exposition format (0.0.4)."""
+        snapshot = self.snapshot()
+        lines = []
+        for kind, prom_type in (("counters", "counter"), ("gauges", "gauge")):
+            for name, samples in sorted(snapshot[kind].items()):
+                self._header(lines, name, prom_type)
+                for sample in samples:
+                    lines.append(f"{name}{_format_labels(sample['labels'])} {_format_value(sample['value'])}")
+        for name, samples in sorted(snapshot["histograms"].items()):
+            self._header(lines, name, "histogram")
+            for sample in samples:
+                for bound, count in sample["buckets"].items():
+                    labels = dict(sample["labels"], le=_format_value(bound))
+                    lines.append(f"{name}_bucket{_format_labels(labels)} {count}")
+                labels = _format_labels(sample["labels"])
+                lines.append(f"{name}_sum{labels} {_format_value(sample['sum'])}")
+                lines.append(f"{name}_count{labels} {sample['count']}")
+        return "\n".join(lines) + "\n"
+
+    def _header(self, lines, name, prom_type):
+        if name in self._help:
+            lines.append(f"# HELP {name} {self._help[name]}")
+        lines.append(f"# TYPE {name} {prom_type}")
+
+
+def _format_labels(labels):
+    if not labels:
+        return ""
+    escaped = (
+        f'{k}="' + str(v).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"') + '"'
+        for k, v in sorted(labels.items())
+    )
+    return "{" + ",".join(escaped) + "}"
+
+
+def _format_value(value):
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+_registry = MetricsRegistry()
+
+
+def get_registry():
+    """The process-wide ``MetricsRegistry``."""
+    return _registry
+
+
+def prometheus_text():
+    return _registry.prometheus_text()
+
+
+def payload_size(value):
+    """Approximate wire size of a tool argument or result."""
+    if isinstance(value, (str, bytes)):
+        return len(value)
+    try:
+        return len(json.dumps(value, default=str))
+    except (TypeError, ValueError):
+        return len(repr(value))
+
+
+def record_tool_call(tool, duration, arguments, result=None, error=None, retryable=False,
+                     attempts=1, shared=False):
+    """Report one ``execute``/``execute_async`` call of ``tool``."""
+    _registry.inc("gofannon_tool_calls_total", tool=tool, outcome="error" if error else "success")
+    if error and retryable:
+        _registry.inc("gofannon_tool_retryable_errors_total", tool=tool)
+    if attempts > 1:
+        _registry.inc("gofannon_tool_retries_total", attempts - 1, tool=tool)
+    if shared:
+        _registry.inc("gofannon_tool_coalesced_total", tool=tool)
+    _registry.observe("gofannon_tool_duration_seconds", duration, tool=tool)
+    _registry.observe("gofannon_tool_request_bytes", payload_size(arguments),
+                      buckets=BYTES_BUCKETS, tool=tool)
+    if not error:
+        _registry.observe("gofannon_tool_response_bytes", payload_size(result),
+                          buckets=BYTES_BUCKETS, tool=tool)
+
+
+def record_cache(tool, hits=0, misses=0, evictions=0):
+    for result, amount in (("hit", hits), ("miss", misses), ("eviction", evictions)):
+        if amount:
+            _registry.inc("gofannon_tool_cache_total", amount, tool=tool, result=result)
+
+
+def record_validation(tool, duration, valid=True):
+    """Report one check of ``tool``'s arguments against its schema."""
+    _registry.observe("gofannon_tool_validation_seconds", duration,
+                      buckets=VALIDATION_BUCKETS, tool=tool)
+    if not valid:
+        _registry.inc("gofannon_tool_invalid_arguments_total", tool=tool)
+
+
+def record_llm_call(model, source, duration, response=None, error=None):
+    """Report one chat-completion request made on behalf of ``source``."""
+    _registry.inc("gofannon_llm_calls_total", model=model, source=source,
+                  outcome="error" if error else "success")
+    _registry.observe("gofannon_llm_duration_seconds", duration, model=model, source=source)
+    usage = getattr(response, "usage", None)
+    for kind in ("prompt", "completion"):
+        tokens = getattr(usage, f"{kind}_tokens", None)
+        if tokens:
+            _registry.inc("gofannon_llm_tokens_total", tokens, model=model, source=source, kind=kind)
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.path.split("?", 1)[0] != "/metrics":
+            self.send_error(404)
+            return
+        body = self.server.registry.prometheus_text().encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        logger.debug(format, *args)
+
+
+def start_metrics_server(port=9464, addr="127.0.0.1", registry=None):
+    """
+    Serve ``/metrics`` for Prometheus from a daemon thread. Returns the server;
+    call ``shutdown()`` on it to stop.
+    """
+    server = ThreadingHTTPServer((addr, port), _MetricsHandler)
+    server.daemon_threads = True
+    server.registry = registry or _registry
+    threading.Thread(target=server.serve_forever, name="gofannon-metrics", daemon=True).start()
+    return server
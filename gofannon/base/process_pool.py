@@ -0,0 +1,237 @@
+"""
+Process-pool isolation for CPU-bound tools.
+
+Tools whose ``fn`` spends its time computing rather than waiting (PDF text
+extraction, code analysis) hold the GIL and starve the I/O-bound tools running
+in other threads. Such tools declare ``cpu_bound = True``; ``BaseTool.execute``,
+``execute_async`` and the orchestrators then run their ``fn`` in a shared pool
+of worker processes::
+
+    @FunctionRegistry.register
+    class ReadPdf(BaseTool):
+        cpu_bound = True
+
+The tool instance and its arguments are pickled to the worker, and the result
+pickled back, so both must be picklable. The pool is started on first use
+(``warm()`` starts it ahead of time) and configured with
+``configure_process_pool``: worker count, how many calls a worker serves
+before it is replaced, a per-worker memory cap and modules imported when a
+worker starts.
+
+A call that runs past its deadline (see ``deadline``) can't be interrupted
+inside the worker, so the pool is torn down and restarted, killing the
+stuck worker. Other calls that were running in the pool at that moment are
+run again in the new pool, within their own deadlines, so ``cpu_bound``
+tools must be safe to run twice; a ``mutating`` tool's call fails with a
+retryable ``WorkerCrashedError`` instead.
+"""
+import asyncio
+import concurrent.futures
+import importlib
+import logging
+import multiprocessing
+import os
+import sys
+import threading
+import weakref
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+from typing import Optional, Tuple
+
+from . import deadline
+
+logger = logging.getLogger(__name__)
+
+
+class WorkerCrashedError(RuntimeError):
+    """The worker process running a call died (killed, out of memory, crashed)."""
+    retryable = True
+
+
+@dataclass(frozen=True)
+class ProcessPoolConfig:
+    """
+    Args:
+        max_workers: Worker processes; defaults to the number of CPUs.
+        max_tasks_per_child: Calls a worker serves before it is replaced, which
+            bounds the memory leaked by native libraries. Needs Python 3.11;
+            ignored before.
+        memory_limit: Address-space limit of each worker in bytes (POSIX
+            only); a call exceeding it fails with ``MemoryError``.
+        preload: Modules imported when a worker starts, so the first calls
+            don't pay for them.
+        start_method: ``multiprocessing`` start method. ``spawn`` is the safe
+            choice for a process that already runs threads.
+    """
+    max_workers: Optional[int] = None
+    max_tasks_per_child: Optional[int] = 100
+    memory_limit: Optional[int] = None
+    preload: Tuple[str, ...] = ("gofannon.base",)
+    start_method: str = "spawn"
+
+
+def _init_worker(config):
+    if config.memory_limit is not None:
+        try:
+            import resource
+
+            resource.setrlimit(resource.RLIMIT_AS, (config.memory_limit, config.memory_limit))
+        except (ImportError, ValueError, OSError) as e:
+            logger.warning("Could not cap worker memory: %s", e)
+    for module in config.preload:
+        try:
+            importlib.import_module(module)
+        except ImportError as e:
+            logger.warning("Could not preload %s in tool worker: %s", module, e)
+
+
+def _call_fn(tool, arguments):
+    return tool.fn(**arguments)
+
+
+def _ping():
+    return os.getpid()
+
+
+_RERUN = object()
+
+
+class ToolProcessPool:
+    """A restartable ``ProcessPoolExecutor`` running tool calls."""
+
+    def __init__(self, config=None):
+        self.config = config or ProcessPoolConfig()
+        self._executor = None
+        self._lock = threading.Lock()
+        # Executors whose workers were killed to stop a call past its
+        # deadline; the other calls they were running are not at fault.
+        self._killed = weakref.WeakSet()
+
+    def _get_executor(self):
+        with self._lock:
+            if self._executor is None:
+                kwargs = {}
+                if sys.version_info >= (3, 11) and self.config.max_tasks_per_child:
+                    kwargs["max_tasks_per_child"] = self.config.max_tasks_per_child
+                self._executor = concurrent.futures.ProcessPoolExecutor(
+                    max_workers=self.config.max_workers,
+                    mp_context=multiprocessing.get_context(self.config.start_method),
+                    initializer=_init_worker,
+                    initargs=(self.config,),
+                    **kwargs,
+                )
+            return self._executor
+
+    def warm(self):
+        """Start the workers now rather than on the first calls; returns their pids."""
+        executor = self._get_executor()
+        futures = [executor.submit(_ping) for _ in range(executor._max_workers)]
+        return sorted({f.result() for f in futures})
+
+    def _submit(self, tool, arguments):
+        """Returns the future of the call and the executor running it."""
+        executor = self._get_executor()
+        try:
+            return executor.submit(_call_fn, tool, arguments), executor
+        except (BrokenProcessPool, RuntimeError):
+            # Broken, or shut down by a restart since we fetched it.
+            self.restart(executor)
+            executor = self._get_executor()
+            return executor.submit(_call_fn, tool, arguments), executor
+
+    def restart(self, executor=None, kill=False):
+        """
+        Replace the pool (only if it is still ``executor``, when given). With
+        ``kill`` its workers are terminated instead of finishing their calls.
+        """
+        with self._lock:
+            if self._executor is None or (executor is not None and self._executor is not executor):
+                return
+            old, self._executor = self._executor, None
+            if kill:
+                self._killed.add(old)
+        if kill:
+            for process in list((getattr(old, "_processes", None) or {}).values()):
+                process.terminate()
+        old.shutdown(wait=False, cancel_futures=True)
+
+    def shutdown(self):
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def _result(self, future, executor, tool):
+        """The call's result, or ``_RERUN`` if it was lost to another call's kill."""
+        try:
+            return future.result()
+        except concurrent.futures.CancelledError:
+            if executor in self._killed:
+                # Still queued when the pool was restarted; it never ran.
+                return _RERUN
+            raise
+        except BrokenProcessPool as e:
+            if executor in self._killed and not tool.mutating:
+                logger.info("Rerunning a %s call lost when the pool was restarted",
+                            type(tool).__name__)
+                return _RERUN
+            self.restart(executor)
+            raise WorkerCrashedError(f"Tool worker process died: {e}") from e
+
+    def call(self, tool, arguments):
+        """Run ``tool.fn(**arguments)`` in a worker, within the current deadline."""
+        while True:
+            future, executor = self._submit(tool, arguments)
+            concurrent.futures.wait([future], timeout=deadline.remaining())
+            if not future.done():
+                self._stop(future, executor)
+                raise deadline.ToolTimeoutError("Tool call timed out in its worker process")
+            result = self._result(future, executor, tool)
+            if result is not _RERUN:
+                return result
+
+    async def call_async(self, tool, arguments):
+        while True:
+            future, executor = self._submit(tool, arguments)
+            try:
+                await asyncio.wait([asyncio.wrap_future(future)])
+            except asyncio.CancelledError:
+                self._stop(future, executor)
+                raise
+            result = self._result(future, executor, tool)
+            if result is not _RERUN:
+                return result
+
+    def _stop(self, future, executor):
+        """Stop a call whose result is no longer wanted."""
+        if future.cancel():
+            return
+        left = deadline.remaining()
+        if left is not None and left <= 0:
+            # Already running past its deadline: only killing the worker stops it.
+            logger.warning("Restarting the tool worker pool to stop a call past its deadline")
+            self.restart(executor, kill=True)
+
+
+_pool = ToolProcessPool()
+
+
+def get_process_pool():
+    """The process-wide pool used by ``cpu_bound`` tools."""
+    return _pool
+
+
+def configure_process_pool(**settings):
+    """
+    Set ``ProcessPoolConfig`` fields of the shared pool. The running pool, if
+    any, finishes its calls and is replaced on next use.
+    """
+    global _pool
+    old, _pool = _pool, ToolProcessPool(ProcessPoolConfig(**settings))
+    old.restart()
+    return _pool
+
+
+def warm():
+    """Start the workers of the shared pool."""
+    return _pool.warm()
@@ -0,0 +1,196 @@
+"""
+Client-side rate limiting of outbound HTTP requests.
+
+Limits are token buckets keyed like the shared HTTP sessions: by a tool's
+``API_SERVICE`` (``"github"``) or by host (``"export.arxiv.org"``). Every
+request made through ``BaseTool.http_session`` or ``BaseTool.async_http_client``
+takes a token from the bucket of its key first, waiting for one if the bucket
+is empty (but never past the deadline of the tool call, see ``deadline``), so
+bursts from many concurrent workflows queue briefly instead of getting
+throttled by the upstream API::
+
+    configure_rate_limit("github", rate=5000 / 3600, burst=20)
+
+Buckets are per process unless ``shared_path`` names a SQLite database that
+several worker processes use to coordinate (``GOFANNON_RATE_LIMIT_DB`` sets a
+default for every limit).
+"""
+import asyncio
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+from .deadline import ToolTimeoutError
+
+DEFAULT_SHARED_PATH = os.getenv("GOFANNON_RATE_LIMIT_DB")
+
+# Looked up on every wait so that tests can replace them.
+sleep = time.sleep
+async_sleep = asyncio.sleep
+
+
+class RateLimitExceeded(Exception):
+    """The wait for a token would exceed the limit's ``max_wait``."""
+    retryable = True
+
+
+class TokenBucket:
+    """
+    ``rate`` tokens per second, holding at most ``burst``.
+
+    ``reserve`` takes a token now, possibly borrowing against future refills,
+    and returns how long the caller must wait before using it. Reservations
+    are served in the order they were made.
+    """
+    clock = staticmethod(time.monotonic)
+
+    def __init__(self, rate, burst=1, max_wait=None):
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = rate
+        self.burst = burst
+        self.max_wait = max_wait
+        self._tokens = burst
+        self._updated = self.clock()
+        self._lock = threading.Lock()
+
+    def _take(self, tokens, updated, now, timeout=None):
+        """
+        Bucket state after taking a token at ``now``, and the wait for it.
+        Raises instead, leaving the bucket as it was, if the wait would exceed
+        ``max_wait`` or ``timeout``.
+        """
+        tokens = min(self.burst, tokens + (now - updated) * self.rate) - 1
+        wait = -tokens / self.rate if tokens < 0 else 0.0
+        if self.max_wait is not None and wait > self.max_wait:
+            raise RateLimitExceeded(f"Rate limit wait of {wait:.1f}s exceeds {self.max_wait}s")
+        if timeout is not None and wait > timeout:
+            raise ToolTimeoutError(f"Rate limit wait of {wait:.1f}s would overrun the deadline")
+        return tokens, wait
+
+    def reserve(self, timeout=None):
+        with self._lock:
+            now = self.clock()
+            self._tokens, wait = self._take(self._tokens, self._updated, now, timeout)
+            self._updated = now
+        return wait
+
+    def acquire(self, timeout=None):
+        """
+        Block until a token is available. Raises ``ToolTimeoutError`` at once
+        if that would take longer than ``timeout`` seconds.
+        """
+        wait = self.reserve(timeout)
+        if wait:
+            sleep(wait)
+        return wait
+
+    async def acquire_async(self, timeout=None):
+        """Wait on the event loop until a token is available (see ``acquire``)."""
+        wait = self.reserve(timeout)
+        if wait:
+            await async_sleep(wait)
+        return wait
+
+
+class SharedTokenBucket(TokenBucket):
+    """
+    A ``TokenBucket`` whose state lives in a SQLite database, so processes
+    using the same ``path`` and ``key`` draw from one bucket. Timestamps are
+    wall-clock time, since monotonic clocks are not comparable across
+    processes.
+    """
+    clock = staticmethod(time.time)
+
+    def __init__(self, rate, burst=1, max_wait=None, *, path, key):
+        super().__init__(rate, burst, max_wait)
+        self.path = Path(path)
+        self.key = key
+        self._conn = None
+
+    def _connection(self):
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.path), timeout=30, isolation_level=None,
+                                   check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS buckets "
+                "(key TEXT PRIMARY KEY, tokens REAL NOT NULL, updated REAL NOT NULL)"
+            )
+            self._conn = conn
+        return self._conn
+
+    def reserve(self, timeout=None):
+        with self._lock:
+            conn = self._connection()
+            # BEGIN IMMEDIATE takes the write lock up front, serializing
+            # reservations across processes.
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                now = self.clock()
+                row = conn.execute("SELECT tokens, updated FROM buckets WHERE key = ?",
+                                   (self.key,)).fetchone()
+                tokens, updated = row if row else (self.burst, now)
+                tokens, wait = self._take(tokens, updated, now, timeout)
+                conn.execute("INSERT OR REPLACE INTO buckets (key, tokens, updated) VALUES (?, ?, ?)",
+                             (self.key, tokens, now))
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
+        return wait
+
+
+_limiters = {}
+_host_aliases = {}
+_limiters_lock = threading.Lock()
+
+
+def configure_rate_limit(key, rate, burst=None, *, hosts=(), max_wait=None, shared_path=None):
+    """
+    Limit requests for ``key`` (an ``API_SERVICE`` or a host) to ``rate`` per
+    second with bursts of up to ``burst`` (default: one second's worth, at
+    least 1).
+
+    ``hosts`` are hosts whose requests count against this limit even when
+    made without the service key, e.g. through the shared async client.
+    ``max_wait`` bounds how long a request queues before failing with a
+    retryable ``RateLimitExceeded``. Pass ``rate=None`` to remove the limit.
+    """
+    with _limiters_lock:
+        for host, target in list(_host_aliases.items()):
+            if target == key:
+                del _host_aliases[host]
+        if rate is None:
+            _limiters.pop(key, None)
+            return None
+        burst = burst if burst is not None else max(1, rate)
+        shared_path = shared_path or DEFAULT_SHARED_PATH
+        if shared_path:
+            limiter = SharedTokenBucket(rate, burst, max_wait, path=shared_path, key=key)
+        else:
+            limiter = TokenBucket(rate, burst, max_wait)
+        _limiters[key] = limiter
+        for host in hosts:
+            _host_aliases[host] = key
+        return limiter
+
+
+def get_limiter(key):
+    """The limiter for ``key`` (a service key or host), or None."""
+    limiter = _limiters.get(key)
+    if limiter is None and key in _host_aliases:
+        limiter = _limiters.get(_host_aliases[key])
+    return limiter
+
+
+def limiter_for(key=None, host=None):
+    """The limiter of a session ``key``, falling back to that of ``host``."""
+    return (key and get_limiter(key)) or (host and get_limiter(host)) or None
+
+
+# arXiv asks API clients for at most one request every three seconds.
+configure_rate_limit("export.arxiv.org", rate=1 / 3, burst=1)
@@ -0,0 +1,187 @@
+"""
+Retries of transient tool failures.
+
+``BaseTool.execute`` and ``execute_async`` retry ``fn`` when it fails with a
+transient error: a connection error or timeout, or an HTTP error whose status
+is in ``RetryPolicy.retry_statuses`` (429 and most 5xx by default). Waits grow
+exponentially, capped at ``max_delay``, with full jitter; a ``Retry-After``
+header from the server takes precedence. Other errors (4xx validation errors,
+``ValueError`` and the like) fail immediately with ``retryable=False``.
+
+The policy of a tool is, in order: its ``retry_policy`` class attribute, the
+policy set for its ``API_SERVICE`` with ``configure_retry``, or
+``DEFAULT_RETRY_POLICY``. Tools that declare ``mutating = True`` are not
+retried unless they declare a policy themselves, since a failed call may
+already have taken effect.
+"""
+import asyncio
+import email.utils
+import logging
+import random
+import sys
+import threading
+import time
+from dataclasses import dataclass
+from typing import Optional, Tuple
+
+from . import deadline
+
+logger = logging.getLogger(__name__)
+
+# Looked up on every retry so that tests can replace them.
+sleep = time.sleep
+async_sleep = asyncio.sleep
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """
+    How failed calls are retried.
+
+    Args:
+        max_attempts: Total number of calls, including the first one.
+        base_delay: Wait before the first retry, in seconds.
+        multiplier: Factor applied to the wait after every retry.
+        max_delay: Upper bound of a single wait.
+        jitter: Draw each wait uniformly from ``[0, delay]`` so that clients
+            failing together don't retry together.
+        retry_statuses: HTTP statuses worth retrying.
+        max_retry_after: Longest ``Retry-After`` honoured; a server asking for
+            more fails the call instead.
+    """
+    max_attempts: int = 3
+    base_delay: float = 0.5
+    multiplier: float = 2.0
+    max_delay: float = 30.0
+    jitter: bool = True
+    retry_statuses: Tuple[int, ...] = (408, 425, 429, 500, 502, 503, 504)
+    max_retry_after: Optional[float] = 120.0
+
+    def backoff(self, retry):
+        """Wait before retry number ``retry`` (1-based), ignoring ``Retry-After``."""
+        delay = min(self.max_delay, self.base_delay * self.multiplier ** (retry - 1))
+        return random.uniform(0, delay) if self.jitter else delay
+
+
+DEFAULT_RETRY_POLICY = RetryPolicy()
+NO_RETRY = RetryPolicy(max_attempts=1)
+
+_service_policies = {}
+_service_policies_lock = threading.Lock()
+
+
+def configure_retry(service, policy):
+    """Use ``policy`` for every tool whose ``API_SERVICE`` is ``service``."""
+    with _service_policies_lock:
+        if policy is None:
+            _service_policies.pop(service, None)
+        else:
+            _service_policies[service] = policy
+
+
+def service_policy(service):
+    return _service_policies.get(service)
+
+
+def _status_and_headers(exc):
+    response = getattr(exc, "response", None)
+    status = getattr(response, "status_code", None)
+    headers = getattr(response, "headers", None) or {}
+    return status, headers
+
+
+def parse_retry_after(value):
+    """Seconds to wait according to a ``Retry-After`` header, or None."""
+    if value is None:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        when = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, when.timestamp() - time.time())
+
+
+def _is_transport_error(exc):
+    if isinstance(exc, (ConnectionError, TimeoutError)):
+        return True
+    # Only libraries that are already loaded can have raised the error; this
+    # keeps them out of the import path of tools that don't use them.
+    requests = sys.modules.get("requests")
+    if requests is not None and isinstance(
+            exc, (requests.exceptions.ConnectionError, requests.exceptions.Timeout)):
+        return True
+    httpx = sys.modules.get("httpx")
+    return httpx is not None and isinstance(exc, httpx.TransportError)
+
+
+def classify(exc, policy=DEFAULT_RETRY_POLICY):
+    """
+    ``(retryable, retry_after)`` for an exception raised by a tool.
+
+    An exception may decide for itself by carrying a boolean ``retryable``
+    attribute; with ``fail_fast = True`` as well it is reported retryable but
+    not retried within the call (e.g. a request refused by an open circuit).
+    ``retry_after`` is the server's requested wait in seconds, if
+    it sent one.
+    """
+    own = getattr(exc, "retryable", None)
+    status, headers = _status_and_headers(exc)
+    retry_after = parse_retry_after(headers.get("Retry-After")) if status else None
+    if isinstance(own, bool):
+        return own, retry_after
+    if status is not None:
+        return status in policy.retry_statuses, retry_after
+    return _is_transport_error(exc), None
+
+
+class Retrier:
+    """Calls a function under a ``RetryPolicy``, counting the attempts made."""
+
+    def __init__(self, policy, name="call"):
+        self.policy = policy
+        self.name = name
+        self.attempts = 0
+        self.retryable = False
+
+    def _next_delay(self, exc):
+        """Seconds to wait before the next attempt, or None to give up."""
+        self.retryable, retry_after = classify(exc, self.policy)
+        if (not self.retryable or self.attempts >= self.policy.max_attempts
+                or getattr(exc, "fail_fast", False)):
+            return None
+        delay = self.policy.backoff(self.attempts)
+        if retry_after is not None:
+            if self.policy.max_retry_after is not None and retry_after > self.policy.max_retry_after:
+                return None
+            delay = max(delay, retry_after)
+        left = deadline.remaining()
+        if left is not None and delay >= left:
+            return None
+        logger.info("%s failed (attempt %d of %d): %s; retrying in %.2fs",
+                    self.name, self.attempts, self.policy.max_attempts, exc, delay)
+        return delay
+
+    def call(self, fn):
+        while True:
+            self.attempts += 1
+            try:
+                return fn()
+            except Exception as e:
+                delay = self._next_delay(e)
+                if delay is None:
+                    raise
+            sleep(delay)
+
+    async def acall(self, afn):
+        while True:
+            self.attempts += 1
+            try:
+                return await afn()
+            except Exception as e:
+                delay = self._next_delay(e)
+                if delay is None:
+                    raise
+            await async_sleep(delay)
@@ -0,0 +1,103 @@
+"""
+Coalescing of identical in-flight tool calls.
+
+When several workflows call the same tool with the same arguments at the same
+time, only the first call runs ``fn``; the others wait for it and share its
+result (or its exception). ``BaseTool.execute`` and ``execute_async`` do this
+for every tool that isn't ``mutating``, keyed like the result cache: tool,
+arguments with their defaults filled in, and ``cache_scope()``. Tools opt out
+with ``coalesce = False``.
+
+Only concurrent calls are merged; a call that starts after the first one
+finished runs again (use a ``cache_policy`` to reuse finished results).
+"""
+import asyncio
+import threading
+import weakref
+
+
+class _Call:
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class _Flight:
+    __slots__ = ("task", "waiters")
+
+    def __init__(self, task):
+        self.task = task
+        self.waiters = 0
+
+
+class SingleFlight:
+    """A group of keyed calls, each running at most once at a time."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls = {}
+        # asyncio futures belong to one event loop, so async calls are keyed
+        # per loop.
+        self._tasks = weakref.WeakKeyDictionary()
+
+    def do(self, key, fn):
+        """
+        Run ``fn()`` unless a call for ``key`` is already in flight, in which
+        case wait for that one. Returns ``(result, shared)``, ``shared`` being
+        True for the callers that waited.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result, True
+        try:
+            call.result = fn()
+            return call.result, False
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+    async def do_async(self, key, afn):
+        """
+        Async counterpart of ``do`` for calls made on one event loop. A
+        cancelled caller doesn't cancel the call others still wait for; the
+        call is cancelled once all of its callers are.
+        """
+        with self._lock:
+            flights = self._tasks.setdefault(asyncio.get_running_loop(), {})
+        flight = flights.get(key)
+        shared = flight is not None
+        if not shared:
+            flight = flights[key] = _Flight(asyncio.ensure_future(afn()))
+            flight.task.add_done_callback(
+                lambda _: flights.pop(key) if flights.get(key) is flight else None)
+        flight.waiters += 1
+        try:
+            return await asyncio.shield(flight.task), shared
+        except asyncio.CancelledError:
+            if flight.waiters == 1:
+                flight.task.cancel()
+            raise
+        finally:
+            flight.waiters -= 1
+
+
+_group = SingleFlight()
+
+
+def get_group():
+    """The process-wide ``SingleFlight`` used by ``BaseTool``."""
+    return _group
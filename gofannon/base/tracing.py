@@ -0,0 +1,217 @@
+"""
+Span-based tracing of workflows, LLM calls, tool calls and HTTP requests.
+
+Tracing is off by default and costs one attribute check per instrumented call
+while off. Turn it on with ``enable_tracing()`` (or ``GOFANNON_TRACING=1``),
+run the workflow, then write the spans out for offline inspection::
+
+    tracer = enable_tracing()
+    orchestrator.execute_workflow(query, model)
+    tracer.export_chrome_trace("trace.json")   # chrome://tracing, Perfetto
+    tracer.export_otlp_json("trace.otlp.json")  # OTLP/JSON collectors
+
+Spans nest through ``contextvars``: a span started while another is open on
+the same thread or task becomes its child. Work handed to thread pools keeps
+its parent when submitted with ``contextvars.copy_context().run``.
+"""
+import contextvars
+import json
+import logging
+import os
+import threading
+import time
+from collections import deque
+
+logger = logging.getLogger(__name__)
+
+_current_span = contextvars.ContextVar("gofannon_current_span", default=None)
+
+
+class Span:
+    """One timed operation; ``start_ns``/``end_ns`` are Unix-epoch nanoseconds."""
+
+    __slots__ = ("name", "category", "attributes", "trace_id", "span_id", "parent_id",
+                 "start_ns", "end_ns", "thread_id", "error", "_tracer", "_token", "_t0")
+
+    def __init__(self, tracer, name, category, attributes):
+        parent = _current_span.get()
+        self._tracer = tracer
+        self.name = name
+        self.category = category
+        self.attributes = attributes
+        self.parent_id = parent.span_id if parent else None
+        self.trace_id = parent.trace_id if parent else os.urandom(16).hex()
+        self.span_id = os.urandom(8).hex()
+        self.thread_id = threading.get_ident()
+        self.error = None
+        self.start_ns = self.end_ns = None
+
+    def set_attribute(self, key, value):
+        self.attributes[key] = value
+
+    def record_error(self, exc):
+        """Mark the span failed by ``exc`` when the exception doesn't escape it."""
+        self.error = f"{type(exc).__name__}: {exc}"
+
+    def __enter__(self):
+        self._token = _current_span.set(self)
+        self.start_ns = time.time_ns()
+        # Durations come from the monotonic clock; the wall clock only anchors them.
+        self._t0 = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.end_ns = self.start_ns + time.perf_counter_ns() - self._t0
+        if exc is not None:
+            self.record_error(exc)
+        _current_span.reset(self._token)
+        self._tracer._finish(self)
+        return False
+
+    @property
+    def duration(self):
+        """Seconds between start and end."""
+        return (self.end_ns - self.start_ns) / 1e9
+
+
+class _NoSpan:
+    """Stand-in returned by ``span`` while tracing is off."""
+
+    def set_attribute(self, key, value):
+        pass
+
+    def record_error(self, exc):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+_NO_SPAN = _NoSpan()
+
+
+class Tracer:
+    """
+    Collects finished spans in memory, keeping at most ``max_spans`` (the
+    oldest are dropped first).
+    """
+
+    def __init__(self, max_spans=100_000, service_name="gofannon"):
+        self.enabled = False
+        self.service_name = service_name
+        self._spans = deque(maxlen=max_spans)
+        self._lock = threading.Lock()
+
+    def span(self, name, category="", **attributes):
+        """Context manager timing the enclosed block as a child of the current span."""
+        if not self.enabled:
+            return _NO_SPAN
+        return Span(self, name, category, attributes)
+
+    def _finish(self, span):
+        with self._lock:
+            self._spans.append(span)
+
+    def spans(self):
+        """Finished spans, in the order they ended."""
+        with self._lock:
+            return list(self._spans)
+
+    def clear(self):
+        with self._lock:
+            self._spans.clear()
+
+    def chrome_trace(self):
+        """Spans as Chrome trace-event JSON (complete ``"X"`` events)."""
+        pid = os.getpid()
+        events = []
+        for span in self.spans():
+            args = dict(span.attributes, span_id=span.span_id, trace_id=span.trace_id)
+            if span.parent_id:
+                args["parent_id"] = span.parent_id
+            if span.error:
+                args["error"] = span.error
+            events.append({
+                "name": span.name,
+                "cat": span.category,
+                "ph": "X",
+                "ts": span.start_ns / 1000,
+                "dur": (span.end_ns - span.start_ns) / 1000,
+                "pid": pid,
+                "tid": span.thread_id,
+                "args": args,
+            })
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def otlp_json(self):
+        """Spans in the OTLP/JSON encoding of an ``ExportTraceServiceRequest``."""
+        spans = []
+        for span in self.spans():
+            attributes = dict(span.attributes)
+            if span.category:
+                attributes["gofannon.category"] = span.category
+            otlp_span = {
+                "traceId": span.trace_id,
+                "spanId": span.span_id,
+                "name": span.name,
+                "kind": 1,
+                "startTimeUnixNano": str(span.start_ns),
+                "endTimeUnixNano": str(span.end_ns),
+                "attributes": [_otlp_attribute(k, v) for k, v in attributes.items()],
+                "status": {"code": 2, "message": span.error} if span.error else {"code": 1},
+            }
+            if span.parent_id:
+                otlp_span["parentSpanId"] = span.parent_id
+            spans.append(otlp_span)
+        return {"resourceSpans": [{
+            "resource": {"attributes": [_otlp_attribute("service.name", self.service_name)]},
+            "scopeSpans": [{"scope": {"name": "gofannon"}, "spans": spans}],
+        }]}
+
+    def export_chrome_trace(self, path):
+        with open(path, "w") as f:
+            json.dump(self.chrome_trace(), f)
+
+    def export_otlp_json(self, path):
+        with open(path, "w") as f:
+            json.dump(self.otlp_json(), f)
+
+
+def _otlp_attribute(key, value):
+    if isinstance(value, bool):
+        typed = {"boolValue": value}
+    elif isinstance(value, int):
+        typed = {"intValue": str(value)}
+    elif isinstance(value, float):
+        typed = {"doubleValue": value}
+    else:
+        typed = {"stringValue": str(value)}
+    return {"key": key, "value": typed}
+
+
+_tracer = Tracer()
+_tracer.enabled = os.getenv("GOFANNON_TRACING", "").lower() in ("1", "true", "yes")
+
+
+def get_tracer():
+    """The process-wide ``Tracer``."""
+    return _tracer
+
+
+def enable_tracing():
+    _tracer.enabled = True
+    return _tracer
+
+
+def disable_tracing():
+    _tracer.enabled = False
+
+
+def span(name, category="", **attributes):
+    """``get_tracer().span(...)``."""
+    if not _tracer.enabled:
+        return _NO_SPAN
+    return Span(_tracer, name, category, attributes)
@@ -0,0 +1,104 @@
+"""
+Validation of tool arguments against the tool's JSON schema.
+
+``BaseTool.execute``, ``execute_async`` and the orchestrators check the
+arguments of a call against ``definition["function"]["parameters"]`` before
+``fn`` runs, so that a malformed call from the LLM fails at once with a
+message it can act on instead of after a round trip to the upstream API. A
+failed check raises ``ArgumentValidationError`` (``execute`` returns it as a
+non-retryable ``ToolResult``).
+
+Validators are compiled once per distinct schema and cached, and each tool
+instance remembers its own so that repeat calls neither rebuild
+``definition`` nor serialize the schema. Callers that
+build arguments themselves and trust them can skip the check::
+
+    with validation.trusted():
+        tool.execute(context, **arguments)
+
+Checks are reported as ``gofannon_tool_validation_seconds{tool}`` and
+``gofannon_tool_invalid_arguments_total{tool}`` (see ``metrics``).
+"""
+import contextvars
+import functools
+import json
+import logging
+import weakref
+from contextlib import contextmanager
+
+from . import metrics
+
+logger = logging.getLogger(__name__)
+
+_trusted = contextvars.ContextVar("gofannon_trusted_arguments", default=False)
+
+# Tool instance -> its compiled validator. Kept off the instance so that
+# tools still pickle (e.g. to run in the process pool).
+_tool_validators = weakref.WeakKeyDictionary()
+_MISSING = object()
+
+
+class ArgumentValidationError(ValueError):
+    """The arguments of a call don't match the tool's parameter schema."""
+    retryable = False
+
+    def __init__(self, tool, errors):
+        self.tool = tool
+        self.errors = errors
+        super().__init__(f"Invalid arguments for {tool}: {'; '.join(errors)}")
+
+
+@contextmanager
+def trusted():
+    """Skip argument validation for calls made in the body."""
+    token = _trusted.set(True)
+    try:
+        yield
+    finally:
+        _trusted.reset(token)
+
+
+@functools.lru_cache(maxsize=512)
+def _compile(schema_json):
+    import jsonschema
+
+    schema = json.loads(schema_json)
+    cls = jsonschema.validators.validator_for(schema)
+    try:
+        cls.check_schema(schema)
+    except jsonschema.exceptions.SchemaError as e:
+        logger.warning("Not validating arguments against an invalid schema: %s", e.message)
+        return None
+    return cls(schema)
+
+
+def validator_for(schema):
+    """The compiled validator of ``schema``, or None if there is nothing to check."""
+    if not isinstance(schema, dict) or not schema:
+        return None
+    return _compile(json.dumps(schema, sort_keys=True, default=str))
+
+
+def _tool_validator(tool):
+    validator = _tool_validators.get(tool, _MISSING)
+    if validator is _MISSING:
+        validator = validator_for(tool.definition.get("function", {}).get("parameters"))
+        _tool_validators[tool] = validator
+    return validator
+
+
+def check_arguments(tool, arguments):
+    """Raise ``ArgumentValidationError`` unless ``arguments`` match ``tool``'s parameter schema."""
+    if _trusted.get():
+        return
+    start = metrics.clock()
+    name = tool.__class__.__name__
+    validator = _tool_validator(tool)
+    errors = []
+    if validator is not None:
+        for error in sorted(validator.iter_errors(arguments), key=lambda e: list(map(str, e.path))):
+            location = "/".join(map(str, error.path))
+            errors.append(f"{location}: {error.message}" if location else error.message)
+    metrics.record_validation(name, metrics.clock() - start, valid=not errors)
+    if errors:
+        raise ArgumentValidationError(name, errors)
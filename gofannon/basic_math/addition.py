@@ -6,6 +6,9 @@ logger = logging.getLogger(__name__)
 
 @FunctionRegistry.register
 class Addition(BaseTool):
+    thread_safe = True
+    remote_safe = True
+
     def __init__(self, name="addition"):
         super().__init__()
         self.name = name
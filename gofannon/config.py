@@ -1,12 +1,19 @@
 import os
+import importlib
+import threading
 from dotenv import load_dotenv
 import logging
 
+from .manifest import TOOL_MANIFEST
+
+logger = logging.getLogger(__name__)
+
 
 class ToolConfig:
     _instance = None
 
     def __init__(self):
+        ensure_logging()
         load_dotenv()
         self.config = {
             'github_api_key': os.getenv('GITHUB_API_KEY'),
@@ -25,39 +32,151 @@ class ToolConfig:
             cls._instance = ToolConfig()
         return cls._instance.config.get(key)
 
+class _FrozenDict(dict):
+    """A read-only dict used for cached tool definitions.
+
+    It is still a ``dict`` so it can be passed straight to LLM clients and
+    ``json.dumps``, but any attempt to mutate it raises ``TypeError``.
+    """
+
+    def _readonly(self, *args, **kwargs):
+        raise TypeError("Tool definitions are immutable; copy them before modifying.")
+
+    __setitem__ = __delitem__ = _readonly
+    clear = pop = popitem = setdefault = update = _readonly
+
+    def __reduce__(self):
+        return (_FrozenDict, (dict(self),))
+
+
+def _freeze(value):
+    if isinstance(value, dict):
+        return _FrozenDict((k, _freeze(v)) for k, v in value.items())
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
 class FunctionRegistry:
+    """
+    Catalog of registered tool classes.
+
+    Registering a tool does not instantiate it. The first time the catalog is
+    queried, every pending tool is instantiated once to snapshot its
+    definition; afterwards ``get_tools`` only returns the cached, immutable
+    snapshots.
+    """
     _tools = {}
+    _definitions = {}
+    _pending = []
+    # Tool class -> exception raised while snapshotting its definition.
+    _failed = {}
+    _lock = threading.RLock()
 
     @classmethod
     def register(cls, tool_class):
-        cls._tools[tool_class().definition['function']['name']] = tool_class
+        with cls._lock:
+            cls._pending.append(tool_class)
         return tool_class
 
+    @classmethod
+    def _resolve_pending(cls):
+        with cls._lock:
+            while cls._pending:
+                # Popped first so that a broken tool is reported once rather
+                # than blocking every later query.
+                tool_class = cls._pending.pop(0)
+                try:
+                    definition = _freeze(tool_class().definition)
+                    name = definition['function']['name']
+                except Exception as e:
+                    logger.error("Skipping tool %s: could not snapshot its definition: %s",
+                                 tool_class.__qualname__, e)
+                    cls._failed[tool_class] = e
+                    continue
+                previous = cls._tools.get(name)
+                if previous is not None and previous is not tool_class:
+                    logger.warning("Tool name %r of %s replaces %s", name,
+                                   tool_class.__qualname__, previous.__qualname__)
+                cls._tools[name] = tool_class
+                cls._definitions[name] = definition
+
     @classmethod
     def get_tools(cls):
-        return [cls._tools[name]().definition for name in cls._tools]
+        cls._resolve_pending()
+        return list(cls._definitions.values())
+
+    @classmethod
+    def get_definition(cls, name):
+        cls._resolve_pending()
+        return cls._definitions[name]
+
+    @classmethod
+    def get_tool_class(cls, name):
+        cls._resolve_pending()
+        return cls._tools[name]
+
+    @classmethod
+    def get_tool_classes(cls):
+        cls._resolve_pending()
+        return dict(cls._tools)
+
+    @classmethod
+    def catalog(cls):
+        """Map every shipped tool name to its module path without importing it."""
+        return {name: module_path for name, module_path, _ in TOOL_MANIFEST}
+
+    @classmethod
+    def load(cls, name):
+        """Import the module defining tool ``name`` and return its class."""
+        entries = {tool_name: (module_path, class_name)
+                   for tool_name, module_path, class_name in TOOL_MANIFEST}
+        if name not in entries:
+            raise KeyError(f"Unknown tool: {name}")
+        module_path, class_name = entries[name]
+        return getattr(importlib.import_module(module_path), class_name)
+
+    @classmethod
+    def load_all(cls):
+        """
+        Import and register every tool in the manifest.
+
+        Tools whose optional dependencies are not installed are skipped.
+        """
+        for name, module_path, _ in TOOL_MANIFEST:
+            try:
+                importlib.import_module(module_path)
+            except ImportError as e:
+                logger.debug("Skipping tool %s: %s", name, e)
 
 def setup_logging():
-    """Configure logging for the gofannon package."""
-    logger = logging.getLogger('')
-    log_level = os.getenv('GOFANNON_LOG_LEVEL', 'WARNING').upper()
-    level = getattr(logging, log_level, logging.WARNING)
-
-    # Clear existing handlers if any
-    if logger.handlers:
-        for handler in logger.handlers:
-            logger.removeHandler(handler)
-
-            # Configure new handler
-    handler = logging.StreamHandler()
-    formatter = logging.Formatter(
-        '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-    )
-    handler.setFormatter(formatter)
-    logger.addHandler(handler)
-
-    logger.setLevel(level)
-    logger.propagate = False
-
-# Initialize logging when config is imported
-setup_logging()
+    """
+    Configure the ``gofannon`` logger.
+
+    Its level comes from ``GOFANNON_LOG_LEVEL`` (default WARNING) unless the
+    application has already set one. A handler is only added if the
+    application hasn't configured logging (the root logger has no handlers);
+    handlers it has installed are never touched.
+    """
+    logger = logging.getLogger('gofannon')
+    if logger.level == logging.NOTSET or 'GOFANNON_LOG_LEVEL' in os.environ:
+        log_level = os.getenv('GOFANNON_LOG_LEVEL', 'WARNING').upper()
+        logger.setLevel(getattr(logging, log_level, logging.WARNING))
+
+    if not logger.handlers and not logging.getLogger().handlers:
+        handler = logging.StreamHandler()
+        formatter = logging.Formatter(
+            '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+        )
+        handler.setFormatter(formatter)
+        logger.addHandler(handler)
+
+_logging_configured = False
+
+
+def ensure_logging():
+    """Run ``setup_logging`` once, the first time gofannon actually needs it."""
+    global _logging_configured
+    if not _logging_configured:
+        _logging_configured = True
+        setup_logging()
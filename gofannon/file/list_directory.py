@@ -8,6 +8,8 @@ logger = logging.getLogger(__name__)
 
 @FunctionRegistry.register
 class ListDirectory(BaseTool):
+    thread_safe = True
+
     def __init__(self, name="list_directory"):
         super().__init__()
         self.name = name
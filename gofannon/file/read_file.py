@@ -17,6 +17,8 @@ class ReadFile(BaseTool):
     Attributes:
         file_path (str): The path to the file that should be read.
     """
+    thread_safe = True
+
     def __init__(self, name="read_file"):
         super().__init__()
         self.name = name
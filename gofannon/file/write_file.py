@@ -6,6 +6,9 @@ logger = logging.getLogger(__name__)
 
 @FunctionRegistry.register
 class WriteFile(BaseTool):
+    mutating = True
+    thread_safe = True
+
     def __init__(self, name="write_file"):
         super().__init__()
         self.name = name
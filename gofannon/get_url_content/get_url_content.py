@@ -1,10 +1,19 @@
 from ..base import BaseTool
 from ..config import FunctionRegistry, ToolConfig
+from ..base.http import get_async_client, get_session
 import requests
 import logging
 
 logger = logging.getLogger(__name__)
 
+REQUEST_HEADERS = {
+    'User-Agent': (
+        'Mozilla/5.0 (Windows NT 10.0; Win64; x64) '
+        'AppleWebKit/537.36 (KHTML, like Gecko) '
+        'Chrome/91.0.4472.124 Safari/537.36'
+    )
+}
+
 """Fetches the text content of a given URL.
 
 This tool makes a simple GET request and returns the raw text content.
@@ -12,6 +21,8 @@ It does not render JavaScript or handle complex interactions."""
 
 @FunctionRegistry.register
 class GetUrlContent(BaseTool):
+    thread_safe = True
+
     def __init__(self, name="get_url_content"):
         self.name = name
 
@@ -40,31 +51,59 @@ class GetUrlContent(BaseTool):
         }
     
     def fn(self, url: str):
+        return self._fetch(url)
+
+    async def afn(self, url: str):
+        return await self._afetch(url)
+
+    def _fn_raw(self, url: str):
+        return self._fetch(url, raise_retryable=True)
+
+    async def _afn_raw(self, url: str):
+        return await self._afetch(url, raise_retryable=True)
+
+    def _fetch(self, url, raise_retryable=False):
         logger.debug(f"Attempting to fetch content from URL: {url}")
         try:
-            headers = {
-                'User-Agent': (
-                    'Mozilla/5.0 (Windows NT 10.0; Win64; x64) '
-                    'AppleWebKit/537.36 (KHTML, like Gecko) '
-                    'Chrome/91.0.4472.124 Safari/537.36'
-                )
-            }
-            response = requests.get(url, headers=headers, timeout=15)
+            # URLs can point anywhere, so share one session (whose adapter keeps
+            # a bounded number of per-host pools) rather than one per host.
+            response = get_session("get_url_content").get(url, headers=REQUEST_HEADERS, timeout=15)
+            response.raise_for_status()
+            logger.info(f"Successfully fetched content from URL: {url}")
+            return response.text
+        except Exception as e:
+            if raise_retryable and self.is_retryable(e):
+                # Rate limits, 5xx, dropped connections and timeouts are
+                # raised so that ``execute`` retries them.
+                logger.warning(f"Transient error fetching URL {url}: {e}")
+                raise
+            if isinstance(e, requests.exceptions.HTTPError):
+                logger.error(f"HTTP error fetching URL {url}: {e}")
+                return f"Error: HTTP error - {e}"
+            if isinstance(e, requests.exceptions.RequestException):
+                logger.error(f"Request error fetching URL {url}: {e}")
+                return f"Error: Request error - {e}"
+            logger.error(f"Unexpected error fetching URL {url}: {e}")
+            return f"Error: Unexpected error - {e}"
+
+    async def _afetch(self, url, raise_retryable=False):
+        import httpx
+
+        logger.debug(f"Attempting to fetch content from URL: {url}")
+        try:
+            response = await get_async_client("get_url_content").get(url, headers=REQUEST_HEADERS, timeout=15)
             response.raise_for_status()
             logger.info(f"Successfully fetched content from URL: {url}")
             return response.text
-        except requests.exceptions.HTTPError as e:
-            logger.error(f"HTTP error fetching URL {url}: {e}")
-            return f"Error: HTTP error - {e}"
-        except requests.exceptions.ConnectionError as e:
-            logger.error(f"Connection error fetching URL {url}: {e}")
-            return f"Error: Connection error - {e}"
-        except requests.exceptions.Timeout as e:
-            logger.error(f"Timeout fetching URL {url}: {e}")
-            return f"Error: Timeout - {e}"
-        except requests.exceptions.RequestException as e:
-            logger.error(f"Request error fetching URL {url}: {e}")
-            return f"Error: Request error - {e}"
         except Exception as e:
+            if raise_retryable and self.is_retryable(e):
+                logger.warning(f"Transient error fetching URL {url}: {e}")
+                raise
+            if isinstance(e, httpx.HTTPStatusError):
+                logger.error(f"HTTP error fetching URL {url}: {e}")
+                return f"Error: HTTP error - {e}"
+            if isinstance(e, httpx.RequestError):
+                logger.error(f"Request error fetching URL {url}: {e}")
+                return f"Error: Request error - {e}"
             logger.error(f"Unexpected error fetching URL {url}: {e}")
-            return f"Error: Unexpected error - {e}"
\ No newline at end of file
+            return f"Error: Unexpected error - {e}"
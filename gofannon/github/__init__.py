@@ -1,4 +1,3 @@
+from ..manifest import lazy_package_attrs
 
-
-
-
+__getattr__, __dir__ = lazy_package_attrs(__name__)
@@ -1,4 +1,3 @@
-import git
 from pathlib import Path
 
 from..base import BaseTool
@@ -16,6 +15,9 @@ class CloneRepo(BaseTool):
     Returns a success message if the operation completes successfully,
     or an error message if it fails.
     """
+    mutating = True
+    thread_safe = True
+
     def __init__(self, name="clone_github_repo"):
         super().__init__()
         self.name = name
@@ -46,6 +48,7 @@ class CloneRepo(BaseTool):
 
     def fn(self, repo_url, local_dir):
         logger.debug(f"Cloning repository {repo_url} to {local_dir}")
+        import git
 
         # Ensure the local directory exists
         local_dir_path = Path(local_dir)
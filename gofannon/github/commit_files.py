@@ -2,7 +2,6 @@ import os
 
 import requests
 import json
-import git
 from pathlib import Path
 
 from..base import BaseTool
@@ -13,6 +12,9 @@ logger = logging.getLogger(__name__)
 
 @FunctionRegistry.register
 class CommitFiles(BaseTool):
+    mutating = True
+    thread_safe = True
+
     def __init__(self,
                  api_key=None,
                  name="commit_files",
@@ -64,6 +66,8 @@ class CommitFiles(BaseTool):
 
     def fn(self, repo_url, branch, commit_msg, files_json, base_branch='main'):
         logger.debug(f"Committing files to {repo_url}")
+        import git
+
         # Extracting the owner and repo name from the URL
         repo_parts = repo_url.rstrip('/').split('/')
         owner = repo_parts[-2]
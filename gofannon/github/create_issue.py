@@ -1,4 +1,3 @@
-from requests import post
 from json import dumps
 from..base import BaseTool
 from ..config import FunctionRegistry
@@ -8,6 +7,9 @@ logger = logging.getLogger(__name__)
 
 @FunctionRegistry.register
 class CreateIssue(BaseTool):
+    mutating = True
+    thread_safe = True
+
     def __init__(self,
                  api_key=None,
                  name="create_issue"):
@@ -48,8 +50,7 @@ class CreateIssue(BaseTool):
             }
         }
 
-    def fn(self, repo_url, title, body, labels=None):
-        logger.debug(f"Crating issue'{title}' in repo {repo_url}")
+    def _request(self, repo_url, title, body, labels):
         # Extracting the owner and repo name from the URL
         repo_parts = repo_url.rstrip('/').split('/')
         owner = repo_parts[-2]
@@ -68,8 +69,22 @@ class CreateIssue(BaseTool):
 
         if labels:
             payload["labels"] = labels.split(',')
+        return api_url, headers, payload
+
+    def fn(self, repo_url, title, body, labels=None):
+        logger.debug(f"Crating issue'{title}' in repo {repo_url}")
+        api_url, headers, payload = self._request(repo_url, title, body, labels)
+
+        response = self.http_session().post(api_url, headers=headers, json=payload)
+        response.raise_for_status()
+
+        return dumps(response.json())
+
+    async def afn(self, repo_url, title, body, labels=None):
+        logger.debug(f"Crating issue'{title}' in repo {repo_url}")
+        api_url, headers, payload = self._request(repo_url, title, body, labels)
 
-        response = post(api_url, headers=headers, json=payload)
+        response = await self.async_http_client().post(api_url, headers=headers, json=payload)
         response.raise_for_status()
 
-        return dumps(response.json())
\ No newline at end of file
+        return dumps(response.json())
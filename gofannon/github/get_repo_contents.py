@@ -1,4 +1,5 @@
-import requests
+import asyncio
+
 from ..base import BaseTool
 from ..config import FunctionRegistry
 import logging
@@ -7,6 +8,10 @@ logger = logging.getLogger(__name__)
 
 @FunctionRegistry.register
 class GetRepoContents(BaseTool):
+    thread_safe = True
+    # Requests ``afn`` keeps in flight at once; large repos would otherwise
+    # exhaust the shared client's connection pool and the GitHub rate limit.
+    max_concurrent_requests = 8
 
     def __init__(self,
                  api_key=None,
@@ -56,23 +61,26 @@ class GetRepoContents(BaseTool):
             }
         }
 
+    def _contents_url(self, repo_url, directory_path):
+        # Extracting the owner and repo name from the URL
+        repo_parts = repo_url.rstrip('/').split('/')
+        owner = repo_parts[-2]
+        repo = repo_parts[-1]
+        return f"https://api.github.com/repos/{owner}/{repo}/contents/{directory_path}"
+
     def fn(self, repo_url,
            directory_path = "/",
            eoi = None)-> str:
         logger.debug(f"Getting contents of repo {repo_url}")
         if eoi is None:
             eoi = self.eoi
-        # Extracting the owner and repo name from the URL
-        repo_parts = repo_url.rstrip('/').split('/')
-        owner = repo_parts[-2]
-        repo = repo_parts[-1]
-
-        api_url = f"https://api.github.com/repos/{owner}/{repo}/contents/{directory_path}"
+        api_url = self._contents_url(repo_url, directory_path)
         headers = {
             'Authorization': f'token {self.api_key}'
         }
 
-        response = requests.get(api_url, headers=headers)
+        session = self.http_session()
+        response = session.get(api_url, headers=headers)
         response.raise_for_status()
 
         contents = response.json()
@@ -81,12 +89,12 @@ class GetRepoContents(BaseTool):
 
         for item in contents:
             if item['type'] == 'file':
-                file_response = requests.get(item['download_url'], headers=headers)
                 extension = item['name'].split('.')[-1]
                 if extension in eoi:
                     language = eoi[extension]
                 else:
                     continue
+                file_response = session.get(item['download_url'], headers=headers)
                 file_response.raise_for_status()
                 file_content = file_response.text
                 result.append(f"{item['path']}\n```{language}\n{file_content}\n```")
@@ -95,4 +103,47 @@ class GetRepoContents(BaseTool):
                 subdirectory_contents = self.fn(repo_url, item['path'], eoi)
                 result.append(subdirectory_contents)
 
-        return "\n\n".join(result)
\ No newline at end of file
+        return "\n\n".join(result)
+
+    async def afn(self, repo_url,
+                  directory_path = "/",
+                  eoi = None)-> str:
+        """
+        Async counterpart of ``fn``; files and subdirectories are fetched
+        concurrently, at most ``max_concurrent_requests`` at a time.
+        """
+        logger.debug(f"Getting contents of repo {repo_url}")
+        if eoi is None:
+            eoi = self.eoi
+        headers = {
+            'Authorization': f'token {self.api_key}'
+        }
+        semaphore = asyncio.Semaphore(self.max_concurrent_requests)
+        return await self._afetch_directory(repo_url, directory_path, eoi, headers, semaphore)
+
+    async def _afetch_directory(self, repo_url, directory_path, eoi, headers, semaphore):
+        client = self.async_http_client()
+
+        async def get(url):
+            # Only the requests hold the semaphore, not the recursion, so that
+            # nested directories can't starve their parents.
+            async with semaphore:
+                response = await client.get(url, headers=headers)
+            response.raise_for_status()
+            return response
+
+        async def fetch_file(item, language):
+            file_response = await get(item['download_url'])
+            return f"{item['path']}\n```{language}\n{file_response.text}\n```"
+
+        response = await get(self._contents_url(repo_url, directory_path))
+        pending = []
+        for item in response.json():
+            if item['type'] == 'file':
+                extension = item['name'].split('.')[-1]
+                if extension in eoi:
+                    pending.append(fetch_file(item, eoi[extension]))
+            elif item['type'] == 'dir':
+                pending.append(self._afetch_directory(repo_url, item['path'], eoi, headers, semaphore))
+
+        return "\n\n".join(await asyncio.gather(*pending))
@@ -1,5 +1,4 @@
 from..base import BaseTool
-from requests import get
 import json
 from ..config import FunctionRegistry
 import logging
@@ -9,6 +8,8 @@ logger = logging.getLogger(__name__)
 
 @FunctionRegistry.register
 class ListIssues(BaseTool):
+    thread_safe = True
+
     def __init__(self, api_key=None, name="list_issues"):
         super().__init__()
         self.api_key = api_key
@@ -61,8 +62,7 @@ class ListIssues(BaseTool):
             }
         }
 
-    def fn(self, repo_url, state="open", labels=None, sort="created", direction="desc", since=None):
-        logger.debug(f"Listing issues for repo {repo_url} with state={state}")
+    def _request(self, repo_url, state, labels, sort, direction, since):
         # Extracting the owner and repo name from the URL
         repo_parts = repo_url.rstrip('/').split('/')
         owner = repo_parts[-2]
@@ -83,13 +83,9 @@ class ListIssues(BaseTool):
             params['labels'] = labels
         if since:
             params['since'] = since
+        return api_url, headers, params
 
-        response = get(api_url, headers=headers, params=params)
-        response.raise_for_status()
-
-        issues = response.json()
-
-        # Format the response
+    def _format_issues(self, issues):
         formatted_issues = []
         for issue in issues:
             # Skip pull requests (GitHub API returns PRs as issues too)
@@ -107,4 +103,22 @@ class ListIssues(BaseTool):
                 "user": issue['user']['login']
             })
 
-        return formatted_issues
\ No newline at end of file
+        return formatted_issues
+
+    def fn(self, repo_url, state="open", labels=None, sort="created", direction="desc", since=None):
+        logger.debug(f"Listing issues for repo {repo_url} with state={state}")
+        api_url, headers, params = self._request(repo_url, state, labels, sort, direction, since)
+
+        response = self.http_session().get(api_url, headers=headers, params=params)
+        response.raise_for_status()
+
+        return self._format_issues(response.json())
+
+    async def afn(self, repo_url, state="open", labels=None, sort="created", direction="desc", since=None):
+        logger.debug(f"Listing issues for repo {repo_url} with state={state}")
+        api_url, headers, params = self._request(repo_url, state, labels, sort, direction, since)
+
+        response = await self.async_http_client().get(api_url, headers=headers, params=params)
+        response.raise_for_status()
+
+        return self._format_issues(response.json())
@@ -1,6 +1,6 @@
-import requests
 import json
 from ..base import BaseTool
+from ..base.cache import CachePolicy
 from ..config import FunctionRegistry
 import logging
 
@@ -13,6 +13,9 @@ class ListRepoFiles(BaseTool):
     This tool fetches the file tree for a given branch and returns a list
     of all file paths.
     """
+    cache_policy = CachePolicy(ttl=300)
+    thread_safe = True
+
     def __init__(self, api_key=None, name="list_repo_files"):
         super().__init__()
         self.api_key = api_key
@@ -43,41 +46,69 @@ class ListRepoFiles(BaseTool):
             }
         }
 
-    def fn(self, repo_url, branch=None):
-        logger.debug(f"Listing files for repo {repo_url}")
+    def _repo_api_url(self, repo_url):
         repo_parts = repo_url.rstrip('/').split('/')
         owner = repo_parts[-2]
         repo_name = repo_parts[-1]
+        return f"https://api.github.com/repos/{owner}/{repo_name}"
 
-        headers = {
+    def _headers(self):
+        return {
             'Authorization': f'token {self.api_key}',
             'Accept': 'application/vnd.github.v3+json'
         }
 
+    def _file_paths(self, tree_data, repo_url, branch):
+        if tree_data.get('truncated'):
+            logger.warning(f"File list for {repo_url} on branch {branch} is truncated because it exceeds the maximum number of items.")
+
+        # Filter for files (blobs) and return their paths
+        file_paths = [item['path'] for item in tree_data['tree'] if item['type'] == 'blob']
+
+        return json.dumps(file_paths, indent=2)
+
+    def fn(self, repo_url, branch=None):
+        logger.debug(f"Listing files for repo {repo_url}")
+        repo_api_url = self._repo_api_url(repo_url)
+        headers = self._headers()
+        session = self.http_session()
+
         # 1. Get the default branch if one isn't specified
         if not branch:
-            repo_api_url = f"https://api.github.com/repos/{owner}/{repo_name}"
-            repo_response = requests.get(repo_api_url, headers=headers)
+            repo_response = session.get(repo_api_url, headers=headers)
             repo_response.raise_for_status()
             branch = repo_response.json()['default_branch']
             logger.debug(f"No branch specified, using default branch: {branch}")
 
         # 2. Get the latest commit SHA for the branch
-        branch_api_url = f"https://api.github.com/repos/{owner}/{repo_name}/branches/{branch}"
-        branch_response = requests.get(branch_api_url, headers=headers)
+        branch_response = session.get(f"{repo_api_url}/branches/{branch}", headers=headers)
         branch_response.raise_for_status()
         tree_sha = branch_response.json()['commit']['commit']['tree']['sha']
 
         # 3. Get the file tree recursively
-        tree_api_url = f"https://api.github.com/repos/{owner}/{repo_name}/git/trees/{tree_sha}?recursive=1"
-        tree_response = requests.get(tree_api_url, headers=headers)
+        tree_response = session.get(f"{repo_api_url}/git/trees/{tree_sha}?recursive=1", headers=headers)
         tree_response.raise_for_status()
-        tree_data = tree_response.json()
 
-        if tree_data.get('truncated'):
-            logger.warning(f"File list for {repo_url} on branch {branch} is truncated because it exceeds the maximum number of items.")
-        
         # 4. Filter for files (blobs) and return their paths
-        file_paths = [item['path'] for item in tree_data['tree'] if item['type'] == 'blob']
-        
-        return json.dumps(file_paths, indent=2)
\ No newline at end of file
+        return self._file_paths(tree_response.json(), repo_url, branch)
+
+    async def afn(self, repo_url, branch=None):
+        logger.debug(f"Listing files for repo {repo_url}")
+        client = self.async_http_client()
+        repo_api_url = self._repo_api_url(repo_url)
+        headers = self._headers()
+
+        if not branch:
+            repo_response = await client.get(repo_api_url, headers=headers)
+            repo_response.raise_for_status()
+            branch = repo_response.json()['default_branch']
+            logger.debug(f"No branch specified, using default branch: {branch}")
+
+        branch_response = await client.get(f"{repo_api_url}/branches/{branch}", headers=headers)
+        branch_response.raise_for_status()
+        tree_sha = branch_response.json()['commit']['commit']['tree']['sha']
+
+        tree_response = await client.get(f"{repo_api_url}/git/trees/{tree_sha}?recursive=1", headers=headers)
+        tree_response.raise_for_status()
+
+        return self._file_paths(tree_response.json(), repo_url, branch)
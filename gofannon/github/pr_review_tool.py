@@ -2,8 +2,6 @@ import os
 import json
 import logging
 import importlib.util
-from github import Github
-from openai import OpenAI
 from gofannon.config import FunctionRegistry
 from gofannon.base import BaseTool
 
@@ -26,13 +24,24 @@ def load_review_checks():
 
 @FunctionRegistry.register
 class PRReviewTool(BaseTool):
+    thread_safe = True
+
     def __init__(self, name="pr_review_tool"):
         super().__init__()
         self.name = name
         self.api_key = os.getenv("OPENAI_API_KEY")
         self.base_url = os.getenv("OPENAI_BASE_URL")
         self.model_name = os.getenv("OPENAI_MODEL_NAME")
-        self.client = OpenAI(api_key=self.api_key, base_url=self.base_url)
+        self._client = None
+
+    @property
+    def client(self):
+        # Built on first use so that snapshotting the definition stays cheap.
+        if self._client is None:
+            from openai import OpenAI
+
+            self._client = OpenAI(api_key=self.api_key, base_url=self.base_url)
+        return self._client
 
     @property
     def definition(self):
@@ -60,6 +69,8 @@ class PRReviewTool(BaseTool):
         }
 
     def fn(self, pr_number, repo_name):
+        from github import Github
+
         # Connect to GitHub and get pull request details.
         g = Github(os.getenv("GITHUB_TOKEN"))
         repo = g.get_repo(repo_name)
@@ -1,4 +1,3 @@
-import requests
 import base64
 from ..base import BaseTool
 from ..config import FunctionRegistry
@@ -13,6 +12,8 @@ class ReadFile(BaseTool):
     This tool takes a repository URL, a file path, and an optional branch name,
     and returns the content of the file as a string.
     """
+    thread_safe = True
+
     def __init__(self, api_key=None, name="read_file"):
         super().__init__()
         self.api_key = api_key
@@ -47,8 +48,7 @@ class ReadFile(BaseTool):
             }
         }
 
-    def fn(self, repo_url, file_path, branch=None):
-        logger.debug(f"Reading file {file_path} from repo {repo_url}")
+    def _request(self, repo_url, file_path, branch):
         repo_parts = repo_url.rstrip('/').split('/')
         owner = repo_parts[-2]
         repo_name = repo_parts[-1]
@@ -61,16 +61,29 @@ class ReadFile(BaseTool):
         params = {}
         if branch:
             params['ref'] = branch
+        return api_url, headers, params
 
-        response = requests.get(api_url, headers=headers, params=params)
-        response.raise_for_status()
-
-        file_data = response.json()
-        
+    def _decode(self, file_data):
         if 'content' not in file_data or file_data.get('encoding') != 'base64':
              raise ValueError(f"Could not retrieve file content. The path might be a directory or the encoding is not base64.")
 
         content_base64 = file_data['content']
-        decoded_content = base64.b64decode(content_base64).decode('utf-8')
-        
-        return decoded_content
\ No newline at end of file
+        return base64.b64decode(content_base64).decode('utf-8')
+
+    def fn(self, repo_url, file_path, branch=None):
+        logger.debug(f"Reading file {file_path} from repo {repo_url}")
+        api_url, headers, params = self._request(repo_url, file_path, branch)
+
+        response = self.http_session().get(api_url, headers=headers, params=params)
+        response.raise_for_status()
+
+        return self._decode(response.json())
+
+    async def afn(self, repo_url, file_path, branch=None):
+        logger.debug(f"Reading file {file_path} from repo {repo_url}")
+        api_url, headers, params = self._request(repo_url, file_path, branch)
+
+        response = await self.async_http_client().get(api_url, headers=headers, params=params)
+        response.raise_for_status()
+
+        return self._decode(response.json())
@@ -1,6 +1,7 @@
 
+import asyncio
+
 from..base import BaseTool
-import requests
 import json
 from ..config import FunctionRegistry
 import logging
@@ -9,6 +10,8 @@ logger = logging.getLogger(__name__)
 
 @FunctionRegistry.register
 class ReadIssue(BaseTool):
+    thread_safe = True
+
     def __init__(self, api_key=None, name="read_issue"):
         super().__init__()
         self.api_key = api_key
@@ -39,8 +42,7 @@ class ReadIssue(BaseTool):
             }
         }
 
-    def fn(self, repo_url, issue_number):
-        logger.debug(f"Reading issue number {issue_number} from repo {repo_url}")
+    def _issue_urls(self, repo_url, issue_number):
         # Extracting the owner and repo name from the URL
         repo_parts = repo_url.rstrip('/').split('/')
         owner = repo_parts[-2]
@@ -48,15 +50,21 @@ class ReadIssue(BaseTool):
 
         issue_url = f"https://api.github.com/repos/{owner}/{repo}/issues/{issue_number}"
         comment_url = f"https://api.github.com/repos/{owner}/{repo}/issues/{issue_number}/comments"
+        return issue_url, comment_url
+
+    def fn(self, repo_url, issue_number):
+        logger.debug(f"Reading issue number {issue_number} from repo {repo_url}")
+        issue_url, comment_url = self._issue_urls(repo_url, issue_number)
 
         headers = {
             'Authorization': f'token {self.api_key}'
         }
 
-        issue_response = requests.get(issue_url, headers=headers)
+        session = self.http_session()
+        issue_response = session.get(issue_url, headers=headers)
         issue_response.raise_for_status()
 
-        comment_response = requests.get(comment_url, headers=headers)
+        comment_response = session.get(comment_url, headers=headers)
         comment_response.raise_for_status()
 
         issue_data = issue_response.json()
@@ -67,4 +75,27 @@ class ReadIssue(BaseTool):
             "comments": comment_data
         }
 
-        return json.dumps(result, indent=4)  
\ No newline at end of file
+        return json.dumps(result, indent=4)
+
+    async def afn(self, repo_url, issue_number):
+        logger.debug(f"Reading issue number {issue_number} from repo {repo_url}")
+        issue_url, comment_url = self._issue_urls(repo_url, issue_number)
+        client = self.async_http_client()
+        headers = {
+            'Authorization': f'token {self.api_key}'
+        }
+
+        # The issue and its comments are independent, so fetch them together.
+        issue_response, comment_response = await asyncio.gather(
+            client.get(issue_url, headers=headers),
+            client.get(comment_url, headers=headers),
+        )
+        issue_response.raise_for_status()
+        comment_response.raise_for_status()
+
+        result = {
+            "issue": issue_response.json(),
+            "comments": comment_response.json()
+        }
+
+        return json.dumps(result, indent=4)
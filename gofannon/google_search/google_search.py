@@ -7,6 +7,8 @@ logger = logging.getLogger(__name__)
 
 @FunctionRegistry.register
 class GoogleSearch(BaseTool):
+    thread_safe = True
+
     def __init__(self, api_key=None, engine_id=None, name="google_search"):
         super().__init__()
         self.api_key = api_key or ToolConfig.get("google_search_api_key")
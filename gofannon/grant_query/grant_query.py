@@ -5,6 +5,8 @@ import requests
 
 logger = logging.getLogger(__name__)
 
+SEARCH_API_URL = "https://api.tech.ec.europe.eu/search-api/prod/rest/search"
+
 @FunctionRegistry.register
 class GrantsQueryTool(BaseTool):
     """Query the EU Grants database for funding opportunities
@@ -12,6 +14,8 @@ class GrantsQueryTool(BaseTool):
     Uses the EU Search API to find grant opportunities based on a search query.
     Returns information about matching grants including title, identifier, deadline date and URL.
     """
+    thread_safe = True
+
     def __init__(self, name="grants_query"):
         super().__init__
         self.name = name
@@ -46,6 +50,43 @@ class GrantsQueryTool(BaseTool):
             }
         }
     
+    def _request_kwargs(self, query, page_size, page_number):
+        return {
+            "params": {
+                "apiKey": "SEDIA", 
+                "text": query, 
+                "pageSize": page_size, 
+                "pageNumber": page_number
+            },
+            "json": {
+                "languages": ["en"],
+                "displayFields": ["title", "identifier", "deadlineDate", "url"]
+            },
+            "timeout": 10
+        }
+
+    def _format_results(self, data, page_number):
+        formatted_results = []
+        for item in data.get("results", []):
+            title = item.get("content")
+            metadata = item.get("metadata", {})
+            deadline = metadata.get("deadlineDate")
+            identifier = metadata.get("identifier")
+            url = item.get("url")
+            
+            formatted_results.append({
+                "title": title,
+                "identifier": identifier,
+                "deadline": deadline,
+                "url": url
+            })
+        
+        return {
+            "total_results": data.get("totalResults", 0),
+            "page": page_number,
+            "grants": formatted_results
+        }
+
     def fn(self, query, page_size=5, page_number=1):
         """Search for EU grants based on a query
         
@@ -68,45 +109,10 @@ class GrantsQueryTool(BaseTool):
             
             logger.debug(f"Searching for EU grants with query: {query}")
 
-            response = requests.post(
-                "https://api.tech.ec.europe.eu/search-api/prod/rest/search",
-                params={
-                    "apiKey": "SEDIA", 
-                    "text": query, 
-                    "pageSize": page_size, 
-                    "pageNumber": page_number
-                },
-                 json={
-                    "languages": ["en"],
-                    "displayFields": ["title", "identifier", "deadlineDate", "url"]
-                },
-                timeout=10
-            )
+            response = self.http_session(SEARCH_API_URL).post(SEARCH_API_URL, **self._request_kwargs(query, page_size, page_number))
             response.raise_for_status()
 
-            data = response.json()
-
-            formatted_results = []
-            for item in data.get("results", []):
-                title = item.get("content")
-                metadata = item.get("metadata", {})
-                deadline = metadata.get("deadlineDate")
-                identifier = metadata.get("identifier")
-                url = item.get("url")
-                
-                formatted_results.append({
-                    "title": title,
-                    "identifier": identifier,
-                    "deadline": deadline,
-                    "url": url
-                })
-            
-            result = {
-                "total_results": data.get("totalResults", 0),
-                "page": page_number,
-                "grants": formatted_results
-            }
-            return result
+            return self._format_results(response.json(), page_number)
              
         except ValueError as e:
             logger.error(f"Value error in eu_grants_query: {str(e)}")
@@ -116,4 +122,29 @@ class GrantsQueryTool(BaseTool):
             raise
         except Exception as e:
             logger.error(f"Unexpected error in eu_grants_query: {str(e)}")
-            raise
\ No newline at end of file
+            raise
+
+    async def afn(self, query, page_size=5, page_number=1):
+        """Async counterpart of ``fn``."""
+        import httpx
+
+        try:
+            if not query:
+                raise ValueError("Query cannot be empty")
+
+            logger.debug(f"Searching for EU grants with query: {query}")
+
+            response = await self.async_http_client(SEARCH_API_URL).post(SEARCH_API_URL, **self._request_kwargs(query, page_size, page_number))
+            response.raise_for_status()
+
+            return self._format_results(response.json(), page_number)
+
+        except ValueError as e:
+            logger.error(f"Value error in eu_grants_query: {str(e)}")
+            raise
+        except httpx.HTTPError as e:
+            logger.error(f"API request failed in eu_grants_query: {str(e)}")
+            raise
+        except Exception as e:
+            logger.error(f"Unexpected error in eu_grants_query: {str(e)}")
+            raise
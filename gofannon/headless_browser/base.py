@@ -1,5 +1,3 @@
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
 from ..base import BaseTool
 import logging
 
@@ -12,6 +10,8 @@ class HeadlessBrowserBase(BaseTool):
     "selenium-chrome", "selenium-firefox", "lightpanda", or "remote".
     Currently, only "selenium-chrome" is supported.
     """
+    thread_safe = True
+
     def __init__(self, provider="selenium-chrome", **kwargs):
         super().__init__(**kwargs)
         self.provider = provider.lower()
@@ -21,6 +21,9 @@ class HeadlessBrowserBase(BaseTool):
 
     def _get_driver(self):
         if self.provider == "selenium-chrome":
+            from selenium import webdriver
+            from selenium.webdriver.chrome.options import Options
+
             chrome_options = Options()
             chrome_options.add_argument("--headless")
             chrome_options.add_argument("--disable-gpu")
@@ -0,0 +1,95 @@
+"""
+Static manifest of the tools shipped with gofannon.
+
+Each entry maps a tool name to the module that defines it, so the catalog can
+be listed, and individual tools loaded, without importing every tool module
+(and its optional backend dependencies) up front. Tools whose public name is
+already taken by another entry are listed under a ``<package>.<name>`` key;
+the name in their definition is unchanged.
+"""
+import importlib
+
+TOOL_MANIFEST = (
+    ("get_article", "gofannon.arxiv.get_article", "GetArticle"),
+    ("search", "gofannon.arxiv.search", "Search"),
+    ("addition", "gofannon.basic_math.addition", "Addition"),
+    ("division", "gofannon.basic_math.division", "Division"),
+    ("exponents", "gofannon.basic_math.exponents", "Exponents"),
+    ("multiplication", "gofannon.basic_math.multiplication", "Multiplication"),
+    ("subtraction", "gofannon.basic_math.subtraction", "Subtraction"),
+    ("list_directory", "gofannon.file.list_directory", "ListDirectory"),
+    ("read_file", "gofannon.file.read_file", "ReadFile"),
+    ("write_file", "gofannon.file.write_file", "WriteFile"),
+    ("get_url_content", "gofannon.get_url_content.get_url_content", "GetUrlContent"),
+    ("grants_query", "gofannon.grant_query.grant_query", "GrantsQueryTool"),
+    ("clone_github_repo", "gofannon.github.clone_repo", "CloneRepo"),
+    ("commit_file", "gofannon.github.commit_file", "CommitFile"),
+    ("commit_files", "gofannon.github.commit_files", "CommitFiles"),
+    ("create_issue", "gofannon.github.create_issue", "CreateIssue"),
+    ("get_repo_contents", "gofannon.github.get_repo_contents", "GetRepoContents"),
+    ("list_issues", "gofannon.github.list_issues", "ListIssues"),
+    ("list_repo_files", "gofannon.github.list_repo_files", "ListRepoFiles"),
+    ("pr_review_tool", "gofannon.github.pr_review_tool", "PRReviewTool"),
+    ("github.read_file", "gofannon.github.read_file", "ReadFile"),
+    ("read_issue", "gofannon.github.read_issue", "ReadIssue"),
+    ("search_repos", "gofannon.github.search", "SearchRepos"),
+    ("google_search", "gofannon.google_search.google_search", "GoogleSearch"),
+    ("headless_browser_get", "gofannon.headless_browser.headless_browser_get", "HeadlessBrowserGet"),
+    ("apod", "gofannon.nasa.apod", "AstronomyPhotoOfTheDayTool"),
+    ("complaints_by_vehicle", "gofannon.nhsta", "ComplaintsByVehicle"),
+    ("iss_locator", "gofannon.open_notify_space.iss_locator", "IssLocator"),
+    ("pdf_reader", "gofannon.pdf_reader.pdf_reader", "ReadPdf"),
+    ("hierarchical_cot", "gofannon.reasoning.hierarchical_cot", "HierarchicalCoT"),
+    ("sequential_cot", "gofannon.reasoning.sequential_cot", "SequentialCoT"),
+    ("tree_of_thought", "gofannon.reasoning.tree_of_thought", "TreeOfThought"),
+    ("get_opportunity", "gofannon.simpler_grants_gov.get_opportunity", "GetOpportunity"),
+    ("list_agencies", "gofannon.simpler_grants_gov.list_agencies", "ListAgencies"),
+    ("query_opportunities_by_applicant_eligibility", "gofannon.simpler_grants_gov.query_by_applicant_eligibility", "QueryByApplicantEligibility"),
+    ("query_opportunities_by_assistance_listing", "gofannon.simpler_grants_gov.query_by_assistance_listing", "QueryByAssistanceListing"),
+    ("query_opportunities_by_award_criteria", "gofannon.simpler_grants_gov.query_by_award_criteria", "QueryByAwardCriteria"),
+    ("query_opportunities_by_dates", "gofannon.simpler_grants_gov.query_by_dates", "QueryByDates"),
+    ("query_opportunities_by_funding_details", "gofannon.simpler_grants_gov.query_by_funding_details", "QueryByFundingDetails"),
+    ("query_opportunities_by_multiple_criteria", "gofannon.simpler_grants_gov.query_by_multiple_criteria", "QueryByMultipleCriteria"),
+    ("query_opportunities", "gofannon.simpler_grants_gov.query_opportunities", "QueryOpportunities"),
+    ("query_opportunities_by_agency", "gofannon.simpler_grants_gov.query_opportunities_by_agency", "QueryOpportunitiesByAgencyCode"),
+    ("search_agencies", "gofannon.simpler_grants_gov.search_agencies", "SearchAgencies"),
+    ("search_opportunities", "gofannon.simpler_grants_gov.search_opportunities", "SearchOpportunities"),
+    ("wikipedia_lookup", "gofannon.wikipedia.wikipedia_lookup", "WikipediaLookup"),
+)
+
+
+def _check_unique(manifest):
+    seen = {}
+    for name, module_path, _ in manifest:
+        if name in seen:
+            raise ValueError(f"Tool name {name!r} is listed twice in the manifest: "
+                             f"{seen[name]} and {module_path}")
+        seen[name] = module_path
+
+
+_check_unique(TOOL_MANIFEST)
+
+
+def lazy_package_attrs(package):
+    """
+    Build PEP 562 ``__getattr__``/``__dir__`` hooks for a tool subpackage.
+
+    The returned ``__getattr__`` imports the defining module the first time
+    one of the package's tool classes is accessed, e.g.
+    ``from gofannon.github import ListRepoFiles``.
+    """
+    classes = {
+        class_name: module_path
+        for _, module_path, class_name in TOOL_MANIFEST
+        if module_path.rpartition('.')[0] == package
+    }
+
+    def __getattr__(name):
+        if name in classes:
+            return getattr(importlib.import_module(classes[name]), name)
+        raise AttributeError(f"module {package!r} has no attribute {name!r}")
+
+    def __dir__():
+        return sorted(set(classes) | set(vars(importlib.import_module(package))))
+
+    return __getattr__, __dir__
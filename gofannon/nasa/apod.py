@@ -1,4 +1,5 @@
 from ..base import BaseTool
+from ..base.cache import CachePolicy
 from ..config import FunctionRegistry, ToolConfig
 import logging
 import requests
@@ -19,6 +20,10 @@ Authentication:
 
 @FunctionRegistry.register
 class AstronomyPhotoOfTheDayTool(BaseTool):
+    # The picture changes once a day; failures are returned as {"error": ...}.
+    cache_policy = CachePolicy(ttl=3600, cache_if=lambda result: "error" not in result)
+    thread_safe = True
+
     def __init__(self, api_key=None ,name='apod'):
         super().__init__()
         self.name = name
@@ -50,7 +55,7 @@ class AstronomyPhotoOfTheDayTool(BaseTool):
         }
 
         try:
-            response = requests.get(url, params=params)
+            response = self.http_session(url).get(url, params=params)
             response.raise_for_status()
             data = response.json()
 
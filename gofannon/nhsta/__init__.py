@@ -1,4 +1,3 @@
-from requests import get
 from json import dumps
 
 from ..base import BaseTool
@@ -9,6 +8,8 @@ logger = logging.getLogger(__name__)
 
 @FunctionRegistry.register
 class ComplaintsByVehicle(BaseTool):
+    thread_safe = True
+
     def __init__(self,
                  api_key=None,
                  name="complaints_by_vehicle",):
@@ -55,5 +56,5 @@ class ComplaintsByVehicle(BaseTool):
             "model": model,
             "modelYear": modelYear
         }
-        r = get(base_url, params=payload)
+        r = self.http_session().get(base_url, params=payload)
         return dumps(r.json())
@@ -1,6 +1,7 @@
 import jsonschema
 import jsonschema.exceptions
 from ..base import BaseTool
+from ..base.breaker import CircuitOpenError
 from ..config import FunctionRegistry
 
 import logging
@@ -37,6 +38,8 @@ error_response_json = {
 
 @FunctionRegistry.register
 class IssLocator(BaseTool):
+    thread_safe = True
+
     def __init__(self, name="iss_locator", format_json=True):
         super().__init__()
         self.name = name
@@ -82,7 +85,7 @@ class IssLocator(BaseTool):
             response = error_response_string
 
         try:
-            http_response = requests.get(base_url)
+            http_response = self.http_session(base_url).get(base_url)
             response_json = http_response.json()
             # Validate the returned schema is valid.
             validate(response_json, valid_iss_schema)
@@ -119,6 +122,10 @@ class IssLocator(BaseTool):
                 f"Value Exception GET at {base_url} malformed response: {errv}"
             )
             pass
+        except CircuitOpenError:
+            # Not an answer from the endpoint; let ``execute`` report it as a
+            # retryable failure.
+            raise
         except Exception as erre:
             logger.debug(f"General exception GET at {base_url} Error: {erre}")
             pass
@@ -1,94 +1,365 @@
+import asyncio
+import contextvars
 import json
+import threading
 import time
+import uuid
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from typing import List, Dict, Any
-from ..base import WorkflowContext, ToolResult
+from ..base import WorkflowContext, ToolResult, deadline, metrics, tracing
+from ..base.cache import make_key
+from ..base.execution_log import LogRetention
 from ..config import FunctionRegistry
+from .tool_pool import ToolPool, default_tool_pool
 import logging
 
 logger = logging.getLogger(__name__)
 
+SYNTHESIS_PROMPT = '''Based on the tool outputs above,   
+            provide a complete natural language answer with final numerical result   
+            in bold. Follow this format:  
+              
+            **Final Answer**: [result in bold]   
+              
+            With supporting calculations shown.'''
+
 class FunctionOrchestrator:
-    def __init__(self, llm_client, tool_configs=None):
+    """
+    Runs an LLM tool-calling loop over the registered tools.
+
+    Args:
+        llm_client: An OpenAI-compatible client.
+        tool_configs: Per-function keyword arguments for tool constructors.
+        max_concurrency: Maximum number of tool calls of one turn that run at
+            the same time. ``1`` runs them one after another.
+        tool_timeout: Seconds a single tool call may take, counted from when
+            it is submitted, before its result is replaced by a timeout error
+            message; ``None`` waits indefinitely.
+        turn_timeout: Seconds all tool calls of one turn may take together;
+            calls still running after that are answered with a timeout error
+            message. ``None`` waits indefinitely.
+        tool_pool: Where tool instances come from. Defaults to a pool owned by
+            this orchestrator; pass ``default_tool_pool()`` to share instances
+            process-wide.
+        context: ``WorkflowContext`` the tool calls are logged to. Defaults to
+            one keeping the last 1000 log entries.
+        dispatcher: A ``WorkerDispatcher`` (see ``gofannon.orchestration.worker``)
+            to run tool calls on remote tool workers instead of in-process.
+    """
+    def __init__(self, llm_client, tool_configs=None, max_concurrency=8, tool_timeout=None,
+                 tool_pool=None, turn_timeout=None, dispatcher=None, context=None):
         self.logger = logging.getLogger(f"{__name__}.FunctionOrchestrator")
         self.llm = llm_client
         self.available_functions = FunctionRegistry.get_tools()
         self.tool_configs = tool_configs or {}
-        self.function_map = self.function_map = self._build_function_map()
+        self.function_map = self._build_function_map()
+        self.max_concurrency = max_concurrency
+        self.tool_timeout = tool_timeout
+        self.turn_timeout = turn_timeout
+        self.dispatcher = dispatcher
+        self.context = context
+        self.tool_pool = tool_pool if tool_pool is not None else ToolPool()
+        self._executor = None
+        self._executor_lock = threading.Lock()
         self.logger.debug("Available functions in orchestrator: " + ', '.join(
             [f['function']['name'] for f in self.available_functions]))
 
     def _build_function_map(self):
         return {
             func_def['function']['name']: (
-                FunctionRegistry._tools[func_def['function']['name']],
+                FunctionRegistry.get_tool_class(func_def['function']['name']),
                 self.tool_configs.get(func_def['function']['name'], {})
             ) for func_def in self.available_functions
         }
 
     def _instantiate_tool(self, function_name):
         tool_class, config = self.function_map[function_name]
-        return tool_class(**config)
+        return self.tool_pool.get(tool_class, config)
+
+    def _get_context(self):
+        with self._executor_lock:
+            if self.context is None:
+                self.context = WorkflowContext(log_retention=LogRetention(max_entries=1000))
+            return self.context
+
+    def _call_tool(self, tool_call):
+        function_name = tool_call.function.name
+        function_args = json.loads(tool_call.function.arguments)
+
+        # Get a configured tool (pooled if thread-safe) and execute
+        tool = self._instantiate_tool(function_name)
+        result = tool.execute(self._get_context(), timeout=tool.timeout, **function_args)
+        return self._tool_message(function_name, result)
+
+    def _tool_message(self, function_name, result):
+        if result.success:
+            return str(result.output)
+        self.logger.warning("Tool call %s failed: %s", function_name, result.error)
+        return f"Error: {result.error}"
+
+    def _timeout_message(self, tool_call, seconds):
+        name = tool_call.function.name
+        self.logger.warning("Tool call %s timed out after %.2gs", name, seconds)
+        return f"Error: {name} timed out after {seconds:.2g} seconds"
+
+    def _call_budget(self, started, turn_deadline):
+        """Deadline of a call started at ``started`` (None if not started yet)."""
+        deadlines = [turn_deadline] if turn_deadline is not None else []
+        if started is not None and self.tool_timeout is not None:
+            deadlines.append(started + self.tool_timeout)
+        return min(deadlines) if deadlines else None
+
+    def _get_executor(self):
+        # One orchestrator may serve workflows from several threads.
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_concurrency,
+                    thread_name_prefix="gofannon-tool",
+                )
+            return self._executor
+
+    def _execute_tool_calls(self, tool_calls):
+        """
+        Run the tool calls of one turn concurrently and return their results in
+        the order of ``tool_calls``.
+
+        Every call must finish within ``tool_timeout`` of being submitted, and
+        within the turn's ``turn_timeout``, including any time spent queued
+        behind busy worker threads. A call that misses its deadline is
+        abandoned: its result becomes an error message and, if it already
+        started, its worker thread finishes in the background with the
+        deadline visible to it (see ``gofannon.base.deadline``) so that it
+        can stop early.
+        """
+        if self.dispatcher is not None:
+            return self._dispatch_tool_calls(tool_calls)
+        if (self.tool_timeout is None and self.turn_timeout is None
+                and (self.max_concurrency <= 1 or len(tool_calls) == 1)):
+            return [self._call_tool(tool_call) for tool_call in tool_calls]
+
+        turn_start = time.monotonic()
+        turn_deadline = turn_start + self.turn_timeout if self.turn_timeout is not None else None
+        budget = self._call_budget(turn_start, turn_deadline)
+
+        def run(tool_call):
+            remaining = budget - time.monotonic() if budget is not None else None
+            if remaining is not None and remaining <= 0:
+                # Dequeued after its deadline; don't start it at all.
+                return self._timeout_message(tool_call, budget - turn_start)
+            with deadline.scope(remaining):
+                return self._call_tool(tool_call)
+
+        executor = self._get_executor()
+        futures = [
+            # Tool spans nest under the turn that made the call.
+            executor.submit(contextvars.copy_context().run, run, tool_call)
+            for tool_call in tool_calls
+        ]
+        wait(futures, timeout=budget - time.monotonic() if budget is not None else None)
+
+        results = []
+        abandoned = False
+        for future, tool_call in zip(futures, tool_calls):
+            if future.done():
+                results.append(future.result())
+                continue
+            if not future.cancel():
+                abandoned = True
+            results.append(self._timeout_message(tool_call, budget - turn_start))
+        if abandoned:
+            self._retire_executor(executor)
+        return results
+
+    def _retire_executor(self, executor):
+        # Threads stuck in abandoned calls would otherwise keep the executor's
+        # slots busy and starve later turns. The next turn gets a fresh
+        # executor; the stuck threads exit once their calls return.
+        with self._executor_lock:
+            if self._executor is executor:
+                self._executor = None
+
+    def _dispatch_tool_calls(self, tool_calls):
+        """Run the tool calls of one turn on the dispatcher's workers."""
+        # The calls of a turn run side by side on the workers, so each gets
+        # the whole turn budget (or less, per ``tool_timeout``).
+        limits = [t for t in (self.tool_timeout, self.turn_timeout) if t is not None]
+        timeout = min(limits) if limits else None
+        calls = [(tc.function.name, json.loads(tc.function.arguments), timeout)
+                 for tc in tool_calls]
+        with tracing.span("dispatch", "tool", calls=len(calls)):
+            results = self.dispatcher.call_many(calls)
+        return [str(r.output) if r.success else f"Error: {r.error}" for r in results]
+
+    def close(self):
+        """Release the worker threads used for concurrent tool calls."""
+        with self._executor_lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False)
+                self._executor = None
+
+    def _complete(self, **kwargs):
+        start = metrics.clock()
+        try:
+            with tracing.span("llm.completion", "llm", model=kwargs["model"]):
+                response = self.llm.chat.completions.create(**kwargs)
+        except Exception as e:
+            metrics.record_llm_call(kwargs["model"], "orchestrator", metrics.clock() - start, error=e)
+            raise
+        metrics.record_llm_call(kwargs["model"], "orchestrator", metrics.clock() - start, response)
+        return response
 
     def execute_workflow(self, user_query: str, model_name: str, max_steps=5):
+        with tracing.span("workflow", "orchestrator", model=model_name):
+            return self._execute_workflow(user_query, model_name, max_steps)
+
+    def _execute_workflow(self, user_query, model_name, max_steps):
         self.logger.debug("Starting workflow execution with query: %s", user_query)
         messages = [{"role": "user", "content": user_query}]
         final_answer = None
 
-        for _ in range(max_steps):
-            # Get LLM response
-            response = self.llm.chat.completions.create(
+        for turn in range(max_steps):
+            with tracing.span("turn", "orchestrator", turn=turn):
+                # Get LLM response
+                response = self._complete(
+                    model=model_name,
+                    messages=messages,
+                    tools=self.available_functions
+                )
+                msg = response.choices[0].message
+                messages.append(msg)
+
+                # Check for direct answer first
+                if msg.content and not msg.tool_calls:
+                    final_answer = msg.content
+                    break
+
+                    # Process tool calls if any
+                if msg.tool_calls:
+                    # Calls of one turn are independent; run them together but
+                    # answer them in the order the model made them.
+                    results = self._execute_tool_calls(msg.tool_calls)
+                    for tool_call, result in zip(msg.tool_calls, results):
+                        # Store result in context
+                        messages.append({
+                            "role": "tool",
+                            "tool_call_id": tool_call.id,
+                            "content": result,
+                            # "name": function_name
+                        })
+                else:
+                    break  # Exit if no tools called and no content
+
+        # Final synthesis step
+        if not final_answer:
+            messages.append({"role": "user", "content": SYNTHESIS_PROMPT})
+
+            response = self._complete(
                 model=model_name,
-                messages=messages,
-                tools=self.available_functions
+                messages=messages
             )
-            msg = response.choices[0].message
-            messages.append(msg)
+            final_answer = response.choices[0].message.content
 
-            # Check for direct answer first
-            if msg.content and not msg.tool_calls:
-                final_answer = msg.content
-                break
+        return {
+            "conversation": messages,
+            "final_answer": final_answer
+        }
 
-                # Process tool calls if any
-            if msg.tool_calls:
-                for tool_call in msg.tool_calls:
-                    function_name = tool_call.function.name
+class AsyncFunctionOrchestrator(FunctionOrchestrator):
+    """
+    ``FunctionOrchestrator`` for async LLM clients (e.g. ``openai.AsyncOpenAI``).
 
-                    function_args = json.loads(tool_call.function.arguments)
+    LLM requests and tool calls are awaited instead of blocking a thread, so one
+    event loop can run many workflows concurrently. Tools run through
+    ``BaseTool.execute_async``: natively if they define ``afn``, in a worker
+    thread otherwise. Takes the same arguments as ``FunctionOrchestrator``.
+    """
 
-                    # Execute function
-                    # Get tool class and configuration
-                    tool_class, config = self.function_map[function_name]
+    async def _call_tool_async(self, tool_call):
+        function_args = json.loads(tool_call.function.arguments)
+        tool = self._instantiate_tool(tool_call.function.name)
+        try:
+            result = ToolResult(success=True, output=await tool.execute_async(function_args))
+        except Exception as e:
+            # Reported to the model like the failures of ``execute``.
+            result = ToolResult(success=False, output=None, error=str(e))
+        return self._tool_message(tool_call.function.name, result)
 
-                    # Instantiate tool with configuration
-                    tool = tool_class(**config)
+    async def _execute_tool_calls_async(self, tool_calls):
+        if self.dispatcher is not None:
+            import anyio
 
-                    # Execute function
-                    result = tool.fn(**function_args)
+            return await anyio.to_thread.run_sync(self._dispatch_tool_calls, tool_calls)
+        semaphore = asyncio.Semaphore(max(self.max_concurrency, 1))
+        turn_deadline = (time.monotonic() + self.turn_timeout
+                         if self.turn_timeout is not None else None)
 
-                    # Store result in context
-                    messages.append({
-                        "role": "tool",
-                        "tool_call_id": tool_call.id,
-                        "content": str(result),#.output,
-                        # "name": function_name
-                    })
-            else:
-                break  # Exit if no tools called and no content
+        async def run(tool_call):
+            async with semaphore:
+                now = time.monotonic()
+                budget = self._call_budget(now, turn_deadline)
+                timeout = max(budget - now, 0) if budget is not None else None
+                try:
+                    return await deadline.await_with_timeout(
+                        self._call_tool_async(tool_call), timeout, tool_call.function.name)
+                except deadline.ToolTimeoutError as e:
+                    if timeout is None:
+                        # The tool's own ``timeout``.
+                        self.logger.warning("Tool call %s: %s", tool_call.function.name, e)
+                        return f"Error: {e}"
+                    return self._timeout_message(tool_call, timeout)
 
-        # Final synthesis step
-        if not final_answer:
-            synthesis_prompt = '''Based on the tool outputs above,   
-            provide a complete natural language answer with final numerical result   
-            in bold. Follow this format:  
-              
-            **Final Answer**: [result in bold]   
-              
-            With supporting calculations shown.'''
+        return await asyncio.gather(*(run(tool_call) for tool_call in tool_calls))
+
+    async def _complete_async(self, **kwargs):
+        start = metrics.clock()
+        try:
+            with tracing.span("llm.completion", "llm", model=kwargs["model"]):
+                response = await self.llm.chat.completions.create(**kwargs)
+        except Exception as e:
+            metrics.record_llm_call(kwargs["model"], "orchestrator", metrics.clock() - start, error=e)
+            raise
+        metrics.record_llm_call(kwargs["model"], "orchestrator", metrics.clock() - start, response)
+        return response
+
+    async def execute_workflow(self, user_query: str, model_name: str, max_steps=5):
+        with tracing.span("workflow", "orchestrator", model=model_name):
+            return await self._execute_workflow_async(user_query, model_name, max_steps)
+
+    async def _execute_workflow_async(self, user_query, model_name, max_steps):
+        self.logger.debug("Starting async workflow execution with query: %s", user_query)
+        messages = [{"role": "user", "content": user_query}]
+        final_answer = None
+
+        for turn in range(max_steps):
+            with tracing.span("turn", "orchestrator", turn=turn):
+                response = await self._complete_async(
+                    model=model_name,
+                    messages=messages,
+                    tools=self.available_functions
+                )
+                msg = response.choices[0].message
+                messages.append(msg)
 
-            messages.append({"role": "user", "content": synthesis_prompt})
+                if msg.content and not msg.tool_calls:
+                    final_answer = msg.content
+                    break
 
-            response = self.llm.chat.completions.create(
+                if msg.tool_calls:
+                    results = await self._execute_tool_calls_async(msg.tool_calls)
+                    for tool_call, result in zip(msg.tool_calls, results):
+                        messages.append({
+                            "role": "tool",
+                            "tool_call_id": tool_call.id,
+                            "content": result,
+                        })
+                else:
+                    break
+
+        if not final_answer:
+            messages.append({"role": "user", "content": SYNTHESIS_PROMPT})
+
+            response = await self._complete_async(
                 model=model_name,
                 messages=messages
             )
@@ -99,46 +370,224 @@ class FunctionOrchestrator:
             "final_answer": final_answer
         }
 
+
 class ToolChain:
-    def __init__(self, tools: List[Any], context: WorkflowContext):
+    """
+    Runs tools one after another, passing values through ``context.data``.
+
+    Each tool's ``definition["function"]["parameters"]`` maps argument names to
+    literals or ``{{key}}`` templates resolved from ``context.data``; a tool's
+    output is stored under ``"<ToolClass>_output"``.
+
+    With ``parallel=True`` the chain instead builds a dependency graph from
+    those templates and runs steps that don't depend on each other concurrently
+    on up to ``max_workers`` threads. Conflicting steps (one reads a key another
+    writes, or both write the same key) keep their list order, so
+    ``context.data`` ends up exactly as in a sequential run.
+
+    After every step a checkpoint named by ``checkpoint_name`` is saved. The
+    names include ``run_id`` (a fresh id unless one is given), so runs sharing
+    a checkpoint store never see each other's state; pass the ``run_id`` of an
+    interrupted run to ``resume`` it.
+    """
+    # ``completed_steps`` entry ordering the checkpoints of a run.
+    _SEQ_KEY = "checkpoint_seq"
+
+    def __init__(self, tools: List[Any], context: WorkflowContext, parallel=False, max_workers=4,
+                 run_id=None):
         self.tools = tools
         self.context = context
+        self.parallel = parallel
+        self.max_workers = max_workers
+        self.run_id = run_id or uuid.uuid4().hex
+        self._seq = 0
+
+    def checkpoint_name(self, index):
+        """Name of the checkpoint saved after step ``index`` of this run."""
+        return f"{self.run_id}.after_{index}_{self.tools[index].__class__.__name__}"
+
+    @staticmethod
+    def _template_key(input_template):
+        if (isinstance(input_template, str) and input_template.startswith('{{')
+                and input_template.endswith('}}')):
+            return input_template[2:-2].strip()
+        return None
 
     def _resolve_input(self, input_template: str) -> Any:
         if not input_template:
             return None
 
-        if input_template.startswith('{{') and input_template.endswith('}}'):
-            key = input_template[2:-2].strip()
+        key = self._template_key(input_template)
+        if key is not None:
             return self.context.data.get(key)
         return input_template
 
+    def _step_inputs(self, tool):
+        return tool.definition.get('function', {}).get('parameters', {})
+
+    def _resolve_inputs(self, tool):
+        return {k: self._resolve_input(v) for k, v in self._step_inputs(tool).items()}
+
+    def _consumed_keys(self, tool):
+        keys = (self._template_key(v) for v in self._step_inputs(tool).values())
+        return {key for key in keys if key is not None}
+
+    @staticmethod
+    def _output_key(tool):
+        return f"{tool.__class__.__name__}_output"
+
+    @staticmethod
+    def _step_id(index, tool):
+        return f"{index}:{tool.__class__.__name__}"
+
+    def _fingerprint(self, index, tool, inputs):
+        return make_key(self._step_id(index, tool), inputs)
+
+    def _already_done(self, index, tool, inputs):
+        """True if a restored checkpoint shows this step ran with the same inputs."""
+        recorded = self.context.completed_steps.get(self._step_id(index, tool))
+        return (recorded == self._fingerprint(index, tool, inputs)
+                and self._output_key(tool) in self.context.data)
+
+    def _record(self, index, tool, inputs, result):
+        # Store output in context
+        self.context.data[self._output_key(tool)] = result.output
+        self.context.completed_steps[self._step_id(index, tool)] = self._fingerprint(index, tool, inputs)
+
+        # Save checkpoint. Parallel steps finish out of order, and an earlier
+        # attempt of the run may have left checkpoints of later steps, so each
+        # one is stamped to tell which is newest. Wall-clock time keeps the
+        # order across processes resuming the same run.
+        self._seq = max(self._seq + 1, time.time_ns())
+        self.context.completed_steps[self._SEQ_KEY] = self._seq
+        self.context.save_checkpoint(self.checkpoint_name(index))
+
+    def dependencies(self):
+        """For each step, the indices of the earlier steps it must wait for."""
+        last_writer = {}
+        readers = {}
+        dependencies = []
+        for index, tool in enumerate(self.tools):
+            consumed = self._consumed_keys(tool)
+            output_key = self._output_key(tool)
+            # Read after write: wait for the step that produces each input.
+            deps = {last_writer[key] for key in consumed if key in last_writer}
+            # Write after write / read: don't overwrite a value before the
+            # earlier steps are done with it.
+            if output_key in last_writer:
+                deps.add(last_writer[output_key])
+            deps.update(readers.get(output_key, ()))
+
+            for key in consumed:
+                readers.setdefault(key, []).append(index)
+            readers[output_key] = []
+            last_writer[output_key] = index
+            dependencies.append(deps)
+        return dependencies
+
     def execute(self, initial_input: Dict[str, Any] = None) -> ToolResult:
+        return self._run(initial_input, skip_completed=False)
+
+    def _run(self, initial_input, skip_completed):
         self.context.data.update(initial_input or {})
 
-        for tool in self.tools:
-            tool_name = tool.__class__.__name__
+        if self.parallel:
+            return self._execute_parallel(skip_completed)
 
-            # Resolve inputs from context
-            resolved_inputs = {
-                k: self._resolve_input(v)
-                for k, v in tool.definition.get('function', {}).get('parameters', {}).items()
-            }
+        for index, tool in enumerate(self.tools):
+            # Resolve inputs from context and execute tool
+            inputs = self._resolve_inputs(tool)
+            if skip_completed and self._already_done(index, tool, inputs):
+                logger.debug("Skipping %s, completed in a previous run", tool.__class__.__name__)
+                continue
 
-            # Execute tool
-            result = tool.execute(self.context, **resolved_inputs)
+            result = tool.execute(self.context, **inputs)
 
             if not result.success:
                 return result
 
-                # Store output in context
-            output_key = f"{tool_name}_output"
-            self.context.data[output_key] = result.output
+            self._record(index, tool, inputs, result)
+
+        return ToolResult(
+            success=True,
+            output=self.context.data
+        )
+
+    def resume(self, initial_input: Dict[str, Any] = None, checkpoint: str = None) -> ToolResult:
+        """
+        Continue the chain from a checkpoint of an earlier, interrupted run.
+
+        Loads ``checkpoint`` (by default the newest checkpoint saved by the
+        run ``run_id``) and executes the chain, skipping every step whose
+        recorded input fingerprint matches its current inputs. Steps whose
+        inputs changed, e.g. through a different ``initial_input``, run again.
+        Without any checkpoint this is the same as ``execute``.
+        """
+        if checkpoint is None:
+            checkpoint = self._latest_checkpoint()
+        if checkpoint is not None and self.context.load_checkpoint(checkpoint):
+            logger.debug("Resuming chain from checkpoint %s", checkpoint)
+            self._seq = max(self._seq, self.context.completed_steps.get(self._SEQ_KEY, 0))
+        return self._run(initial_input, skip_completed=True)
+
+    def _latest_checkpoint(self):
+        """The newest checkpoint of this run, or None if it saved none."""
+        latest, newest = None, -1
+        for index in range(len(self.tools)):
+            name = self.checkpoint_name(index)
+            if self.context.load_checkpoint(name):
+                seq = self.context.completed_steps.get(self._SEQ_KEY, 0)
+                if seq > newest:
+                    latest, newest = name, seq
+        return latest
+
+    def _execute_parallel(self, skip_completed) -> ToolResult:
+        waiting = dict(enumerate(self.dependencies()))
+        completed = set()
+        failures = {}
+        running = {}
+
+        with ThreadPoolExecutor(max_workers=self.max_workers,
+                                thread_name_prefix="gofannon-chain") as executor:
+            while waiting or running:
+                # Stop scheduling after a failure; let running steps finish.
+                # Skipping a step completed in a previous run can make others
+                # ready, so scan until nothing changes.
+                scheduled = not failures
+                while scheduled:
+                    scheduled = False
+                    for index in sorted(waiting):
+                        if not waiting[index] <= completed:
+                            continue
+                        del waiting[index]
+                        tool = self.tools[index]
+                        # Inputs are resolved here, on the coordinating thread,
+                        # after every step they depend on is recorded.
+                        inputs = self._resolve_inputs(tool)
+                        if skip_completed and self._already_done(index, tool, inputs):
+                            completed.add(index)
+                            scheduled = True
+                            continue
+                        future = executor.submit(contextvars.copy_context().run,
+                                                 tool.execute, self.context, **inputs)
+                        running[future] = (index, inputs)
+                if not running:
+                    break
 
-            # Save checkpoint
-            self.context.save_checkpoint(f"after_{tool_name}")
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                # Record in list order so ties resolve the same way every run.
+                for future in sorted(done, key=lambda f: running[f][0]):
+                    index, inputs = running.pop(future)
+                    result = future.result()
+                    if result.success:
+                        self._record(index, self.tools[index], inputs, result)
+                        completed.add(index)
+                    else:
+                        failures[index] = result
 
+        if failures:
+            return failures[min(failures)]
         return ToolResult(
             success=True,
             output=self.context.data
-        )
\ No newline at end of file
+        )
@@ -1,10 +1,12 @@
 import firebase_admin
-from firebase_admin import credentials, firestore
+from firebase_admin import credentials
 from typing import Optional
 from . import WorkflowContext
+from ..base.checkpoints import FirestoreStore
 
 class FirebaseWrapper:
     _initialized = False
+    _store = None
 
     @classmethod
     def initialize(cls, config_path: Optional[str] = None):
@@ -18,25 +20,18 @@ class FirebaseWrapper:
             cls._initialized = True
 
     @classmethod
-    def get_context(cls, doc_id: str) -> WorkflowContext:
-        db = firestore.client()
-        doc_ref = db.collection('workflows').document(doc_id)
-        doc = doc_ref.get()
+    def store(cls) -> FirestoreStore:
+        """The ``FirestoreStore`` behind ``get_context``/``save_context``."""
+        if cls._store is None:
+            cls._store = FirestoreStore(collection='workflows')
+        return cls._store
 
-        if doc.exists:
-            data = doc.to_dict()
-            context = WorkflowContext(firebase_config=True)
-            context.data = data.get('data', {})
-            context.execution_log = data.get('execution_log', [])
-            return context
-        return WorkflowContext(firebase_config=True)
+    @classmethod
+    def get_context(cls, doc_id: str) -> WorkflowContext:
+        return cls.store().get_context(doc_id)
 
     @classmethod
     def save_context(cls, doc_id: str, context: WorkflowContext):
-        db = firestore.client()
-        doc_ref = db.collection('workflows').document(doc_id)
-        doc_ref.set({
-            'data': context.data,
-            'execution_log': context.execution_log,
-            'timestamp': firestore.SERVER_TIMESTAMP
-        })
\ No newline at end of file
+        # Only fields changed since the context was loaded or last saved are
+        # sent; see FirestoreStore.
+        cls.store().save_context(doc_id, context)
@@ -0,0 +1,65 @@
+import json
+import logging
+import threading
+
+logger = logging.getLogger(__name__)
+
+
+def _config_key(config):
+    # Configs are plain keyword arguments; objects without a JSON form are
+    # keyed by their repr (i.e. by identity for most classes).
+    return json.dumps(config, sort_keys=True, default=repr)
+
+
+class ToolPool:
+    """
+    Configured tool instances reused across tool calls, turns and workflows.
+
+    Tools that declare ``thread_safe = True`` are constructed once per
+    (class, config) and shared by every call, including concurrent ones. Any
+    other tool gets a fresh instance per call, since it may keep per-call state
+    on ``self``.
+
+    Each ``FunctionOrchestrator`` owns a pool by default; pass
+    ``default_tool_pool()`` to share one across the whole process.
+    """
+
+    def __init__(self):
+        self._instances = {}
+        self._lock = threading.Lock()
+
+    def get(self, tool_class, config=None):
+        config = config or {}
+        if not getattr(tool_class, "thread_safe", False):
+            return tool_class(**config)
+
+        key = (tool_class, _config_key(config))
+        tool = self._instances.get(key)
+        if tool is None:
+            with self._lock:
+                tool = self._instances.get(key)
+                if tool is None:
+                    logger.debug("Creating pooled %s instance", tool_class.__name__)
+                    tool = self._instances[key] = tool_class(**config)
+        return tool
+
+    def clear(self):
+        with self._lock:
+            self._instances.clear()
+
+    def __len__(self):
+        return len(self._instances)
+
+
+_default_pool = None
+_default_pool_lock = threading.Lock()
+
+
+def default_tool_pool():
+    """The process-wide ``ToolPool``."""
+    global _default_pool
+    if _default_pool is None:
+        with _default_pool_lock:
+            if _default_pool is None:
+                _default_pool = ToolPool()
+    return _default_pool
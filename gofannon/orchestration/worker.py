@@ -0,0 +1,525 @@
+"""
+Tool workers: run tool calls in other processes or on other machines.
+
+A worker serves tools of the ``FunctionRegistry`` catalog behind a small
+JSON-over-HTTP API, on a TCP port (``127.0.0.1:8700`` by default) or a Unix
+socket::
+
+    GOFANNON_WORKER_TOKEN=... python -m gofannon.orchestration.worker --listen 10.0.0.5:8700
+    GOFANNON_WORKER_TOKEN=... python -m gofannon.orchestration.worker \
+        --listen unix:/run/gofannon/worker.sock --tools get_article search
+
+Every request must carry the shared secret from ``GOFANNON_WORKER_TOKEN`` in
+the ``X-Gofannon-Token`` header; clients read it from the same variable. Only
+tools named with ``--tools`` or marked ``remote_safe`` are served.
+
+- ``GET /tools``: definitions of the tools the worker can run.
+- ``GET /load``: ``{"in_flight", "capacity", "completed", "failed", "pid"}``.
+- ``POST /call``: ``{"calls": [{"name", "arguments", "timeout"?}, ...]}``; the
+  calls of a batch run concurrently and are answered in order as
+  ``{"results": [{"success", "output", "error", "retryable"}, ...], "load": ...}``.
+
+``WorkerDispatcher`` spreads calls over several workers, sending each to the
+least-loaded one, and can be handed to an orchestrator::
+
+    dispatcher = WorkerDispatcher(["10.0.0.5:8700", "10.0.0.6:8700"], token=token)
+    FunctionOrchestrator(llm, dispatcher=dispatcher)
+
+Tools run on the worker with the worker's configuration and credentials;
+outputs that aren't JSON are sent as strings.
+"""
+import argparse
+import hmac
+import http.client
+import json
+import logging
+import os
+import select
+import socket
+import socketserver
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from ..base import ToolResult, WorkflowContext
+from ..base.execution_log import LogRetention
+from ..config import FunctionRegistry
+from .tool_pool import ToolPool
+
+logger = logging.getLogger(__name__)
+
+UNIX_PREFIX = "unix:"
+TOKEN_HEADER = "X-Gofannon-Token"
+TOKEN_ENV = "GOFANNON_WORKER_TOKEN"
+
+
+class ToolWorker:
+    """
+    Runs tool calls by name, tracking its load.
+
+    Args:
+        tool_configs: Per-function keyword arguments for tool constructors.
+        max_concurrency: Calls run at the same time; further calls queue.
+        allowed_tools: Names of tools to serve besides those marked
+            ``remote_safe``.
+    """
+
+    def __init__(self, tool_configs=None, max_concurrency=8, allowed_tools=()):
+        self.tool_configs = tool_configs or {}
+        self.max_concurrency = max_concurrency
+        self.allowed_tools = frozenset(allowed_tools)
+        self.tool_pool = ToolPool()
+        # One context records every call; only the recent log is kept.
+        self.context = WorkflowContext(log_retention=LogRetention(max_entries=1000, spill_bytes=None))
+        self._executor = ThreadPoolExecutor(max_workers=max_concurrency,
+                                            thread_name_prefix="gofannon-worker")
+        self._lock = threading.Lock()
+        self.in_flight = 0
+        self.completed = 0
+        self.failed = 0
+
+    def tools(self):
+        FunctionRegistry.load_all()
+        return [FunctionRegistry.get_definition(name)
+                for name, tool_class in FunctionRegistry.get_tool_classes().items()
+                if self._serves(name, tool_class)]
+
+    def load(self):
+        with self._lock:
+            return {"in_flight": self.in_flight, "capacity": self.max_concurrency,
+                    "completed": self.completed, "failed": self.failed, "pid": os.getpid()}
+
+    def _serves(self, name, tool_class):
+        return name in self.allowed_tools or tool_class.remote_safe
+
+    def _tool_class(self, name):
+        try:
+            tool_class = FunctionRegistry.get_tool_class(name)
+        except KeyError:
+            tool_class = FunctionRegistry.load(name)
+        if not self._serves(name, tool_class):
+            raise PermissionError(f"Tool {name} is not served by this worker")
+        return tool_class
+
+    def call(self, name, arguments, timeout=None):
+        result = None
+        try:
+            tool = self.tool_pool.get(self._tool_class(name), self.tool_configs.get(name, {}))
+            result = tool.execute(self.context, timeout=timeout, **arguments)
+        except Exception as e:
+            result = ToolResult(success=False, output=None, error=f"{type(e).__name__}: {e}")
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+                if result is not None and result.success:
+                    self.completed += 1
+                else:
+                    self.failed += 1
+        return result
+
+    def call_batch(self, calls):
+        """
+        Run ``calls`` (dicts with ``name``, ``arguments``, ``timeout``) concurrently,
+        in order. Raises ``ValueError``, running none of them, if one is malformed.
+        """
+        try:
+            calls = [(c["name"], dict(c.get("arguments") or {}), c.get("timeout"))
+                     for c in calls]
+        except (KeyError, TypeError, ValueError, AttributeError) as e:
+            raise ValueError(f"Malformed call: {e!r}") from e
+        with self._lock:
+            self.in_flight += len(calls)
+        futures = []
+        try:
+            for name, arguments, timeout in calls:
+                futures.append(self._executor.submit(self.call, name, arguments, timeout))
+        finally:
+            # Submitted calls count themselves out when they finish.
+            with self._lock:
+                self.in_flight -= len(calls) - len(futures)
+        return [f.result() for f in futures]
+
+    def close(self):
+        self._executor.shutdown(wait=False)
+
+
+def _result_json(result):
+    return {"success": result.success, "output": result.output, "error": result.error,
+            "retryable": result.retryable}
+
+
+class _WorkerHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def _send(self, status, payload):
+        body = json.dumps(payload, default=str).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _authorized(self):
+        token = self.headers.get(TOKEN_HEADER, "")
+        if hmac.compare_digest(token.encode("utf-8"), self.server.token.encode("utf-8")):
+            return True
+        # The request body, if any, is left unread.
+        self.close_connection = True
+        self._send(401, {"error": "unauthorized"})
+        return False
+
+    def do_GET(self):
+        if not self._authorized():
+            return
+        worker = self.server.worker
+        if self.path == "/load":
+            self._send(200, worker.load())
+        elif self.path == "/tools":
+            self._send(200, {"tools": worker.tools()})
+        else:
+            self._send(404, {"error": "not found"})
+
+    def do_POST(self):
+        if not self._authorized():
+            return
+        if self.path != "/call":
+            self._send(404, {"error": "not found"})
+            return
+        worker = self.server.worker
+        try:
+            length = int(self.headers.get("Content-Length", 0))
+            results = worker.call_batch(json.loads(self.rfile.read(length))["calls"])
+        except (ValueError, KeyError, TypeError) as e:
+            self._send(400, {"error": f"Bad request: {e}"})
+            return
+        self._send(200, {"results": [_result_json(r) for r in results], "load": worker.load()})
+
+    def address_string(self):
+        # Unix sockets have no client address.
+        return str(self.client_address[0]) if self.client_address else "unix"
+
+    def log_message(self, format, *args):
+        logger.debug(format, *args)
+
+
+class _UnixHTTPServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+    def get_request(self):
+        request, _ = super().get_request()
+        return request, ("unix", 0)
+
+
+def start_worker(listen="127.0.0.1:0", worker=None, token=None, **worker_kwargs):
+    """
+    Serve a ``ToolWorker`` on ``listen`` (``host:port`` or ``unix:/path``) from a
+    daemon thread. Returns the server; ``server.address`` is the address to
+    connect to and ``shutdown()`` stops it.
+
+    Requests must send ``token`` (by default ``GOFANNON_WORKER_TOKEN``) in the
+    ``X-Gofannon-Token`` header; a worker without one refuses to start.
+    """
+    token = token or os.getenv(TOKEN_ENV)
+    if not token:
+        raise ValueError(f"A tool worker needs a shared secret: pass token or set {TOKEN_ENV}")
+    worker = worker or ToolWorker(**worker_kwargs)
+    if listen.startswith(UNIX_PREFIX):
+        path = listen[len(UNIX_PREFIX):]
+        if os.path.exists(path):
+            os.unlink(path)
+        server = _UnixHTTPServer(path, _WorkerHandler)
+        server.address = listen
+    else:
+        host, port = listen.rsplit(":", 1)
+        server = ThreadingHTTPServer((host, int(port)), _WorkerHandler)
+        server.daemon_threads = True
+        server.address = f"{host}:{server.server_address[1]}"
+    server.worker = worker
+    server.token = token
+    threading.Thread(target=server.serve_forever, name="gofannon-worker-server",
+                     daemon=True).start()
+    return server
+
+
+class _UnixHTTPConnection(http.client.HTTPConnection):
+    def __init__(self, path, timeout=None):
+        super().__init__("localhost", timeout=timeout)
+        self.socket_path = path
+
+    def connect(self):
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        if self.timeout is not None:
+            self.sock.settimeout(self.timeout)
+        self.sock.connect(self.socket_path)
+
+
+class WorkerUnavailable(ConnectionError):
+    """A worker could not be reached, or turned calls away without running them."""
+    retryable = True
+
+
+class WorkerCallFailed(ConnectionError):
+    """
+    A worker stopped answering after calls were sent to it. They may have run,
+    so they are not sent again unless their tools are idempotent.
+    """
+
+
+class WorkerClient:
+    """
+    Talks to one worker; keeps a connection per calling thread. ``token``
+    defaults to ``GOFANNON_WORKER_TOKEN``.
+    """
+
+    def __init__(self, address, timeout=300, token=None):
+        self.address = address
+        self.timeout = timeout
+        self.token = token or os.getenv(TOKEN_ENV, "")
+        self._local = threading.local()
+
+    def _connection(self):
+        """The calling thread's connection, and whether it was used before."""
+        conn = getattr(self._local, "conn", None)
+        if conn is not None and conn.sock is not None and not self._dropped(conn):
+            return conn, True
+        if conn is not None:
+            conn.close()
+        if self.address.startswith(UNIX_PREFIX):
+            conn = _UnixHTTPConnection(self.address[len(UNIX_PREFIX):], timeout=self.timeout)
+        else:
+            host, port = self.address.rsplit(":", 1)
+            conn = http.client.HTTPConnection(host, int(port), timeout=self.timeout)
+        self._local.conn = conn
+        return conn, False
+
+    @staticmethod
+    def _dropped(conn):
+        # An idle kept-alive connection the worker has closed reads as EOF.
+        return bool(select.select([conn.sock], [], [], 0)[0])
+
+    def _drop(self, conn):
+        conn.close()
+        self._local.conn = None
+
+    def _request(self, method, path, payload=None, replay=False):
+        """
+        Send one request. Failing to connect raises ``WorkerUnavailable``;
+        failing after the request went out raises ``WorkerCallFailed``, unless
+        it is a GET or ``replay`` allows sending it once more over a fresh
+        connection.
+        """
+        body = json.dumps(payload, default=str) if payload is not None else None
+        headers = {TOKEN_HEADER: self.token}
+        if body is not None:
+            headers["Content-Type"] = "application/json"
+        replay = replay or method == "GET"
+        for attempt in (1, 2):
+            conn, reused = self._connection()
+            if not reused:
+                try:
+                    conn.connect()
+                except OSError as e:
+                    self._drop(conn)
+                    raise WorkerUnavailable(f"Worker {self.address} unavailable: {e}") from e
+            try:
+                conn.request(method, path, body=body, headers=headers)
+                response = conn.getresponse()
+                data = json.loads(response.read())
+            except (OSError, http.client.HTTPException, ValueError) as e:
+                self._drop(conn)
+                # The worker may have closed the kept-alive connection just
+                # as the request went out.
+                if reused and replay and attempt == 1 and isinstance(
+                        e, (ConnectionError, http.client.BadStatusLine)):
+                    continue
+                raise WorkerCallFailed(f"Worker {self.address} did not answer: {e}") from e
+            if response.status != 200:
+                raise WorkerUnavailable(f"Worker {self.address} answered {response.status}: "
+                                        f"{data.get('error')}")
+            return data
+
+    def load(self):
+        return self._request("GET", "/load")
+
+    def tools(self):
+        return self._request("GET", "/tools")["tools"]
+
+    def call_batch(self, calls, replay=False):
+        """
+        Returns ``(results, load)`` for ``calls``. Pass ``replay=True`` only if
+        every call may run twice.
+        """
+        data = self._request("POST", "/call", {"calls": calls}, replay=replay)
+        return [ToolResult(**r) for r in data["results"]], data["load"]
+
+
+class WorkerDispatcher:
+    """
+    Sends tool calls to the least-loaded of several workers.
+
+    A worker's load is the number of calls this dispatcher has outstanding on
+    it plus the calls other clients had in flight when it last reported,
+    relative to its capacity. Unreachable workers are skipped for
+    ``retry_down`` seconds and their calls go to the others. Calls a worker
+    received but did not answer fail instead: they may have run. They are
+    marked retryable only if their tools are idempotent, i.e. known here and
+    not ``mutating``.
+    """
+
+    def __init__(self, addresses, timeout=300, retry_down=10.0, token=None):
+        if not addresses:
+            raise ValueError("WorkerDispatcher needs at least one worker address")
+        self.clients = [WorkerClient(a, timeout=timeout, token=token) for a in addresses]
+        self.retry_down = retry_down
+        self._lock = threading.Lock()
+        self._outstanding = {c.address: 0 for c in self.clients}
+        self._reported = {c.address: {"in_flight": 0, "capacity": 1} for c in self.clients}
+        self._down_until = {}
+        # Tool name -> whether its calls may run twice.
+        self._idempotent_tools = {}
+        self._executor = ThreadPoolExecutor(max_workers=max(4, len(self.clients)),
+                                            thread_name_prefix="gofannon-dispatch")
+
+    def _score(self, client, extra=0):
+        reported = self._reported[client.address]
+        # What the worker reported already includes our own calls it had then.
+        others = max(reported["in_flight"] - reported.get("ours", 0), 0)
+        return (self._outstanding[client.address] + extra + others) / max(reported["capacity"], 1)
+
+    def _assign(self, count, exclude=()):
+        """Pick a worker for each of ``count`` calls; returns client per call."""
+        now = time.monotonic()
+        with self._lock:
+            candidates = [c for c in self.clients if c.address not in exclude
+                          and self._down_until.get(c.address, 0) <= now]
+            if not candidates:
+                return None
+            assigned = {c.address: 0 for c in candidates}
+            choice = []
+            for _ in range(count):
+                client = min(candidates, key=lambda c: self._score(c, assigned[c.address]))
+                assigned[client.address] += 1
+                choice.append(client)
+            for address, n in assigned.items():
+                self._outstanding[address] += n
+        return choice
+
+    def _idempotent(self, name):
+        idempotent = self._idempotent_tools.get(name)
+        if idempotent is None:
+            try:
+                try:
+                    tool_class = FunctionRegistry.get_tool_class(name)
+                except KeyError:
+                    tool_class = FunctionRegistry.load(name)
+                idempotent = not tool_class.mutating
+            except (KeyError, ImportError):
+                idempotent = False
+            self._idempotent_tools[name] = idempotent
+        return idempotent
+
+    def _send(self, client, calls):
+        replay = all(self._idempotent(c["name"]) for c in calls)
+        try:
+            results, load = client.call_batch(calls, replay=replay)
+        except (WorkerUnavailable, WorkerCallFailed) as e:
+            with self._lock:
+                self._outstanding[client.address] -= len(calls)
+                if isinstance(e, WorkerUnavailable):
+                    self._down_until[client.address] = time.monotonic() + self.retry_down
+            raise
+        with self._lock:
+            self._outstanding[client.address] -= len(calls)
+            self._reported[client.address] = dict(load, ours=self._outstanding[client.address])
+        return results
+
+    def refresh(self):
+        """Poll every worker for its current load."""
+        for client in self.clients:
+            try:
+                load = client.load()
+            except (WorkerUnavailable, WorkerCallFailed):
+                continue
+            with self._lock:
+                self._reported[client.address] = dict(load, ours=self._outstanding[client.address])
+                self._down_until.pop(client.address, None)
+
+    def call_many(self, calls):
+        """
+        Run ``calls``, a list of ``(name, arguments)`` or ``(name, arguments,
+        timeout)``, across the workers; returns their ``ToolResult``s in order.
+        """
+        calls = [{"name": c[0], "arguments": c[1], "timeout": c[2] if len(c) > 2 else None}
+                 for c in calls]
+        results = [None] * len(calls)
+        pending = list(range(len(calls)))
+        tried = set()
+        while pending:
+            choice = self._assign(len(pending), exclude=tried)
+            if choice is None:
+                for i in pending:
+                    results[i] = ToolResult(success=False, output=None, retryable=True,
+                                            error="No tool worker available")
+                break
+            batches = {}
+            for i, client in zip(pending, choice):
+                batches.setdefault(client, []).append(i)
+            futures = {
+                self._executor.submit(self._send, client, [calls[i] for i in indexes]): (client, indexes)
+                for client, indexes in batches.items()
+            }
+            pending = []
+            for future, (client, indexes) in futures.items():
+                try:
+                    for i, result in zip(indexes, future.result()):
+                        results[i] = result
+                except WorkerUnavailable as e:
+                    logger.warning("%s; retrying its calls elsewhere", e)
+                    tried.add(client.address)
+                    pending.extend(indexes)
+                except WorkerCallFailed as e:
+                    for i in indexes:
+                        results[i] = ToolResult(success=False, output=None, error=str(e),
+                                                retryable=self._idempotent(calls[i]["name"]))
+            pending.sort()
+        return results
+
+    def call(self, name, arguments, timeout=None):
+        return self.call_many([(name, arguments, timeout)])[0]
+
+    def close(self):
+        self._executor.shutdown(wait=False)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Serve gofannon tools to remote orchestrators.")
+    parser.add_argument("--listen", default="127.0.0.1:8700",
+                        help="host:port or unix:/path/to/socket")
+    parser.add_argument("--max-concurrency", type=int, default=8)
+    parser.add_argument("--config", help="JSON file of per-tool constructor arguments")
+    parser.add_argument("--tools", nargs="+", default=(), metavar="NAME",
+                        help="tools to serve besides those marked remote_safe")
+    args = parser.parse_args(argv)
+
+    tool_configs = {}
+    if args.config:
+        with open(args.config) as f:
+            tool_configs = json.load(f)
+    try:
+        server = start_worker(args.listen, tool_configs=tool_configs,
+                              max_concurrency=args.max_concurrency, allowed_tools=args.tools)
+    except ValueError as e:
+        parser.error(str(e))
+    # The first line of output is the address, for whoever spawned us.
+    print(server.address, flush=True)
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
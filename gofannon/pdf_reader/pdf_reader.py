@@ -3,8 +3,6 @@ from ..config import FunctionRegistry, ToolConfig
 import logging
 import requests
 import os
-import pdfplumber
-from pdfminer.pdfparser import PDFSyntaxError
 
 logger = logging.getLogger(__name__)
 
@@ -17,6 +15,10 @@ logger = logging.getLogger(__name__)
 
 @FunctionRegistry.register
 class ReadPdf(BaseTool) :
+    thread_safe = True
+    # Text extraction is pure-Python parsing; keep it off the caller's GIL.
+    cpu_bound = True
+
     def __init__(self, name="pdf_reader"):
         super().__init__()
         self.name=name
@@ -43,6 +45,9 @@ class ReadPdf(BaseTool) :
 
     def fn(self, file_path: str) -> str :
         logger.debug(f"Reading PDF file: {file_path}")
+        import pdfplumber
+        from pdfminer.pdfparser import PDFSyntaxError
+
         try:
             if not os.path.exists(file_path):
                 logger.error(f"File not found: {file_path}")
@@ -1,7 +1,6 @@
 from abc import ABC, abstractmethod
 import json
-from openai import OpenAI
-from gofannon.base import BaseTool
+from gofannon.base import BaseTool, metrics, tracing
 
 sample_depth_chart = [
     {'model_name' : "Qwen/Qwen2.5-72B-Instruct",
@@ -13,6 +12,9 @@ sample_depth_chart = [
 ]
 
 class ReasoningTool(BaseTool, ABC):
+    # ``fn`` collects ``error_context`` on the instance, so every call needs its own.
+    thread_safe = False
+
     def __init__(self,
                  depth_chart = sample_depth_chart
                  ):
@@ -27,17 +29,28 @@ class ReasoningTool(BaseTool, ABC):
         pass
 
     def create_openai_like_client(self, level: int):
+        from openai import OpenAI
+
         return OpenAI(
             api_key=self.depth_chart[level]['api_key'],
             base_url=self.depth_chart[level]['base_url']
         )
 
     def get_response(self, level: int, messages):
-        return self.create_openai_like_client(level).chat.completions.create(
-            model=self.depth_chart[level]['model_name'],
-            messages=messages,
-            temperature=self.depth_chart[level]['temperature']
-        )
+        model = self.depth_chart[level]['model_name']
+        start = metrics.clock()
+        try:
+            with tracing.span("llm.completion", "llm", model=model, level=level):
+                response = self.create_openai_like_client(level).chat.completions.create(
+                    model=model,
+                    messages=messages,
+                    temperature=self.depth_chart[level]['temperature']
+                )
+        except Exception as e:
+            metrics.record_llm_call(model, self.__class__.__name__, metrics.clock() - start, error=e)
+            raise
+        metrics.record_llm_call(model, self.__class__.__name__, metrics.clock() - start, response)
+        return response
 
     def get_debug_info(self):
         """Get current debugging information"""
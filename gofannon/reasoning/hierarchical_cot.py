@@ -1,6 +1,5 @@
 import json
 import logging
-from openai import OpenAI, APIError
 from.base import ReasoningTool
 from ..config import FunctionRegistry
 
@@ -63,6 +62,8 @@ class HierarchicalCoT(ReasoningTool):
             }
 
     def _generate_outline(self, prompt, depth):
+        from openai import APIError
+
         try:
             outline_prompt = f"""Organize this problem into a {depth}-level hierarchical structure:    
             {prompt}    
@@ -123,6 +124,8 @@ class HierarchicalCoT(ReasoningTool):
             return {"error": "Unexpected error during outline generation"}
 
     def _expand_sections(self, node, current_depth, max_depth, path=None):
+        from openai import APIError
+
         if path is None:
             path = []
 
@@ -140,7 +143,6 @@ class HierarchicalCoT(ReasoningTool):
             raise ValueError("Current depth exceeds configured model depth chart")
 
         try:
-            client = self.create_openai_like_client(current_depth)
             expanded = node.copy()
 
             if 'sections' in node:
@@ -170,10 +172,9 @@ class HierarchicalCoT(ReasoningTool):
                         Your output should be a properly formatted JSON only. No preamble, explanations, or markdown ticks (```). """
 
                     try:
-                        response = client.chat.completions.create(
-                            model=self.depth_chart[current_depth]['model_name'],
-                            messages=[{"role": "user", "content": expansion_prompt}],
-                            temperature=self.depth_chart[current_depth]['temperature']
+                        response = self.get_response(
+                            level=current_depth,
+                            messages=[{"role": "user", "content": expansion_prompt}]
                         )
                     except APIError as e:
                         self.error_context.append({
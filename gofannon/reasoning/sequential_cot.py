@@ -1,5 +1,4 @@
 import json
-from openai import OpenAI
 from gofannon.reasoning.base import ReasoningTool
 from ..config import FunctionRegistry
 import logging
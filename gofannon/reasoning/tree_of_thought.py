@@ -1,6 +1,5 @@
 import json
 import logging
-from openai import OpenAI, APIError
 from .base import ReasoningTool
 from ..config import FunctionRegistry
 
@@ -229,6 +228,8 @@ class TreeOfThought(ReasoningTool):
             return {"error": "Deep analysis failed"}
 
     def _safe_get_response(self, level, messages, context_stage):
+        from openai import APIError
+
         try:
             if level >= len(self.depth_chart):
                 error_msg = f"Level {level} not configured in depth_chart"
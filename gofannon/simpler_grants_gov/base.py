@@ -1,13 +1,30 @@
 import requests
 import logging
 import json
-from typing import Optional, Dict, Any
+from dataclasses import dataclass
+from typing import Optional, Dict, Any, Union
 
 from ..base import BaseTool
 from ..config import ToolConfig
 
 logger = logging.getLogger(__name__)
 
+
+
+@dataclass(frozen=True)
+class ApiRequest:
+    """A request built by a tool's ``_build_request``, sent by ``fn`` or ``afn``."""
+    method: str
+    endpoint: str
+    operation: str
+    params: Optional[Dict[str, Any]] = None
+    json_payload: Optional[Dict[str, Any]] = None
+
+
+def is_api_result(result) -> bool:
+    """False for the ``{"error": ..., "success": False}`` responses built by these tools."""
+    return not (isinstance(result, str) and result.startswith('{"error": '))
+
 class SimplerGrantsGovBase(BaseTool):
     """
     Base class for tools interacting with the Simpler Grants Gov API.
@@ -15,6 +32,8 @@ class SimplerGrantsGovBase(BaseTool):
     Handles common setup like API key and base URL management, and provides
     a helper method for making authenticated requests.
     """
+    thread_safe = True
+
     def __init__(self, api_key: Optional[str] = None, base_url: Optional[str] = None, **kwargs):
         super().__init__(**kwargs)
         self.api_key = api_key or ToolConfig.get("simpler_grants_api_key")
@@ -39,22 +58,12 @@ class SimplerGrantsGovBase(BaseTool):
         self.logger.debug(f"Initialized {self.__class__.__name__} with base_url: {self.base_url} and API key {'present' if self.api_key else 'missing'}")
 
 
-    def _make_request(self, method: str, endpoint: str, params: Optional[Dict[str, Any]] = None, json_payload: Optional[Dict[str, Any]] = None) -> str:
+    def _prepare_request(self, method: str, endpoint: str, params: Optional[Dict[str, Any]] = None, json_payload: Optional[Dict[str, Any]] = None):
         """
-        Makes an authenticated request to the Simpler Grants Gov API.
-
-        Args:
-            method: HTTP method (e.g., 'GET', 'POST').
-            endpoint: API endpoint path (e.g., '/v1/opportunities/search').
-            params: URL query parameters.
-            json_payload: JSON body for POST/PUT requests.
+        Validates configuration and builds the URL and headers for a request.
 
         Returns:
-            The JSON response content as a string.
-
-        Raises:
-            requests.exceptions.RequestException: If the request fails.
-            ValueError: If API key or base URL is missing.
+            A ``(full_url, headers)`` tuple.
         """
         if not self.api_key:
             raise ValueError("Simpler Grants Gov API key is missing.")
@@ -77,10 +86,46 @@ class SimplerGrantsGovBase(BaseTool):
             # Be careful logging potentially large/sensitive payloads
             log_payload = json.dumps(json_payload)[:500] # Log truncated payload
             self.logger.debug(f"JSON Payload (truncated): {log_payload}")
+        return full_url, headers
+
+    def _read_response(self, response, full_url: str) -> str:
+        """
+        Returns the body of a successful response as text. Works for both
+        ``requests`` and ``httpx`` responses.
+        """
+        # Check if response is empty or not JSON before trying to parse
+        content_type = response.headers.get('Content-Type', '')
+        if response.content and 'application/json' in content_type:
+            # Return raw text which usually includes JSON string
+            return response.text
+        elif response.content:
+            self.logger.warning(f"Response from {full_url} is not JSON (Content-Type: {content_type}). Returning raw text.")
+            return response.text
+        else:
+            self.logger.warning(f"Received empty response from {full_url}. Status: {response.status_code}")
+            return "" # Return empty string for empty response
+
+    def _make_request(self, method: str, endpoint: str, params: Optional[Dict[str, Any]] = None, json_payload: Optional[Dict[str, Any]] = None) -> str:
+        """
+        Makes an authenticated request to the Simpler Grants Gov API.
+
+        Args:
+            method: HTTP method (e.g., 'GET', 'POST').
+            endpoint: API endpoint path (e.g., '/v1/opportunities/search').
+            params: URL query parameters.
+            json_payload: JSON body for POST/PUT requests.
 
+        Returns:
+            The JSON response content as a string.
+
+        Raises:
+            requests.exceptions.RequestException: If the request fails.
+            ValueError: If API key or base URL is missing.
+        """
+        full_url, headers = self._prepare_request(method, endpoint, params, json_payload)
 
         try:
-            response = requests.request(
+            response = self.http_session(full_url).request(
                 method,
                 full_url,
                 headers=headers,
@@ -89,37 +134,92 @@ class SimplerGrantsGovBase(BaseTool):
                 timeout=30 # Add a reasonable timeout
             )
             response.raise_for_status()  # Raise an exception for bad status codes (4xx or 5xx)
-
-            # Check if response is empty or not JSON before trying to parse
-            content_type = response.headers.get('Content-Type', '')
-            if response.content and 'application/json' in content_type:
-                try:
-                    # Return raw text which usually includes JSON string
-                    return response.text
-                except json.JSONDecodeError as e:
-                    self.logger.error(f"Failed to decode JSON response from {full_url}. Status: {response.status_code}. Content: {response.text[:500]}... Error: {e}")
-                    # Return raw text even if not JSON, could be an error message
-                    return response.text
-            elif response.content:
-                self.logger.warning(f"Response from {full_url} is not JSON (Content-Type: {content_type}). Returning raw text.")
-                return response.text
-            else:
-                self.logger.warning(f"Received empty response from {full_url}. Status: {response.status_code}")
-                return "" # Return empty string for empty response
-
+            return self._read_response(response, full_url)
 
         except requests.exceptions.RequestException as e:
             self.logger.error(f"Request to {full_url} failed: {e}")
             # Re-raise the exception to be handled by the BaseTool's execute method
-            # Or return a formatted error string
-            # return json.dumps({"error": f"API request failed: {e}"})
             raise # Re-raise for BaseTool's error handling
 
+    async def _amake_request(self, method: str, endpoint: str, params: Optional[Dict[str, Any]] = None, json_payload: Optional[Dict[str, Any]] = None) -> str:
+        """
+        Async counterpart of ``_make_request`` using the shared async client.
+
+        Raises:
+            httpx.HTTPError: If the request fails.
+            ValueError: If API key or base URL is missing.
+        """
+        import httpx
+
+        full_url, headers = self._prepare_request(method, endpoint, params, json_payload)
+
+        try:
+            response = await self.async_http_client(full_url).request(
+                method,
+                full_url,
+                headers=headers,
+                params=params,
+                json=json_payload,
+                timeout=30
+            )
+            response.raise_for_status()
+            return self._read_response(response, full_url)
+        except httpx.HTTPError as e:
+            self.logger.error(f"Request to {full_url} failed: {e}")
+            raise
 
-    # Subclasses must implement definition and fn
+    def _fetch(self, request: Union[ApiRequest, str], raise_retryable: bool = False) -> str:
+        """
+        Sends ``request`` and converts failures into a JSON error string
+        (``"<operation> failed: <reason>"``). With ``raise_retryable``,
+        failures worth retrying (see ``is_retryable``) are raised instead. A
+        string (a validation error returned by ``_build_request``) is passed
+        through unchanged.
+        """
+        if isinstance(request, str):
+            return request
+        try:
+            result = self._make_request(request.method, request.endpoint, params=request.params,
+                                        json_payload=request.json_payload)
+            self.logger.debug(f"{request.operation} succeeded. Response length: {len(result)}")
+            return result
+        except Exception as e:
+            return self._error_response(request, e, raise_retryable)
+
+    async def _afetch(self, request: Union[ApiRequest, str], raise_retryable: bool = False) -> str:
+        """Async counterpart of ``_fetch`` using the shared async client."""
+        if isinstance(request, str):
+            return request
+        try:
+            result = await self._amake_request(request.method, request.endpoint, params=request.params,
+                                               json_payload=request.json_payload)
+            self.logger.debug(f"{request.operation} succeeded. Response length: {len(result)}")
+            return result
+        except Exception as e:
+            return self._error_response(request, e, raise_retryable)
+
+    def _error_response(self, request: ApiRequest, e: Exception, raise_retryable: bool) -> str:
+        if raise_retryable and self.is_retryable(e):
+            raise e
+        self.logger.error(f"{request.operation} failed: {e}", exc_info=True)
+        return json.dumps({"error": f"{request.operation} failed: {str(e)}", "success": False})
+
+    def _fn_raw(self, **kwargs) -> str:
+        return self._fetch(self._build_request(**kwargs), raise_retryable=True)
+
+    async def _afn_raw(self, **kwargs) -> str:
+        return await self._afetch(self._build_request(**kwargs), raise_retryable=True)
+
+    def _build_request(self, *args, **kwargs) -> Union[ApiRequest, str]:
+        """
+        Subclasses turn their arguments into an ``ApiRequest``, or return a
+        JSON error string for invalid arguments. Their ``fn`` and ``afn`` keep
+        the tool's typed signature (MCP and the cache keys are built from it)
+        and send the request with ``_fetch`` and ``_afetch``.
+        """
+        raise NotImplementedError("Subclasses must implement '_build_request'.")
+
+    # Subclasses must implement definition and _build_request
     @property
     def definition(self):
         raise NotImplementedError("Subclasses must implement the 'definition' property.")
-
-    def fn(self, *args, **kwargs):
-        raise NotImplementedError("Subclasses must implement the 'fn' method.")
\ No newline at end of file
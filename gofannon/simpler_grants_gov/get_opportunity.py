@@ -1,8 +1,9 @@
 import logging
-from typing import Optional
+from typing import Optional, Union
 import json
 
-from .base import SimplerGrantsGovBase
+from .base import ApiRequest, SimplerGrantsGovBase, is_api_result
+from ..base.cache import CachePolicy
 from ..config import FunctionRegistry
 
 logger = logging.getLogger(__name__)
@@ -13,6 +14,8 @@ class GetOpportunity(SimplerGrantsGovBase):
     Tool to retrieve details for a specific grant opportunity by its ID.
     Corresponds to the GET /v1/opportunities/{opportunity_id} endpoint.
     """
+    cache_policy = CachePolicy(ttl=900, cache_if=is_api_result)
+
     def __init__(self, api_key: Optional[str] = None, base_url: Optional[str] = None, name: str = "get_opportunity"):
         super().__init__(api_key=api_key, base_url=base_url)
         self.name = name
@@ -39,14 +42,20 @@ class GetOpportunity(SimplerGrantsGovBase):
         }
 
     def fn(self, opportunity_id: int) -> str:
+        return self._fetch(self._build_request(opportunity_id))
+
+    async def afn(self, opportunity_id: int) -> str:
+        return await self._afetch(self._build_request(opportunity_id))
+
+    def _build_request(self, opportunity_id: int) -> Union[ApiRequest, str]:
         """
-        Executes the get opportunity request.
+        Builds the get opportunity request.
 
         Args:
             opportunity_id: The ID of the opportunity to retrieve.
 
         Returns:
-            A JSON string representing the opportunity details.
+            The request, or a JSON error string for an invalid ID.
         """
         self.logger.info(f"Executing Simpler Grants Gov get opportunity tool for ID: {opportunity_id}")
 
@@ -56,11 +65,4 @@ class GetOpportunity(SimplerGrantsGovBase):
             return json.dumps({"error": "Invalid opportunity_id provided. Must be a positive integer.", "success": False})
 
         endpoint = f"/v1/opportunities/{opportunity_id}"
-        try:
-            result = self._make_request("GET", endpoint)
-            self.logger.debug(f"Get opportunity successful for ID {opportunity_id}. Response length: {len(result)}")
-            return result
-        except Exception as e:
-            self.logger.error(f"Get opportunity failed for ID {opportunity_id}: {e}", exc_info=True)
-            # Return a JSON error string
-            return json.dumps({"error": f"Get opportunity failed: {str(e)}", "success": False})
+        return ApiRequest("GET", endpoint, "Get opportunity")
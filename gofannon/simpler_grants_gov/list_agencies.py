@@ -1,8 +1,9 @@
 import logging
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Union
 import json
 
-from .base import SimplerGrantsGovBase
+from .base import ApiRequest, SimplerGrantsGovBase, is_api_result
+from ..base.cache import CachePolicy
 from ..config import FunctionRegistry
 
 logger = logging.getLogger(__name__)
@@ -14,6 +15,8 @@ class ListAgencies(SimplerGrantsGovBase):
     Corresponds to the POST /v1/agencies endpoint.
     NOTE: The API uses POST for listing/filtering, not GET.
     """
+    cache_policy = CachePolicy(ttl=3600, cache_if=is_api_result)
+
     def __init__(self, api_key: Optional[str] = None, base_url: Optional[str] = None, name: str = "list_agencies"):
         super().__init__(api_key=api_key, base_url=base_url)
         self.name = name
@@ -64,8 +67,14 @@ class ListAgencies(SimplerGrantsGovBase):
         }
 
     def fn(self, pagination: Dict[str, Any], filters: Optional[Dict[str, Any]] = None) -> str:
+        return self._fetch(self._build_request(pagination, filters))
+
+    async def afn(self, pagination: Dict[str, Any], filters: Optional[Dict[str, Any]] = None) -> str:
+        return await self._afetch(self._build_request(pagination, filters))
+
+    def _build_request(self, pagination: Dict[str, Any], filters: Optional[Dict[str, Any]] = None) -> Union[ApiRequest, str]:
         """
-        Executes the list agencies request.
+        Builds the list agencies request.
         """
         self.logger.info("Executing Simpler Grants Gov list agencies tool")
         payload = {"pagination": pagination}
@@ -73,11 +82,5 @@ class ListAgencies(SimplerGrantsGovBase):
             payload["filters"] = filters
 
         endpoint = "/v1/agencies"
-        try:
-            result = self._make_request("POST", endpoint, json_payload=payload)
-            self.logger.debug(f"List agencies successful. Response length: {len(result)}")
-            return result
-        except Exception as e:
-            self.logger.error(f"List agencies failed: {e}", exc_info=True)
-            return json.dumps({"error": f"List agencies failed: {str(e)}", "success": False})
+        return ApiRequest("POST", endpoint, "List agencies", json_payload=payload)
   
\ No newline at end of file
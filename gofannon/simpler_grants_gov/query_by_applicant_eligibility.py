@@ -1,7 +1,8 @@
 import logging
 import json
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Union
 
+from .base import ApiRequest
 from .search_base import SearchOpportunitiesBase
 from ..config import FunctionRegistry
 
@@ -82,6 +83,44 @@ class QueryByApplicantEligibility(SearchOpportunitiesBase):
            show_forecasted: bool = False,
            show_closed: bool = False,
            show_archived: bool = False) -> str:
+        return self._fetch(self._build_request(
+            applicant_types, requires_cost_sharing, query_text, query_operator,
+            items_per_page, page_number, order_by, sort_direction, show_posted,
+            show_forecasted, show_closed, show_archived))
+
+    async def afn(self,
+           applicant_types: Optional[List[str]] = None,
+           requires_cost_sharing: Optional[bool] = None,
+           query_text: Optional[str] = None,
+           query_operator: str = "AND",
+           # Common params
+           items_per_page: int = 5,
+           page_number: int = 1,
+           order_by: str = "relevancy",
+           sort_direction: str = "descending",
+           show_posted: bool = True,
+           show_forecasted: bool = False,
+           show_closed: bool = False,
+           show_archived: bool = False) -> str:
+        return await self._afetch(self._build_request(
+            applicant_types, requires_cost_sharing, query_text, query_operator,
+            items_per_page, page_number, order_by, sort_direction, show_posted,
+            show_forecasted, show_closed, show_archived))
+
+    def _build_request(self,
+           applicant_types: Optional[List[str]] = None,
+           requires_cost_sharing: Optional[bool] = None,
+           query_text: Optional[str] = None,
+           query_operator: str = "AND",
+           # Common params
+           items_per_page: int = 5,
+           page_number: int = 1,
+           order_by: str = "relevancy",
+           sort_direction: str = "descending",
+           show_posted: bool = True,
+           show_forecasted: bool = False,
+           show_closed: bool = False,
+           show_archived: bool = False) -> Union[ApiRequest, str]:
 
         self.logger.info(f"Querying by applicant eligibility: types={applicant_types}, cost_sharing={requires_cost_sharing}, query='{query_text}'")
 
@@ -111,4 +150,4 @@ class QueryByApplicantEligibility(SearchOpportunitiesBase):
             show_archived=show_archived,
             query_operator=query_operator
         )
-        return self._execute_search(payload)  
\ No newline at end of file
+        return self._search_request(payload)  
\ No newline at end of file
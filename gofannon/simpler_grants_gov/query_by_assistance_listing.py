@@ -1,7 +1,8 @@
 import logging
 import json
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Union
 
+from .base import ApiRequest
 from .search_base import SearchOpportunitiesBase
 from ..config import FunctionRegistry
 
@@ -70,6 +71,42 @@ class QueryByAssistanceListing(SearchOpportunitiesBase):
            show_forecasted: bool = False,
            show_closed: bool = False,
            show_archived: bool = False) -> str:
+        return self._fetch(self._build_request(
+            assistance_listing_numbers, query_text, query_operator, items_per_page,
+            page_number, order_by, sort_direction, show_posted, show_forecasted,
+            show_closed, show_archived))
+
+    async def afn(self,
+           assistance_listing_numbers: List[str],
+           query_text: Optional[str] = None,
+           query_operator: str = "AND",
+           # Common params
+           items_per_page: int = 5,
+           page_number: int = 1,
+           order_by: str = "relevancy",
+           sort_direction: str = "descending",
+           show_posted: bool = True,
+           show_forecasted: bool = False,
+           show_closed: bool = False,
+           show_archived: bool = False) -> str:
+        return await self._afetch(self._build_request(
+            assistance_listing_numbers, query_text, query_operator, items_per_page,
+            page_number, order_by, sort_direction, show_posted, show_forecasted,
+            show_closed, show_archived))
+
+    def _build_request(self,
+           assistance_listing_numbers: List[str],
+           query_text: Optional[str] = None,
+           query_operator: str = "AND",
+           # Common params
+           items_per_page: int = 5,
+           page_number: int = 1,
+           order_by: str = "relevancy",
+           sort_direction: str = "descending",
+           show_posted: bool = True,
+           show_forecasted: bool = False,
+           show_closed: bool = False,
+           show_archived: bool = False) -> Union[ApiRequest, str]:
 
         self.logger.info(f"Querying by Assistance Listing Numbers: {assistance_listing_numbers}, query='{query_text}'")
 
@@ -99,4 +136,4 @@ class QueryByAssistanceListing(SearchOpportunitiesBase):
             show_archived=show_archived,
             query_operator=query_operator
         )
-        return self._execute_search(payload)  
\ No newline at end of file
+        return self._search_request(payload)  
\ No newline at end of file
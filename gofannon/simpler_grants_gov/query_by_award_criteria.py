@@ -1,7 +1,8 @@
 import logging
 import json
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Union
 
+from .base import ApiRequest
 from .search_base import SearchOpportunitiesBase
 from ..config import FunctionRegistry
 
@@ -67,6 +68,36 @@ class QueryByAwardCriteria(SearchOpportunitiesBase):
            items_per_page: int = 5, page_number: int = 1, order_by: str = "relevancy",
            sort_direction: str = "descending", show_posted: bool = True, show_forecasted: bool = False,
            show_closed: bool = False, show_archived: bool = False) -> str:
+        return self._fetch(self._build_request(
+            min_award_floor, max_award_ceiling, min_expected_awards, max_expected_awards,
+            min_total_funding, max_total_funding, query_text, query_operator,
+            items_per_page, page_number, order_by, sort_direction, show_posted,
+            show_forecasted, show_closed, show_archived))
+
+    async def afn(self,
+           min_award_floor: Optional[int] = None, max_award_ceiling: Optional[int] = None,
+           min_expected_awards: Optional[int] = None, max_expected_awards: Optional[int] = None,
+           min_total_funding: Optional[int] = None, max_total_funding: Optional[int] = None,
+           query_text: Optional[str] = None, query_operator: str = "AND",
+           # Common params
+           items_per_page: int = 5, page_number: int = 1, order_by: str = "relevancy",
+           sort_direction: str = "descending", show_posted: bool = True, show_forecasted: bool = False,
+           show_closed: bool = False, show_archived: bool = False) -> str:
+        return await self._afetch(self._build_request(
+            min_award_floor, max_award_ceiling, min_expected_awards, max_expected_awards,
+            min_total_funding, max_total_funding, query_text, query_operator,
+            items_per_page, page_number, order_by, sort_direction, show_posted,
+            show_forecasted, show_closed, show_archived))
+
+    def _build_request(self,
+           min_award_floor: Optional[int] = None, max_award_ceiling: Optional[int] = None,
+           min_expected_awards: Optional[int] = None, max_expected_awards: Optional[int] = None,
+           min_total_funding: Optional[int] = None, max_total_funding: Optional[int] = None,
+           query_text: Optional[str] = None, query_operator: str = "AND",
+           # Common params
+           items_per_page: int = 5, page_number: int = 1, order_by: str = "relevancy",
+           sort_direction: str = "descending", show_posted: bool = True, show_forecasted: bool = False,
+           show_closed: bool = False, show_archived: bool = False) -> Union[ApiRequest, str]:
 
         self.logger.info(f"Querying by award criteria: floor={min_award_floor}, ceiling={max_award_ceiling}, ... query='{query_text}'")
 
@@ -114,4 +145,4 @@ class QueryByAwardCriteria(SearchOpportunitiesBase):
             sort_direction=sort_direction, show_posted=show_posted, show_forecasted=show_forecasted,
             show_closed=show_closed, show_archived=show_archived, query_operator=query_operator
         )
-        return self._execute_search(payload)  
\ No newline at end of file
+        return self._search_request(payload)  
\ No newline at end of file
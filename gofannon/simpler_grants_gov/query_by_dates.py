@@ -1,7 +1,8 @@
 import logging
 import json
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Union
 
+from .base import ApiRequest
 from .search_base import SearchOpportunitiesBase
 from ..config import FunctionRegistry
 
@@ -65,6 +66,32 @@ class QueryByDates(SearchOpportunitiesBase):
            items_per_page: int = 5, page_number: int = 1, order_by: str = "relevancy",
            sort_direction: str = "descending", show_posted: bool = True, show_forecasted: bool = False,
            show_closed: bool = False, show_archived: bool = False) -> str:
+        return self._fetch(self._build_request(
+            post_start_date, post_end_date, close_start_date, close_end_date, query_text,
+            query_operator, items_per_page, page_number, order_by, sort_direction,
+            show_posted, show_forecasted, show_closed, show_archived))
+
+    async def afn(self,
+           post_start_date: Optional[str] = None, post_end_date: Optional[str] = None,
+           close_start_date: Optional[str] = None, close_end_date: Optional[str] = None,
+           query_text: Optional[str] = None, query_operator: str = "AND",
+           # Common params
+           items_per_page: int = 5, page_number: int = 1, order_by: str = "relevancy",
+           sort_direction: str = "descending", show_posted: bool = True, show_forecasted: bool = False,
+           show_closed: bool = False, show_archived: bool = False) -> str:
+        return await self._afetch(self._build_request(
+            post_start_date, post_end_date, close_start_date, close_end_date, query_text,
+            query_operator, items_per_page, page_number, order_by, sort_direction,
+            show_posted, show_forecasted, show_closed, show_archived))
+
+    def _build_request(self,
+           post_start_date: Optional[str] = None, post_end_date: Optional[str] = None,
+           close_start_date: Optional[str] = None, close_end_date: Optional[str] = None,
+           query_text: Optional[str] = None, query_operator: str = "AND",
+           # Common params
+           items_per_page: int = 5, page_number: int = 1, order_by: str = "relevancy",
+           sort_direction: str = "descending", show_posted: bool = True, show_forecasted: bool = False,
+           show_closed: bool = False, show_archived: bool = False) -> Union[ApiRequest, str]:
 
         self.logger.info(f"Querying by dates: post={post_start_date}-{post_end_date}, close={close_start_date}-{close_end_date}, query='{query_text}'")
 
@@ -105,4 +132,4 @@ class QueryByDates(SearchOpportunitiesBase):
             sort_direction=sort_direction, show_posted=show_posted, show_forecasted=show_forecasted,
             show_closed=show_closed, show_archived=show_archived, query_operator=query_operator
         )
-        return self._execute_search(payload)  
\ No newline at end of file
+        return self._search_request(payload)  
\ No newline at end of file
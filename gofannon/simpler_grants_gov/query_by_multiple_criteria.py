@@ -1,7 +1,8 @@
 import logging
 import json
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Union
 
+from .base import ApiRequest
 from .search_base import SearchOpportunitiesBase
 from ..config import FunctionRegistry
 
@@ -92,6 +93,44 @@ class QueryByMultipleCriteria(SearchOpportunitiesBase):
            items_per_page: int = 5, page_number: int = 1, order_by: str = "relevancy",
            sort_direction: str = "descending", show_posted: bool = True, show_forecasted: bool = False,
            show_closed: bool = False, show_archived: bool = False) -> str:
+        return self._fetch(self._build_request(
+            agency_codes, funding_instruments, funding_categories, applicant_types,
+            assistance_listing_numbers, requires_cost_sharing, query_text, query_operator,
+            items_per_page, page_number, order_by, sort_direction, show_posted,
+            show_forecasted, show_closed, show_archived))
+
+    async def afn(self,
+           agency_codes: Optional[List[str]] = None,
+           funding_instruments: Optional[List[str]] = None,
+           funding_categories: Optional[List[str]] = None,
+           applicant_types: Optional[List[str]] = None,
+           assistance_listing_numbers: Optional[List[str]] = None,
+           requires_cost_sharing: Optional[bool] = None,
+           query_text: Optional[str] = None,
+           query_operator: str = "AND",
+           # Common params
+           items_per_page: int = 5, page_number: int = 1, order_by: str = "relevancy",
+           sort_direction: str = "descending", show_posted: bool = True, show_forecasted: bool = False,
+           show_closed: bool = False, show_archived: bool = False) -> str:
+        return await self._afetch(self._build_request(
+            agency_codes, funding_instruments, funding_categories, applicant_types,
+            assistance_listing_numbers, requires_cost_sharing, query_text, query_operator,
+            items_per_page, page_number, order_by, sort_direction, show_posted,
+            show_forecasted, show_closed, show_archived))
+
+    def _build_request(self,
+           agency_codes: Optional[List[str]] = None,
+           funding_instruments: Optional[List[str]] = None,
+           funding_categories: Optional[List[str]] = None,
+           applicant_types: Optional[List[str]] = None,
+           assistance_listing_numbers: Optional[List[str]] = None,
+           requires_cost_sharing: Optional[bool] = None,
+           query_text: Optional[str] = None,
+           query_operator: str = "AND",
+           # Common params
+           items_per_page: int = 5, page_number: int = 1, order_by: str = "relevancy",
+           sort_direction: str = "descending", show_posted: bool = True, show_forecasted: bool = False,
+           show_closed: bool = False, show_archived: bool = False) -> Union[ApiRequest, str]:
 
         self.logger.info(f"Querying by multiple criteria, query='{query_text}'")
 
@@ -131,4 +170,4 @@ class QueryByMultipleCriteria(SearchOpportunitiesBase):
             sort_direction=sort_direction, show_posted=show_posted, show_forecasted=show_forecasted,
             show_closed=show_closed, show_archived=show_archived, query_operator=query_operator
         )
-        return self._execute_search(payload)
+        return self._search_request(payload)
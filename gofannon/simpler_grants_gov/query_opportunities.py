@@ -1,6 +1,7 @@
 import logging
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Union
 
+from .base import ApiRequest
 from .search_base import SearchOpportunitiesBase
 from ..config import FunctionRegistry
 
@@ -67,8 +68,40 @@ class QueryOpportunities(SearchOpportunitiesBase):
            show_forecasted: bool = False,
            show_closed: bool = False,
            show_archived: bool = False) -> str:
+        return self._fetch(self._build_request(
+            query_text, query_operator, items_per_page, page_number, order_by,
+            sort_direction, show_posted, show_forecasted, show_closed, show_archived))
+
+    async def afn(self,
+           query_text: str,
+           query_operator: str = "AND",
+           # Common params from base, with defaults
+           items_per_page: int = 5,
+           page_number: int = 1,
+           order_by: str = "relevancy",
+           sort_direction: str = "descending",
+           show_posted: bool = True,
+           show_forecasted: bool = False,
+           show_closed: bool = False,
+           show_archived: bool = False) -> str:
+        return await self._afetch(self._build_request(
+            query_text, query_operator, items_per_page, page_number, order_by,
+            sort_direction, show_posted, show_forecasted, show_closed, show_archived))
+
+    def _build_request(self,
+           query_text: str,
+           query_operator: str = "AND",
+           # Common params from base, with defaults
+           items_per_page: int = 5,
+           page_number: int = 1,
+           order_by: str = "relevancy",
+           sort_direction: str = "descending",
+           show_posted: bool = True,
+           show_forecasted: bool = False,
+           show_closed: bool = False,
+           show_archived: bool = False) -> Union[ApiRequest, str]:
         """
-        Executes the general opportunity search.
+        Builds the general opportunity search.
         """
         self.logger.info(f"Executing general opportunity query: '{query_text}'")
 
@@ -90,4 +123,4 @@ class QueryOpportunities(SearchOpportunitiesBase):
             query_operator=query_operator
         )
 
-        return self._execute_search(payload)
+        return self._search_request(payload)
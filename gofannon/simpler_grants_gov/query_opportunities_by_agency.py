@@ -1,6 +1,8 @@
 import logging
-from typing import Optional, Dict, Any, List
+import json
+from typing import Optional, Dict, Any, List, Union
 
+from .base import ApiRequest
 from .search_base import SearchOpportunitiesBase
 from ..config import FunctionRegistry
 
@@ -70,8 +72,42 @@ class QueryOpportunitiesByAgencyCode(SearchOpportunitiesBase):
            show_forecasted: bool = False,
            show_closed: bool = False,
            show_archived: bool = False) -> str:
+        return self._fetch(self._build_request(
+            agency_codes, query_text, query_operator, items_per_page, page_number, order_by,
+            sort_direction, show_posted, show_forecasted, show_closed, show_archived))
+
+    async def afn(self,
+           agency_codes: List[str],
+           query_text: Optional[str] = None,
+           query_operator: str = "AND",
+           # Common params from base
+           items_per_page: int = 5,
+           page_number: int = 1,
+           order_by: str = "relevancy",
+           sort_direction: str = "descending",
+           show_posted: bool = True,
+           show_forecasted: bool = False,
+           show_closed: bool = False,
+           show_archived: bool = False) -> str:
+        return await self._afetch(self._build_request(
+            agency_codes, query_text, query_operator, items_per_page, page_number, order_by,
+            sort_direction, show_posted, show_forecasted, show_closed, show_archived))
+
+    def _build_request(self,
+           agency_codes: List[str],
+           query_text: Optional[str] = None,
+           query_operator: str = "AND",
+           # Common params from base
+           items_per_page: int = 5,
+           page_number: int = 1,
+           order_by: str = "relevancy",
+           sort_direction: str = "descending",
+           show_posted: bool = True,
+           show_forecasted: bool = False,
+           show_closed: bool = False,
+           show_archived: bool = False) -> Union[ApiRequest, str]:
         """
-        Executes the opportunity search filtered by agency codes.
+        Builds the opportunity search filtered by agency codes.
         """
         self.logger.info(f"Executing opportunity query by agency codes: {agency_codes}, query_text: '{query_text}'")
 
@@ -101,4 +137,4 @@ class QueryOpportunitiesByAgencyCode(SearchOpportunitiesBase):
             query_operator=query_operator
         )
 
-        return self._execute_search(payload)
\ No newline at end of file
+        return self._search_request(payload)
\ No newline at end of file
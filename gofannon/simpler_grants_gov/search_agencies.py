@@ -1,8 +1,8 @@
 import logging
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Union
 import json
 
-from .base import SimplerGrantsGovBase
+from .base import ApiRequest, SimplerGrantsGovBase
 from ..config import FunctionRegistry
 
 logger = logging.getLogger(__name__)
@@ -79,8 +79,14 @@ class SearchAgencies(SimplerGrantsGovBase):
         }
 
     def fn(self, pagination: Dict[str, Any], query: Optional[str] = None, filters: Optional[Dict[str, Any]] = None, query_operator: str = "OR") -> str:
+        return self._fetch(self._build_request(pagination, query, filters, query_operator))
+
+    async def afn(self, pagination: Dict[str, Any], query: Optional[str] = None, filters: Optional[Dict[str, Any]] = None, query_operator: str = "OR") -> str:
+        return await self._afetch(self._build_request(pagination, query, filters, query_operator))
+
+    def _build_request(self, pagination: Dict[str, Any], query: Optional[str] = None, filters: Optional[Dict[str, Any]] = None, query_operator: str = "OR") -> Union[ApiRequest, str]:
         """
-        Executes the search agencies request.
+        Builds the search agencies request.
         """
         self.logger.info("Executing Simpler Grants Gov search agencies tool")
         payload: Dict[str, Any] = {
@@ -93,10 +99,4 @@ class SearchAgencies(SimplerGrantsGovBase):
             payload["filters"] = filters
 
         endpoint = "/v1/agencies/search"
-        try:
-            result = self._make_request("POST", endpoint, json_payload=payload)
-            self.logger.debug(f"Search agencies successful. Response length: {len(result)}")
-            return result
-        except Exception as e:
-            self.logger.error(f"Search agencies failed: {e}", exc_info=True)
-            return json.dumps({"error": f"Search agencies failed: {str(e)}", "success": False})  
\ No newline at end of file
+        return ApiRequest("POST", endpoint, "Search agencies", json_payload=payload)  
\ No newline at end of file
@@ -2,7 +2,7 @@ import logging
 import json
 from typing import Optional, Dict, Any, List
 
-from .base import SimplerGrantsGovBase
+from .base import ApiRequest, SimplerGrantsGovBase
 from ..config import FunctionRegistry # Will be used by subclasses
 
 logger = logging.getLogger(__name__)
@@ -145,23 +145,13 @@ class SearchOpportunitiesBase(SimplerGrantsGovBase):
         self.logger.debug(f"Constructed API payload: {json.dumps(payload, indent=2)}")
         return payload
 
-    def _execute_search(self, payload: Dict[str, Any]) -> str:
+    def _search_request(self, payload: Dict[str, Any]) -> ApiRequest:
         """
-        Shared method to make the API call.
+        Shared search request of the subclasses.
         """
-        endpoint = "/v1/opportunities/search"
-        try:
-            result = self._make_request("POST", endpoint, json_payload=payload)
-            self.logger.debug(f"Search successful. Response length: {len(result)}")
-            return result
-        except Exception as e:
-            self.logger.error(f"Opportunity search failed: {e}", exc_info=True)
-            return json.dumps({"error": f"Opportunity search API request failed: {str(e)}", "success": False})
-
-            # Subclasses will implement their specific 'definition' and 'fn'
+        return ApiRequest("POST", "/v1/opportunities/search", "Opportunity search API request", json_payload=payload)
+
+            # Subclasses will implement their specific 'definition' and '_build_request'
     @property
     def definition(self):
         raise NotImplementedError("Subclasses must implement the 'definition' property.")
-
-    def fn(self, *args, **kwargs):
-        raise NotImplementedError("Subclasses must implement the 'fn' method.")
\ No newline at end of file
@@ -217,6 +217,113 @@ class SearchOpportunities(SimplerGrantsGovBase):
             logger.error(f"Unexpected error adding warnings to response: {e}", exc_info=True)
             return response_str # Fallback to original
 
+    def _build_search_payload(self,
+                              warnings_list: List[Dict],
+                              query: Optional[str] = None,
+                              query_operator: str = "AND",
+                              # --- Elevated Filter Args ---
+                              funding_instrument: Optional[List[str]] = None,
+                              funding_category: Optional[List[str]] = None,
+                              applicant_type: Optional[List[str]] = None,
+                              opportunity_status: Optional[List[str]] = None,
+                              agency: Optional[List[str]] = None,
+                              assistance_listing_number: Optional[List[str]] = None,
+                              is_cost_sharing: Optional[bool] = None,
+                              expected_number_of_awards: Optional[Dict[str, int]] = None,
+                              award_floor: Optional[Dict[str, int]] = None,
+                              award_ceiling: Optional[Dict[str, int]] = None,
+                              estimated_total_program_funding: Optional[Dict[str, int]] = None,
+                              post_date: Optional[Dict[str, str]] = None,
+                              close_date: Optional[Dict[str, str]] = None
+           ) -> Dict[str, Any]:
+        """
+        Validates the filter arguments and constructs the search payload.
+        Invalid filter values are omitted and reported in ``warnings_list``.
+        """
+        # --- Internal Pagination ---
+        internal_pagination = {
+            "page_offset": DEFAULT_PAGE_OFFSET,
+            "page_size": DEFAULT_PAGE_SIZE,
+            "sort_order": DEFAULT_SORT_ORDER
+        }
+        self.logger.debug(f"Using internal pagination: {internal_pagination}")
+
+        # --- Reconstruct and Validate Filters for API ---
+        api_filters: Dict[str, Any] = {}
+
+        # Validate and filter list-based enums
+        valid_fi = self._validate_and_filter_list(funding_instrument, "funding_instrument", FUNDING_INSTRUMENT_ENUM, warnings_list)
+        if valid_fi: api_filters["funding_instrument"] = {"one_of": valid_fi}
+
+        valid_fc = self._validate_and_filter_list(funding_category, "funding_category", FUNDING_CATEGORY_ENUM, warnings_list)
+        if valid_fc: api_filters["funding_category"] = {"one_of": valid_fc}
+
+        valid_at = self._validate_and_filter_list(applicant_type, "applicant_type", APPLICANT_TYPE_ENUM, warnings_list)
+        if valid_at: api_filters["applicant_type"] = {"one_of": valid_at}
+
+        valid_os = self._validate_and_filter_list(opportunity_status, "opportunity_status", OPPORTUNITY_STATUS_ENUM, warnings_list)
+        if valid_os: api_filters["opportunity_status"] = {"one_of": valid_os}
+
+        # Filters without strict enum validation in this example (pass if list)
+        if agency is not None:
+            if isinstance(agency, list):
+                api_filters["agency"] = {"one_of": agency}
+            else:
+                warnings_list.append({"filter": "agency", "error": f"Expected a list, got {type(agency).__name__}. Filter omitted."})
+                logger.warning(f"Invalid type for filter 'agency'. Expected list, got {type(agency).__name__}. Filter omitted.")
+
+        if assistance_listing_number is not None:
+            # Add pattern validation if needed, or rely on API
+            if isinstance(assistance_listing_number, list):
+                api_filters["assistance_listing_number"] = {"one_of": assistance_listing_number}
+            else:
+                warnings_list.append({"filter": "assistance_listing_number", "error": f"Expected a list, got {type(assistance_listing_number).__name__}. Filter omitted."})
+                logger.warning(f"Invalid type for filter 'assistance_listing_number'. Expected list, got {type(assistance_listing_number).__name__}. Filter omitted.")
+
+
+                # Boolean filter
+        if is_cost_sharing is not None:
+            if isinstance(is_cost_sharing, bool):
+                api_filters["is_cost_sharing"] = {"one_of": [is_cost_sharing]}
+            else:
+                warnings_list.append({"filter": "is_cost_sharing", "error": f"Expected a boolean, got {type(is_cost_sharing).__name__}. Filter omitted."})
+                logger.warning(f"Invalid type for filter 'is_cost_sharing'. Expected boolean, got {type(is_cost_sharing).__name__}. Filter omitted.")
+
+
+                # Range/Date filters (basic type check)
+        range_date_filters = {
+            "expected_number_of_awards": expected_number_of_awards,
+            "award_floor": award_floor,
+            "award_ceiling": award_ceiling,
+            "estimated_total_program_funding": estimated_total_program_funding,
+            "post_date": post_date,
+            "close_date": close_date
+        }
+        for name, value in range_date_filters.items():
+            if value is not None:
+                if isinstance(value, dict):
+                    api_filters[name] = value
+                else:
+                    warnings_list.append({"filter": name, "error": f"Expected a dictionary object, got {type(value).__name__}. Filter omitted."})
+                    logger.warning(f"Invalid type for filter '{name}'. Expected dict, got {type(value).__name__}. Filter omitted.")
+
+
+                    # --- Payload Construction ---
+        payload: Dict[str, Any] = {
+            "pagination": internal_pagination,
+            "query_operator": query_operator
+        }
+        if query:
+            payload["query"] = query
+        if api_filters:
+            payload["filters"] = api_filters
+            self.logger.debug(f"Constructed API filters: {api_filters}")
+        elif not query:
+            # If no query and no filters, API might require something? Or just return all?
+            # Assuming returning all is ok. If not, add a check/error here.
+            self.logger.info("No query or filters provided for opportunity search.")
+        return payload
+
     def fn(self,
            query: Optional[str] = None,
            query_operator: str = "AND",
@@ -245,116 +352,104 @@ class SearchOpportunities(SimplerGrantsGovBase):
         Returns:
             A JSON string representing the search results (potentially with a 'warnings' field) or an error.
         """
-        self.logger.info(f"Executing Simpler Grants Gov opportunity search tool with query='{query}'")
+        return self._search(dict(
+            query=query,
+            query_operator=query_operator,
+            funding_instrument=funding_instrument,
+            funding_category=funding_category,
+            applicant_type=applicant_type,
+            opportunity_status=opportunity_status,
+            agency=agency,
+            assistance_listing_number=assistance_listing_number,
+            is_cost_sharing=is_cost_sharing,
+            expected_number_of_awards=expected_number_of_awards,
+            award_floor=award_floor,
+            award_ceiling=award_ceiling,
+            estimated_total_program_funding=estimated_total_program_funding,
+            post_date=post_date,
+            close_date=close_date
+        ))
+
+    async def afn(self,
+           query: Optional[str] = None,
+           query_operator: str = "AND",
+           # --- Elevated Filter Args ---
+           funding_instrument: Optional[List[str]] = None,
+           funding_category: Optional[List[str]] = None,
+           applicant_type: Optional[List[str]] = None,
+           opportunity_status: Optional[List[str]] = None,
+           agency: Optional[List[str]] = None,
+           assistance_listing_number: Optional[List[str]] = None,
+           is_cost_sharing: Optional[bool] = None,
+           expected_number_of_awards: Optional[Dict[str, int]] = None,
+           award_floor: Optional[Dict[str, int]] = None,
+           award_ceiling: Optional[Dict[str, int]] = None,
+           estimated_total_program_funding: Optional[Dict[str, int]] = None,
+           post_date: Optional[Dict[str, str]] = None,
+           close_date: Optional[Dict[str, str]] = None
+           ) -> str:
+        """Async counterpart of ``fn``."""
+        return await self._asearch(dict(
+            query=query,
+            query_operator=query_operator,
+            funding_instrument=funding_instrument,
+            funding_category=funding_category,
+            applicant_type=applicant_type,
+            opportunity_status=opportunity_status,
+            agency=agency,
+            assistance_listing_number=assistance_listing_number,
+            is_cost_sharing=is_cost_sharing,
+            expected_number_of_awards=expected_number_of_awards,
+            award_floor=award_floor,
+            award_ceiling=award_ceiling,
+            estimated_total_program_funding=estimated_total_program_funding,
+            post_date=post_date,
+            close_date=close_date
+        ))
+
+    def _fn_raw(self, **kwargs) -> str:
+        return self._search(kwargs, raise_retryable=True)
+
+    async def _afn_raw(self, **kwargs) -> str:
+        return await self._asearch(kwargs, raise_retryable=True)
+
+    def _search(self, arguments: Dict[str, Any], raise_retryable: bool = False) -> str:
+        self.logger.info(f"Executing Simpler Grants Gov opportunity search tool with query='{arguments.get('query')}'")
         warnings_list: List[Dict] = [] # Store warnings here
 
         try:
-            # --- Internal Pagination ---
-            internal_pagination = {
-                "page_offset": DEFAULT_PAGE_OFFSET,
-                "page_size": DEFAULT_PAGE_SIZE,
-                "sort_order": DEFAULT_SORT_ORDER
-            }
-            self.logger.debug(f"Using internal pagination: {internal_pagination}")
-
-            # --- Reconstruct and Validate Filters for API ---
-            api_filters: Dict[str, Any] = {}
-
-            # Validate and filter list-based enums
-            valid_fi = self._validate_and_filter_list(funding_instrument, "funding_instrument", FUNDING_INSTRUMENT_ENUM, warnings_list)
-            if valid_fi: api_filters["funding_instrument"] = {"one_of": valid_fi}
-
-            valid_fc = self._validate_and_filter_list(funding_category, "funding_category", FUNDING_CATEGORY_ENUM, warnings_list)
-            if valid_fc: api_filters["funding_category"] = {"one_of": valid_fc}
-
-            valid_at = self._validate_and_filter_list(applicant_type, "applicant_type", APPLICANT_TYPE_ENUM, warnings_list)
-            if valid_at: api_filters["applicant_type"] = {"one_of": valid_at}
-
-            valid_os = self._validate_and_filter_list(opportunity_status, "opportunity_status", OPPORTUNITY_STATUS_ENUM, warnings_list)
-            if valid_os: api_filters["opportunity_status"] = {"one_of": valid_os}
-
-            # Filters without strict enum validation in this example (pass if list)
-            if agency is not None:
-                if isinstance(agency, list):
-                    api_filters["agency"] = {"one_of": agency}
-                else:
-                    warnings_list.append({"filter": "agency", "error": f"Expected a list, got {type(agency).__name__}. Filter omitted."})
-                    logger.warning(f"Invalid type for filter 'agency'. Expected list, got {type(agency).__name__}. Filter omitted.")
+            payload = self._build_search_payload(warnings_list, **arguments)
+            api_response_str = self._make_request("POST", "/v1/opportunities/search", json_payload=payload)
+            self.logger.debug(f"Search successful. Response length: {len(api_response_str)}")
 
-            if assistance_listing_number is not None:
-                # Add pattern validation if needed, or rely on API
-                if isinstance(assistance_listing_number, list):
-                    api_filters["assistance_listing_number"] = {"one_of": assistance_listing_number}
-                else:
-                    warnings_list.append({"filter": "assistance_listing_number", "error": f"Expected a list, got {type(assistance_listing_number).__name__}. Filter omitted."})
-                    logger.warning(f"Invalid type for filter 'assistance_listing_number'. Expected list, got {type(assistance_listing_number).__name__}. Filter omitted.")
+            # Add warnings to the successful response if any occurred during validation
+            return self._add_warnings_to_response(api_response_str, warnings_list)
+        except Exception as e:
+            return self._search_error_response(e, warnings_list, raise_retryable)
 
+    async def _asearch(self, arguments: Dict[str, Any], raise_retryable: bool = False) -> str:
+        self.logger.info(f"Executing Simpler Grants Gov opportunity search tool with query='{arguments.get('query')}'")
+        warnings_list: List[Dict] = []
 
-                    # Boolean filter
-            if is_cost_sharing is not None:
-                if isinstance(is_cost_sharing, bool):
-                    api_filters["is_cost_sharing"] = {"one_of": [is_cost_sharing]}
-                else:
-                    warnings_list.append({"filter": "is_cost_sharing", "error": f"Expected a boolean, got {type(is_cost_sharing).__name__}. Filter omitted."})
-                    logger.warning(f"Invalid type for filter 'is_cost_sharing'. Expected boolean, got {type(is_cost_sharing).__name__}. Filter omitted.")
-
-
-                    # Range/Date filters (basic type check)
-            range_date_filters = {
-                "expected_number_of_awards": expected_number_of_awards,
-                "award_floor": award_floor,
-                "award_ceiling": award_ceiling,
-                "estimated_total_program_funding": estimated_total_program_funding,
-                "post_date": post_date,
-                "close_date": close_date
-            }
-            for name, value in range_date_filters.items():
-                if value is not None:
-                    if isinstance(value, dict):
-                        api_filters[name] = value
-                    else:
-                        warnings_list.append({"filter": name, "error": f"Expected a dictionary object, got {type(value).__name__}. Filter omitted."})
-                        logger.warning(f"Invalid type for filter '{name}'. Expected dict, got {type(value).__name__}. Filter omitted.")
-
-
-                        # --- Payload Construction ---
-            payload: Dict[str, Any] = {
-                "pagination": internal_pagination,
-                "query_operator": query_operator
-            }
-            if query:
-                payload["query"] = query
-            if api_filters:
-                payload["filters"] = api_filters
-                self.logger.debug(f"Constructed API filters: {api_filters}")
-            elif not query:
-                # If no query and no filters, API might require something? Or just return all?
-                # Assuming returning all is ok. If not, add a check/error here.
-                self.logger.info("No query or filters provided for opportunity search.")
-
-
-                # --- API Call ---
-            endpoint = "/v1/opportunities/search"
-            api_response_str = self._make_request("POST", endpoint, json_payload=payload)
+        try:
+            payload = self._build_search_payload(warnings_list, **arguments)
+            api_response_str = await self._amake_request("POST", "/v1/opportunities/search", json_payload=payload)
             self.logger.debug(f"Search successful. Response length: {len(api_response_str)}")
+            return self._add_warnings_to_response(api_response_str, warnings_list)
+        except Exception as e:
+            return self._search_error_response(e, warnings_list, raise_retryable)
 
-            # Add warnings to the successful response if any occurred during validation
-            final_response_str = self._add_warnings_to_response(api_response_str, warnings_list)
-            return final_response_str
-
-        except ValueError as ve: # Catch potential errors during filter reconstruction if needed
-            error_msg = f"Input processing failed for SearchOpportunities: {ve}"
+    def _search_error_response(self, e: Exception, warnings_list: List[Dict], raise_retryable: bool) -> str:
+        if raise_retryable and self.is_retryable(e):
+            raise e
+        if isinstance(e, ValueError): # Catch potential errors during filter reconstruction if needed
+            error_msg = f"Input processing failed for SearchOpportunities: {e}"
             self.logger.error(error_msg)
-            error_response = {"error": error_msg, "success": False}
-            # Add warnings even to validation error responses
-            if warnings_list:
-                error_response["warnings"] = warnings_list
-            return json.dumps(error_response)
-        except Exception as e:
+        else:
             error_msg = f"Opportunity search failed: {str(e)}"
             self.logger.error(f"Opportunity search failed: {e}", exc_info=True)
-            error_response = {"error": error_msg, "success": False}
-            # Add warnings even to general error responses
-            if warnings_list:
-                error_response["warnings"] = warnings_list
-            return json.dumps(error_response)
+        error_response = {"error": error_msg, "success": False}
+        # Add warnings even to error responses
+        if warnings_list:
+            error_response["warnings"] = warnings_list
+        return json.dumps(error_response)
@@ -1,10 +1,12 @@
 from ..base import BaseTool
+from ..base.cache import CachePolicy
 from ..config import FunctionRegistry
 import logging  
-import requests
 
 logger = logging.getLogger(__name__)
 
+SUMMARY_URL = "https://en.wikipedia.org/api/rest_v1/page/summary/"
+
 """Wikipedia Lookup Tool for retrieving article summaries from Wikipedia.
 This class provides functionality to fetch summaries of Wikipedia articles using the Wikipedia REST API.
 Attributes:
@@ -34,6 +36,9 @@ Returns:
 
 @FunctionRegistry.register
 class WikipediaLookup(BaseTool):
+    cache_policy = CachePolicy(ttl=3600, cache_if=lambda result: "error" not in result)
+    thread_safe = True
+
     def __init__(self, name='wikipedia_lookup'):
         super().__init__()
         self.name = name
@@ -58,13 +63,8 @@ class WikipediaLookup(BaseTool):
             }
         }
     
-    def fn(self, query):
-        logger.debug(f"Fetching Wikipedia summary for: {query}")
-        base_url = "https://en.wikipedia.org/api/rest_v1/page/summary/"
-        response = requests.get(base_url + query.replace(" ", "_"))
-
-        if response.status_code == 200:
-            data = response.json()
+    def _summary(self, query, status_code, data):
+        if status_code == 200:
             return {
                 "title": data.get("title", "No title found"), 
                 "summary": data.get("extract", "No summary found"),
@@ -76,3 +76,14 @@ class WikipediaLookup(BaseTool):
                 "error": f"Failed to fetch Wikipedia summary for {query}"
             }
 
+    def fn(self, query):
+        logger.debug(f"Fetching Wikipedia summary for: {query}")
+        response = self.http_session(SUMMARY_URL).get(SUMMARY_URL + query.replace(" ", "_"))
+        data = response.json() if response.status_code == 200 else None
+        return self._summary(query, response.status_code, data)
+
+    async def afn(self, query):
+        logger.debug(f"Fetching Wikipedia summary for: {query}")
+        response = await self.async_http_client(SUMMARY_URL).get(SUMMARY_URL + query.replace(" ", "_"))
+        data = response.json() if response.status_code == 200 else None
+        return self._summary(query, response.status_code, data)
@@ -0,0 +1,158 @@
+"""
+Compare workflow throughput of FunctionOrchestrator and AsyncFunctionOrchestrator.
+
+Starts a local fake OpenAI-compatible server (in a separate process) that answers every first turn with
+tool calls to ``addition`` and every later turn with a final answer, after a
+fixed delay standing in for model latency. The sync orchestrator runs workflows
+on a thread pool (one thread per in-flight workflow); the async one runs them
+all on a single event loop.
+
+    python scripts/benchmark_orchestrators.py --workflows 500 --latency 0.5
+
+With very low latencies both variants are bound by the OpenAI client's own
+per-request CPU cost; the async variant pulls ahead once requests spend most of
+their time waiting on the model, as real ones do.
+"""
+import argparse
+import asyncio
+import json
+import multiprocessing
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from openai import AsyncOpenAI, OpenAI
+
+from gofannon.config import FunctionRegistry
+from gofannon.orchestration import AsyncFunctionOrchestrator, FunctionOrchestrator
+
+# Registers the one tool the fake model calls.
+FunctionRegistry.load("addition")
+
+
+def _completion(message):
+    return {
+        "id": "chatcmpl-fake",
+        "object": "chat.completion",
+        "created": int(time.time()),
+        "model": "fake",
+        "choices": [{"index": 0, "message": message, "finish_reason": "stop"}],
+        "usage": {"prompt_tokens": 1, "completion_tokens": 1, "total_tokens": 2},
+    }
+
+
+class FakeLLMServer(ThreadingHTTPServer):
+    # The async orchestrator opens hundreds of connections at once.
+    request_queue_size = 1024
+    daemon_threads = True
+
+
+def make_handler(latency, tool_calls_per_turn):
+    class FakeLLMHandler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_POST(self):
+            request = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+            time.sleep(latency)
+            if request["messages"][-1]["role"] == "user" and "tools" in request:
+                message = {
+                    "role": "assistant",
+                    "content": None,
+                    "tool_calls": [
+                        {
+                            "id": f"call_{i}",
+                            "type": "function",
+                            "function": {
+                                "name": "addition",
+                                "arguments": json.dumps({"num1": i, "num2": 1}),
+                            },
+                        }
+                        for i in range(tool_calls_per_turn)
+                    ],
+                }
+            else:
+                message = {"role": "assistant", "content": "**Final Answer**: done"}
+            body = json.dumps(_completion(message)).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    return FakeLLMHandler
+
+
+def serve(latency, tool_calls_per_turn, ready):
+    server = FakeLLMServer(("127.0.0.1", 0), make_handler(latency, tool_calls_per_turn))
+    ready.put(server.server_address[1])
+    server.serve_forever()
+
+
+def run_sync(base_url, workflows, threads):
+    client = OpenAI(base_url=base_url, api_key="fake", max_retries=0)
+    orchestrator = FunctionOrchestrator(client)
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        results = list(executor.map(
+            lambda i: orchestrator.execute_workflow(f"query {i}", "fake"), range(workflows)
+        ))
+    elapsed = time.perf_counter() - start
+    orchestrator.close()
+    return elapsed, results
+
+
+async def run_async(base_url, workflows, concurrency):
+    client = AsyncOpenAI(base_url=base_url, api_key="fake", max_retries=0)
+    orchestrator = AsyncFunctionOrchestrator(client)
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def run(i):
+        async with semaphore:
+            return await orchestrator.execute_workflow(f"query {i}", "fake")
+
+    start = time.perf_counter()
+    results = await asyncio.gather(*(run(i) for i in range(workflows)))
+    elapsed = time.perf_counter() - start
+    await client.close()
+    return elapsed, results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--workflows", type=int, default=200)
+    parser.add_argument("--latency", type=float, default=0.5, help="fake LLM latency in seconds")
+    parser.add_argument("--tool-calls", type=int, default=3, help="tool calls per turn")
+    parser.add_argument("--threads", type=int, default=32, help="threads for the sync orchestrator")
+    parser.add_argument("--concurrency", type=int, default=200,
+                        help="workflows in flight at once for the async orchestrator")
+    args = parser.parse_args()
+
+    # The server runs in its own process so it doesn't compete for the GIL.
+    ready = multiprocessing.Queue()
+    server = multiprocessing.Process(
+        target=serve, args=(args.latency, args.tool_calls, ready), daemon=True
+    )
+    server.start()
+    base_url = f"http://127.0.0.1:{ready.get(timeout=30)}/v1"
+
+    try:
+        sync_elapsed, sync_results = run_sync(base_url, args.workflows, args.threads)
+        async_elapsed, async_results = asyncio.run(run_async(base_url, args.workflows, args.concurrency))
+    finally:
+        server.terminate()
+
+    assert all(r["final_answer"] for r in sync_results + async_results)
+    print(f"{args.workflows} workflows, {args.latency * 1000:.0f} ms LLM latency, "
+          f"{args.tool_calls} tool calls per turn")
+    for label, elapsed in (
+        (f"sync ({args.threads} threads)", sync_elapsed),
+        (f"async ({args.concurrency} in flight)", async_elapsed),
+    ):
+        print(f"  {label:<22} {elapsed:7.2f} s  {args.workflows / elapsed:8.1f} workflows/s")
+
+
+if __name__ == "__main__":
+    main()
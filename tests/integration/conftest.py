@@ -4,4 +4,4 @@ from gofannon.config import FunctionRegistry
 
 @pytest.fixture
 def tools():
-    return [tool_class() for tool_class in FunctionRegistry._tools.values()]
\ No newline at end of file
+    return [tool_class() for tool_class in FunctionRegistry.get_tool_classes().values()]
\ No newline at end of file
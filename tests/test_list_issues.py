@@ -3,10 +3,10 @@ from unittest.mock import patch, MagicMock
 from gofannon.github.list_issues import ListIssues
 from requests.exceptions import HTTPError
 
-# Check where the requests.get is imported in the module
+# ListIssues makes its requests through the shared pooled session
 def test_list_issues_success():
-    # Patch at the exact point where requests.get is used in your code
-    with patch('gofannon.github.list_issues.get') as mock_get:
+    # Patch the session method used by the tool
+    with patch('requests.Session.get') as mock_get:
         # Create a mock response
         mock_response = MagicMock()
         mock_response.json.return_value = [
@@ -79,7 +79,7 @@ def test_list_issues_success():
         assert "pull_request" not in result[1]
 
 def test_list_issues_with_parameters():
-    with patch('gofannon.github.list_issues.get') as mock_get:
+    with patch('requests.Session.get') as mock_get:
         # Create a mock response
         mock_response = MagicMock()
         mock_response.json.return_value = []  # Empty list for simplicity
@@ -119,7 +119,7 @@ def test_list_issues_with_parameters():
         assert result == []
 
 def test_list_issues_api_error():
-    with patch('gofannon.github.list_issues.get') as mock_get:
+    with patch('requests.Session.get') as mock_get:
         # Create the mock and make raise_for_status throw an exception
         mock_response = MagicMock()
         http_error = HTTPError("API error")
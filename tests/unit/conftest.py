@@ -0,0 +1,15 @@
+import pytest
+
+from gofannon.base import WorkflowContext
+
+
+@pytest.fixture
+def home(tmp_path, monkeypatch):
+    """Point ``Path.home()``, where contexts keep their checkpoints, at the test's directory."""
+    monkeypatch.setattr("pathlib.Path.home", lambda: tmp_path)
+    return tmp_path
+
+
+@pytest.fixture
+def context(home):
+    return WorkflowContext()
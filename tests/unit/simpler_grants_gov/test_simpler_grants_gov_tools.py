@@ -1,8 +1,13 @@
+import asyncio
+import inspect
 import pytest
+import requests
 import responses
 import json
 from unittest.mock import patch
 
+from gofannon.base import retry
+
 from gofannon.simpler_grants_gov.get_opportunity import GetOpportunity
 from gofannon.simpler_grants_gov.query_opportunities import QueryOpportunities
 from gofannon.simpler_grants_gov.query_opportunities_by_agency import QueryOpportunitiesByAgencyCode
@@ -17,7 +22,7 @@ MOCK_API_KEY = "test_sgg_api_key"
 MOCK_BASE_URL = "https://mockapi.grants.gov/grants"
 
 # Helper to mock ToolConfig.get
-@pytestfixture(autouse=True)
+@pytest.fixture(autouse=True)
 def mock_tool_config():
     with patch('gofannon.config.ToolConfig.get') as mock_get:
         def side_effect(key):
@@ -88,6 +93,24 @@ class TestGetOpportunity:
         assert "error" in result
         assert "Get opportunity failed" in result["error"] # Tool wraps original error
 
+    @responses.activate
+    def test_transient_errors_are_retried(self, context, monkeypatch):
+        monkeypatch.setattr(retry, "sleep", lambda seconds: None)
+        opportunity_id = 12345
+        expected_url = f"{MOCK_BASE_URL}{self.TOOL_ENDPOINT_BASE}/{opportunity_id}"
+        # One 502 for ``fn``, which reports it, one for ``execute``, which retries.
+        responses.add(responses.GET, expected_url, status=502)
+        responses.add(responses.GET, expected_url, status=502)
+        responses.add(responses.GET, expected_url, json={"opportunity_id": opportunity_id})
+
+        tool = GetOpportunity()
+        assert "Get opportunity failed" in json.loads(tool.fn(opportunity_id=opportunity_id))["error"]
+
+        result = tool.execute(context, opportunity_id=opportunity_id)
+        assert result.success
+        assert json.loads(result.output) == {"opportunity_id": opportunity_id}
+        assert len(responses.calls) == 3
+
     def test_get_opportunity_invalid_id(self):
         tool = GetOpportunity()
         result_str = tool.fn(opportunity_id=-1) # Invalid ID
@@ -152,8 +175,8 @@ class TestSearchToolsBaseFunctionality:
         responses.add(
             responses.POST,
             self.SEARCH_ENDPOINT,
-            json={"error": "Server Error"},
-            status=500,
+            json={"error": "Bad Request"},
+            status=400,
             content_type='application/json'
         )
         result_str = tool_instance.fn(**fn_args)
@@ -161,6 +184,12 @@ class TestSearchToolsBaseFunctionality:
         assert "error" in result
         assert "API request failed" in result["error"]
 
+        # Server errors are raised only on the path ``execute`` retries.
+        responses.replace(responses.POST, self.SEARCH_ENDPOINT, status=503)
+        assert "error" in json.loads(tool_instance.fn(**fn_args))
+        with pytest.raises(requests.exceptions.HTTPError):
+            tool_instance._fn_raw(**fn_args)
+
     def _test_tool_definition_common_params(self, definition):
         params = definition["function"]["parameters"]["properties"]
         assert "items_per_page" in params
@@ -508,4 +537,26 @@ class TestQueryByMultipleCriteria(TestSearchToolsBaseFunctionality):
     def test_fn_api_error(self):
         tool = QueryByMultipleCriteria()
         self._test_search_tool_api_error(tool, {"query_text": "complex search"})
-  
\ No newline at end of file
+  
+
+class TestTypedSignatures:
+    def test_fn_keeps_the_tool_arguments(self):
+        tool = QueryOpportunitiesByAgencyCode()
+        for method in (tool.fn, tool.afn):
+            parameters = inspect.signature(method).parameters
+            assert list(parameters)[:2] == ["agency_codes", "query_text"]
+            assert parameters["items_per_page"].default == 5
+
+        # Defaults are filled in, so both calls share a cache key.
+        assert (tool._bound_arguments({"agency_codes": ["DOC"]})
+                == tool._bound_arguments({"agency_codes": ["DOC"], "page_number": 1}))
+
+    def test_mcp_input_schema(self):
+        fastmcp = pytest.importorskip("mcp.server.fastmcp")
+        server = fastmcp.FastMCP("grants")
+        QueryOpportunitiesByAgencyCode().export_to_mcp(server)
+
+        (exported,) = asyncio.run(server.list_tools())
+
+        assert exported.inputSchema["required"] == ["agency_codes"]
+        assert {"agency_codes", "query_text", "items_per_page"} <= set(exported.inputSchema["properties"])
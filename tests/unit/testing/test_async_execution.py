@@ -0,0 +1,175 @@
+import asyncio
+import json
+
+import httpx
+import pytest
+
+from gofannon.base import BaseTool
+from gofannon.base.http import set_async_client
+from gofannon.github.get_repo_contents import GetRepoContents
+from gofannon.simpler_grants_gov.get_opportunity import GetOpportunity
+from gofannon.simpler_grants_gov.query_by_dates import QueryByDates
+from gofannon.wikipedia.wikipedia_lookup import WikipediaLookup
+
+
+@pytest.fixture
+def mock_http():
+    """Route the shared async client through a handler set by the test."""
+    routes = {}
+
+    def handler(request):
+        return routes["handler"](request)
+
+    set_async_client(httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+    yield routes
+    set_async_client(None)
+
+
+class SyncOnlyTool(BaseTool):
+    @property
+    def definition(self):
+        return {"type": "function", "function": {"name": "sync_only", "parameters": {}}}
+
+    def fn(self, a, b):
+        return a + b
+
+
+class DualTool(SyncOnlyTool):
+    def fn(self, a, b):
+        raise AssertionError("execute_async should prefer afn")
+
+    async def afn(self, a, b):
+        return a * b
+
+
+@pytest.mark.asyncio
+async def test_execute_async_prefers_afn():
+    assert await DualTool().execute_async({"a": 3, "b": 4}) == 12
+
+
+@pytest.mark.asyncio
+async def test_execute_async_falls_back_to_thread_with_kwargs():
+    assert await SyncOnlyTool().execute_async({"a": 3, "b": 4}) == 7
+
+
+@pytest.mark.asyncio
+async def test_wikipedia_afn(mock_http):
+    mock_http["handler"] = lambda request: httpx.Response(
+        200, json={"title": "Test Article", "extract": "Summary"}
+    )
+
+    result = await WikipediaLookup().execute_async({"query": "Test Query"})
+
+    assert result["title"] == "Test Article"
+    assert result["summary"] == "Summary"
+
+
+@pytest.mark.asyncio
+async def test_many_concurrent_calls_share_one_loop(mock_http):
+    async def handler(request):
+        await asyncio.sleep(0.01)
+        return httpx.Response(200, json={"title": request.url.path.rsplit("/", 1)[-1]})
+
+    class AsyncTransport(httpx.AsyncBaseTransport):
+        async def handle_async_request(self, request):
+            return await handler(request)
+
+    set_async_client(httpx.AsyncClient(transport=AsyncTransport()))
+    tool = WikipediaLookup()
+
+    results = await asyncio.gather(
+        *(tool.execute_async({"query": f"term{i}"}) for i in range(500))
+    )
+
+    assert [r["title"] for r in results] == [f"term{i}" for i in range(500)]
+
+
+@pytest.mark.asyncio
+async def test_grants_afn_shares_fn_logic(mock_http):
+    seen = []
+
+    def handler(request):
+        seen.append((request.method, request.url.path, request.headers["X-Auth"]))
+        return httpx.Response(200, json={"opportunity_id": 7})
+
+    mock_http["handler"] = handler
+    tool = GetOpportunity(api_key="key", base_url="https://grants.test")
+
+    assert json.loads(await tool.afn(opportunity_id=7)) == {"opportunity_id": 7}
+    assert seen == [("GET", "/v1/opportunities/7", "key")]
+
+    # Validation errors are returned before any request is made.
+    invalid = json.loads(await tool.afn(opportunity_id=-1))
+    assert "Invalid opportunity_id" in invalid["error"]
+    assert len(seen) == 1
+
+
+@pytest.mark.asyncio
+async def test_grants_search_afn_reports_api_errors(mock_http):
+    mock_http["handler"] = lambda request: httpx.Response(400, json={"error": "boom"})
+    tool = QueryByDates(api_key="key", base_url="https://grants.test")
+
+    result = json.loads(await tool.afn(post_start_date="2024-01-01"))
+
+    assert result["success"] is False
+    assert "API request failed" in result["error"]
+
+    mock_http["handler"] = lambda request: httpx.Response(429, json={"error": "slow down"})
+    assert json.loads(await tool.afn(post_start_date="2024-01-01"))["success"] is False
+    with pytest.raises(httpx.HTTPStatusError):
+        await tool._afn_raw(post_start_date="2024-01-01")
+
+
+@pytest.mark.asyncio
+async def test_get_repo_contents_afn_keeps_listing_order(mock_http):
+    listings = {
+        "/repos/o/r/contents/": [
+            {"type": "file", "name": "a.py", "path": "a.py", "download_url": "https://raw.test/a.py"},
+            {"type": "dir", "name": "pkg", "path": "pkg"},
+            {"type": "file", "name": "image.png", "path": "image.png", "download_url": "https://raw.test/image.png"},
+            {"type": "file", "name": "z.md", "path": "z.md", "download_url": "https://raw.test/z.md"},
+        ],
+        "/repos/o/r/contents/pkg": [
+            {"type": "file", "name": "b.py", "path": "pkg/b.py", "download_url": "https://raw.test/pkg/b.py"},
+        ],
+    }
+
+    def handler(request):
+        if request.url.host == "api.github.com":
+            return httpx.Response(200, json=listings[request.url.path])
+        return httpx.Response(200, text=f"contents of {request.url.path}")
+
+    mock_http["handler"] = handler
+
+    result = await GetRepoContents(api_key="token").afn("https://github.com/o/r", "")
+
+    assert [block.split("\n")[0] for block in result.split("\n\n")] == ["a.py", "pkg/b.py", "z.md"]
+    assert "image.png" not in result
+
+
+@pytest.mark.asyncio
+async def test_get_repo_contents_afn_bounds_concurrent_requests(mock_http):
+    files = [{"type": "file", "name": f"m{i}.py", "path": f"pkg/m{i}.py",
+              "download_url": f"https://raw.test/pkg/m{i}.py"} for i in range(30)]
+    listings = {"/repos/o/r/contents/": [{"type": "dir", "name": "pkg", "path": "pkg"}] + files[:10],
+                "/repos/o/r/contents/pkg": files[10:]}
+    active = peak = 0
+
+    async def handler(request):
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.005)
+        active -= 1
+        if request.url.host == "api.github.com":
+            return httpx.Response(200, json=listings[request.url.path])
+        return httpx.Response(200, text="x")
+
+    mock_http["handler"] = handler
+    tool = GetRepoContents(api_key="token")
+    tool.max_concurrent_requests = 3
+
+    result = await tool.afn("https://github.com/o/r", "")
+
+    assert len(result.split("\n\n")) == 30
+    assert peak == 3
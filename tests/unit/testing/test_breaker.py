@@ -0,0 +1,184 @@
+import asyncio
+
+import httpx
+import pytest
+import responses
+
+from gofannon.base import BaseTool
+from gofannon.base.breaker import (
+    BreakerPolicy,
+    CircuitBreaker,
+    CircuitOpenError,
+    configure_breaker,
+    get_breaker,
+    reset_breakers,
+)
+from gofannon.base.http import _tracing_transport, close_sessions
+from gofannon.base.metrics import get_registry
+from gofannon.base import retry
+from gofannon.base.retry import RetryPolicy
+from gofannon.get_url_content.get_url_content import GetUrlContent
+from gofannon.open_notify_space.iss_locator import IssLocator
+from gofannon.simpler_grants_gov.get_opportunity import GetOpportunity
+
+POLICY = BreakerPolicy(failure_rate=0.5, window=4, min_requests=4, reset_timeout=10)
+
+
+@pytest.fixture(autouse=True)
+def isolated():
+    reset_breakers()
+    get_registry().reset()
+    yield
+    for service in ("breaker_test", "get_url_content", "grants.breaker.test",
+                    "api.open-notify.org"):
+        configure_breaker(service, None)
+    reset_breakers()
+    close_sessions()
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(CircuitBreaker, "clock", staticmethod(lambda: now[0]))
+    return now
+
+
+def gauge(service):
+    return get_registry().value("gofannon_circuit_state", service=service)
+
+
+def test_opens_on_failure_rate_and_recovers_through_probe(clock):
+    breaker = CircuitBreaker("svc", POLICY)
+    for failed in (False, True, False, False):
+        breaker.before_request()
+        breaker.record(failed)
+    assert breaker.state == "closed"
+
+    breaker.before_request()
+    breaker.record(True)
+    assert breaker.state == "open"
+    assert gauge("svc") == 1
+    with pytest.raises(CircuitOpenError) as exc_info:
+        breaker.before_request()
+    assert exc_info.value.retry_after == 10
+    assert get_registry().value("gofannon_circuit_rejections_total", service="svc") == 1
+
+    clock[0] += 10
+    breaker.before_request()
+    assert breaker.state == "half_open"
+    assert gauge("svc") == 2
+    with pytest.raises(CircuitOpenError):
+        breaker.before_request()
+    breaker.record(False)
+    assert breaker.state == "closed"
+    assert gauge("svc") == 0
+
+
+def test_failed_probe_reopens(clock):
+    breaker = CircuitBreaker("svc", BreakerPolicy(window=1, min_requests=1, reset_timeout=5))
+    breaker.before_request()
+    breaker.record(True)
+    clock[0] += 5
+    breaker.before_request()
+    breaker.record(True)
+    assert breaker.state == "open"
+    clock[0] += 1
+    with pytest.raises(CircuitOpenError):
+        breaker.before_request()
+
+
+def test_cancelled_probe_is_given_back(clock):
+    breaker = CircuitBreaker("svc", BreakerPolicy(window=1, min_requests=1, reset_timeout=5))
+    breaker.before_request()
+    breaker.record(True)
+    clock[0] += 5
+    breaker.before_request()
+    breaker.cancel()
+    breaker.before_request()
+    assert breaker.state == "half_open"
+
+
+class Fetch(BaseTool):
+    API_SERVICE = "breaker_test"
+    retry_policy = RetryPolicy(max_attempts=5, base_delay=0)
+
+    @property
+    def definition(self):
+        return {"type": "function", "function": {"name": "fetch", "parameters": {}}}
+
+    def fn(self, url):
+        response = self.http_session(url).get(url)
+        response.raise_for_status()
+        return response.text
+
+
+@responses.activate
+def test_open_circuit_fails_tool_calls_fast(context):
+    responses.add(responses.GET, "https://api.breaker.test/x", status=503)
+    configure_breaker("breaker_test", BreakerPolicy(window=2, min_requests=2))
+
+    result = Fetch().execute(context, url="https://api.breaker.test/x")
+
+    assert not result.success
+    assert result.retryable
+    assert "Circuit for breaker_test is open" in result.error
+    # Two failures opened the circuit; the third attempt never went out.
+    assert len(responses.calls) == 2
+    assert get_breaker("breaker_test").state == "open"
+
+
+@responses.activate
+@pytest.mark.parametrize("tool, url, arguments, service", [
+    (GetOpportunity(api_key="key", base_url="https://grants.breaker.test"),
+     "https://grants.breaker.test/v1/opportunities/7", {"opportunity_id": 7},
+     "grants.breaker.test"),
+    (GetUrlContent(), "https://page.breaker.test/", {"url": "https://page.breaker.test/"},
+     "get_url_content"),
+])
+def test_tools_report_an_open_circuit_as_a_failure(context, monkeypatch, tool, url, arguments,
+                                                   service):
+    monkeypatch.setattr(retry, "sleep", lambda seconds: None)
+    responses.add(responses.GET, url, status=503)
+    configure_breaker(service, BreakerPolicy(window=2, min_requests=2))
+
+    result = tool.execute(context, **arguments)
+
+    assert not result.success and result.retryable
+    assert f"Circuit for {service} is open" in result.error
+    assert len(responses.calls) == 2
+
+
+@responses.activate
+def test_iss_locator_reports_an_open_circuit_as_a_failure(context):
+    responses.add(responses.GET, "http://api.open-notify.org/iss-now.json", status=503)
+    configure_breaker("api.open-notify.org", BreakerPolicy(window=2, min_requests=2))
+    tool = IssLocator()
+    for _ in range(2):
+        tool.execute(context)
+
+    result = tool.execute(context)
+    assert not result.success and result.retryable
+    assert "is open" in result.error
+
+
+def test_async_transport_uses_host_circuit():
+    configure_breaker("breaker_test", BreakerPolicy(window=2, min_requests=2),
+                      hosts=("api.breaker.test",))
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        return httpx.Response(500)
+
+    transport = _tracing_transport(httpx.MockTransport(handler))
+
+    async def main():
+        async with httpx.AsyncClient(transport=transport) as client:
+            for _ in range(2):
+                await client.get("https://api.breaker.test/x")
+            with pytest.raises(CircuitOpenError):
+                await client.get("https://api.breaker.test/x")
+
+    asyncio.run(main())
+    assert len(calls) == 2
+    assert gauge("breaker_test") == 1
@@ -0,0 +1,187 @@
+import json
+
+import pytest
+
+from gofannon.base import BaseTool, WorkflowContext
+from gofannon.base.checkpoints import JournalCheckpointStore
+from gofannon.base.execution_log import LogRetention
+from gofannon.orchestration import ToolChain
+
+
+pytestmark = pytest.mark.usefixtures("home")
+
+
+def make_context(tmp_path, **kwargs):
+    kwargs.setdefault("fsync", "never")
+    return WorkflowContext(checkpoint_store=JournalCheckpointStore(tmp_path / "wf", **kwargs))
+
+
+def journal_records(store):
+    with open(store.journal_path) as f:
+        return [json.loads(line) for line in f]
+
+
+def test_pending_changes_track_deltas(tmp_path):
+    context = make_context(tmp_path)
+    context.data["a"] = 1
+    assert context.pending_changes()["reset"]
+
+    context.save_checkpoint("first")
+    context.data["b"] = 2
+    context.data.pop("a")
+    context.log_execution("Tool", 0.1, {"x": 1}, "out")
+    context.completed_steps["0:Tool"] = "fp"
+
+    changes = context.pending_changes()
+    assert not changes["reset"]
+    assert changes["set"] == {"b": 2}
+    assert changes["deleted"] == ["a"]
+    assert [entry["tool"] for entry in changes["log"]] == ["Tool"]
+    assert changes["steps"] == {"0:Tool": "fp"}
+
+
+def test_checkpoint_appends_only_the_new_step(tmp_path):
+    context = make_context(tmp_path)
+    context.data["big"] = "x" * 10_000
+    context.save_checkpoint("first")
+    size = context.checkpoint_store.journal_path.stat().st_size
+
+    context.data["small"] = "y"
+    context.save_checkpoint("second")
+    records = journal_records(context.checkpoint_store)
+
+    assert context.checkpoint_store.journal_path.stat().st_size - size < 200
+    assert [r["op"] for r in records] == ["reset", "set", "checkpoint", "set", "checkpoint"]
+
+
+def test_load_replays_to_named_checkpoint(tmp_path):
+    context = make_context(tmp_path)
+    context.data["a"] = 1
+    context.save_checkpoint("first")
+    context.data["a"] = 2
+    del context.data["a"]
+    context.data["b"] = 3
+    context.log_execution("Tool", 0.1, {}, "out")
+    context.save_checkpoint("second")
+
+    restored = make_context(tmp_path)
+    assert restored.load_checkpoint("first")
+    assert restored.data == {"a": 1}
+    assert restored.load_checkpoint("second")
+    assert restored.data == {"b": 3}
+    assert [entry["tool"] for entry in restored.execution_log] == ["Tool"]
+    assert not restored.load_checkpoint("missing")
+
+
+def test_torn_tail_is_ignored(tmp_path):
+    context = make_context(tmp_path)
+    context.data["a"] = 1
+    context.save_checkpoint("first")
+    with open(context.checkpoint_store.journal_path, "a") as f:
+        f.write(json.dumps({"op": "set", "key": "a", "value": 2}) + "\n")
+        f.write('{"op": "checkpoint", "na')
+
+    restored = make_context(tmp_path)
+    assert restored.load_checkpoint("first")
+    assert restored.data == {"a": 1}
+
+
+def test_compaction_folds_journal_into_snapshot(tmp_path):
+    context = make_context(tmp_path, compact_every=3)
+    for i in range(4):
+        context.data[f"k{i}"] = i
+        context.save_checkpoint(f"step{i}")
+
+    store = context.checkpoint_store
+    assert store.snapshot_path.exists()
+    assert store.journal_path.name == "journal.1.jsonl"
+    assert not (store.directory / "journal.0.jsonl").exists()
+    assert [r["op"] for r in journal_records(store)] == ["set", "checkpoint"]
+
+    restored = make_context(tmp_path)
+    assert restored.load_checkpoint("step3")
+    assert restored.data == {"k0": 0, "k1": 1, "k2": 2, "k3": 3}
+    # The checkpoint the snapshot was taken at is still available.
+    assert restored.load_checkpoint("step2")
+    assert restored.data == {"k0": 0, "k1": 1, "k2": 2}
+
+
+def test_checkpoints_before_a_compaction_are_gone(tmp_path):
+    context = make_context(tmp_path, compact_every=3)
+    for i in range(3):
+        context.data[f"k{i}"] = i
+        context.save_checkpoint(f"step{i}")
+
+    restored = make_context(tmp_path)
+    restored.data["mine"] = True
+    assert not restored.load_checkpoint("step0")
+    assert not restored.load_checkpoint("step1")
+    assert restored.data == {"mine": True}
+
+
+def test_compaction_keeps_log_entries_dropped_from_memory(tmp_path):
+    store = JournalCheckpointStore(tmp_path / "wf", fsync="never", compact_every=2)
+    context = WorkflowContext(checkpoint_store=store,
+                              log_retention=LogRetention(max_entries=1, spill_bytes=None))
+    for step in range(3):
+        context.log_execution("Tool", 0.1, {}, step)
+        context.save_checkpoint(f"step{step}")
+    assert store.snapshot_path.exists()
+
+    restored = make_context(tmp_path)
+    assert restored.load_checkpoint("step1")
+    assert [entry["output"] for entry in restored.execution_log] == [0, 1]
+    assert restored.load_checkpoint("step2")
+    assert [entry["output"] for entry in restored.execution_log] == [0, 1, 2]
+
+
+@pytest.mark.parametrize("policy, expected", [("always", 3), ("interval", 1), ("never", 0)])
+def test_fsync_policy(tmp_path, monkeypatch, policy, expected):
+    calls = []
+    monkeypatch.setattr("os.fsync", calls.append)
+    context = make_context(tmp_path, fsync=policy, fsync_interval=60)
+    for i in range(3):
+        context.data[i] = i
+        context.save_checkpoint(f"step{i}")
+    assert len(calls) == expected
+
+
+def test_invalid_fsync_policy(tmp_path):
+    with pytest.raises(ValueError):
+        JournalCheckpointStore(tmp_path, fsync="sometimes")
+
+
+class Append(BaseTool):
+    def __init__(self, label, inputs, fail=False):
+        super().__init__()
+        self.label = label
+        self.inputs = inputs
+        self.fail = fail
+        self.calls = 0
+
+    @property
+    def definition(self):
+        return {"function": {"parameters": self.inputs}}
+
+    def fn(self, **kwargs):
+        self.calls += 1
+        if self.fail:
+            raise RuntimeError(f"{self.label} failed")
+        return "+".join([str(v) for v in kwargs.values()] + [self.label])
+
+
+def test_tool_chain_resumes_from_journal(tmp_path):
+    steps = [
+        type("Fetch", (Append,), {})("fetch", {"q": "{{query}}"}),
+        type("Parse", (Append,), {})("parse", {"x": "{{Fetch_output}}"}),
+        type("Report", (Append,), {})("report", {"x": "{{Parse_output}}"}, fail=True),
+    ]
+    chain = ToolChain(steps, make_context(tmp_path))
+    assert not chain.execute({"query": "q"}).success
+
+    steps[2].fail = False
+    result = ToolChain(steps, make_context(tmp_path), run_id=chain.run_id).resume({"query": "q"})
+
+    assert result.success
+    assert result.output["Report_output"] == "q+fetch+parse+report"
+    assert [step.calls for step in steps] == [1, 1, 2]
@@ -0,0 +1,111 @@
+import asyncio
+import threading
+import time
+
+import pytest
+import responses
+
+from gofannon.base import BaseTool, deadline
+from gofannon.base.deadline import ToolTimeoutError
+from gofannon.base.http import get_session
+from gofannon.base.retry import RetryPolicy
+
+
+class Hang(BaseTool):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.release = threading.Event()
+        self.cancelled = False
+
+    @property
+    def definition(self):
+        return {"type": "function", "function": {"name": "hang", "parameters": {}}}
+
+    def fn(self, seconds):
+        self.release.wait(seconds)
+        return "finished"
+
+    async def afn(self, seconds):
+        try:
+            await asyncio.sleep(seconds)
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+        return "finished"
+
+
+def test_execute_abandons_sync_call_after_timeout(context):
+    tool = Hang()
+    start = time.monotonic()
+    result = tool.execute(context, timeout=0.05, seconds=5)
+
+    assert time.monotonic() - start < 1
+    assert not result.success
+    assert result.retryable
+    assert result.error == "Hang timed out after 0.05s"
+    tool.release.set()
+
+
+def test_class_timeout_and_fast_calls(context):
+    tool = Hang(timeout=0.05)
+    assert not tool.execute(context, seconds=5).success
+    tool.release.set()
+    assert tool.execute(context, seconds=0).output == "finished"
+
+
+def test_execute_async_cancels_the_tool():
+    tool = Hang()
+
+    async def main():
+        with pytest.raises(ToolTimeoutError):
+            await tool.execute_async({"seconds": 5}, timeout=0.05)
+        await asyncio.sleep(0)
+
+    asyncio.run(main())
+    assert tool.cancelled
+
+
+def test_deadline_is_visible_inside_the_call(context):
+    seen = []
+
+    class Probe(Hang):
+        def fn(self, seconds):
+            seen.append(deadline.remaining())
+            return "ok"
+
+    Probe().execute(context, timeout=10, seconds=0)
+    Probe().execute(context, seconds=0)
+    assert 9 < seen[0] <= 10
+    assert seen[1] is None
+
+
+@responses.activate
+def test_http_requests_are_capped_by_the_deadline():
+    responses.add(responses.GET, "https://api.deadline.test/x", body="ok")
+    session = get_session("deadline_test")
+
+    with deadline.scope(2):
+        session.get("https://api.deadline.test/x")
+    session.get("https://api.deadline.test/x")
+
+    assert responses.calls[0].request.req_kwargs["timeout"] <= 2
+    assert responses.calls[1].request.req_kwargs["timeout"] == 30
+    with deadline.scope(0), pytest.raises(ToolTimeoutError):
+        session.get("https://api.deadline.test/x")
+
+
+def test_retries_stop_at_the_deadline(context, monkeypatch):
+    monkeypatch.setattr("gofannon.base.retry.sleep", lambda seconds: None)
+
+    class Flaky(Hang):
+        retry_policy = RetryPolicy(max_attempts=5, base_delay=1, jitter=False)
+        attempts = 0
+
+        def fn(self, seconds):
+            type(self).attempts += 1
+            raise ConnectionError("reset")
+
+    # The first backoff (1s) fits in the budget, the second (2s) would overrun it.
+    result = Flaky().execute(context, timeout=1.5, seconds=0)
+    assert not result.success and result.retryable
+    assert Flaky.attempts == 2
@@ -0,0 +1,186 @@
+import threading
+import time
+
+import pytest
+import responses
+
+from gofannon.arxiv.get_article import ARXIV_API_URL, GetArticle
+from gofannon.base import BaseTool
+from gofannon.base.cache import CachePolicy
+from gofannon.base.ratelimit import configure_rate_limit
+from gofannon.base.retry import NO_RETRY
+
+
+@pytest.fixture
+def no_arxiv_limit():
+    configure_rate_limit("export.arxiv.org", None)
+    yield
+    configure_rate_limit("export.arxiv.org", rate=1 / 3, burst=1)
+
+
+class Lookup(BaseTool):
+    thread_safe = True
+    retry_policy = NO_RETRY
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.active = 0
+        self.peak = 0
+        self.lock = threading.Lock()
+
+    @property
+    def definition(self):
+        return {"type": "function", "function": {"name": "lookup", "parameters": {}}}
+
+    def fn(self, term):
+        with self.lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        try:
+            time.sleep(0.05)
+            if term == "missing":
+                raise KeyError(term)
+            return term.upper()
+        finally:
+            with self.lock:
+                self.active -= 1
+
+
+def test_results_keep_order_with_partial_failures(context):
+    tool = Lookup()
+    terms = ["a", "missing", "c", "d", "e", "f"]
+    results = tool.execute_many(context, [{"term": t} for t in terms], max_concurrency=3)
+
+    assert [r.success for r in results] == [True, False, True, True, True, True]
+    assert [r.output for r in results if r.success] == ["A", "C", "D", "E", "F"]
+    assert "missing" in results[1].error
+    assert 1 < tool.peak <= 3
+    assert len(context.execution_log) == 5
+
+
+def test_tools_that_are_not_thread_safe_run_one_at_a_time(context):
+    class Unsafe(Lookup):
+        thread_safe = False
+
+    tool = Unsafe()
+    results = tool.execute_many(context, [{"term": t} for t in "abc"], max_concurrency=8)
+    assert [r.output for r in results] == ["A", "B", "C"]
+    assert tool.peak == 1
+
+
+class Bulk(Lookup):
+    cache_policy = CachePolicy(ttl=60)
+    batches = []
+
+    def fn_many(self, arguments_list):
+        self.batches.append([a["term"] for a in arguments_list])
+        return [KeyError(a["term"]) if a["term"] == "missing" else a["term"].upper()
+                for a in arguments_list]
+
+
+def test_bulk_hook_answers_uncached_entries_in_one_call(context):
+    tool = Bulk()
+    tool.execute(context, term="b")
+
+    results = tool.execute_many(context, [{"term": t} for t in ["a", "b", "missing"]])
+
+    assert Bulk.batches == [["a", "missing"]]
+    assert [r.output for r in results] == ["A", "B", None]
+    assert not results[2].success
+    assert context.cache_stats["hits"] == 1
+    assert tool.execute_many(context, [{"term": "a"}])[0].output == "A"
+    assert Bulk.batches == [["a", "missing"]]
+
+
+def test_failed_bulk_call_fails_every_entry(context):
+    class Broken(Bulk):
+        cache_policy = None
+
+        def fn_many(self, arguments_list):
+            raise ConnectionError("reset")
+
+    results = Broken().execute_many(context, [{"term": "a"}, {"term": "b"}])
+    assert [(r.success, r.retryable, r.error) for r in results] == [(False, True, "reset")] * 2
+
+
+def feed(*ids):
+    entries = "".join(
+        f"<entry><id>http://arxiv.org/abs/{i}</id><title>Paper {i}</title></entry>" for i in ids)
+    return f'<feed xmlns="http://www.w3.org/2005/Atom"><title>query</title>{entries}</feed>'
+
+
+@responses.activate
+def test_get_article_fetches_ids_in_one_request(context, no_arxiv_limit):
+    responses.add(responses.GET, ARXIV_API_URL, body=feed("1904.11655v1", "2101.00001v2"))
+
+    results = GetArticle().execute_many(
+        context, [{"id": "2101.00001v2"}, {"id": "0000.00000"}, {"id": "1904.11655"}])
+
+    assert len(responses.calls) == 1
+    params = responses.calls[0].request.params
+    assert params["id_list"] == "2101.00001v2,0000.00000,1904.11655"
+    assert params["max_results"] == "3"
+    assert "Paper 2101.00001v2" in results[0].output
+    assert "Paper 1904.11655v1" not in results[0].output
+    assert results[1].success and "<entry>" not in results[1].output
+    assert "Paper 1904.11655v1" in results[2].output
+
+
+def rejected(bad_id):
+    return ('<feed xmlns="http://www.w3.org/2005/Atom"><entry>'
+            f"<id>http://arxiv.org/api/errors#incorrect_id_format_for_{bad_id}</id>"
+            f"<summary>incorrect id format for {bad_id}</summary></entry></feed>")
+
+
+@responses.activate
+def test_get_article_fails_malformed_ids_without_sending_them(context, no_arxiv_limit):
+    responses.add(responses.GET, ARXIV_API_URL, body=feed("1904.11655v1"))
+
+    bad, good = GetArticle().execute_many(context, [{"id": "bad"}, {"id": "1904.11655"}])
+
+    assert len(responses.calls) == 1
+    assert responses.calls[0].request.params["id_list"] == "1904.11655"
+    assert not bad.success
+    assert bad.error == "Not an arXiv id: 'bad'"
+    assert "Paper 1904.11655v1" in good.output
+
+
+@responses.activate
+def test_get_article_reports_rejected_queries(context, no_arxiv_limit):
+    responses.add(responses.GET, ARXIV_API_URL, body=rejected("9999.99999"))
+
+    results = GetArticle().execute_many(context, [{"id": "9999.99999"}, {"id": "1904.11655"}])
+
+    assert len(responses.calls) == 1
+    assert [r.error for r in results] == ["arXiv rejected the query: incorrect id format for 9999.99999"] * 2
+
+
+def arxiv_by_id(request):
+    ids = request.params["id_list"].split(",")
+    return (200, {}, feed(*[i for i in ids if i.startswith("1")]))
+
+
+@responses.activate
+def test_get_article_batches_match_single_fetches(context, no_arxiv_limit):
+    responses.add_callback(responses.GET, ARXIV_API_URL, callback=arxiv_by_id)
+    tool = GetArticle()
+    ids = ["1904.11655", "0000.00000"]
+
+    batched = tool.execute_many(context, [{"id": i} for i in ids])
+    single = [tool.execute(context, id=i) for i in ids]
+
+    assert [(r.success, r.output) for r in batched] == [(r.success, r.output) for r in single]
+    assert "Paper 1904.11655" in batched[0].output
+    assert "<entry>" not in batched[1].output
+
+
+@responses.activate
+def test_get_article_batches_return_http_errors_like_single_fetches(context, no_arxiv_limit):
+    responses.add(responses.GET, ARXIV_API_URL, status=503, body="Service Unavailable")
+    tool = GetArticle()
+    ids = ["1904.11655", "0000.00000"]
+
+    batched = tool.execute_many(context, [{"id": i} for i in ids])
+    single = [tool.execute(context, id=i) for i in ids]
+
+    assert [(r.success, r.output) for r in batched + single] == [(True, "Service Unavailable")] * 4
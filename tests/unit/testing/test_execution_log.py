@@ -0,0 +1,83 @@
+import json
+
+import pytest
+
+from gofannon.base import WorkflowContext
+from gofannon.base.checkpoints import JournalCheckpointStore
+from gofannon.base.execution_log import BLOB_REF, BlobStore, LogRetention
+
+
+pytestmark = pytest.mark.usefixtures("home")
+
+
+def make_context(tmp_path, **kwargs):
+    kwargs.setdefault("blob_path", tmp_path / "blobs")
+    return WorkflowContext(log_retention=LogRetention(**kwargs))
+
+
+def test_default_context_keeps_everything(tmp_path):
+    context = WorkflowContext()
+    for i in range(5):
+        context.log_execution("Tool", 0.1, {"i": i}, "x" * 100_000)
+    assert len(context.execution_log) == 5
+    assert context.execution_log[0]["output"] == "x" * 100_000
+
+
+def test_ring_buffer_keeps_recent_entries(tmp_path):
+    context = make_context(tmp_path, max_entries=3)
+    for i in range(10):
+        context.log_execution("Tool", 0.1, {"i": i}, i)
+    assert [entry["output"] for entry in context.execution_log] == [7, 8, 9]
+
+
+def test_large_values_spill_to_blob_store(tmp_path):
+    context = make_context(tmp_path, spill_bytes=100, preview_chars=10)
+    context.log_execution("ReadFile", 0.1, {"path": "a.txt"}, "x" * 1000)
+
+    entry = context.execution_log[0]
+    assert entry["input"] == {"path": "a.txt"}
+    ref = entry["output"]
+    assert ref["size"] == 1002
+    assert ref["preview"] == json.dumps("x" * 1000)[:10]
+    assert context.resolve_blob(ref) == "x" * 1000
+    assert context.resolve_blob(entry["input"]) == {"path": "a.txt"}
+
+
+def test_blobs_are_deduplicated(tmp_path):
+    context = make_context(tmp_path, spill_bytes=100)
+    for _ in range(3):
+        context.log_execution("ReadFile", 0.1, {}, "same" * 100)
+    context.log_execution("ReadFile", 0.1, {}, "other" * 100)
+
+    refs = {entry["output"][BLOB_REF] for entry in context.execution_log}
+    assert len(refs) == 2
+    assert len([p for p in (tmp_path / "blobs").rglob("*") if p.is_file()]) == 2
+
+
+def test_blob_store_round_trip(tmp_path):
+    store = BlobStore(tmp_path)
+    digest = store.put(json.dumps({"a": [1, 2]}))
+    assert digest in store
+    assert store.get(digest) == {"a": [1, 2]}
+
+
+def test_checkpoints_persist_entries_before_they_are_dropped(tmp_path):
+    store = JournalCheckpointStore(tmp_path / "wf", fsync="never")
+    context = WorkflowContext(checkpoint_store=store,
+                              log_retention=LogRetention(max_entries=2, blob_path=tmp_path / "blobs"))
+    for step in range(4):
+        context.log_execution("Tool", 0.1, {}, step)
+        context.log_execution("Tool", 0.1, {}, step)
+        context.save_checkpoint(f"step{step}")
+
+    restored = WorkflowContext(checkpoint_store=store)
+    assert restored.load_checkpoint("step3")
+    assert [entry["output"] for entry in restored.execution_log] == [0, 0, 1, 1, 2, 2, 3, 3]
+
+    # A bounded context restores only the most recent entries.
+    bounded = make_context(tmp_path, max_entries=3)
+    bounded.checkpoint_store = store
+    assert bounded.load_checkpoint("step3")
+    assert [entry["output"] for entry in bounded.execution_log] == [2, 3, 3]
+    bounded.log_execution("Tool", 0.1, {}, 4)
+    assert [entry["output"] for entry in bounded.pending_changes()["log"]] == [3, 3, 4]
@@ -0,0 +1,347 @@
+import sys
+import types
+
+import pytest
+
+from gofannon.base import WorkflowContext
+from gofannon.base.checkpoints import BLOB_REF, FirestoreStore
+from gofannon.base.execution_log import LogRetention
+
+SERVER_TIMESTAMP = object()
+DELETE_FIELD = object()
+
+
+class FieldPath:
+    def __init__(self, *parts):
+        self.parts = parts
+
+    def to_api_repr(self):
+        return ".".join(self.parts)
+
+
+class FakeDocument:
+    def __init__(self, db, path):
+        self.db = db
+        self.path = path
+        self.id = path.rsplit("/", 1)[-1]
+
+    def collection(self, name):
+        return FakeCollection(self.db, f"{self.path}/{name}")
+
+    def get(self):
+        fields = self.db.docs.get(self.path)
+        return types.SimpleNamespace(exists=fields is not None, to_dict=lambda: dict(fields))
+
+
+class FakeQuery:
+    def __init__(self, docs):
+        self.docs = docs
+
+    def order_by(self, field):
+        # Like Firestore, documents without the field are left out.
+        return FakeQuery(sorted((d for d in self.docs if field in d), key=lambda d: d[field]))
+
+    def limit(self, n):
+        return FakeQuery(self.docs[:n])
+
+    def stream(self):
+        return [types.SimpleNamespace(to_dict=lambda d=d: dict(d)) for d in self.docs]
+
+
+class FakeCollection:
+    def __init__(self, db, path):
+        self.db = db
+        self.path = path
+
+    def document(self, doc_id):
+        return FakeDocument(self.db, f"{self.path}/{doc_id}")
+
+    def order_by(self, field):
+        prefix = self.path + "/"
+        docs = [fields for path, fields in self.db.docs.items()
+                if path.startswith(prefix) and "/" not in path[len(prefix):]]
+        return FakeQuery(docs).order_by(field)
+
+
+class FakeBatch:
+    def __init__(self, db):
+        self.db = db
+        self.ops = []
+
+    def set(self, ref, fields):
+        self.ops.append(("set", ref, fields))
+
+    def update(self, ref, fields):
+        self.ops.append(("update", ref, fields))
+
+    def commit(self):
+        self.db.commits.append(self.ops)
+        for op, ref, fields in self.ops:
+            if op == "set":
+                self.db.docs[ref.path] = resolve({}, fields)
+            else:
+                if ref.path not in self.db.docs:
+                    raise KeyError(f"No document to update: {ref.path}")
+                doc = self.db.docs[ref.path]
+                for path, value in fields.items():
+                    *parents, leaf = path.split(".")
+                    target = doc
+                    for part in parents:
+                        target = target.setdefault(part, {})
+                    if value is DELETE_FIELD:
+                        target.pop(leaf, None)
+                    else:
+                        target[leaf] = resolve_value(value)
+
+
+def resolve_value(value):
+    return "now" if value is SERVER_TIMESTAMP else value
+
+
+def resolve(doc, fields):
+    doc.update({k: resolve_value(v) for k, v in fields.items()})
+    return doc
+
+
+class FakeFirestore:
+    def __init__(self):
+        self.docs = {}
+        self.commits = []
+
+    def collection(self, name):
+        return FakeCollection(self, name)
+
+    def batch(self):
+        return FakeBatch(self)
+
+    def written(self):
+        """Documents written by the commits so far, then forget them."""
+        paths = [ref.path for ops in self.commits for _, ref, _ in ops]
+        self.commits = []
+        return paths
+
+
+@pytest.fixture
+def db(home, monkeypatch):
+    db = FakeFirestore()
+    firestore = types.ModuleType("firebase_admin.firestore")
+    firestore.SERVER_TIMESTAMP = SERVER_TIMESTAMP
+    firestore.DELETE_FIELD = DELETE_FIELD
+    firestore.FieldPath = FieldPath
+    firestore.client = lambda: db
+    firebase_admin = types.ModuleType("firebase_admin")
+    firebase_admin.firestore = firestore
+    monkeypatch.setitem(sys.modules, "firebase_admin", firebase_admin)
+    monkeypatch.setitem(sys.modules, "firebase_admin.firestore", firestore)
+    return db
+
+
+def test_first_save_writes_everything(db):
+    store = FirestoreStore(db)
+    context = WorkflowContext()
+    context.data["a"] = 1
+    context.log_execution("Tool", 0.1, {"x": 1}, "out")
+    store.save_context("wf", context)
+
+    doc = db.docs["workflows/wf"]
+    assert doc["data"] == {"a": 1}
+    assert doc["execution_log_length"] == 1
+    assert "execution_log" not in doc
+    assert db.docs["workflows/wf/execution_log/000000000000"]["tool"] == "Tool"
+
+
+def test_later_saves_send_only_changes(db):
+    store = FirestoreStore(db)
+    context = WorkflowContext()
+    context.data.update(a=1, b=2)
+    context.log_execution("First", 0.1, {}, "out")
+    store.save_context("wf", context)
+    db.written()
+
+    context.data["b"] = 3
+    del context.data["a"]
+    context.log_execution("Second", 0.1, {}, "out")
+    store.save_context("wf", context)
+
+    (ops,) = db.commits
+    assert [op for op, _, _ in ops] == ["set", "update"]
+    assert ops[0][1].path == "workflows/wf/execution_log/000000000001"
+    update = ops[1][2]
+    assert update["data.b"] == 3
+    assert update["data.a"] is DELETE_FIELD
+    assert update["execution_log_length"] == 2
+
+    restored = store.get_context("wf")
+    assert restored.data == {"b": 3}
+    assert [entry["tool"] for entry in restored.execution_log] == ["First", "Second"]
+
+
+def test_unchanged_context_writes_nothing(db):
+    store = FirestoreStore(db)
+    context = store.get_context("wf")
+    store.save_context("wf", context)
+    db.written()
+
+    restored = store.get_context("wf")
+    store.save_context("wf", restored)
+    assert db.written() == []
+
+
+def test_log_is_written_in_batches(db):
+    store = FirestoreStore(db, batch_size=10)
+    context = WorkflowContext()
+    for i in range(25):
+        context.log_execution("Tool", 0.1, {"i": i}, i)
+    store.save_context("wf", context)
+
+    assert [len(ops) for ops in db.commits] == [10, 10, 6]
+    # The workflow document is written last.
+    assert db.commits[-1][-1][1].path == "workflows/wf"
+    assert [e["output"] for e in store.get_context("wf").execution_log] == list(range(25))
+
+
+def test_large_values_are_offloaded(db):
+    store = FirestoreStore(db, max_document_bytes=300)
+    store.CHUNK_BYTES = 64
+    context = WorkflowContext()
+    context.data["page"] = "x" * 500
+    context.log_execution("Fetch", 0.1, {"url": "u"}, "x" * 500)
+    store.save_context("wf", context)
+
+    ref = db.docs["workflows/wf"]["data"]["page"]
+    assert ref[BLOB_REF]
+    log_entry = db.docs["workflows/wf/execution_log/000000000000"]
+    # Both values share one content-addressed blob.
+    assert log_entry["output"] == ref
+    assert sum(path.startswith("workflows/wf/blobs/") for path in db.docs) == 1 + 8
+
+    restored = store.get_context("wf")
+    assert restored.data["page"] == "x" * 500
+    assert restored.execution_log[0]["output"] == "x" * 500
+
+
+def test_values_are_offloaded_by_document_size(db):
+    store = FirestoreStore(db, max_document_bytes=1000)
+    context = WorkflowContext()
+    context.data.update(small="s" * 100, medium="m" * 300, large="l" * 400)
+    store.save_context("wf", context)
+
+    # 800 bytes fit in one document.
+    assert db.docs["workflows/wf"]["data"]["large"] == "l" * 400
+
+    context.data["extra"] = "e" * 350
+    store.save_context("wf", context)
+    data = db.docs["workflows/wf"]["data"]
+    # The changed value is moved out to make room; stored ones stay put.
+    assert data["extra"][BLOB_REF]
+    assert data["large"] == "l" * 400
+    assert store.get_context("wf").data["extra"] == "e" * 350
+
+
+def test_spilled_log_values_are_uploaded(db, tmp_path):
+    store = FirestoreStore(db, max_document_bytes=300)
+    context = WorkflowContext(log_retention=LogRetention(spill_bytes=100, blob_path=tmp_path))
+    context.log_execution("Fetch", 0.1, {"url": "u"}, "x" * 500)
+    spilled = context.execution_log[0]["output"]
+    store.save_context("wf", context)
+
+    # The log and Firestore address the value by the same digest.
+    log_entry = db.docs["workflows/wf/execution_log/000000000000"]
+    assert log_entry["output"][BLOB_REF] == spilled[BLOB_REF]
+    assert store.get_context("wf").execution_log[0]["output"] == "x" * 500
+
+
+def test_saving_to_another_document_writes_everything(db):
+    store = FirestoreStore(db)
+    context = WorkflowContext()
+    context.data["a"] = 1
+    store.save_context("wf-1", context)
+    context.data["b"] = 2
+    store.save_context("wf-2", context)
+
+    assert db.docs["workflows/wf-2"]["data"] == {"a": 1, "b": 2}
+
+
+def test_checkpoints_reference_the_shared_log(db):
+    store = FirestoreStore(db)
+    context = store.get_context("wf")
+    context.data["a"] = 1
+    context.log_execution("First", 0.1, {}, "out")
+    context.save_checkpoint("first")
+    context.data["a"] = 2
+    context.log_execution("Second", 0.1, {}, "out")
+    context.save_checkpoint("second")
+
+    checkpoint = db.docs["workflows/wf/checkpoints/000000000001"]
+    assert checkpoint["name"] == "first"
+    assert checkpoint["execution_log_length"] == 1
+    assert "execution_log" not in checkpoint
+
+    restored = store.get_context("wf")
+    assert restored.load_checkpoint("first")
+    assert restored.data == {"a": 1}
+    assert [entry["tool"] for entry in restored.execution_log] == ["First"]
+
+
+def test_checkpoints_hold_only_their_changes(db):
+    context = WorkflowContext(firebase_config=True, workflow_id="wf")
+    context.data["keep"] = "k"
+    for step in range(10):
+        context.data[f"step{step}"] = step
+        if step == 5:
+            del context.data["keep"]
+        context.log_execution("Tool", 0.1, {}, step)
+        context.save_checkpoint(f"after_{step}")
+
+    # A log entry, the checkpoint and the workflow document per step.
+    assert len(db.written()) == 30
+    last = db.docs["workflows/wf/checkpoints/000000000010"]
+    assert last["data"] == {"step9": 9}
+    assert not last["reset"]
+
+    restored = WorkflowContext(firebase_config=True, workflow_id="wf")
+    assert restored.load_checkpoint("after_4")
+    assert restored.data == {"keep": "k", **{f"step{i}": i for i in range(5)}}
+    assert [entry["output"] for entry in restored.execution_log] == list(range(5))
+    assert restored.load_checkpoint("after_9")
+    assert restored.data == {f"step{i}": i for i in range(10)}
+
+
+def test_latest_checkpoint_of_a_name_wins(db):
+    store = FirestoreStore(db)
+    context = store.get_context("wf")
+    for value in (1, 2):
+        context.data["a"] = value
+        context.save_checkpoint("step")
+
+    # Another process continues the workflow: its first checkpoint is whole.
+    other = FirestoreStore(db)
+    resumed = other.get_context("wf")
+    resumed.data["b"] = 3
+    resumed.save_checkpoint("step")
+    assert db.docs["workflows/wf/checkpoints/000000000003"]["reset"]
+
+    restored = store.get_context("wf")
+    assert restored.load_checkpoint("step")
+    assert restored.data == {"a": 2, "b": 3}
+
+
+def test_workflow_context_firebase_checkpoints(db):
+    context = WorkflowContext(firebase_config=True)
+    context.data["a"] = 1
+    context.save_checkpoint("after_Tool")
+
+    restored = WorkflowContext(firebase_config=True)
+    assert restored.load_checkpoint("after_Tool")
+    assert restored.data == {"a": 1}
+
+
+def test_reads_documents_with_embedded_log(db):
+    db.docs["checkpoints/old"] = {
+        "data": {"a": 1},
+        "execution_log": [{"tool": "Tool"}],
+        "completed_steps": {},
+    }
+    context = WorkflowContext(firebase_config=True)
+    assert context.load_checkpoint("old")
+    assert context.execution_log == [{"tool": "Tool"}]
@@ -0,0 +1,127 @@
+import json
+import logging
+
+import pytest
+
+from gofannon.base import BaseTool
+from gofannon.config import FunctionRegistry
+
+
+@pytest.fixture
+def registry(monkeypatch):
+    monkeypatch.setattr(FunctionRegistry, "_tools", {})
+    monkeypatch.setattr(FunctionRegistry, "_definitions", {})
+    monkeypatch.setattr(FunctionRegistry, "_pending", [])
+    monkeypatch.setattr(FunctionRegistry, "_failed", {})
+    return FunctionRegistry
+
+
+def make_counting_tool(tool_name="counting_tool"):
+    class CountingTool(BaseTool):
+        instances = 0
+
+        def __init__(self, name=tool_name):
+            super().__init__()
+            type(self).instances += 1
+            self.name = name
+
+        @property
+        def definition(self):
+            return {
+                "type": "function",
+                "function": {
+                    "name": self.name,
+                    "description": "Counts its own instantiations",
+                    "parameters": {
+                        "type": "object",
+                        "properties": {"x": {"type": "number"}},
+                        "required": ["x"],
+                    },
+                },
+            }
+
+        def fn(self, x):
+            return x
+
+    return CountingTool
+
+
+def test_register_does_not_instantiate(registry):
+    tool_class = make_counting_tool()
+    registry.register(tool_class)
+    assert tool_class.instances == 0
+
+
+def test_get_tools_snapshots_definition_once(registry):
+    tool_class = make_counting_tool()
+    registry.register(tool_class)
+
+    first = registry.get_tools()
+    second = registry.get_tools()
+
+    assert tool_class.instances == 1
+    assert first[0] is second[0]
+    assert first[0]["function"]["name"] == "counting_tool"
+    assert registry.get_tool_class("counting_tool") is tool_class
+
+
+def test_cached_definitions_are_immutable_and_serializable(registry):
+    registry.register(make_counting_tool())
+    definition = registry.get_definition("counting_tool")
+
+    with pytest.raises(TypeError):
+        definition["function"]["name"] = "renamed"
+    with pytest.raises(TypeError):
+        definition["function"]["parameters"]["properties"].update({"y": {}})
+
+    assert json.loads(json.dumps(definition))["function"]["parameters"]["required"] == ["x"]
+
+
+def test_failed_snapshot_is_skipped(registry):
+    class BrokenTool(BaseTool):
+        def __init__(self):
+            raise RuntimeError("boom")
+
+        @property
+        def definition(self):
+            return {}
+
+        def fn(self):
+            return None
+
+    registry.register(BrokenTool)
+    registry.register(make_counting_tool())
+
+    assert [d["function"]["name"] for d in registry.get_tools()] == ["counting_tool"]
+    assert [d["function"]["name"] for d in registry.get_tools()] == ["counting_tool"]
+    assert registry._pending == []
+    assert str(registry._failed[BrokenTool]) == "boom"
+
+
+def test_manifest_names_are_unique():
+    from gofannon.manifest import TOOL_MANIFEST, _check_unique
+
+    names = [name for name, _, _ in TOOL_MANIFEST]
+    assert len(names) == len(set(names))
+    assert FunctionRegistry.load("read_file").__module__ == "gofannon.file.read_file"
+    github_read_file = FunctionRegistry.load("github.read_file")
+    assert github_read_file.__module__ == "gofannon.github.read_file"
+    assert github_read_file().definition["function"]["name"] == "read_file"
+    with pytest.raises(ValueError, match="'read_file' is listed twice"):
+        _check_unique(TOOL_MANIFEST + (("read_file", "gofannon.other", "ReadFile"),))
+
+
+def test_building_a_tool_keeps_application_log_handlers(monkeypatch):
+    from gofannon import config
+    from gofannon.basic_math.addition import Addition
+
+    monkeypatch.setattr(config, "_logging_configured", False)
+    root = logging.getLogger()
+    handler = logging.NullHandler()
+    root.addHandler(handler)
+    try:
+        Addition()
+        assert handler in root.handlers
+        assert logging.getLogger("gofannon").propagate
+    finally:
+        root.removeHandler(handler)
@@ -1,4 +1,5 @@
 import pytest
+import requests
 import responses
 from gofannon.get_url_content.get_url_content import GetUrlContent
 
@@ -15,6 +16,19 @@ def test_invalid_url():
     result = tool.fn(url)
     assert result.startswith("Error:")
 
+@responses.activate
+def test_client_and_server_errors():
+    url = "https://example.com/page"
+    responses.add(responses.GET, url, status=404)
+    assert tool.fn(url).startswith("Error: HTTP error - 404")
+
+    # Server errors are reported by ``fn`` but raised on the path ``execute``
+    # takes, so that it retries them.
+    responses.replace(responses.GET, url, status=503)
+    assert tool.fn(url).startswith("Error: HTTP error - 503")
+    with pytest.raises(requests.exceptions.HTTPError):
+        tool._fn_raw(url)
+
 def test_malformed_url():
     url = "not_a_url"
     result = tool.fn(url)
@@ -0,0 +1,53 @@
+from unittest.mock import patch
+
+import pytest
+
+from gofannon.base import http
+from gofannon.github.read_file import ReadFile
+from gofannon.wikipedia.wikipedia_lookup import WikipediaLookup
+
+
+@pytest.fixture(autouse=True)
+def fresh_sessions():
+    http.close_sessions()
+    yield
+    http._session_settings.clear()
+    http.close_sessions()
+
+
+def test_tools_share_session_per_service():
+    a, b = ReadFile(api_key="x"), ReadFile(api_key="y")
+
+    assert a.http_session() is b.http_session()
+    assert a.http_session().headers["Accept"] == "application/vnd.github.v3+json"
+
+
+def test_tools_without_service_share_session_per_host():
+    tool = WikipediaLookup()
+
+    assert tool.http_session("https://en.wikipedia.org/a") is tool.http_session("https://en.wikipedia.org/b")
+    assert tool.http_session("https://en.wikipedia.org/a") is not tool.http_session("https://example.com/")
+
+
+def test_default_timeout_applied_unless_overridden():
+    session = http.get_session("example.com")
+
+    with patch("requests.Session.request") as mock_request:
+        session.get("https://example.com/")
+        session.get("https://example.com/", timeout=3)
+
+    assert mock_request.call_args_list[0].kwargs["timeout"] == http.DEFAULT_TIMEOUT
+    assert mock_request.call_args_list[1].kwargs["timeout"] == 3
+
+
+def test_configure_session_replaces_existing_session():
+    old = http.get_session("svc")
+
+    http.configure_session("svc", timeout=5, headers={"X-Test": "1"}, pool_maxsize=4)
+    new = http.get_session("svc")
+
+    assert new is not old
+    assert new.timeout == 5
+    assert new.headers["X-Test"] == "1"
+    assert new.get_adapter("https://example.com")._pool_maxsize == 4
+
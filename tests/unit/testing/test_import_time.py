@@ -0,0 +1,85 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+# Cumulative import budget for the catalog path, in microseconds. Override with
+# GOFANNON_IMPORT_BUDGET_US on slow CI machines.
+IMPORT_BUDGET_US = int(os.getenv("GOFANNON_IMPORT_BUDGET_US", "250000"))
+
+HEAVY_MODULES = ("openai", "github", "git", "pdfplumber", "pdfminer", "selenium")
+
+
+def run_python(code, *flags):
+    return subprocess.run(
+        [sys.executable, *flags, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+
+def parse_importtime(stderr):
+    """
+    Return ``{module: (depth, cumulative_us)}`` from ``python -X importtime``
+    output.
+    """
+    timings = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, module = line[len("import time:"):].split("|")
+        depth = (len(module) - len(module.lstrip()) - 1) // 2
+        timings[module.strip()] = (depth, int(cumulative))
+    return timings
+
+
+def test_listing_catalog_is_within_import_budget():
+    interpreter = parse_importtime(run_python("pass", "-X", "importtime").stderr)
+    timings = parse_importtime(run_python(
+        "import gofannon; gofannon.FunctionRegistry.catalog()", "-X", "importtime"
+    ).stderr)
+
+    for module in HEAVY_MODULES:
+        assert module not in timings, f"{module} imported while listing the catalog"
+
+    # Top-level entries not already imported by a bare interpreter are the
+    # cost attributable to gofannon.
+    spent = sum(
+        cumulative for module, (depth, cumulative) in timings.items()
+        if depth == 0 and module not in interpreter
+    )
+    assert spent < IMPORT_BUDGET_US, f"catalog import took {spent}us"
+
+
+@pytest.mark.parametrize("module_path", [
+    "gofannon.pdf_reader.pdf_reader",
+    "gofannon.github.clone_repo",
+    "gofannon.github.commit_files",
+    "gofannon.github.pr_review_tool",
+    "gofannon.reasoning.sequential_cot",
+    "gofannon.reasoning.hierarchical_cot",
+    "gofannon.reasoning.tree_of_thought",
+])
+def test_tool_modules_defer_backend_imports(module_path):
+    code = (
+        "import importlib, sys\n"
+        f"importlib.import_module({module_path!r})\n"
+        "from gofannon.config import FunctionRegistry\n"
+        "FunctionRegistry.get_tools()\n"
+        f"print(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))\n"
+    )
+    result = run_python(code)
+    assert result.stdout.strip() == ""
+
+
+def test_subpackages_resolve_tool_classes_lazily():
+    code = (
+        "import sys, gofannon\n"
+        "assert 'gofannon.github' not in sys.modules\n"
+        "cls = gofannon.github.ListRepoFiles\n"
+        "assert cls.__module__ == 'gofannon.github.list_repo_files'\n"
+        "assert gofannon.FunctionRegistry.load('addition').__name__ == 'Addition'\n"
+    )
+    run_python(code)
@@ -0,0 +1,156 @@
+import asyncio
+import urllib.request
+from types import SimpleNamespace
+
+import pytest
+
+from gofannon.base import BaseTool
+from gofannon.base.cache import CachePolicy, clear_caches
+from gofannon.base.metrics import MetricsRegistry, get_registry, start_metrics_server
+from gofannon.base.retry import NO_RETRY
+from gofannon.orchestration import AsyncFunctionOrchestrator, FunctionOrchestrator
+from gofannon.reasoning.sequential_cot import SequentialCoT
+
+
+@pytest.fixture(autouse=True)
+def registry():
+    get_registry().reset()
+    clear_caches()
+    yield get_registry()
+    get_registry().reset()
+
+
+class Echo(BaseTool):
+    retry_policy = NO_RETRY
+
+    @property
+    def definition(self):
+        return {"type": "function", "function": {"name": "echo", "parameters": {}}}
+
+    def fn(self, text, fail=False):
+        if fail:
+            raise ConnectionError("boom")
+        return text
+
+
+class CachedEcho(Echo):
+    cache_policy = CachePolicy(ttl=60)
+
+
+def test_execute_records_outcomes_and_latency(context, registry):
+    tool = Echo()
+    tool.execute(context, text="hello")
+    tool.execute(context, text="hello", fail=True)
+
+    assert registry.value("gofannon_tool_calls_total", tool="Echo", outcome="success") == 1
+    assert registry.value("gofannon_tool_calls_total", tool="Echo", outcome="error") == 1
+    assert registry.value("gofannon_tool_retryable_errors_total", tool="Echo") == 1
+    assert registry.histogram("gofannon_tool_duration_seconds", tool="Echo")["count"] == 2
+    response = registry.histogram("gofannon_tool_response_bytes", tool="Echo")
+    assert (response["count"], response["sum"]) == (1, 5)
+    assert registry.histogram("gofannon_tool_request_bytes", tool="Echo")["count"] == 2
+
+
+def test_cache_hits_are_counted(context, registry):
+    tool = CachedEcho()
+    for _ in range(3):
+        tool.execute(context, text="hello")
+    asyncio.run(tool.execute_async({"text": "hello"}))
+
+    assert registry.value("gofannon_tool_cache_total", tool="CachedEcho", result="miss") == 1
+    assert registry.value("gofannon_tool_cache_total", tool="CachedEcho", result="hit") == 3
+
+
+def test_execute_async_records_errors(registry):
+    with pytest.raises(ConnectionError):
+        asyncio.run(Echo().execute_async({"text": "x", "fail": True}))
+    assert registry.value("gofannon_tool_calls_total", tool="Echo", outcome="error") == 1
+
+
+def completion(content):
+    return SimpleNamespace(
+        choices=[SimpleNamespace(message=SimpleNamespace(content=content, tool_calls=None))],
+        usage=SimpleNamespace(prompt_tokens=7, completion_tokens=3),
+    )
+
+
+def test_orchestrator_llm_calls(registry):
+    llm = SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(
+        create=lambda **kwargs: completion("done"))))
+    FunctionOrchestrator(llm).execute_workflow("q", "model-a")
+
+    labels = {"model": "model-a", "source": "orchestrator"}
+    assert registry.value("gofannon_llm_calls_total", outcome="success", **labels) == 1
+    assert registry.value("gofannon_llm_tokens_total", kind="prompt", **labels) == 7
+    assert registry.value("gofannon_llm_tokens_total", kind="completion", **labels) == 3
+    assert registry.histogram("gofannon_llm_duration_seconds", **labels)["count"] == 1
+
+
+def test_async_orchestrator_llm_errors(registry):
+    async def create(**kwargs):
+        raise ConnectionError("down")
+
+    llm = SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=create)))
+    with pytest.raises(ConnectionError):
+        asyncio.run(AsyncFunctionOrchestrator(llm).execute_workflow("q", "model-a"))
+    assert registry.value("gofannon_llm_calls_total", model="model-a",
+                          source="orchestrator", outcome="error") == 1
+
+
+def test_reasoning_get_response(registry, monkeypatch):
+    client = SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(
+        create=lambda **kwargs: completion("thought"))))
+    tool = SequentialCoT(depth_chart=[{"model_name": "m", "temperature": 0.1,
+                                       "api_key": "k", "base_url": "http://x"}])
+    monkeypatch.setattr(tool, "create_openai_like_client", lambda level: client)
+
+    tool.get_response(0, [{"role": "user", "content": "q"}])
+    assert registry.value("gofannon_llm_calls_total", model="m", source="SequentialCoT",
+                          outcome="success") == 1
+
+
+def test_prometheus_text():
+    registry = MetricsRegistry()
+    registry.describe("requests_total", "Requests served.")
+    registry.inc("requests_total", 2, path='/a"b')
+    registry.set_gauge("breaker_state", 1, service="github")
+    registry.observe("latency_seconds", 0.02, buckets=(0.01, 0.1))
+    registry.observe("latency_seconds", 0.5, buckets=(0.01, 0.1))
+
+    assert registry.prometheus_text().splitlines() == [
+        "# HELP requests_total Requests served.",
+        "# TYPE requests_total counter",
+        'requests_total{path="/a\\"b"} 2',
+        "# TYPE breaker_state gauge",
+        'breaker_state{service="github"} 1',
+        "# TYPE latency_seconds histogram",
+        'latency_seconds_bucket{le="0.01"} 0',
+        'latency_seconds_bucket{le="0.1"} 1',
+        'latency_seconds_bucket{le="+Inf"} 2',
+        "latency_seconds_sum 0.52",
+        "latency_seconds_count 2",
+    ]
+
+
+def test_snapshot():
+    registry = MetricsRegistry()
+    registry.inc("calls_total", tool="Echo")
+    registry.observe("latency_seconds", 0.02, buckets=(0.01, 0.1), tool="Echo")
+
+    snapshot = registry.snapshot()
+    assert snapshot["counters"]["calls_total"] == [{"labels": {"tool": "Echo"}, "value": 1}]
+    (histogram,) = snapshot["histograms"]["latency_seconds"]
+    assert histogram["count"] == 1
+    assert histogram["buckets"] == {0.01: 0, 0.1: 1, float("inf"): 1}
+
+
+def test_metrics_server(context):
+    Echo().execute(context, text="hello")
+    server = start_metrics_server(port=0)
+    try:
+        url = f"http://127.0.0.1:{server.server_address[1]}/metrics"
+        with urllib.request.urlopen(url) as response:
+            body = response.read().decode()
+    finally:
+        server.shutdown()
+    assert 'gofannon_tool_calls_total{outcome="success",tool="Echo"} 1' in body
@@ -0,0 +1,266 @@
+import asyncio
+import json
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from gofannon.base import BaseTool
+from gofannon.orchestration import AsyncFunctionOrchestrator, FunctionOrchestrator
+from gofannon.orchestration.tool_pool import ToolPool, default_tool_pool
+
+
+class SleepTool(BaseTool):
+    active = 0
+    peak = 0
+    lock = threading.Lock()
+
+    @property
+    def definition(self):
+        return {"type": "function", "function": {"name": "sleep", "parameters": {}}}
+
+    def fn(self, seconds, label):
+        with SleepTool.lock:
+            SleepTool.active += 1
+            SleepTool.peak = max(SleepTool.peak, SleepTool.active)
+        time.sleep(seconds)
+        with SleepTool.lock:
+            SleepTool.active -= 1
+        return label
+
+
+def tool_call(call_id, **arguments):
+    return SimpleNamespace(
+        id=call_id,
+        function=SimpleNamespace(name="sleep", arguments=json.dumps(arguments)),
+    )
+
+
+class ScriptedLLM:
+    """Answers with the given tool calls first, then with a final message."""
+
+    def __init__(self, tool_calls):
+        self.turns = [
+            SimpleNamespace(content=None, tool_calls=tool_calls),
+            SimpleNamespace(content="done", tool_calls=None),
+        ]
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self.create))
+
+    def create(self, **kwargs):
+        return SimpleNamespace(choices=[SimpleNamespace(message=self.turns.pop(0))])
+
+
+@pytest.fixture(autouse=True)
+def reset_sleep_tool():
+    SleepTool.active = SleepTool.peak = 0
+
+
+def make_orchestrator(tool_calls, **kwargs):
+    orchestrator = FunctionOrchestrator(ScriptedLLM(tool_calls), **kwargs)
+    orchestrator.function_map = {"sleep": (SleepTool, {})}
+    return orchestrator
+
+
+def tool_messages(result):
+    return [(m["tool_call_id"], m["content"]) for m in result["conversation"]
+            if isinstance(m, dict) and m.get("role") == "tool"]
+
+
+def test_tool_calls_of_a_turn_run_concurrently_in_order():
+    calls = [tool_call(f"call_{i}", seconds=0.3 - i * 0.05, label=f"r{i}") for i in range(5)]
+    orchestrator = make_orchestrator(calls)
+
+    start = time.monotonic()
+    result = orchestrator.execute_workflow("q", "model")
+    elapsed = time.monotonic() - start
+
+    assert elapsed < 0.8
+    assert SleepTool.peak == 5
+    assert tool_messages(result) == [(f"call_{i}", f"r{i}") for i in range(5)]
+    assert result["final_answer"] == "done"
+    orchestrator.close()
+
+
+def test_max_concurrency_bounds_parallel_calls():
+    calls = [tool_call(f"call_{i}", seconds=0.05, label=f"r{i}") for i in range(6)]
+    orchestrator = make_orchestrator(calls, max_concurrency=2)
+
+    result = orchestrator.execute_workflow("q", "model")
+
+    assert SleepTool.peak == 2
+    assert [content for _, content in tool_messages(result)] == [f"r{i}" for i in range(6)]
+    orchestrator.close()
+
+
+def test_slow_calls_time_out():
+    calls = [
+        tool_call("fast", seconds=0.01, label="ok"),
+        tool_call("slow", seconds=1, label="late"),
+    ]
+    orchestrator = make_orchestrator(calls, tool_timeout=0.2)
+
+    start = time.monotonic()
+    result = orchestrator.execute_workflow("q", "model")
+
+    assert time.monotonic() - start < 0.8
+    messages = dict(tool_messages(result))
+    assert messages["fast"] == "ok"
+    assert messages["slow"] == "Error: sleep timed out after 0.2 seconds"
+    orchestrator.close()
+
+
+def test_turn_budget_bounds_queued_and_running_calls():
+    calls = [tool_call(f"call_{i}", seconds=0.3, label=f"r{i}") for i in range(3)]
+    orchestrator = make_orchestrator(calls, max_concurrency=2, turn_timeout=0.45)
+
+    start = time.monotonic()
+    result = orchestrator.execute_workflow("q", "model")
+
+    assert time.monotonic() - start < 0.8
+    messages = dict(tool_messages(result))
+    assert messages["call_0"] == "r0" and messages["call_1"] == "r1"
+    assert messages["call_2"] == "Error: sleep timed out after 0.45 seconds"
+    orchestrator.close()
+
+
+def test_hung_calls_do_not_starve_queued_calls():
+    calls = [tool_call(f"call_{i}", seconds=0.5 if i < 2 else 0.01, label=f"r{i}")
+             for i in range(3)]
+    orchestrator = make_orchestrator(calls, max_concurrency=2, tool_timeout=0.2)
+
+    start = time.monotonic()
+    result = orchestrator.execute_workflow("q", "model")
+
+    assert time.monotonic() - start < 0.45
+    assert [content for _, content in tool_messages(result)] == [
+        "Error: sleep timed out after 0.2 seconds"] * 3
+
+    # The threads stuck in the abandoned calls don't hold up the next turn.
+    orchestrator.llm = ScriptedLLM([tool_call("next", seconds=0.01, label="ok")])
+    result = orchestrator.execute_workflow("q", "model")
+    assert tool_messages(result) == [("next", "ok")]
+    orchestrator.close()
+
+
+class CountingTool(BaseTool):
+    thread_safe = True
+    instances = 0
+
+    def __init__(self, prefix=""):
+        super().__init__()
+        self.prefix = prefix
+        CountingTool.instances += 1
+
+    @property
+    def definition(self):
+        return {"type": "function", "function": {"name": "count", "parameters": {}}}
+
+    def fn(self, label):
+        return self.prefix + label
+
+
+class StatefulTool(CountingTool):
+    thread_safe = False
+
+
+def test_thread_safe_tools_are_pooled_per_config():
+    pool = ToolPool()
+    CountingTool.instances = 0
+
+    a = pool.get(CountingTool, {"prefix": "x"})
+    assert pool.get(CountingTool, {"prefix": "x"}) is a
+    assert pool.get(CountingTool, {"prefix": "y"}) is not a
+    assert CountingTool.instances == 2
+
+
+def test_stateful_tools_get_per_call_instances():
+    pool = ToolPool()
+
+    assert pool.get(StatefulTool) is not pool.get(StatefulTool)
+    assert len(pool) == 0
+
+
+def test_orchestrator_reuses_instances_across_workflows():
+    CountingTool.instances = 0
+    call = SimpleNamespace(id="c", function=SimpleNamespace(name="count", arguments='{"label": "a"}'))
+    pool = ToolPool()
+
+    for _ in range(3):
+        orchestrator = FunctionOrchestrator(ScriptedLLM([call, call]), tool_pool=pool)
+        orchestrator.function_map = {"count": (CountingTool, {"prefix": "p-"})}
+        result = orchestrator.execute_workflow("q", "model")
+        assert [content for _, content in tool_messages(result)] == ["p-a", "p-a"]
+        orchestrator.close()
+
+    assert CountingTool.instances == 1
+
+
+def test_default_tool_pool_is_process_wide():
+    assert default_tool_pool() is default_tool_pool()
+
+
+class AsyncScriptedLLM(ScriptedLLM):
+    def __init__(self, tool_calls, latency=0.05):
+        super().__init__(tool_calls)
+        self.latency = latency
+
+    async def create(self, **kwargs):
+        await asyncio.sleep(self.latency)
+        return super().create(**kwargs)
+
+
+class AsyncSleepTool(SleepTool):
+    async def afn(self, seconds, label):
+        await asyncio.sleep(seconds)
+        return label
+
+
+def make_async_orchestrator(tool_calls, **kwargs):
+    orchestrator = AsyncFunctionOrchestrator(AsyncScriptedLLM(tool_calls), **kwargs)
+    orchestrator.function_map = {"sleep": (AsyncSleepTool, {})}
+    return orchestrator
+
+
+@pytest.mark.asyncio
+async def test_async_orchestrator_multiplexes_workflows():
+    orchestrators = [
+        make_async_orchestrator([tool_call(f"call_{i}", seconds=0.05, label=f"r{i}") for i in range(3)])
+        for _ in range(200)
+    ]
+
+    start = time.monotonic()
+    results = await asyncio.gather(*(o.execute_workflow("q", "model") for o in orchestrators))
+
+    assert time.monotonic() - start < 2
+    for result in results:
+        assert tool_messages(result) == [(f"call_{i}", f"r{i}") for i in range(3)]
+        assert result["final_answer"] == "done"
+
+
+@pytest.mark.asyncio
+async def test_async_orchestrator_times_out_slow_calls():
+    calls = [tool_call("fast", seconds=0.01, label="ok"), tool_call("slow", seconds=1, label="late")]
+    orchestrator = make_async_orchestrator(calls, tool_timeout=0.1)
+
+    result = await orchestrator.execute_workflow("q", "model")
+
+    assert dict(tool_messages(result)) == {
+        "fast": "ok",
+        "slow": "Error: sleep timed out after 0.1 seconds",
+    }
+
+
+@pytest.mark.asyncio
+async def test_async_turn_budget_cancels_slow_calls():
+    calls = [tool_call("fast", seconds=0.01, label="ok"), tool_call("slow", seconds=1, label="late")]
+    orchestrator = make_async_orchestrator(calls, turn_timeout=0.1)
+
+    start = time.monotonic()
+    result = await orchestrator.execute_workflow("q", "model")
+
+    assert time.monotonic() - start < 0.5
+    assert dict(tool_messages(result)) == {
+        "fast": "ok",
+        "slow": "Error: sleep timed out after 0.1 seconds",
+    }
@@ -0,0 +1,114 @@
+import asyncio
+import os
+import threading
+import time
+
+import pytest
+
+from gofannon.base import BaseTool
+from gofannon.base.process_pool import configure_process_pool, get_process_pool
+from gofannon.base.retry import NO_RETRY
+from gofannon.pdf_reader.pdf_reader import ReadPdf
+
+ASSET_DIR = os.path.join(os.path.dirname(__file__), "assets")
+
+
+@pytest.fixture(autouse=True)
+def pool():
+    pool = configure_process_pool(max_workers=2, max_tasks_per_child=None)
+    yield pool
+    pool.shutdown()
+    configure_process_pool()
+
+
+class Crunch(BaseTool):
+    cpu_bound = True
+    retry_policy = NO_RETRY
+
+    @property
+    def definition(self):
+        return {"type": "function", "function": {"name": "crunch", "parameters": {}}}
+
+    def fn(self, seconds=0, crash=False):
+        if crash:
+            os._exit(1)
+        time.sleep(seconds)
+        return os.getpid()
+
+
+def test_execute_runs_in_a_warm_worker(context, pool):
+    workers = pool.warm()
+    assert len(workers) >= 1 and os.getpid() not in workers
+
+    result = Crunch().execute(context)
+    assert result.success
+    assert result.output in workers
+
+
+def test_execute_async_runs_in_a_worker():
+    pid = asyncio.run(Crunch().execute_async({}))
+    assert pid != os.getpid()
+
+
+def test_crashed_worker_is_retryable_and_replaced(context):
+    result = Crunch().execute(context, crash=True)
+    assert not result.success
+    assert result.retryable
+    assert "worker process died" in result.error
+
+    assert Crunch().execute(context).success
+
+
+def test_timed_out_call_kills_its_worker(context, pool):
+    pool.warm()
+    stuck = pool._executor
+    start = time.monotonic()
+    result = Crunch().execute(context, timeout=0.5, seconds=30)
+
+    assert time.monotonic() - start < 5
+    assert not result.success and result.retryable
+    # The pool is restarted without waiting for the stuck call. The restart
+    # can land just after ``execute`` returns; a call submitted before it
+    # would fail with the killed pool.
+    while pool._executor is stuck and time.monotonic() - start < 5:
+        time.sleep(0.01)
+    assert Crunch().execute(context).success
+
+
+def run_in_thread(fn):
+    results = []
+    thread = threading.Thread(target=lambda: results.append(fn()))
+    thread.start()
+    return thread, results
+
+
+def test_calls_killed_with_a_stuck_one_are_rerun(context, pool):
+    pool.warm()
+    thread, results = run_in_thread(lambda: Crunch().execute(context, seconds=1))
+    time.sleep(0.2)
+
+    assert not Crunch().execute(context, timeout=0.5, seconds=30).success
+    thread.join()
+
+    assert results[0].success
+
+
+class Write(Crunch):
+    mutating = True
+
+
+def test_mutating_calls_killed_with_a_stuck_one_fail(context, pool):
+    pool.warm()
+    thread, results = run_in_thread(lambda: Write().execute(context, seconds=1))
+    time.sleep(0.2)
+
+    assert not Crunch().execute(context, timeout=0.5, seconds=30).success
+    thread.join()
+
+    assert not results[0].success and results[0].retryable
+    assert "worker process died" in results[0].error
+
+
+def test_read_pdf_in_worker(context):
+    result = ReadPdf().execute(context, file_path=os.path.join(ASSET_DIR, "sample.pdf"))
+    assert "Sample PDF text" in result.output
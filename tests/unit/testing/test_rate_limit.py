@@ -0,0 +1,195 @@
+import asyncio
+import multiprocessing
+
+import httpx
+import pytest
+import responses
+
+from gofannon.base import BaseTool, deadline, ratelimit
+from gofannon.base.deadline import ToolTimeoutError
+from gofannon.base.http import _tracing_transport, aclose_async_client, get_session
+from gofannon.base.ratelimit import (
+    RateLimitExceeded,
+    SharedTokenBucket,
+    TokenBucket,
+    configure_rate_limit,
+    get_limiter,
+)
+
+
+@pytest.fixture
+def waits(monkeypatch):
+    waits = []
+
+    async def async_sleep(seconds):
+        waits.append(seconds)
+
+    monkeypatch.setattr(ratelimit, "sleep", waits.append)
+    monkeypatch.setattr(ratelimit, "async_sleep", async_sleep)
+    return waits
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(TokenBucket, "clock", staticmethod(lambda: now[0]))
+    return now
+
+
+def test_bucket_allows_burst_then_spaces_requests(clock, waits):
+    bucket = TokenBucket(rate=2, burst=3)
+    for _ in range(5):
+        bucket.acquire()
+    assert waits == [0.5, 1.0]
+
+    clock[0] += 10
+    waits.clear()
+    for _ in range(4):
+        bucket.acquire()
+    assert waits == [0.5]
+
+
+def test_max_wait_raises_retryable_error(clock, waits):
+    bucket = TokenBucket(rate=1, burst=1, max_wait=1.5)
+    bucket.acquire()
+    bucket.acquire()
+    with pytest.raises(RateLimitExceeded) as exc_info:
+        bucket.acquire()
+    assert exc_info.value.retryable
+    assert waits == [1.0]
+
+
+def test_wait_past_the_timeout_fails_without_taking_a_token(clock, waits):
+    bucket = TokenBucket(rate=1, burst=1)
+    bucket.acquire()
+    with pytest.raises(ToolTimeoutError):
+        bucket.acquire(timeout=0.5)
+    assert bucket.acquire(timeout=1.5) == 1.0
+    assert waits == [1.0]
+
+
+def test_async_acquire(clock, waits):
+    bucket = TokenBucket(rate=4, burst=1)
+
+    async def main():
+        await asyncio.gather(*(bucket.acquire_async() for _ in range(3)))
+
+    asyncio.run(main())
+    assert waits == [0.25, 0.5]
+
+
+def test_configure_and_host_aliases():
+    try:
+        limiter = configure_rate_limit("ratelimit_test", rate=10, hosts=("api.ratelimit.test",))
+        assert get_limiter("ratelimit_test") is limiter
+        assert get_limiter("api.ratelimit.test") is limiter
+        assert limiter.burst == 10
+    finally:
+        configure_rate_limit("ratelimit_test", None)
+    assert get_limiter("ratelimit_test") is None
+    assert get_limiter("api.ratelimit.test") is None
+
+
+@responses.activate
+def test_sessions_wait_for_their_service_limit(waits):
+    responses.add(responses.GET, "https://api.ratelimit.test/x", body="ok")
+    configure_rate_limit("ratelimit_test", rate=1, burst=1)
+    try:
+        session = get_session("ratelimit_test")
+        for _ in range(3):
+            session.get("https://api.ratelimit.test/x")
+    finally:
+        configure_rate_limit("ratelimit_test", None)
+    assert len(waits) == 2
+
+
+def test_async_transport_waits_for_host_limit(waits):
+    transport = _tracing_transport(httpx.MockTransport(lambda request: httpx.Response(204)))
+    configure_rate_limit("ratelimit_test", rate=1, burst=1, hosts=("api.ratelimit.test",))
+
+    async def main():
+        async with httpx.AsyncClient(transport=transport) as client:
+            for _ in range(3):
+                await client.get("https://api.ratelimit.test/x")
+            await client.get("https://other.ratelimit.test/x")
+
+    try:
+        asyncio.run(main())
+    finally:
+        configure_rate_limit("ratelimit_test", None)
+    assert len(waits) == 2
+
+
+@responses.activate
+def test_sessions_stop_waiting_at_the_deadline(clock, waits):
+    responses.add(responses.GET, "https://api.ratelimit.test/x", body="ok")
+    configure_rate_limit("ratelimit_test", rate=0.1, burst=1)
+    try:
+        session = get_session("ratelimit_test")
+        session.get("https://api.ratelimit.test/x")
+        with deadline.scope(5), pytest.raises(ToolTimeoutError):
+            session.get("https://api.ratelimit.test/x")
+    finally:
+        configure_rate_limit("ratelimit_test", None)
+    assert waits == []
+
+
+class Ping(BaseTool):
+    API_SERVICE = "ratelimit_test"
+
+    @property
+    def definition(self):
+        return {"type": "function", "function": {"name": "ping", "parameters": {}}}
+
+    def fn(self, url):
+        return self.http_session(url).get(url).text
+
+    async def afn(self, url):
+        return (await self.async_http_client(url).get(url)).text
+
+
+@responses.activate
+def test_sync_and_async_calls_share_the_service_limit(clock, waits, monkeypatch):
+    url = "https://api.ratelimit.test/x"
+    responses.add(responses.GET, url, body="ok")
+    monkeypatch.setattr(httpx, "AsyncHTTPTransport",
+                        lambda **kwargs: httpx.MockTransport(lambda request: httpx.Response(200, text="ok")))
+    configure_rate_limit("ratelimit_test", rate=1, burst=1)
+    tool = Ping()
+
+    async def main():
+        for _ in range(2):
+            assert await tool.afn(url) == "ok"
+        await aclose_async_client()
+
+    try:
+        assert tool.fn(url) == "ok"
+        asyncio.run(main())
+        assert tool.fn(url) == "ok"
+    finally:
+        configure_rate_limit("ratelimit_test", None)
+    assert waits == [1.0, 2.0, 3.0]
+
+
+def test_shared_buckets_draw_from_one_database(tmp_path, monkeypatch):
+    monkeypatch.setattr(SharedTokenBucket, "clock", staticmethod(lambda: 1000.0))
+    path = tmp_path / "limits.db"
+    # Separate instances stand in for separate processes: they share nothing
+    # but the database file.
+    a, b = (SharedTokenBucket(rate=1, burst=2, path=path, key="shared") for _ in range(2))
+    other = SharedTokenBucket(rate=1, burst=1, path=path, key="other")
+
+    assert [a.reserve(), b.reserve(), a.reserve(), b.reserve()] == [0.0, 0.0, 1.0, 2.0]
+    assert other.reserve() == 0.0
+
+
+def _reserve(path):
+    return SharedTokenBucket(rate=1, burst=1, path=path, key="procs").reserve()
+
+
+def test_shared_bucket_across_processes(tmp_path):
+    path = str(tmp_path / "limits.db")
+    with multiprocessing.get_context("spawn").Pool(2) as pool:
+        reserved = pool.map(_reserve, [path] * 3)
+    assert sorted(reserved)[0] == 0.0
+    assert all(wait > 0 for wait in sorted(reserved)[1:])
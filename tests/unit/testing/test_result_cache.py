@@ -0,0 +1,151 @@
+import pytest
+
+from gofannon.base import BaseTool
+from gofannon.base import cache as cache_module
+from gofannon.base.cache import CachePolicy, ResultCache, DiskStore, make_key
+
+
+@pytest.fixture(autouse=True)
+def clear_caches():
+    cache_module.clear_caches()
+    yield
+    cache_module.clear_caches()
+
+
+class CountingTool(BaseTool):
+    cache_policy = CachePolicy(ttl=60, max_entries=2)
+
+    def __init__(self):
+        super().__init__()
+        self.calls = 0
+
+    @property
+    def definition(self):
+        return {"type": "function", "function": {"name": "counting", "parameters": {}}}
+
+    def fn(self, query, verbose=False):
+        self.calls += 1
+        return {"query": query, "call": self.calls}
+
+
+class MutatingTool(CountingTool):
+    mutating = True
+
+
+class ErrorReportingTool(CountingTool):
+    cache_policy = CachePolicy(cache_if=lambda result: "error" not in result)
+
+    def fn(self, query, verbose=False):
+        self.calls += 1
+        return {"error": "try again"}
+
+
+def test_make_key_is_canonical():
+    assert make_key("t", {"a": 1, "b": [1, 2]}) == make_key("t", {"b": [1, 2], "a": 1})
+    assert make_key("t", {"a": 1}) != make_key("t", {"a": 2})
+    assert make_key("t", {"a": 1, "b": 2}, key_args=("a",)) == make_key("t", {"a": 1, "b": 3}, key_args=("a",))
+    assert make_key("t", {"a": 1}, scope={"api_key": "x"}) != make_key("t", {"a": 1}, scope={"api_key": "y"})
+
+
+def test_lru_eviction():
+    cache = ResultCache(CachePolicy(max_entries=2))
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+
+    assert cache.set("c", 3) == 1
+    assert cache.get("b") == (False, None)
+    assert cache.get("a") == (True, 1)
+    assert cache.stats()["evictions"] == 1
+
+
+def test_cached_values_are_isolated_from_callers():
+    cache = ResultCache(CachePolicy())
+    value = {"items": [1, 2]}
+    cache.set("k", value)
+    value["items"].append(3)
+
+    _, first = cache.get("k")
+    first["items"].append(4)
+
+    assert cache.get("k") == (True, {"items": [1, 2]})
+
+
+def test_max_bytes_eviction():
+    cache = ResultCache(CachePolicy(max_bytes=20))
+    cache.set("a", "x" * 9)
+    cache.set("b", "y" * 9)
+
+    assert len(cache) == 1
+    assert cache.get("b") == (True, "y" * 9)
+    # Results larger than the whole budget are never stored.
+    assert cache.set("c", "z" * 50) == 0
+    assert cache.get("c") == (False, None)
+
+
+def test_ttl_expiry(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(cache_module.time, "time", lambda: now[0])
+    cache = ResultCache(CachePolicy(ttl=10))
+    cache.set("a", 1)
+
+    now[0] += 9
+    assert cache.get("a") == (True, 1)
+    now[0] += 2
+    assert cache.get("a") == (False, None)
+
+
+def test_disk_store_survives_memory(tmp_path):
+    policy = CachePolicy(ttl=60, disk=True)
+    ResultCache(policy, DiskStore(tmp_path)).set("a", {"x": 1})
+
+    fresh = ResultCache(policy, DiskStore(tmp_path))
+    assert fresh.get("a") == (True, {"x": 1})
+    assert len(fresh) == 1
+
+
+def test_execute_uses_cache_and_records_stats(context):
+    tool = CountingTool()
+
+    first = tool.execute(context, query="x")
+    second = tool.execute(context, verbose=False, query="x")
+    tool.execute(context, query="y")
+    tool.execute(context, query="z")
+
+    assert first.output == second.output == {"query": "x", "call": 1}
+    assert tool.calls == 3
+    assert context.cache_stats == {"hits": 1, "misses": 3, "evictions": 1}
+    assert len(context.execution_log) == 4
+
+
+def test_cache_is_shared_between_instances(context):
+    CountingTool().execute(context, query="x")
+    tool = CountingTool()
+
+    assert tool.execute(context, query="x").output["call"] == 1
+    assert tool.calls == 0
+
+
+def test_mutating_tools_are_never_cached(context):
+    tool = MutatingTool()
+    tool.execute(context, query="x")
+    tool.execute(context, query="x")
+
+    assert tool.calls == 2
+    assert context.cache_stats == {"hits": 0, "misses": 0, "evictions": 0}
+
+
+def test_cache_if_skips_error_results(context):
+    tool = ErrorReportingTool()
+    tool.execute(context, query="x")
+    tool.execute(context, query="x")
+
+    assert tool.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_execute_async_uses_cache():
+    tool = CountingTool()
+
+    assert await tool.execute_async({"query": "x"}) == await tool.execute_async({"query": "x"})
+    assert tool.calls == 1
@@ -0,0 +1,157 @@
+import asyncio
+import email.utils
+import time
+
+import httpx
+import pytest
+import requests
+
+from gofannon.base import BaseTool
+from gofannon.base.metrics import get_registry
+from gofannon.base.retry import (
+    NO_RETRY,
+    RetryPolicy,
+    classify,
+    configure_retry,
+    parse_retry_after,
+)
+
+
+@pytest.fixture(autouse=True)
+def sleeps(monkeypatch):
+    """Record waits instead of sleeping."""
+    waits = []
+
+    async def async_sleep(seconds):
+        waits.append(seconds)
+
+    monkeypatch.setattr("gofannon.base.retry.sleep", waits.append)
+    monkeypatch.setattr("gofannon.base.retry.async_sleep", async_sleep)
+    get_registry().reset()
+    return waits
+
+
+def http_error(status, headers=None):
+    response = requests.Response()
+    response.status_code = status
+    response.headers.update(headers or {})
+    return requests.HTTPError(f"{status} error", response=response)
+
+
+class Flaky(BaseTool):
+    """Fails with the queued errors, then succeeds."""
+    retry_policy = RetryPolicy(max_attempts=4, base_delay=1, jitter=False)
+
+    def __init__(self, errors=()):
+        super().__init__()
+        self.errors = list(errors)
+        self.calls = 0
+
+    @property
+    def definition(self):
+        return {}
+
+    def fn(self, value=1):
+        self.calls += 1
+        if self.errors:
+            raise self.errors.pop(0)
+        return value
+
+
+def test_transient_errors_are_retried_with_backoff(context, sleeps):
+    tool = Flaky([http_error(502), requests.ConnectionError("reset"), http_error(503)])
+    result = tool.execute(context, value=5)
+
+    assert result.success and result.output == 5
+    assert tool.calls == 4
+    assert sleeps == [1, 2, 4]
+    assert context.execution_log[-1]["attempts"] == 4
+    assert get_registry().value("gofannon_tool_retries_total", tool="Flaky") == 3
+
+
+def test_validation_errors_fail_fast(context, sleeps):
+    tool = Flaky([http_error(422), None])
+    result = tool.execute(context)
+
+    assert not result.success
+    assert result.retryable is False
+    assert tool.calls == 1
+    assert sleeps == []
+
+
+def test_gives_up_after_max_attempts(context, sleeps):
+    tool = Flaky([http_error(500)] * 5)
+    result = tool.execute(context)
+
+    assert not result.success
+    assert result.retryable is True
+    assert tool.calls == 4
+    assert get_registry().value("gofannon_tool_retryable_errors_total", tool="Flaky") == 1
+
+
+def test_retry_after_is_honoured(context, sleeps):
+    tool = Flaky([http_error(429, {"Retry-After": "7"})])
+    assert tool.execute(context).success
+    assert sleeps == [7]
+
+
+def test_excessive_retry_after_fails(context, sleeps):
+    tool = Flaky([http_error(429, {"Retry-After": "3600"})])
+    assert not tool.execute(context).success
+    assert sleeps == []
+
+
+def test_jitter_stays_within_cap():
+    policy = RetryPolicy(base_delay=1, max_delay=5)
+    assert all(0 <= policy.backoff(retry) <= 5 for retry in range(1, 20))
+
+
+def test_parse_retry_after():
+    assert parse_retry_after("12") == 12
+    later = email.utils.formatdate(time.time() + 30, usegmt=True)
+    assert 25 <= parse_retry_after(later) <= 30
+    assert parse_retry_after("soon") is None
+
+
+def test_classify():
+    assert classify(TimeoutError()) == (True, None)
+    assert classify(httpx.ConnectError("refused")) == (True, None)
+    assert classify(ValueError("bad")) == (False, None)
+    assert classify(http_error(404)) == (False, None)
+    assert classify(http_error(503, {"Retry-After": "2"})) == (True, 2)
+
+    class Unavailable(Exception):
+        retryable = True
+
+    assert classify(Unavailable())[0]
+
+
+def test_mutating_tools_are_not_retried_by_default(context, sleeps):
+    class Commit(Flaky):
+        mutating = True
+        retry_policy = None
+
+    tool = Commit([requests.ConnectionError("reset")])
+    assert not tool.execute(context).success
+    assert tool.calls == 1
+
+
+def test_service_policy(context, sleeps):
+    class GrantsTool(Flaky):
+        API_SERVICE = "retry_test_service"
+        retry_policy = None
+
+    configure_retry("retry_test_service", NO_RETRY)
+    try:
+        tool = GrantsTool([http_error(503)])
+        assert not tool.execute(context).success
+        assert tool.calls == 1
+    finally:
+        configure_retry("retry_test_service", None)
+
+
+def test_execute_async_retries(sleeps):
+    tool = Flaky([httpx.ReadTimeout("slow"), http_error(502)])
+    assert asyncio.run(tool.execute_async({"value": 3})) == 3
+    assert tool.calls == 3
+    assert sleeps == [1, 2]
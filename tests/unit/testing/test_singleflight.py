@@ -0,0 +1,125 @@
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from gofannon.base import BaseTool
+from gofannon.base.metrics import get_registry
+from gofannon.base.retry import NO_RETRY
+from gofannon.base.singleflight import SingleFlight
+
+
+@pytest.fixture(autouse=True)
+def registry():
+    get_registry().reset()
+    yield get_registry()
+    get_registry().reset()
+
+
+class Slow(BaseTool):
+    retry_policy = NO_RETRY
+
+    def __init__(self, release, **kwargs):
+        super().__init__(**kwargs)
+        self.release = release
+        self.calls = []
+
+    @property
+    def definition(self):
+        return {"type": "function", "function": {"name": "slow", "parameters": {}}}
+
+    def fn(self, name, limit=10):
+        self.calls.append(name)
+        self.release.wait(5)
+        if name == "bad":
+            raise ConnectionError("upstream down")
+        return f"{name}:{limit}"
+
+
+def run_concurrently(tool, context, kwargs_list):
+    with ThreadPoolExecutor(len(kwargs_list)) as pool:
+        futures = [pool.submit(tool.execute, context, **kwargs) for kwargs in kwargs_list]
+        # Let every call reach the tool before the first one returns.
+        threading.Event().wait(0.2)
+        tool.release.set()
+        return [f.result() for f in futures]
+
+
+def test_identical_calls_share_one_run(context, registry):
+    tool = Slow(threading.Event())
+    results = run_concurrently(tool, context, [{"name": "a"}, {"name": "a", "limit": 10},
+                                               {"name": "a"}, {"name": "b"}])
+
+    assert [r.output for r in results] == ["a:10", "a:10", "a:10", "b:10"]
+    assert sorted(tool.calls) == ["a", "b"]
+    assert registry.value("gofannon_tool_coalesced_total", tool="Slow") == 2
+    assert registry.value("gofannon_tool_calls_total", tool="Slow", outcome="success") == 4
+
+
+def test_errors_are_shared_and_retryable(context):
+    tool = Slow(threading.Event())
+    results = run_concurrently(tool, context, [{"name": "bad"}] * 3)
+
+    assert tool.calls == ["bad"]
+    assert all(not r.success and r.retryable and r.error == "upstream down" for r in results)
+
+
+def test_mutating_and_opted_out_tools_are_not_coalesced(context):
+    for attribute in ("mutating", "coalesce"):
+        tool = Slow(threading.Event())
+        setattr(tool, attribute, attribute == "mutating")
+        run_concurrently(tool, context, [{"name": "a"}] * 3)
+        assert tool.calls == ["a"] * 3
+
+
+def test_sequential_calls_run_again(context):
+    tool = Slow(threading.Event())
+    tool.release.set()
+    tool.execute(context, name="a")
+    tool.execute(context, name="a")
+    assert tool.calls == ["a", "a"]
+
+
+class AsyncLookup(BaseTool):
+    retry_policy = NO_RETRY
+    calls = 0
+
+    @property
+    def definition(self):
+        return {"type": "function", "function": {"name": "lookup", "parameters": {}}}
+
+    def fn(self, term):
+        raise NotImplementedError
+
+    async def afn(self, term):
+        type(self).calls += 1
+        await asyncio.sleep(0.05)
+        return term.upper()
+
+
+def test_async_calls_are_coalesced(registry):
+    async def main():
+        return await asyncio.gather(*(AsyncLookup().execute_async({"term": t})
+                                      for t in ("x", "x", "y", "x")))
+
+    assert asyncio.run(main()) == ["X", "X", "Y", "X"]
+    assert AsyncLookup.calls == 2
+    assert registry.value("gofannon_tool_coalesced_total", tool="AsyncLookup") == 2
+
+
+def test_cancelled_waiter_does_not_cancel_shared_call():
+    group = SingleFlight()
+
+    async def work():
+        await asyncio.sleep(0.05)
+        return "done"
+
+    async def main():
+        leader = asyncio.ensure_future(group.do_async("k", work))
+        waiter = asyncio.ensure_future(group.do_async("k", work))
+        await asyncio.sleep(0)
+        waiter.cancel()
+        return await leader
+
+    assert asyncio.run(main()) == ("done", False)
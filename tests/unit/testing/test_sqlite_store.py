@@ -0,0 +1,154 @@
+import os
+import sqlite3
+import subprocess
+import sys
+import threading
+import time
+
+import pytest
+
+from gofannon.base import WorkflowContext
+from gofannon.base.checkpoints import SQLiteStore
+
+
+@pytest.fixture
+def store(home, tmp_path):
+    store = SQLiteStore(tmp_path / "state.db")
+    yield store
+    store.close()
+
+
+def test_database_uses_wal(store):
+    conn = sqlite3.connect(store.path)
+    assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    conn.close()
+
+
+def test_checkpoint_round_trip(store):
+    context = WorkflowContext(checkpoint_store=store.workflow("wf-1"))
+    context.data["answer"] = 42
+    context.log_execution("Tool", 0.1, {"x": 1}, "out")
+    context.completed_steps["0:Tool"] = "fp"
+    context.save_checkpoint("after_Tool")
+
+    restored = WorkflowContext(checkpoint_store=store.workflow("wf-1"))
+    assert restored.load_checkpoint("after_Tool")
+    assert restored.data == {"answer": 42}
+    assert restored.execution_log == context.execution_log
+    assert restored.completed_steps == {"0:Tool": "fp"}
+
+    other = WorkflowContext(checkpoint_store=store.workflow("wf-2"))
+    assert not other.load_checkpoint("after_Tool")
+
+
+def test_get_and_save_context(store):
+    context = store.get_context("wf-1")
+    assert context.data == {}
+
+    context.data["k"] = "v"
+    store.save_context("wf-1", context)
+
+    restored = store.get_context("wf-1")
+    assert restored.data == {"k": "v"}
+    assert restored.checkpoint_store.workflow_id == "wf-1"
+
+
+def committed(path):
+    conn = sqlite3.connect(path)
+    try:
+        return conn.execute("SELECT COUNT(*) FROM checkpoints").fetchone()[0]
+    finally:
+        conn.close()
+
+
+def test_writes_are_committed_before_returning(store):
+    store.save_checkpoint("wf", "a", WorkflowContext())
+    assert committed(store.path) == 1
+
+
+def test_concurrent_writes_share_a_commit(home, tmp_path, monkeypatch):
+    store = SQLiteStore(tmp_path / "state.db")
+    batches = []
+    commit = store._commit_locked
+    monkeypatch.setattr(store, "_commit_locked",
+                        lambda: (batches.append(len(store._pending)), commit()))
+    context = WorkflowContext()
+
+    # Writers queue up while another commit holds the connection.
+    with store._lock:
+        threads = [threading.Thread(target=store.save_checkpoint, args=("wf", str(i), context))
+                   for i in range(5)]
+        for thread in threads:
+            thread.start()
+        while len(store._pending) < 5:
+            time.sleep(0.01)
+    for thread in threads:
+        thread.join()
+
+    assert batches == [5]
+    assert committed(store.path) == 5
+    store.close()
+
+
+CRASHING_RUN = """
+import os, sys
+from gofannon.base import WorkflowContext
+from gofannon.base.checkpoints import SQLiteStore
+
+context = WorkflowContext(checkpoint_store=SQLiteStore(sys.argv[1]).workflow("wf"))
+for step in range(10):
+    context.data[f"step{step}"] = step
+    context.save_checkpoint(f"step{step}")
+    print(step, flush=True)
+    if step == 2:
+        sys.stdin.read()
+"""
+
+
+def test_checkpoints_survive_a_killed_process(home, tmp_path):
+    path = tmp_path / "state.db"
+    process = subprocess.Popen([sys.executable, "-c", CRASHING_RUN, str(path)],
+                               stdin=subprocess.PIPE, stdout=subprocess.PIPE, text=True,
+                               env=dict(os.environ, HOME=str(home)))
+    try:
+        assert [process.stdout.readline().strip() for _ in range(3)] == ["0", "1", "2"]
+    finally:
+        process.kill()
+        process.wait(10)
+
+    store = SQLiteStore(path)
+    resumed = WorkflowContext(checkpoint_store=store.workflow("wf"))
+    assert resumed.load_checkpoint("step2")
+    assert resumed.data == {"step0": 0, "step1": 1, "step2": 2}
+    resumed.data["step3"] = 3
+    resumed.save_checkpoint("step3")
+    assert store.load_checkpoint("wf", "step3")["data"]["step3"] == 3
+    store.close()
+
+
+def test_list_checkpoints_by_time(store):
+    context = WorkflowContext()
+    for name in ("a", "b", "c"):
+        store.save_checkpoint("wf", name, context)
+
+    checkpoints = store.list_checkpoints("wf")
+    assert [name for name, _ in checkpoints] == ["a", "b", "c"]
+    since = checkpoints[1][1]
+    assert [name for name, _ in store.list_checkpoints("wf", since=since)] == ["b", "c"]
+
+
+def test_concurrent_workflows(store):
+    def run(i):
+        context = WorkflowContext(checkpoint_store=store.workflow(f"wf-{i}"))
+        for step in range(5):
+            context.data[f"step{step}"] = i
+            context.save_checkpoint(f"step{step}")
+
+    threads = [threading.Thread(target=run, args=(i,)) for i in range(20)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert store.load_checkpoint("wf-7", "step4")["data"]["step4"] == 7
+    assert len(store.list_checkpoints("wf-19")) == 5
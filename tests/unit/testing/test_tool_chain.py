@@ -0,0 +1,201 @@
+import threading
+import time
+
+import pytest
+
+from gofannon.base import BaseTool, WorkflowContext
+from gofannon.orchestration import ToolChain
+
+
+class Step(BaseTool):
+    """A chain step: sleeps, then joins its inputs and its label."""
+    active = 0
+    peak = 0
+    lock = threading.Lock()
+
+    def __init__(self, label, inputs, delay=0.05, fail=False):
+        super().__init__()
+        self.label = label
+        self.inputs = inputs
+        self.delay = delay
+        self.fail = fail
+        self.calls = 0
+
+    @property
+    def definition(self):
+        return {"function": {"parameters": self.inputs}}
+
+    def fn(self, **kwargs):
+        self.calls += 1
+        with Step.lock:
+            Step.active += 1
+            Step.peak = max(Step.peak, Step.active)
+        time.sleep(self.delay)
+        with Step.lock:
+            Step.active -= 1
+        if self.fail:
+            raise RuntimeError(f"{self.label} failed")
+        return "+".join([str(kwargs[k]) for k in sorted(kwargs)] + [self.label])
+
+
+def make_step(name, label, inputs, **kwargs):
+    # Output keys are derived from the class name, so each step gets its own class.
+    return type(name, (Step,), {})(label, inputs, **kwargs)
+
+
+@pytest.fixture(autouse=True)
+def reset_counters():
+    Step.active = Step.peak = 0
+
+
+def diamond():
+    return [
+        make_step("Fetch", "fetch", {"q": "{{query}}"}),
+        make_step("Left", "left", {"x": "{{Fetch_output}}"}),
+        make_step("Right", "right", {"x": "{{Fetch_output}}"}),
+        make_step("Other", "other", {"q": "{{query}}"}),
+        make_step("Join", "join", {"a": "{{Left_output}}", "b": "{{Right_output}}"}),
+    ]
+
+
+def test_dependencies_follow_templates():
+    chain = ToolChain(diamond(), None)
+
+    assert chain.dependencies() == [set(), {0}, {0}, set(), {1, 2}]
+
+
+def test_parallel_matches_sequential(context):
+    sequential = WorkflowContext()
+    assert ToolChain(diamond(), sequential).execute({"query": "q"}).success
+
+    start = time.monotonic()
+    result = ToolChain(diamond(), context, parallel=True).execute({"query": "q"})
+    elapsed = time.monotonic() - start
+
+    assert result.success
+    assert context.data == sequential.data
+    assert context.data["Join_output"] == "q+fetch+left+q+fetch+right+join"
+    assert Step.peak >= 2
+    # Three levels of 50 ms steps instead of five.
+    assert elapsed < 0.25
+
+
+def test_max_workers_bounds_concurrency(context):
+    steps = [make_step(f"S{i}", str(i), {}) for i in range(6)]
+
+    ToolChain(steps, context, parallel=True, max_workers=2).execute()
+
+    assert Step.peak == 2
+
+
+def test_conflicting_writes_keep_list_order(context):
+    first = make_step("Same", "first", {}, delay=0.1)
+    reader = make_step("Reader", "reader", {"x": "{{Same_output}}"})
+    second = make_step("Same", "second", {}, delay=0.01)
+    second.__class__ = first.__class__
+
+    chain = ToolChain([first, reader, second], context, parallel=True)
+
+    assert chain.dependencies() == [set(), {0}, {0, 1}]
+    chain.execute()
+    assert context.data["Reader_output"] == "first+reader"
+    assert context.data["Same_output"] == "second"
+
+
+def test_failure_stops_dependents(context):
+    steps = [
+        make_step("Fetch", "fetch", {}, fail=True),
+        make_step("Independent", "independent", {}),
+        make_step("Dependent", "dependent", {"x": "{{Fetch_output}}"}),
+    ]
+
+    result = ToolChain(steps, context, parallel=True).execute()
+
+    assert not result.success
+    assert result.error == "fetch failed"
+    assert "Dependent_output" not in context.data
+
+
+def linear(fail_last=False):
+    return [
+        make_step("Fetch", "fetch", {"q": "{{query}}"}),
+        make_step("Parse", "parse", {"x": "{{Fetch_output}}"}),
+        make_step("Report", "report", {"x": "{{Parse_output}}"}, fail=fail_last),
+    ]
+
+
+def test_load_checkpoint_missing(context):
+    assert context.load_checkpoint("nope") is False
+
+
+def test_checkpoint_round_trip(context):
+    chain = ToolChain(linear(), context)
+    chain.execute({"query": "q"})
+
+    restored = WorkflowContext()
+    assert restored.load_checkpoint(chain.checkpoint_name(2))
+    assert restored.data == context.data
+    assert restored.execution_log == context.execution_log
+    assert restored.completed_steps == context.completed_steps
+
+
+@pytest.mark.parametrize("parallel", [False, True])
+def test_resume_skips_completed_steps(context, parallel):
+    steps = linear(fail_last=True)
+    chain = ToolChain(steps, context, parallel=parallel)
+    assert not chain.execute({"query": "q"}).success
+
+    steps[2].fail = False
+    result = ToolChain(steps, WorkflowContext(), parallel=parallel,
+                       run_id=chain.run_id).resume({"query": "q"})
+
+    assert result.success
+    assert result.output["Report_output"] == "q+fetch+parse+report"
+    assert [step.calls for step in steps] == [1, 1, 2]
+
+
+def test_resume_reruns_steps_whose_inputs_changed(context):
+    steps = linear()
+    ToolChain(steps, context, run_id="run").execute({"query": "q"})
+
+    result = ToolChain(steps, WorkflowContext(), run_id="run").resume({"query": "other"})
+
+    assert result.output["Report_output"] == "other+fetch+parse+report"
+    assert [step.calls for step in steps] == [2, 2, 2]
+
+
+def test_resume_ignores_other_runs(context):
+    ToolChain(linear(), context, run_id="alpha").execute({"query": "alpha"})
+    steps = linear()
+    steps[1].fail = True
+    assert not ToolChain(steps, WorkflowContext(), run_id="beta").execute({"query": "beta"}).success
+
+    steps[1].fail = False
+    result = ToolChain(steps, WorkflowContext(), run_id="beta").resume()
+
+    assert result.output["Report_output"] == "beta+fetch+parse+report"
+    assert [step.calls for step in steps] == [1, 2, 1]
+
+
+def test_resume_uses_the_newest_checkpoint_of_the_run(context):
+    steps = linear()
+    ToolChain(steps, context, run_id="run").execute({"query": "q"})
+    # A later attempt of the same run reruns the first step with new input
+    # and fails, leaving the first attempt's last checkpoint behind.
+    steps[1].fail = True
+    assert not ToolChain(steps, WorkflowContext(), run_id="run").resume({"query": "new"}).success
+
+    steps[1].fail = False
+    result = ToolChain(steps, WorkflowContext(), run_id="run").resume()
+
+    assert result.output["Report_output"] == "new+fetch+parse+report"
+    assert [step.calls for step in steps] == [2, 3, 2]
+
+
+def test_execute_does_not_skip(context):
+    steps = linear()
+    chain = ToolChain(steps, context)
+    chain.execute({"query": "q"})
+    chain.execute({"query": "q"})
+
+    assert [step.calls for step in steps] == [2, 2, 2]
@@ -0,0 +1,172 @@
+import asyncio
+import json
+from types import SimpleNamespace
+
+import httpx
+import pytest
+import responses
+
+from gofannon.base import BaseTool
+from gofannon.base.http import _tracing_transport
+from gofannon.base.tracing import enable_tracing, disable_tracing, span
+from gofannon.orchestration import AsyncFunctionOrchestrator, FunctionOrchestrator, ToolChain
+
+
+@pytest.fixture
+def tracer():
+    tracer = enable_tracing()
+    tracer.clear()
+    yield tracer
+    disable_tracing()
+    tracer.clear()
+
+
+class Fetch(BaseTool):
+    API_SERVICE = "tracing_test"
+
+    @property
+    def definition(self):
+        return {"type": "function", "function": {"name": "fetch", "parameters": {}}}
+
+    def fn(self, url):
+        return self.http_session(url).get(url).text
+
+
+class ScriptedLLM:
+    def __init__(self, tool_calls):
+        self.turns = [
+            SimpleNamespace(content=None, tool_calls=tool_calls),
+            SimpleNamespace(content="done", tool_calls=None),
+        ]
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self.create))
+
+    def create(self, **kwargs):
+        return SimpleNamespace(choices=[SimpleNamespace(message=self.turns.pop(0))])
+
+
+def fetch_call(call_id, url):
+    return SimpleNamespace(
+        id=call_id,
+        function=SimpleNamespace(name="fetch", arguments=json.dumps({"url": url})),
+    )
+
+
+def by_name(tracer):
+    spans = {}
+    for s in tracer.spans():
+        spans.setdefault(s.name, []).append(s)
+    return spans
+
+
+@responses.activate
+def test_workflow_spans_nest(tracer):
+    responses.add(responses.GET, "https://api.example.com/a", body="A")
+    responses.add(responses.GET, "https://api.example.com/b", body="B")
+    llm = ScriptedLLM([fetch_call("1", "https://api.example.com/a?key=secret"),
+                       fetch_call("2", "https://api.example.com/b")])
+    orchestrator = FunctionOrchestrator(llm)
+    orchestrator.function_map = {"fetch": (Fetch, {})}
+
+    orchestrator.execute_workflow("q", "model")
+
+    spans = by_name(tracer)
+    (workflow,) = spans["workflow"]
+    turns = spans["turn"]
+    assert [t.attributes["turn"] for t in turns] == [0, 1]
+    assert all(t.parent_id == workflow.span_id for t in turns)
+    assert [s.parent_id for s in spans["llm.completion"]] == [t.span_id for t in turns]
+
+    tools = spans["tool Fetch"]
+    assert len(tools) == 2
+    assert all(t.parent_id == turns[0].span_id for t in tools)
+    https = spans["HTTP GET"]
+    assert {h.parent_id for h in https} == {t.span_id for t in tools}
+    assert {h.attributes["url"] for h in https} == {"https://api.example.com/a",
+                                                    "https://api.example.com/b"}
+    assert all(s.trace_id == workflow.trace_id for s in tracer.spans())
+
+
+def test_tool_errors_are_recorded(tracer, context):
+    class Broken(BaseTool):
+        @property
+        def definition(self):
+            return {}
+
+        def fn(self):
+            raise ValueError("bad input")
+
+    result = Broken().execute(context)
+    assert not result.success
+    (tool_span,) = tracer.spans()
+    assert tool_span.error == "ValueError: bad input"
+
+
+def test_parallel_tool_chain_steps_nest_under_caller(tracer, context):
+    class Step(BaseTool):
+        @property
+        def definition(self):
+            return {"function": {"parameters": {}}}
+
+        def fn(self):
+            return "ok"
+
+    steps = [type(f"Step{i}", (Step,), {})() for i in range(3)]
+    with span("chain") as chain:
+        ToolChain(steps, context, parallel=True).execute()
+
+    tool_spans = [s for s in tracer.spans() if s.category == "tool"]
+    assert len(tool_spans) == 3
+    assert all(s.parent_id == chain.span_id for s in tool_spans)
+
+
+def test_async_workflow_and_http_spans(tracer):
+    async def create(**kwargs):
+        return SimpleNamespace(choices=[SimpleNamespace(
+            message=SimpleNamespace(content="done", tool_calls=None))])
+
+    llm = SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=create)))
+    transport = _tracing_transport(httpx.MockTransport(lambda request: httpx.Response(204)))
+
+    async def main():
+        await AsyncFunctionOrchestrator(llm).execute_workflow("q", "model")
+        async with httpx.AsyncClient(transport=transport) as client:
+            await client.get("https://api.example.com/x?token=t")
+
+    asyncio.run(main())
+
+    spans = by_name(tracer)
+    (workflow,) = spans["workflow"]
+    assert spans["turn"][0].parent_id == workflow.span_id
+    (http,) = spans["HTTP GET"]
+    assert http.attributes == {"url": "https://api.example.com/x", "status_code": 204}
+
+
+def test_disabled_tracing_records_nothing(tracer):
+    disable_tracing()
+    with span("ignored") as s:
+        s.set_attribute("k", "v")
+    assert tracer.spans() == []
+
+
+def test_exports(tracer, tmp_path):
+    with span("outer", "test", size=3):
+        with span("inner", "test", ok=True):
+            pass
+
+    tracer.export_chrome_trace(tmp_path / "trace.json")
+    chrome = json.loads((tmp_path / "trace.json").read_text())
+    events = {e["name"]: e for e in chrome["traceEvents"]}
+    assert events["outer"]["ph"] == "X"
+    assert events["outer"]["args"]["size"] == 3
+    assert events["inner"]["args"]["parent_id"] == events["outer"]["args"]["span_id"]
+    assert events["outer"]["ts"] <= events["inner"]["ts"]
+    assert events["inner"]["dur"] <= events["outer"]["dur"]
+
+    tracer.export_otlp_json(tmp_path / "trace.otlp.json")
+    otlp = json.loads((tmp_path / "trace.otlp.json").read_text())
+    spans = {s["name"]: s for s in otlp["resourceSpans"][0]["scopeSpans"][0]["spans"]}
+    assert spans["inner"]["parentSpanId"] == spans["outer"]["spanId"]
+    assert len(spans["outer"]["traceId"]) == 32
+    assert {"key": "size", "value": {"intValue": "3"}} in spans["outer"]["attributes"]
+    assert {"key": "ok", "value": {"boolValue": True}} in spans["inner"]["attributes"]
+    assert int(spans["outer"]["endTimeUnixNano"]) >= int(spans["outer"]["startTimeUnixNano"])
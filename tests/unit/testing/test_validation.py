@@ -0,0 +1,113 @@
+import asyncio
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from gofannon.base import BaseTool, validation
+from gofannon.base.metrics import get_registry
+from gofannon.base.validation import ArgumentValidationError
+from gofannon.basic_math.addition import Addition  # noqa: F401 (registers "addition")
+from gofannon.orchestration import FunctionOrchestrator
+from gofannon.simpler_grants_gov.search_opportunities import SearchOpportunities
+
+
+@pytest.fixture
+def registry():
+    get_registry().reset()
+    yield get_registry()
+    get_registry().reset()
+
+
+class Repeat(BaseTool):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.calls = 0
+
+    @property
+    def definition(self):
+        return {"type": "function", "function": {"name": "repeat", "parameters": {
+            "type": "object",
+            "properties": {
+                "text": {"type": "string"},
+                "times": {"type": "integer", "minimum": 1},
+            },
+            "required": ["text"],
+        }}}
+
+    def fn(self, text, times=1):
+        self.calls += 1
+        return text * times
+
+
+def test_invalid_arguments_fail_before_fn(context, registry):
+    tool = Repeat()
+    result = tool.execute(context, text="ab", times="3")
+
+    assert not result.success and not result.retryable
+    assert result.error == "Invalid arguments for Repeat: times: '3' is not of type 'integer'"
+    assert tool.calls == 0
+    assert registry.value("gofannon_tool_invalid_arguments_total", tool="Repeat") == 1
+
+    assert tool.execute(context, text="ab", times=2).output == "abab"
+    assert registry.histogram("gofannon_tool_validation_seconds", tool="Repeat")["count"] == 2
+
+
+def test_execute_async_raises(registry):
+    with pytest.raises(ArgumentValidationError, match="'text' is a required property"):
+        asyncio.run(Repeat().execute_async({"times": 2}))
+
+
+def test_validators_are_compiled_once_per_schema(context):
+    validation._compile.cache_clear()
+    for _ in range(3):
+        Repeat().execute(context, text="a")
+    info = validation._compile.cache_info()
+    assert (info.misses, info.hits) == (1, 2)
+
+
+def test_instances_remember_their_validator(context):
+    class Counted(Repeat):
+        lookups = 0
+
+        @property
+        def definition(self):
+            Counted.lookups += 1
+            return super().definition
+
+    tool = Counted()
+    for times in (1, 2, "3"):
+        tool.execute(context, text="a", times=times)
+    assert Counted.lookups == 1
+
+
+def test_trusted_callers_skip_validation(context, registry):
+    tool = Repeat()
+    with validation.trusted():
+        assert tool.execute(context, text="ab", times=0).output == ""
+    assert registry.histogram("gofannon_tool_validation_seconds", tool="Repeat") is None
+
+
+def test_malformed_aln_never_reaches_the_api(context):
+    tool = SearchOpportunities(api_key="key", base_url="https://api.grants.test")
+    result = tool.execute(context, assistance_listing_number=["45.149", "45-149"])
+
+    assert not result.success
+    assert "assistance_listing_number/1: '45-149' does not match" in result.error
+
+
+def test_orchestrator_reports_invalid_calls_to_the_llm(context):
+    turns = [
+        SimpleNamespace(content=None, tool_calls=[SimpleNamespace(
+            id="call_0", function=SimpleNamespace(
+                name="addition", arguments=json.dumps({"num1": "one", "num2": 2})))]),
+        SimpleNamespace(content="done", tool_calls=None),
+    ]
+    llm = SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(
+        create=lambda **kwargs: SimpleNamespace(choices=[SimpleNamespace(message=turns.pop(0))]))))
+
+    result = FunctionOrchestrator(llm).execute_workflow("q", "model")
+
+    (message,) = [m["content"] for m in result["conversation"]
+                  if isinstance(m, dict) and m.get("role") == "tool"]
+    assert message.startswith("Error: Invalid arguments for Addition: num1: 'one' is not of type")
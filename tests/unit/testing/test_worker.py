@@ -0,0 +1,237 @@
+import json
+import os
+import socketserver
+import subprocess
+import sys
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from gofannon.orchestration import FunctionOrchestrator
+from gofannon.orchestration.worker import (
+    ToolWorker,
+    WorkerCallFailed,
+    WorkerClient,
+    WorkerDispatcher,
+    WorkerUnavailable,
+    start_worker,
+)
+
+
+@pytest.fixture
+def workers(home, monkeypatch):
+    monkeypatch.setenv("GOFANNON_WORKER_TOKEN", "secret")
+    servers = []
+
+    def start(listen="127.0.0.1:0", **kwargs):
+        server = start_worker(listen, **kwargs)
+        servers.append(server)
+        return server
+
+    yield start
+    for server in servers:
+        server.shutdown()
+        server.server_close()
+
+
+def test_batched_calls_keep_order_and_partial_failures(workers):
+    client = WorkerClient(workers().address)
+    results, load = client.call_batch([
+        {"name": "addition", "arguments": {"num1": 1, "num2": 2}},
+        {"name": "division", "arguments": {"num1": 1, "num2": 0}},
+        {"name": "no_such_tool", "arguments": {}},
+        {"name": "multiplication", "arguments": {"num1": 3, "num2": 4}},
+    ])
+
+    assert [r.success for r in results] == [True, False, False, True]
+    assert results[0].output == 3 and results[3].output == 12
+    assert results[1].error == "Cannot divide by zero"
+    assert "Unknown tool" in results[2].error
+    assert load["in_flight"] == 0
+    assert (load["completed"], load["failed"]) == (2, 2)
+
+
+def test_rejected_batches_leave_no_calls_in_flight(workers):
+    server = workers()
+    client = WorkerClient(server.address)
+
+    with pytest.raises(WorkerUnavailable, match="400"):
+        client.call_batch([{"name": "addition", "arguments": {}}, {"arguments": {}}])
+    assert client.load()["in_flight"] == 0
+
+    server.worker.close()
+    with pytest.raises(RuntimeError):
+        server.worker.call_batch([{"name": "addition", "arguments": {}}])
+    assert server.worker.load()["in_flight"] == 0
+
+
+def test_unix_socket_worker_reports_load_and_tools(workers, tmp_path):
+    server = workers(f"unix:{tmp_path / 'worker.sock'}", max_concurrency=3)
+    client = WorkerClient(server.address)
+
+    assert client.load()["capacity"] == 3
+    assert "addition" in {t["function"]["name"] for t in client.tools()}
+    results, _ = client.call_batch([{"name": "addition", "arguments": {"num1": 2, "num2": 2}}])
+    assert results[0].output == 4
+
+
+def test_workers_need_a_token(workers, monkeypatch):
+    server = workers()
+    with pytest.raises(WorkerUnavailable, match="401"):
+        WorkerClient(server.address, token="wrong").load()
+
+    monkeypatch.delenv("GOFANNON_WORKER_TOKEN")
+    with pytest.raises(ValueError):
+        start_worker()
+
+
+def test_workers_serve_only_allowed_tools(workers):
+    client = WorkerClient(workers().address)
+    names = {t["function"]["name"] for t in client.tools()}
+    assert "addition" in names and "read_file" not in names
+
+    results, _ = client.call_batch([{"name": "read_file", "arguments": {"file": "/etc/passwd"}}])
+    assert not results[0].success
+    assert "not served" in results[0].error
+
+    client = WorkerClient(workers(allowed_tools=["read_file"]).address)
+    assert "read_file" in {t["function"]["name"] for t in client.tools()}
+
+
+def test_dispatcher_prefers_workers_with_spare_capacity(workers):
+    small = workers(max_concurrency=1)
+    large = workers(max_concurrency=8)
+    dispatcher = WorkerDispatcher([small.address, large.address])
+    dispatcher.refresh()
+
+    results = dispatcher.call_many([("addition", {"num1": i, "num2": 1}) for i in range(4)])
+
+    assert [r.output for r in results] == [1, 2, 3, 4]
+    assert small.worker.load()["completed"] == 1
+    assert large.worker.load()["completed"] == 3
+    dispatcher.close()
+
+
+def test_dispatcher_fails_over_from_unreachable_workers(workers, tmp_path):
+    live = workers()
+    dispatcher = WorkerDispatcher([f"unix:{tmp_path / 'missing.sock'}", live.address])
+
+    results = dispatcher.call_many([("addition", {"num1": i, "num2": i}) for i in range(3)])
+
+    assert [r.output for r in results] == [0, 2, 4]
+    dispatcher.close()
+
+    down = WorkerDispatcher([f"unix:{tmp_path / 'missing.sock'}"])
+    (result,) = down.call_many([("addition", {"num1": 1, "num2": 1})])
+    assert not result.success and result.retryable
+    down.close()
+
+
+class SlowWorker(ToolWorker):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.received = []
+
+    def call_batch(self, calls):
+        self.received.extend(c["name"] for c in calls)
+        time.sleep(0.5)
+        return super().call_batch(calls)
+
+
+@pytest.mark.parametrize("tool", ["addition", "write_file"])
+def test_dispatcher_does_not_resend_unanswered_calls(workers, tool):
+    slow = [SlowWorker(allowed_tools=["write_file"]) for _ in range(2)]
+    dispatcher = WorkerDispatcher([workers(worker=w).address for w in slow], timeout=0.2)
+
+    (result,) = dispatcher.call_many([(tool, {})])
+
+    assert not result.success
+    assert "did not answer" in result.error
+    assert result.retryable == (tool == "addition")
+    assert sum(len(w.received) for w in slow) == 1
+    dispatcher.close()
+
+
+class AnswerOnce(socketserver.StreamRequestHandler):
+    """Answers the first request of a connection, then reads one more and hangs up."""
+
+    def handle(self):
+        for answered in (False, True):
+            length = 0
+            line = self.rfile.readline()
+            while line not in (b"\r\n", b""):
+                if line.lower().startswith(b"content-length:"):
+                    length = int(line.split(b":")[1])
+                line = self.rfile.readline()
+            if not line:
+                return
+            self.rfile.read(length)
+            self.server.requests += 1
+            if answered:
+                return
+            body = b'{"results": [], "load": {}, "in_flight": 0, "capacity": 1}'
+            self.wfile.write(b"HTTP/1.1 200 OK\r\nContent-Length: %d\r\n\r\n%s" % (len(body), body))
+
+
+def test_client_replays_calls_only_if_allowed(home):
+    server = socketserver.ThreadingTCPServer(("127.0.0.1", 0), AnswerOnce)
+    server.daemon_threads = True
+    server.requests = 0
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    client = WorkerClient(f"127.0.0.1:{server.server_address[1]}", token="secret")
+    try:
+        client.load()
+        with pytest.raises(WorkerCallFailed):
+            client.call_batch([{"name": "write_file", "arguments": {}}])
+        assert server.requests == 2
+
+        client.load()
+        # Sent again once, over a fresh connection that answers it.
+        assert client.call_batch([{"name": "addition", "arguments": {}}], replay=True) == ([], {})
+        assert server.requests == 5
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_orchestrator_runs_tool_calls_on_workers(workers):
+    dispatcher = WorkerDispatcher([workers().address, workers().address])
+    turns = [
+        SimpleNamespace(content=None, tool_calls=[
+            SimpleNamespace(id=f"call_{i}", function=SimpleNamespace(
+                name="multiplication", arguments=json.dumps({"num1": i, "num2": 10})))
+            for i in range(3)
+        ]),
+        SimpleNamespace(content="done", tool_calls=None),
+    ]
+    llm = SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(
+        create=lambda **kwargs: SimpleNamespace(choices=[SimpleNamespace(message=turns.pop(0))]))))
+
+    result = FunctionOrchestrator(llm, dispatcher=dispatcher).execute_workflow("q", "model")
+
+    tool_messages = [m["content"] for m in result["conversation"]
+                     if isinstance(m, dict) and m.get("role") == "tool"]
+    assert tool_messages == ["0", "10", "20"]
+    dispatcher.close()
+
+
+def test_spawned_worker_process(home, tmp_path, monkeypatch):
+    monkeypatch.setenv("GOFANNON_WORKER_TOKEN", "secret")
+    socket_path = tmp_path / "spawned.sock"
+    env = dict(os.environ, HOME=str(home))
+    process = subprocess.Popen(
+        [sys.executable, "-m", "gofannon.orchestration.worker", "--listen", f"unix:{socket_path}"],
+        stdout=subprocess.PIPE, text=True, env=env,
+    )
+    try:
+        address = process.stdout.readline().strip()
+        assert address == f"unix:{socket_path}"
+        client = WorkerClient(address)
+        assert client.load()["pid"] == process.pid
+        results, _ = client.call_batch([{"name": "subtraction", "arguments": {"num1": 5, "num2": 3}}])
+        assert results[0].output == 2
+    finally:
+        process.terminate()
+        process.wait(10)